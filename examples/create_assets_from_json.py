@@ -49,6 +49,7 @@ def build_assets_from_json(
         # Assets can be bulk-exported from runZero and examined programmatically allowing for very custom,
         # arbitrarily-defined merge/match rules to be executed. Any program you can write to match an ImportAsset object
         # to a runZero asset ID is an encoding of merge/match rules you've defined for any data set or situation.
+        # runzero.api.MatchIndex builds such a lookup from an asset export, matching by external ID, MAC, hostname or IP.
         run_zero_id = asset_id_force_merge_lookup.get(asset_id, None)
         assets.append(
             ImportAsset(
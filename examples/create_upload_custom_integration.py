@@ -1,8 +1,13 @@
-import time
 import uuid
 
 import runzero
-from runzero.api import CustomAssets, CustomIntegrationsAdmin, Sites, Tasks
+from runzero.api import (
+    CustomAssets,
+    CustomIntegrationsAdmin,
+    Sites,
+    Tasks,
+    TaskWaitTimeoutError,
+)
 from runzero.types import ImportAsset, ImportTask
 
 # API keys are required for using the runZero sdk. See https://www.runzero.com/docs/leveraging-the-api/
@@ -61,16 +66,16 @@ def main():
 
     # create a task api manager, so we can monitor our custom asset import task
     task_mgr = Tasks(client=c)
-    status = task_mgr.get_status(MY_ORG_ID, import_task.id)
-
-    # keep polling until the task is completed or failed or 30 seconds have elapsed
-    iters = 0
-    while status not in ("processed", "failed", "error") and iters < 6:
-        print("polling on status for custom integration upload task....")
-        time.sleep(5)
-        iters += 1
-        status = task_mgr.get_status(MY_ORG_ID, import_task.id)
-        print(f"task status is {status}")
+
+    # watch the task until it is completed or failed, or 30 seconds have elapsed
+    status = None
+    try:
+        for change in task_mgr.wait_for(MY_ORG_ID, [import_task.id], timeout=30):
+            status = change.status
+            print(f"task status is {status}")
+    except TaskWaitTimeoutError:
+        print("timed out waiting for the custom integration upload task")
+        return
 
     # check that our task successfully completed
     assert status == "processed"
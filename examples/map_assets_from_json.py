@@ -0,0 +1,50 @@
+import json
+from typing import Any, Dict
+
+from runzero.api import AssetMapping
+
+# The mapping of examples/create_assets_from_json.py, declared as data rather than written as code. It could
+# equally be loaded from a configuration file with AssetMapping(**json.load(file)).
+MAPPING: Dict[str, Any] = {
+    "fields": {
+        "id": "asset_id",
+        "domain": "asset_domain",
+        "device_type": {"path": "type", "default": "Unknown"},
+    },
+    # the addresses are sorted into the IPv4 and IPv6 addresses of the interface
+    "interfaces": [{"mac_address": "mac", "addresses": "ip_addresses"}],
+    "custom_attributes": {"otherAttribute": "other_attribute", "driveType": "drive_type"},
+    # every other value of a record becomes a custom attribute too
+    "leftovers": True,
+}
+
+
+def main():
+    """
+    Converts JSON from an external API to ImportAssets with a declarative AssetMapping, which is compiled once
+    and then applied to each record.
+    """
+    data_from_other_api = """\
+[{"asset_id": "someId1", "asset_domain": "some.domain.com", "other_attribute": "small", "type": "Tablet",\
+"mac": "6F:C2:BF:22:E8:38", "ip_addresses": ["101.82.74.140", "9.216.6.20"], "drive_type": "ssd"},\
+{"asset_id": "someId2", "asset_domain": "other.domain.com", "other_attribute": "medium", "type": "Desktop",\
+"mac": "1D:E6:64:DA:3D:87", "ip_addresses": ["140.0.21.251"], "drive_type": "hdd", "unexpected_attribute": "XL"},\
+{"asset_domain": "another.domain.com", "other_attribute": "large", "type": "Server",\
+"mac": "A6:C5:E7:6A:85:4A", "ip_addresses": ["6946:e4fb:963b:9ab2:1943:b4d6:7d14:b041", "180.169.16.247"]}]\
+"""
+    mapping = AssetMapping(**MAPPING)
+
+    # build converts and validates in this process. For large imports, mapping.chunks does the same in a pool of
+    # worker processes, returning compressed chunks for CustomAssets.upload_asset_chunks.
+    assets, errors = mapping.build(json.loads(data_from_other_api))
+    print(f"created {len(assets)} ImportAssets from our API data")
+    for asset in assets:
+        print(f"id: {asset.id}, device type: {asset.device_type}, attributes: {asset.custom_attributes}")
+
+    # the third record has no ID, which every ImportAsset requires
+    for error in errors:
+        print(f"record {error.record} was skipped: {error.message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,19 @@
 runzero provides an interface to the runZero platform APIs
 """
 
-# The Client is the first thing you should use.
-# Should be imported here first because of circular import potential below
-from runzero.client import Client  # isort: skip
+from typing import TYPE_CHECKING
 
-import runzero.version
-from runzero.client import AuthError, ClientError, ServerError
-from runzero.errors import APIError, Error
-from runzero.types import ValidationError
+from runzero._lazy import attach
 
-__version__ = runzero.version.__version__
+if TYPE_CHECKING:
+    # The Client is the first thing you should use.
+    # Should be imported here first because of circular import potential below
+    from runzero.client import Client  # isort: skip
+    from runzero import api, client, errors, types, version
+    from runzero.client import AuthError, ClientError, ServerError
+    from runzero.errors import APIError, Error
+    from runzero.types import ValidationError
+    from runzero.version import __version__
 
 __all__ = [
     "__version__",
@@ -22,3 +25,24 @@ __all__ = [
     "Error",
     "ValidationError",
 ]
+
+# the client, its http stack, the models and even the installed version are looked up on first use
+__getattr__, __dir__ = attach(
+    __name__,
+    globals(),
+    {
+        "api": None,
+        "client": None,
+        "errors": None,
+        "types": None,
+        "version": None,
+        "APIError": ".errors",
+        "AuthError": ".client",
+        "Client": ".client",
+        "ClientError": ".client",
+        "Error": ".errors",
+        "ServerError": ".client",
+        "ValidationError": ".types",
+        "__version__": ".version",
+    },
+)
@@ -0,0 +1,41 @@
+"""
+_lazy defers importing a package's modules until one of their public names is first used (PEP 562).
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+
+def attach(
+    package: str, namespace: Dict[str, Any], names: Mapping[str, Optional[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Creates the module ``__getattr__`` and ``__dir__`` functions of a package with lazily imported names.
+
+    :param package: the package's ``__name__``
+    :param namespace: the package's ``globals()``, in which each name is stored once imported so
+        later lookups do not reach ``__getattr__``
+    :param names: maps each public name to the module it is imported from, which may be relative to
+        the package. ``module:attribute`` imports a name under an alias. None marks the name as a
+        submodule of the package.
+
+    :returns: the ``__getattr__`` and ``__dir__`` functions for the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            target = names[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        if target is None:
+            value: Any = importlib.import_module(f"{package}.{name}")
+        else:
+            module, _, attribute = target.partition(":")
+            value = getattr(importlib.import_module(module, package), attribute or name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(names))
+
+    return __getattr__, __dir__
@@ -0,0 +1,107 @@
+"""
+_pydantic lets the SDK run on either major version of pydantic.
+
+pydantic 2 validates and serializes models in its compiled core, which is considerably faster for
+large payloads such as asset imports. Where the two versions' APIs differ, the SDK calls the helpers
+here rather than the version-specific methods, so the same code runs on whichever is installed.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Type, TypeVar
+
+import pydantic
+from pydantic import BaseModel
+
+__all__ = [
+    "PYDANTIC_V2",
+    "ROOT",
+    "before_validator",
+    "copy",
+    "dump_json",
+    "parse",
+    "root",
+]
+
+PYDANTIC_V2: bool = not pydantic.VERSION.startswith("1.")
+"""True when the installed pydantic is version 2 or later"""
+
+ROOT: str = "root" if PYDANTIC_V2 else "__root__"
+"""The name of the field holding the value of a root model, such as a Hostname or Tag"""
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+if TYPE_CHECKING or not PYDANTIC_V2:
+
+    def parse(model: Type[ModelT], obj: Any) -> ModelT:
+        """
+        Validates a decoded JSON object as a model.
+
+        :param model: the model type
+        :param obj: the decoded JSON object
+
+        :returns: the model instance
+        :raises: ValidationError
+        """
+        return model.parse_obj(obj)
+
+    def dump_json(model: BaseModel, **kwargs: Any) -> str:
+        """
+        Serializes a model to JSON.
+
+        :param model: the model to serialize
+        :param kwargs: options such as by_alias and exclude_none, which both versions accept
+
+        :returns: the JSON document
+        """
+        return model.json(**kwargs)
+
+    def copy(model: ModelT) -> ModelT:
+        """
+        Makes a shallow copy of a model.
+
+        :param model: the model to copy
+
+        :returns: the copy
+        """
+        return model.copy()
+
+    def before_validator(*fields: str) -> Callable[[Any], Any]:
+        """
+        Decorates a classmethod which converts the raw value of fields before they are validated.
+
+        :param fields: the names of the fields to convert
+
+        :returns: the decorator
+        """
+        return pydantic.validator(*fields, pre=True, allow_reuse=True)
+
+else:
+    # pylint: disable-next=no-name-in-module,ungrouped-imports
+    from pydantic import ConfigDict
+
+    class APIModel(BaseModel):
+        """The base of the generated pydantic 2 API models, accepting numbers for strings as pydantic 1 does."""
+
+        model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    def parse(model: Type[ModelT], obj: Any) -> ModelT:  # pylint: disable=missing-function-docstring
+        return model.model_validate(obj)
+
+    def dump_json(model: BaseModel, **kwargs: Any) -> str:  # pylint: disable=missing-function-docstring
+        return model.model_dump_json(**kwargs)
+
+    def copy(model: ModelT) -> ModelT:  # pylint: disable=missing-function-docstring
+        return model.model_copy()
+
+    def before_validator(*fields: str) -> Callable[[Any], Any]:  # pylint: disable=missing-function-docstring
+        return pydantic.field_validator(*fields, mode="before")  # pylint: disable=no-member
+
+
+def root(model: BaseModel) -> Any:
+    """
+    Gets the value of a root model, such as the string of a Hostname or Tag.
+
+    :param model: the root model
+
+    :returns: the wrapped value
+    """
+    return getattr(model, ROOT)
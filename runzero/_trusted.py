@@ -0,0 +1,489 @@
+"""
+_trusted builds models from server responses without validating them.
+
+Validating a response converts every field, though callers often read only a few: listing
+100,000 tasks to find the failed ones parses 100,000 sets of UUIDs nobody reads. A trusted model
+stores the JSON values of plain fields, such as strings and numbers, as they are. The remaining
+fields, such as UUIDs, timestamps, enums, nested models and fields with validators, are converted
+when first read. Operations on the whole model, such as dumping, comparing or copying it, convert
+every remaining field first.
+
+Trusted models are instances of a subclass of the requested model, so ``isinstance`` checks and
+type annotations hold. Copying or pickling one produces an instance of the requested model itself.
+"""
+
+import copy
+import enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel, ValidationError
+
+from runzero._pydantic import PYDANTIC_V2, ModelT
+
+__all__ = [
+    "FieldPlan",
+    "construct",
+    "field_plans",
+    "is_trusted",
+]
+
+Convert = Callable[[Any], Any]
+
+_MISSING = object()
+_NoneType = type(None)
+_PLAIN_TYPES = (str, int, float, bool, Any)
+_IMMUTABLE_TYPES = (str, int, float, bool, tuple, frozenset, enum.Enum, _NoneType)
+
+
+def _origin(annotation: Any) -> Any:
+    return getattr(annotation, "__origin__", None)
+
+
+def _args(annotation: Any) -> Tuple[Any, ...]:
+    return getattr(annotation, "__args__", ())
+
+
+def _strip_optional(annotation: Any) -> Any:
+    if _origin(annotation) is Union:
+        args = [arg for arg in _args(annotation) if arg is not _NoneType]
+        if len(args) == 1:
+            return _strip_optional(args[0])
+    return annotation
+
+
+def _is_plain(annotation: Any) -> bool:
+    """Whether values of the annotated type are the same in JSON and in a validated model."""
+    annotation = _strip_optional(annotation)
+    if any(annotation is plain for plain in _PLAIN_TYPES):
+        return True
+    if _origin(annotation) in (list, dict):
+        return all(_is_plain(arg) for arg in _args(annotation))
+    return False
+
+
+def _is_root(model: Type[BaseModel]) -> bool:
+    if PYDANTIC_V2:
+        return getattr(model, "__pydantic_root_model__", False) is True
+    return "__root__" in model.__fields__
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel) and not _is_root(annotation)
+
+
+def _model_of(annotation: Any) -> Optional[Tuple[Type[BaseModel], bool]]:
+    """The nested model of a field holding a model or a list of models, and whether it is a list."""
+    annotation = _strip_optional(annotation)
+    if _is_model(annotation):
+        return annotation, False
+    if _origin(annotation) is list and _args(annotation):
+        item = _strip_optional(_args(annotation)[0])
+        if _is_model(item):
+            return item, True
+    return None
+
+
+class _LazyField:
+    """A non-data descriptor converting a field's JSON value on first read.
+
+    The converted value is stored in the instance ``__dict__``, which takes precedence over a
+    non-data descriptor, so later reads are plain attribute lookups.
+    """
+
+    __slots__ = ("name", "convert", "default")
+
+    def __init__(self, name: str, convert: Convert, default: Callable[[], Any]) -> None:
+        self.name = name
+        self.convert = convert
+        self.default = default
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        value = (instance._raw or {}).get(self.name, _MISSING)  # pylint: disable=protected-access
+        value = self.default() if value is _MISSING else self.convert(value)
+        instance.__dict__[self.name] = value
+        return value
+
+
+class _Plan:
+    """How to build trusted instances of one model from its JSON objects.
+
+    :param trusted: the trusted subclass of the model
+    :param names: the names of the model's fields, in order
+    :param lazy: the names of the fields converted when first read
+    :param keys: maps each JSON key, the alias or name of a field, to the field name and whether it is lazy
+    :param template: the default values of the fields which are not lazy
+    """
+
+    __slots__ = ("trusted", "names", "lazy", "keys", "template")
+
+    def __init__(
+        self,
+        trusted: Type[BaseModel],
+        names: List[str],
+        lazy: List[str],
+        keys: Dict[str, Tuple[str, bool]],
+        template: Dict[str, Any],
+    ) -> None:
+        self.trusted = trusted
+        self.names = names
+        self.lazy = lazy
+        self.keys = keys
+        self.template = template
+
+
+_plans: Dict[Type[BaseModel], _Plan] = {}
+
+
+class _Trusted:
+    """The behavior the trusted subclasses of models share, converting every field before whole-model operations."""
+
+    __slots__ = ()
+
+    _base: Type[BaseModel]
+    _raw: Optional[Dict[str, Any]]
+
+    def _materialize(self) -> None:
+        """Converts every field not yet read, including those of nested trusted models."""
+        if self._raw is None:
+            return
+        values = self.__dict__
+        plan = _plans[self._base]
+        for name in plan.lazy:
+            if name not in values:
+                getattr(self, name)
+        # lazy fields were added to __dict__ as they were read, out of order, which would reorder dumps
+        values = {name: values[name] for name in plan.names}
+        object.__setattr__(self, "__dict__", values)
+        object.__setattr__(self, "_raw", None)
+        for value in values.values():
+            if isinstance(value, _Trusted):
+                value._materialize()  # pylint: disable=protected-access
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, _Trusted):
+                        item._materialize()  # pylint: disable=protected-access
+
+    def _validated(self) -> BaseModel:
+        """An instance of the requested model holding the same, fully converted, values."""
+        self._materialize()
+        return _rebuild(self._base, dict(self.__dict__), set(_fields_set(self)))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        self._materialize()
+        return _rebuild, (self._base, dict(self.__dict__), set(_fields_set(self)))
+
+    def __copy__(self) -> BaseModel:
+        return self._validated()
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> BaseModel:
+        return copy.deepcopy(self._validated(), memo)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _Trusted):
+            other = other._validated()
+        return bool(self._validated() == other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr_args__(self) -> Any:
+        self._materialize()
+        return super().__repr_args__()  # type: ignore[misc]  # pylint: disable=no-member
+
+    def __iter__(self) -> Any:
+        self._materialize()
+        return super().__iter__()  # type: ignore[misc]  # pylint: disable=no-member
+
+
+if TYPE_CHECKING or not PYDANTIC_V2:
+
+    def _fields_set(model: Any) -> Set[str]:
+        return model.__fields_set__
+
+    def _rebuild(model: Type[ModelT], values: Dict[str, Any], fields_set: Set[str]) -> ModelT:
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__fields_set__", fields_set)
+        instance._init_private_attributes()  # pylint: disable=protected-access
+        return instance
+
+    def _new(trusted: Type[BaseModel], values: Dict[str, Any], raw: Dict[str, Any], fields_set: Set[str]) -> Any:
+        instance = trusted.__new__(trusted)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__fields_set__", fields_set)
+        object.__setattr__(instance, "_raw", raw)
+        return instance
+
+    def _fields(model: Type[BaseModel]) -> List[Tuple[str, str, Any, Callable[[], Any], Optional[int]]]:
+        """The name, alias, annotation, default factory and greatest length of each field of a model."""
+        return [
+            (
+                name,
+                field.alias,
+                field.annotation,
+                field.get_default,
+                field.field_info.max_items if field.field_info.max_items is not None else field.field_info.max_length,
+            )
+            for name, field in model.__fields__.items()
+        ]
+
+    def _has_validators(model: Type[BaseModel], name: str) -> bool:
+        return bool(model.__fields__[name].class_validators)
+
+    def _validator(model: Type[BaseModel], name: str) -> Convert:
+        """Validates a value of one field of a model, running the field's validators as well as its type's."""
+        field = model.__fields__[name]
+
+        def validate(value: Any) -> Any:
+            value, errors = field.validate(value, {}, loc=field.alias, cls=model)
+            if errors:
+                raise ValidationError([errors], model)
+            return value
+
+        return validate
+
+    class _TrustedModel(_Trusted):
+        __slots__ = ()
+
+        def _iter(self, *args: Any, **kwargs: Any) -> Any:
+            self._materialize()
+            return super()._iter(*args, **kwargs)  # type: ignore[misc]  # pylint: disable=no-member
+
+else:
+    from typing import Annotated  # pylint: disable=ungrouped-imports
+
+    # pylint: disable-next=no-name-in-module,ungrouped-imports
+    from pydantic import TypeAdapter
+
+    def _fields_set(model: Any) -> Set[str]:  # pylint: disable=missing-function-docstring
+        return model.__pydantic_fields_set__  # type: ignore[no-any-return]
+
+    def _rebuild(  # pylint: disable=missing-function-docstring
+        model: Type[ModelT], values: Dict[str, Any], fields_set: Set[str]
+    ) -> ModelT:
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
+    def _new(  # pylint: disable=missing-function-docstring
+        trusted: Type[BaseModel], values: Dict[str, Any], raw: Dict[str, Any], fields_set: Set[str]
+    ) -> Any:
+        instance = trusted.__new__(trusted)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        object.__setattr__(instance, "_raw", raw)
+        return instance
+
+    def _fields(  # pylint: disable=missing-function-docstring
+        model: Type[BaseModel],
+    ) -> List[Tuple[str, str, Any, Callable[[], Any], Optional[int]]]:
+        return [
+            (
+                name,
+                field.alias or name,
+                field.annotation,
+                lambda field=field: field.get_default(call_default_factory=True),
+                next((meta.max_length for meta in field.metadata if hasattr(meta, "max_length")), None),
+            )
+            for name, field in model.model_fields.items()
+        ]
+
+    def _has_validators(model: Type[BaseModel], name: str) -> bool:  # pylint: disable=missing-function-docstring
+        return any(
+            name in decorator.info.fields or "*" in decorator.info.fields
+            for decorator in model.__pydantic_decorators__.field_validators.values()
+        )
+
+    def _validator(model: Type[BaseModel], name: str) -> Convert:  # pylint: disable=missing-function-docstring
+        if _has_validators(model, name):
+
+            def validate_assignment(value: Any) -> Any:
+                # assigning to an empty instance runs the field's validators as well as its type's
+                instance = _rebuild(model, {}, set())
+                model.__pydantic_validator__.validate_assignment(instance, name, value)
+                return instance.__dict__[name]
+
+            return validate_assignment
+
+        adapter: List[Convert] = []
+
+        def validate(value: Any) -> Any:
+            if not adapter:
+                # built on first use, as building validators for every field up front would slow the first response
+                field = model.model_fields[name]
+                annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+                adapter.append(TypeAdapter(annotation).validate_python)
+            return adapter[0](value)
+
+        return validate
+
+    class _TrustedModel(_Trusted):  # pylint: disable=missing-class-docstring
+        __slots__ = ()
+
+        def model_dump(self, *args: Any, **kwargs: Any) -> Any:  # pylint: disable=missing-function-docstring
+            self._materialize()
+            return super().model_dump(*args, **kwargs)  # type: ignore[misc]  # pylint: disable=no-member
+
+        def model_dump_json(self, *args: Any, **kwargs: Any) -> Any:  # pylint: disable=missing-function-docstring
+            self._materialize()
+            return super().model_dump_json(*args, **kwargs)  # type: ignore[misc]  # pylint: disable=no-member
+
+
+def _nested(model: Type[BaseModel]) -> Convert:
+    def convert(value: Any) -> Any:
+        return construct(model, value) if isinstance(value, dict) else value
+
+    return convert
+
+
+def _nested_list(model: Type[BaseModel]) -> Convert:
+    def convert(value: Any) -> Any:
+        if not isinstance(value, list):
+            return value
+        return [construct(model, item) if isinstance(item, dict) else item for item in value]
+
+    return convert
+
+
+class FieldPlan(NamedTuple):
+    """How to read one field of a model from its JSON object.
+
+    :param name: the field name
+    :param alias: the JSON key of the field, which may be its name
+    :param convert: converts the JSON value to the field's type, or None for a plain field whose
+        JSON value is used as it is
+    :param default: returns the value of a field missing from the JSON object
+    :param max_length: the greatest number of items of a list field, or characters of a string
+        field, or None if it is not limited
+    """
+
+    name: str
+    alias: str
+    convert: Optional[Convert]
+    default: Callable[[], Any]
+    max_length: Optional[int]
+
+
+_field_plans: Dict[Type[BaseModel], List[FieldPlan]] = {}
+
+
+def field_plans(model: Type[BaseModel]) -> List[FieldPlan]:
+    """
+    Describes how to read each field of a model from a JSON object the server sent, without
+    validating the model as a whole.
+
+    :param model: the model type
+
+    :returns: a plan for each field, in the model's field order
+    """
+    plans = _field_plans.get(model)
+    if plans is not None:
+        return plans
+    plans = []
+    for name, alias, annotation, default, max_length in _fields(model):
+        validated = _has_validators(model, name)
+        convert: Optional[Convert] = None
+        if validated or not _is_plain(annotation):
+            nested = None if validated else _model_of(annotation)
+            if nested is None:
+                convert = _validator(model, name)
+            else:
+                convert = _nested_list(nested[0]) if nested[1] else _nested(nested[0])
+        plans.append(FieldPlan(name, alias, convert, default, max_length))
+    return _field_plans.setdefault(model, plans)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _plan(model: Type[BaseModel]) -> _Plan:
+    trusted: Type[BaseModel] = type(model)(  # type: ignore[misc]
+        model.__name__,
+        (_TrustedModel, model),
+        {"__slots__": ("_raw",), "__module__": model.__module__, "__qualname__": model.__qualname__},
+    )
+    # set once the class exists, as pydantic 2 would treat it as a private attribute in the class body
+    setattr(trusted, "_base", model)
+    names: List[str] = []
+    lazy: List[str] = []
+    keys: Dict[str, Tuple[str, bool]] = {}
+    template: Dict[str, Any] = {}
+    for name, alias, convert, default, _ in field_plans(model):
+        names.append(name)
+        if convert is None and isinstance(default(), _IMMUTABLE_TYPES):
+            template[name] = default()
+            keys[alias] = keys[name] = (name, False)
+            continue
+        # a plain field with a mutable default is lazy so each model gets its own default
+        setattr(trusted, name, _LazyField(name, convert or _identity, default))
+        lazy.append(name)
+        keys[alias] = keys[name] = (name, True)
+    plan = _Plan(trusted, names, lazy, keys, template)
+    # building a plan twice in concurrent threads is harmless, one of the two is kept
+    return _plans.setdefault(model, plan)
+
+
+def construct(model: Type[ModelT], obj: Any) -> ModelT:
+    """
+    Builds a model from a decoded JSON object the runZero server sent, without validating it.
+
+    Fields are converted from their JSON values when first read, and conversion errors surface then.
+    Validate data which did not come from the server with :func:`runzero._pydantic.parse` instead.
+
+    :param model: the model type
+    :param obj: the decoded JSON object
+
+    :returns: the model instance, whose type is a subclass of model
+    :raises: ValidationError if obj is not a JSON object, or model is a root model which is validated
+    """
+    if not isinstance(obj, dict) or _is_root(model):
+        # pylint: disable-next=import-outside-toplevel
+        from runzero._pydantic import parse
+
+        return parse(model, obj)
+    plan = _plans.get(model) or _plan(model)
+    values = plan.template.copy()
+    raw: Dict[str, Any] = {}
+    fields_set: Set[str] = set()
+    keys = plan.keys
+    for key, value in obj.items():
+        target = keys.get(key)
+        if target is None:
+            continue
+        name, lazy = target
+        if lazy:
+            raw[name] = value
+        else:
+            values[name] = value
+        fields_set.add(name)
+    return _new(plan.trusted, values, raw, fields_set)
+
+
+def is_trusted(model: BaseModel) -> bool:
+    """
+    Whether a model was built by :func:`construct`, and so may hold values which were never validated.
+
+    :param model: the model
+
+    :returns: True for a trusted model
+    """
+    return isinstance(model, _Trusted)
@@ -2,32 +2,98 @@
 api provides all the classes which manage access to runZero http resources and endpoints
 """
 
-from .admin import (
-    CustomIntegrationAssetAdmin,
-    CustomIntegrationsAdmin,
-    OrgsAdmin,
-    TasksAdmin,
-    TemplatesAdmin,
-)
-from .custom_integrations import CustomIntegrations
-from .explorers import Explorers
-from .hosted_zones import HostedZones
-from .imports import CustomAssets
-from .scans import Scans
-from .sites import Sites
-from .tasks import Tasks
+from typing import TYPE_CHECKING
+
+from runzero._lazy import attach
+
+if TYPE_CHECKING:
+    from .admin import (
+        CustomIntegrationAssetAdmin,
+        CustomIntegrationsAdmin,
+        OrgsAdmin,
+        TasksAdmin,
+        TemplatesAdmin,
+    )
+    from .custom_integrations import CustomIntegrations
+    from .explorers import Explorers
+    from .hosted_zones import HostedZones
+    from .imports import (
+        AssetBatch,
+        AssetChunk,
+        AssetMapping,
+        AssetMerger,
+        CustomAssets,
+        MappedAssets,
+        MatchIndex,
+        MergeReport,
+        RecordError,
+        SharingReport,
+        build_asset_chunks,
+        read_csv,
+    )
+    from .scans import Scans
+    from .sites import Sites
+    from .tasks import Tasks, TaskStatusChange, TaskWaitTimeoutError
 
 __all__ = [
+    "AssetBatch",
+    "AssetChunk",
+    "AssetMapping",
+    "AssetMerger",
+    "build_asset_chunks",
     "CustomAssets",
     "CustomIntegrations",
     "CustomIntegrationsAdmin",
     "CustomIntegrationAssetAdmin",
     "Explorers",
     "HostedZones",
+    "MappedAssets",
+    "MatchIndex",
+    "MergeReport",
     "OrgsAdmin",
+    "read_csv",
+    "RecordError",
     "Scans",
+    "SharingReport",
     "Sites",
+    "TaskStatusChange",
     "Tasks",
+    "TaskWaitTimeoutError",
     "TasksAdmin",
     "TemplatesAdmin",
 ]
+
+# each API module is imported on first use
+__getattr__, __dir__ = attach(
+    __name__,
+    globals(),
+    {
+        "admin": None,
+        "imports": None,
+        "AssetBatch": ".imports",
+        "AssetChunk": ".imports",
+        "AssetMapping": ".imports",
+        "AssetMerger": ".imports",
+        "build_asset_chunks": ".imports",
+        "CustomAssets": ".imports",
+        "CustomIntegrations": ".custom_integrations",
+        "CustomIntegrationsAdmin": ".admin",
+        "CustomIntegrationAssetAdmin": ".admin",
+        "Explorers": ".explorers",
+        "HostedZones": ".hosted_zones",
+        "MappedAssets": ".imports",
+        "MatchIndex": ".imports",
+        "MergeReport": ".imports",
+        "OrgsAdmin": ".admin",
+        "read_csv": ".imports",
+        "RecordError": ".imports",
+        "Scans": ".scans",
+        "SharingReport": ".imports",
+        "Sites": ".sites",
+        "TaskStatusChange": ".tasks",
+        "Tasks": ".tasks",
+        "TaskWaitTimeoutError": ".tasks",
+        "TasksAdmin": ".admin",
+        "TemplatesAdmin": ".admin",
+    },
+)
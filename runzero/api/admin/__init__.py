@@ -3,9 +3,17 @@ admin holds API interactions which require 'account' level authorization. These
 broad effects across a customer estate and, as such, are kept separately from other API.
 """
 
-from .custom_integrations import CustomIntegrationAssetAdmin, CustomIntegrationsAdmin
-from .orgs import OrgsAdmin
-from .tasks import TasksAdmin, TemplatesAdmin
+from typing import TYPE_CHECKING
+
+from runzero._lazy import attach
+
+if TYPE_CHECKING:
+    from .custom_integrations import (
+        CustomIntegrationAssetAdmin,
+        CustomIntegrationsAdmin,
+    )
+    from .orgs import OrgsAdmin
+    from .tasks import TasksAdmin, TemplatesAdmin
 
 __all__ = [
     "CustomIntegrationsAdmin",
@@ -14,3 +22,16 @@ __all__ = [
     "TemplatesAdmin",
     "TasksAdmin",
 ]
+
+# each admin API module is imported on first use
+__getattr__, __dir__ = attach(
+    __name__,
+    globals(),
+    {
+        "CustomIntegrationsAdmin": ".custom_integrations",
+        "CustomIntegrationAssetAdmin": ".custom_integrations",
+        "OrgsAdmin": ".orgs",
+        "TemplatesAdmin": ".tasks",
+        "TasksAdmin": ".tasks",
+    },
+)
@@ -8,11 +8,13 @@ import base64
 import pathlib
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
+from runzero._pydantic import root
 from runzero.client import Client
+from runzero.client._http.io import Response
 from runzero.errors import Error
 from runzero.types import (
     BaseCustomIntegration,
@@ -45,11 +47,6 @@ class CRUDAsset(BaseModel):
     A Pydantic-compliant class for marshaling custom assets.
     """
 
-    class Config:
-        "Inner config class."
-
-        allow_population_by_field_name = True
-
     id: str = Field(..., max_length=1024)
     macs: Optional[List[str]] = Field(None)
     addresses: Optional[List[str]] = Field(None)
@@ -74,7 +71,7 @@ class CRUDAsset(BaseModel):
         self.macs = []
         self.addresses = []
         self.addresses_extra = []
-        self.hostnames = [hostname.__root__ for hostname in import_asset.hostnames] if import_asset.hostnames else []
+        self.hostnames = [root(hostname) for hostname in import_asset.hostnames] if import_asset.hostnames else []
         self.domains = [import_asset.domain] if import_asset.domain else []
         self.first_seen = 0
         self.os = import_asset.os or ""
@@ -90,7 +87,7 @@ class CRUDAsset(BaseModel):
             self.first_seen = int(import_asset.first_seen_ts.timestamp())
 
         if import_asset.tags:
-            self.tags = "\t".join(tag.__root__ for tag in import_asset.tags)
+            self.tags = "\t".join(root(tag) for tag in import_asset.tags)
 
         if import_asset.custom_attributes is not None:
             for key, value in import_asset.custom_attributes.items():
@@ -325,10 +322,7 @@ class CustomIntegrationsAdmin:
         :raises: AuthError, ClientError, ServerError
         """
         res = self._client.execute("GET", self._ENDPOINT)
-        result: List[CustomIntegration] = []
-        for src in res.json_obj:
-            result.append(_resp_to_source(src))
-        return result
+        return [_decode_icon(src) for src in res.models(CustomIntegration)]
 
     def get(
         self, name: Optional[str] = None, custom_integration_id: Optional[uuid.UUID] = None
@@ -347,7 +341,7 @@ class CustomIntegrationsAdmin:
             raise ValueError("must provide custom_integration_id or source name")
         if custom_integration_id is not None:
             res = self._client.execute("GET", f"{self._ENDPOINT}/{custom_integration_id}")
-            return _resp_to_source(res.json_obj)
+            return _resp_to_source(res)
         # name
         for src in self.get_all():
             if src.name == name:
@@ -404,7 +398,7 @@ class CustomIntegrationsAdmin:
             icon = base64.b64encode(icon).decode("utf-8")
         req = NewCustomIntegration(name=name, description=description, icon=icon)
         res = self._client.execute("POST", self._ENDPOINT, data=req)
-        return _resp_to_source(res.json_obj)
+        return _resp_to_source(res)
 
     def update(self, custom_integration_id: uuid.UUID, source_options: BaseCustomIntegration) -> CustomIntegration:
         """
@@ -417,7 +411,7 @@ class CustomIntegrationsAdmin:
         :raises: AuthError, ClientError, ServerError
         """
         res = self._client.execute("PATCH", f"{self._ENDPOINT}/{custom_integration_id}", data=source_options)
-        return _resp_to_source(res.json_obj)
+        return _resp_to_source(res)
 
     def delete(self, custom_integration_id: uuid.UUID) -> CustomIntegration:
         """
@@ -429,11 +423,14 @@ class CustomIntegrationsAdmin:
         :raises: AuthError, ClientError, ServerError
         """
         res = self._client.execute("DELETE", f"{self._ENDPOINT}/{custom_integration_id}")
-        return _resp_to_source(res.json_obj)
+        return _resp_to_source(res)
+
+
+def _resp_to_source(res: Response) -> CustomIntegration:
+    return _decode_icon(res.model(CustomIntegration))
 
 
-def _resp_to_source(json_obj: Any) -> CustomIntegration:
-    source = CustomIntegration.parse_obj(json_obj)
+def _decode_icon(source: CustomIntegration) -> CustomIntegration:
     if source.icon is not None:
         source.icon = base64.b64decode(source.icon)
     return source
@@ -32,10 +32,7 @@ class OrgsAdmin:
         :raises: AuthError, ClientError, ServerError
         """
         res = self._client.execute("GET", self._ENDPOINT)
-        result: List[Organization] = []
-        for org in res.json_obj:
-            result.append(Organization.parse_obj(org))
-        return result
+        return res.models(Organization)
 
     def get(self, org_id: Optional[uuid.UUID] = None, name: Optional[str] = None) -> Optional[Organization]:
         """
@@ -51,7 +48,7 @@ class OrgsAdmin:
             raise ValueError("must provide org_id or organization name")
         if org_id is not None:
             res = self._client.execute("GET", f"{self._ENDPOINT}/{org_id}")
-            return Organization.parse_obj(res.json_obj)
+            return res.model(Organization)
         # name
         for org in self.get_all():
             if org.name == name:
@@ -72,7 +69,7 @@ class OrgsAdmin:
         if data_obj:
             obj = data_obj
 
-        return Organization.parse_obj(obj)
+        return res.model(Organization, obj)
 
     def update(self, org_id: uuid.UUID, org_options: OrgOptions) -> Optional[Organization]:
         """
@@ -84,7 +81,7 @@ class OrgsAdmin:
         :raises: AuthError, ClientError, ServerError
         """
         res = self._client.execute("PATCH", f"{self._ENDPOINT}/{org_id}", data=org_options)
-        return Organization.parse_obj(res.json_obj)
+        return res.model(Organization)
 
     def delete(self, org_id: uuid.UUID) -> None:
         """
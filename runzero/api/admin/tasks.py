@@ -41,11 +41,7 @@ class TasksAdmin:
         if status is not None:
             params["status"] = status.strip()
         res = self._client.execute("GET", self._ENDPOINT, params=params)
-        result: List[Task] = []
-        for obj in res.json_obj:
-            task = Task.parse_obj(obj)
-            result.append(task)
-        return result
+        return res.models(Task)
 
 
 class TemplatesAdmin:
@@ -75,11 +71,7 @@ class TemplatesAdmin:
         if query is not None:
             params["search"] = query.strip()
         res = self._client.execute("GET", f"{self._ENDPOINT}", params=params)
-        result: List[ScanTemplate] = []
-        for obj in res.json_obj:
-            template = ScanTemplate.parse_obj(obj)
-            result.append(template)
-        return result
+        return res.models(ScanTemplate)
 
     def get(self, name: Optional[str] = None, scan_template_id: Optional[uuid.UUID] = None) -> Optional[ScanTemplate]:
         """
@@ -96,7 +88,7 @@ class TemplatesAdmin:
             raise ValueError("must provide scan_template_id or scan template name")
         if scan_template_id is not None:
             res = self._client.execute("GET", f"{self._ENDPOINT}/{scan_template_id}")
-            return ScanTemplate.parse_obj(res.json_obj)
+            return res.model(ScanTemplate)
 
         for scan_template in self.get_all():
             if scan_template.name == name:
@@ -113,7 +105,7 @@ class TemplatesAdmin:
         :raises: AuthError, ClientError, ServerError
         """
         res = self._client.execute("POST", f"{self._ENDPOINT}", data=scan_template_options)
-        return ScanTemplate.parse_obj(res.json_obj)
+        return res.model(ScanTemplate)
 
     def update(
         self,
@@ -132,7 +124,7 @@ class TemplatesAdmin:
         :raises: AuthError, ClientError, ServerError
         """
         res = self._client.execute("PUT", f"{self._ENDPOINT}", data=new_scan_template_values)
-        return ScanTemplate.parse_obj(res.json_obj)
+        return res.model(ScanTemplate)
 
     def delete(self, scan_template_id: uuid.UUID) -> None:
         """
@@ -4,9 +4,10 @@ enables standard access to of runZero custom integrations, limited to read opera
 
 import base64
 import uuid
-from typing import Any, List, Optional
+from typing import List, Optional
 
 from runzero.client import Client
+from runzero.client._http.io import Response
 from runzero.types import CustomIntegration
 
 
@@ -38,10 +39,7 @@ class CustomIntegrations:
 
         params = {"_oid": org_id}
         res = self._client.execute("GET", self._ENDPOINT, params=params)
-        result: List[CustomIntegration] = []
-        for src in res.json_obj:
-            result.append(_resp_to_source(src))
-        return result
+        return [_decode_icon(src) for src in res.models(CustomIntegration)]
 
     def get(
         self, org_id: uuid.UUID, name: Optional[str] = None, custom_integration_id: Optional[uuid.UUID] = None
@@ -62,7 +60,7 @@ class CustomIntegrations:
             raise ValueError("must provide custom_integration_id or source name")
         if custom_integration_id is not None:
             res = self._client.execute("GET", f"{self._ENDPOINT}/{custom_integration_id}", params=params)
-            return _resp_to_source(res.json_obj)
+            return _resp_to_source(res)
         # name
         for src in self.get_all(org_id):
             if src.name == name:
@@ -70,8 +68,11 @@ class CustomIntegrations:
         return None
 
 
-def _resp_to_source(json_obj: Any) -> CustomIntegration:
-    source = CustomIntegration.parse_obj(json_obj)
+def _resp_to_source(res: Response) -> CustomIntegration:
+    return _decode_icon(res.model(CustomIntegration))
+
+
+def _decode_icon(source: CustomIntegration) -> CustomIntegration:
     if source.icon is not None:
         source.icon = base64.b64decode(source.icon)
     return source
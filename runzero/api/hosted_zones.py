@@ -6,7 +6,7 @@ import uuid
 from typing import List, Optional
 
 from runzero.client import Client
-from runzero.types import HostedZone
+from runzero.types import HostedZone, HostedZoneView
 
 __all__ = [
     "HostedZones",
@@ -45,10 +45,21 @@ class HostedZones:
         """
         params = {"_oid": org_id}
         res = self._client.execute("GET", self._ENDPOINT, params=params)
-        result: List[HostedZone] = []
-        for hosted_zone in res.json_obj:
-            result.append(HostedZone.parse_obj(hosted_zone))
-        return result
+        return res.models(HostedZone)
+
+    def get_all_views(self, org_id: uuid.UUID) -> List[HostedZoneView]:
+        """
+        Retrieves all active runZero hosted zones available within the given organization as read-only views, which
+        take a fraction of the memory of :meth:`get_all`'s models when scanning many of them.
+
+        :param org_id: The ID of the organization to operate against
+
+        :returns: a list of :class:`runzero.types.HostedZoneView`, whose ``to_model()`` returns the HostedZone
+        :raises: AuthError, ClientError, ServerError
+        """
+        params = {"_oid": org_id}
+        res = self._client.execute("GET", self._ENDPOINT, params=params)
+        return res.views(HostedZoneView)
 
     def get(
         self, org_id: uuid.UUID, name: Optional[str] = None, hosted_zone_id: Optional[uuid.UUID] = None
@@ -72,7 +83,7 @@ class HostedZones:
             res = self._client.execute("GET", f"{self._ENDPOINT}/{hosted_zone_id}", params=params)
             if not res:
                 return None
-            return HostedZone.parse_obj(res.json_obj)
+            return res.model(HostedZone)
         # name
         for hosted_zone in self.get_all(org_id):
             if hosted_zone.name == name:
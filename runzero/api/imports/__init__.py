@@ -6,7 +6,24 @@ may be loaded via CSV via the web console.
 """
 
 from .assets import CustomAssets
+from .batch import AssetBatch, SharingReport
+from .mapping import AssetMapping, MappedAssets
+from .matching import MatchIndex
+from .merge import AssetMerger, MergeReport
+from .parallel import AssetChunk, RecordError, build_asset_chunks
+from .readers import read_csv
 
 __all__ = [
     "CustomAssets",
+    "AssetBatch",
+    "SharingReport",
+    "AssetMapping",
+    "MappedAssets",
+    "MatchIndex",
+    "AssetMerger",
+    "MergeReport",
+    "AssetChunk",
+    "RecordError",
+    "build_asset_chunks",
+    "read_csv",
 ]
@@ -0,0 +1,143 @@
+"""
+arrow streams Parquet files, Arrow data and pandas DataFrames as batches of records for an
+:class:`runzero.api.imports.AssetMapping`, as :func:`runzero.api.imports.read_csv` does for CSV.
+
+Data is read an Arrow record batch at a time and converted to Python a column at a time. Columns
+which are dictionary encoded, as Parquet writers store columns of repeated values such as OS names,
+are converted once per distinct value and share its string among the rows. This module needs
+pyarrow, which is installed with the ``arrow`` extra: ``pip install runzero-sdk[arrow]``. Reading
+DataFrames needs pandas too, which is installed with the ``pandas`` extra.
+"""
+
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+__all__ = [
+    "read_arrow",
+    "read_dataframe",
+    "read_parquet",
+]
+
+Record = Dict[str, Any]
+
+ArrowSource = Union[str, "os.PathLike[str]", pa.Table, pa.RecordBatch, pa.RecordBatchReader, Iterable[pa.RecordBatch]]
+"""Arrow data: the path of an Arrow IPC file, a table, or record batches"""
+
+
+def _column(array: pa.Array) -> List[Any]:
+    """The values of a column, converting each value of a dictionary encoded column once."""
+    if pa.types.is_dictionary(array.type) and len(array.dictionary) < len(array):
+        values = array.dictionary.to_pylist()
+        return [None if index is None else values[index] for index in array.indices.to_pylist()]
+    return array.to_pylist()
+
+
+def _records(batch: pa.RecordBatch) -> List[Record]:
+    """The records of a batch keyed by column name, leaving out null values."""
+    names = batch.schema.names
+    columns = [_column(column) for column in batch.columns]
+    return [{name: value for name, value in zip(names, row) if value is not None} for row in zip(*columns)]
+
+
+def _slices(batches: Iterable[pa.RecordBatch], batch_size: int) -> Iterator[List[Record]]:
+    for batch in batches:
+        for offset in range(0, batch.num_rows, batch_size):
+            yield _records(batch.slice(offset, batch_size))
+
+
+def _file_batches(path: Union[str, "os.PathLike[str]"]) -> Iterator[pa.RecordBatch]:
+    with pa.memory_map(os.fspath(path)) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i)
+
+
+def _check(batch_size: int) -> None:
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+
+def read_arrow(source: ArrowSource, *, batch_size: int = 10000) -> Iterator[List[Record]]:
+    """
+    Reads Arrow data in batches of records keyed by column name, which an AssetMapping converts to
+    ImportAssets with the column names as paths. Nested columns become nested objects and lists.
+
+    Null values are left out of their records, so the mapping treats them as missing values.
+
+    :param source: the path of an Arrow IPC file, which is memory mapped, a table, or record batches
+        such as a RecordBatchReader
+    :param batch_size: the greatest number of rows in each batch; larger record batches are split
+
+    :returns: an iterator of the batches of records
+    :raises: ValueError if batch_size is less than 1
+    """
+    _check(batch_size)
+    batches: Iterable[pa.RecordBatch]
+    if isinstance(source, (str, os.PathLike)):
+        batches = _file_batches(source)
+    elif isinstance(source, pa.Table):
+        batches = source.to_batches(max_chunksize=batch_size)
+    elif isinstance(source, pa.RecordBatch):
+        batches = [source]
+    else:
+        batches = source
+    return _slices(batches, batch_size)
+
+
+def _parquet_batches(
+    source: Any, batch_size: int, columns: Optional[Sequence[str]], read_dictionary: Optional[Sequence[str]]
+) -> Iterator[pa.RecordBatch]:
+    parquet = pq.ParquetFile(source, read_dictionary=read_dictionary)
+    try:
+        yield from parquet.iter_batches(batch_size=batch_size, columns=columns)
+    finally:
+        parquet.close()
+
+
+def read_parquet(
+    source: Any,
+    *,
+    batch_size: int = 10000,
+    columns: Optional[Sequence[str]] = None,
+    read_dictionary: Optional[Sequence[str]] = None,
+) -> Iterator[List[Record]]:
+    """
+    Reads a Parquet file in batches of records keyed by column name, reading one batch of rows
+    from the file at a time. See :func:`read_arrow`.
+
+    :param source: the path of the file, or a binary file object
+    :param batch_size: the number of rows in each batch
+    :param columns: Optional names of the columns to read, which skips reading the others
+    :param read_dictionary: Optional names of columns of repeated strings to read dictionary
+        encoded, which converts each of their distinct values once per batch
+
+    :returns: an iterator of the batches of records
+    :raises: ValueError if batch_size is less than 1
+    """
+    _check(batch_size)
+    return _slices(_parquet_batches(source, batch_size, columns, read_dictionary), batch_size)
+
+
+def _frame_batches(frame: Any, batch_size: int, preserve_index: bool) -> Iterator[pa.RecordBatch]:
+    for offset in range(0, len(frame), batch_size):
+        yield pa.RecordBatch.from_pandas(frame.iloc[offset : offset + batch_size], preserve_index=preserve_index)
+
+
+def read_dataframe(frame: Any, *, batch_size: int = 10000, preserve_index: bool = False) -> Iterator[List[Record]]:
+    """
+    Reads a pandas DataFrame in batches of records keyed by column name, converting one batch of
+    rows to Arrow at a time. Missing values, such as None and NaN, are left out of their records.
+    See :func:`read_arrow`.
+
+    :param frame: the DataFrame
+    :param batch_size: the number of rows in each batch
+    :param preserve_index: whether to add the index of the DataFrame to the records as a column
+
+    :returns: an iterator of the batches of records
+    :raises: ValueError if batch_size is less than 1
+    """
+    _check(batch_size)
+    return _slices(_frame_batches(frame, batch_size, preserve_index), batch_size)
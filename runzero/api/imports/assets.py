@@ -8,11 +8,14 @@ import gzip
 import tempfile
 import time
 import uuid
-from typing import Iterable, List, Optional
+from typing import Iterable, Optional, Union
 
+from runzero._pydantic import dump_json, root
 from runzero.client import Client
 from runzero.types import ImportAsset, ImportTask, NewAssetImport, Task
 
+from .parallel import AssetChunk
+
 
 class CustomAssets:
     """Management of Custom Asset Data for your own custom integrations.
@@ -42,7 +45,7 @@ class CustomAssets:
         org_id: uuid.UUID,
         site_id: uuid.UUID,
         custom_integration_id: uuid.UUID,
-        assets: List[ImportAsset],
+        assets: Iterable[ImportAsset],
         task_info: Optional[ImportTask] = None,
     ) -> Task:
         """
@@ -60,13 +63,52 @@ class CustomAssets:
         :param org_id: Organization ID to import these assets into
         :param site_id: ID of the Site to import these asstes into
         :param custom_integration_id: custom integration id for the provided Import Assets
-        :param assets: A collection of ImportAssets to upload
+        :param assets: A collection of ImportAssets to upload, which may be an iterator, such as a
+            generator building the assets as they are uploaded
+        :param task_info: Descriptive information associated with the import
+            task to be created. If omitted, a task name is generated for you
+
+        :returns: Task: The runZero task associated with processing the asset upload
+        :raises: ServerError, ClientError, AuthError
+        """
+        return self._upload(org_id, site_id, custom_integration_id, _import_assets_into_gzip_jsonl(assets), task_info)
+
+    def upload_asset_chunks(
+        self,
+        org_id: uuid.UUID,
+        site_id: uuid.UUID,
+        custom_integration_id: uuid.UUID,
+        chunks: Iterable[Union[AssetChunk, bytes]],
+        task_info: Optional[ImportTask] = None,
+    ) -> Task:
+        """
+        Upload custom assets already serialized as chunks of gzip-compressed JSONL, such as those
+        :func:`runzero.api.imports.build_asset_chunks` builds, as one import task.
+
+        The chunks are concatenated into one gzip stream, so the assets are not decompressed or
+        validated again.
+
+        :param org_id: Organization ID to import these assets into
+        :param site_id: ID of the Site to import these assets into
+        :param custom_integration_id: custom integration id for the provided assets
+        :param chunks: AssetChunks, or gzip-compressed JSONL of ImportAssets
         :param task_info: Descriptive information associated with the import
             task to be created. If omitted, a task name is generated for you
 
         :returns: Task: The runZero task associated with processing the asset upload
         :raises: ServerError, ClientError, AuthError
         """
+        asset_data = b"".join(chunk if isinstance(chunk, bytes) else chunk.data for chunk in chunks)
+        return self._upload(org_id, site_id, custom_integration_id, asset_data, task_info)
+
+    def _upload(
+        self,
+        org_id: uuid.UUID,
+        site_id: uuid.UUID,
+        custom_integration_id: uuid.UUID,
+        asset_data: bytes,
+        task_info: Optional[ImportTask],
+    ) -> Task:
         # create default task_info not supplied
         if task_info is None:
             task_info = ImportTask(name=f"Custom Asset Import {time.time_ns():.0f}", description="py-sdk import")
@@ -79,16 +121,16 @@ class CustomAssets:
             if task_info.exclude_unknown is None:
                 task_info.exclude_unknown = False
 
-        asset_import_req = _create_custom_asset_request(
+        asset_import_req = NewAssetImport(
             site_id=site_id,
             custom_integration_id=custom_integration_id,
             import_task=task_info,
-            assets=assets,
+            asset_data=asset_data,
         )
 
         tags_as_str = ""
         if asset_import_req.import_task.tags is not None:
-            tags_as_str = ",".join([tag.__root__ for tag in asset_import_req.import_task.tags])
+            tags_as_str = ",".join([root(tag) for tag in asset_import_req.import_task.tags])
         multipart_form_data = (
             ("assetData", ("asset_data.jsonl.gz", asset_import_req.asset_data)),
             ("siteId", (None, str(asset_import_req.site_id))),
@@ -100,24 +142,13 @@ class CustomAssets:
             ("importTask.tags", (None, tags_as_str)),
         )
         res = self._client.execute("POST", self._ENDPOINT.format(oid=org_id), files=multipart_form_data, multipart=True)
-        return Task.parse_obj(res.json_obj)
+        return res.model(Task)
 
 
 def _import_assets_into_gzip_jsonl(import_assets: Iterable[ImportAsset]) -> bytes:
     tmp = tempfile.TemporaryFile(mode="w+b")
     with gzip.GzipFile(fileobj=tmp, mode="wb") as gzw:
         for asset_obj in import_assets:
-            gzw.write(asset_obj.json(by_alias=True).encode("utf-8") + "\n".encode("utf-8"))
+            gzw.write(dump_json(asset_obj, by_alias=True).encode("utf-8") + "\n".encode("utf-8"))
     tmp.seek(0)
     return tmp.read()
-
-
-def _create_custom_asset_request(
-    site_id: uuid.UUID, custom_integration_id: uuid.UUID, assets: Iterable[ImportAsset], import_task: ImportTask
-) -> NewAssetImport:
-    return NewAssetImport(
-        site_id=site_id,
-        custom_integration_id=custom_integration_id,
-        import_task=import_task,
-        asset_data=_import_assets_into_gzip_jsonl(assets),
-    )
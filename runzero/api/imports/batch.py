@@ -0,0 +1,230 @@
+"""
+batch builds the ImportAssets of large uploads.
+
+Values such as operating systems, manufacturers, tags and software records repeat across thousands
+of assets of one import, yet every decoded JSON object and validated model holds its own copy.
+An :class:`AssetBatch` which shares values keeps one copy of each, which can reduce the memory of a
+large batch severalfold.
+"""
+
+import sys
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from runzero._pydantic import PYDANTIC_V2, parse
+from runzero.types import ImportAsset
+from runzero.types._data_models_gen import Hostname, Software, Tag, Vulnerability
+
+__all__ = [
+    "AssetBatch",
+    "SharingReport",
+]
+
+# equal instances of these types, and of the SDK's types which wrap them, are shared among assets
+_SHARED_TYPES = (Hostname, Software, Tag, Vulnerability)
+
+# the per-instance state of models, besides their field values in __dict__
+_MODEL_STATE = (
+    ("__pydantic_fields_set__", "__pydantic_extra__", "__pydantic_private__") if PYDANTIC_V2 else ("__fields_set__",)
+)
+
+
+class SharingReport(NamedTuple):
+    """
+    How much an :class:`AssetBatch` saved by sharing values among its assets.
+
+    :param assets: the number of assets in the batch
+    :param strings: the number of distinct strings the batch holds
+    :param objects: the number of distinct tags, hostnames, software and vulnerability records the
+        batch holds
+    :param strings_shared: the number of duplicate strings replaced by an equal one
+    :param objects_shared: the number of duplicate objects replaced by an equal one
+    :param bytes_saved: an estimate of the memory held by the replaced duplicates, which is freed
+        once nothing else refers to them, less the memory of the tables through which the batch
+        finds equal values
+    """
+
+    assets: int
+    strings: int
+    objects: int
+    strings_shared: int
+    objects_shared: int
+    bytes_saved: int
+
+
+class AssetBatch:
+    """
+    AssetBatch builds the ImportAssets of one upload, optionally sharing repeated values among them.
+
+    With ``share_values``, every string of an asset is replaced by an equal string held by the
+    batch, and equal :class:`runzero.types.Tag`, :class:`runzero.types.Hostname`,
+    :class:`runzero.types.Software` and :class:`runzero.types.Vulnerability` objects become one
+    object used by every asset which has it. Shared objects appear in many assets, so modify a copy
+    rather than the object itself. The batch holds a reference to each distinct value until it is
+    freed.
+
+    Upload the batch with :meth:`runzero.api.CustomAssets.upload_assets`, passing its
+    :attr:`assets`.
+
+    :param share_values: whether to share equal strings and objects among the assets
+    """
+
+    def __init__(self, share_values: bool = False) -> None:
+        self._assets: List[ImportAsset] = []
+        self._share_values = share_values
+        self._strings: Dict[str, str] = {}
+        self._objects: Dict[Hashable, BaseModel] = {}
+        self._strings_shared = 0
+        self._objects_shared = 0
+        self._bytes_saved = 0
+        self._key_bytes = 0
+
+    @property
+    def assets(self) -> List[ImportAsset]:
+        """The assets of the batch, in the order they were added."""
+        return self._assets
+
+    def add(self, asset: Union[ImportAsset, Mapping[str, Any]]) -> ImportAsset:
+        """
+        Adds an asset to the batch.
+
+        :param asset: an ImportAsset, whose values may be replaced by shared equal values, or the
+            decoded JSON object of one
+
+        :returns: the asset added
+        :raises: ValidationError
+        """
+        if not isinstance(asset, ImportAsset):
+            asset = parse(ImportAsset, asset)
+        if self._share_values:
+            self._share_fields(asset)
+        self._assets.append(asset)
+        return asset
+
+    def extend(self, assets: Iterable[Union[ImportAsset, Mapping[str, Any]]]) -> None:
+        """
+        Adds assets to the batch.
+
+        :param assets: ImportAssets or their decoded JSON objects
+
+        :raises: ValidationError
+        """
+        for asset in assets:
+            self.add(asset)
+
+    def sharing(self) -> SharingReport:
+        """
+        Reports how much sharing values saved, which is nothing unless the batch shares values.
+
+        :returns: the report
+        """
+        saved = 0
+        if self._share_values:
+            tables = self._key_bytes + sys.getsizeof(self._strings) + sys.getsizeof(self._objects)
+            saved = self._bytes_saved - tables
+        return SharingReport(
+            assets=len(self._assets),
+            strings=len(self._strings),
+            objects=len(self._objects),
+            strings_shared=self._strings_shared,
+            objects_shared=self._objects_shared,
+            bytes_saved=saved,
+        )
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    def __iter__(self) -> Iterator[ImportAsset]:
+        return iter(self._assets)
+
+    def _share_fields(self, model: BaseModel) -> None:
+        fields = model.__dict__
+        for name, value in fields.items():
+            fields[name] = self._share(value)
+
+    def _share(self, value: Any) -> Any:
+        """The shared equal of a value, which becomes shared if it is the first of its kind."""
+        if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+            shared = self._strings.setdefault(value, value)
+            if shared is not value:
+                self._strings_shared += 1
+                self._bytes_saved += sys.getsizeof(value)
+            return shared
+        if isinstance(value, _SHARED_TYPES):
+            return self._share_object(value)
+        if isinstance(value, BaseModel):
+            self._share_fields(value)
+        elif type(value) is list:  # pylint: disable=unidiomatic-typecheck
+            for index, item in enumerate(value):
+                value[index] = self._share(item)
+        elif type(value) is dict:  # pylint: disable=unidiomatic-typecheck
+            return {self._share(key): self._share(item) for key, item in value.items()}
+        return value
+
+    def _share_object(self, value: BaseModel) -> BaseModel:
+        try:
+            key = _freeze(value)
+            shared = self._objects.get(key)
+        except TypeError:
+            # a value which cannot be compared by hashing, such as a set, is never shared
+            self._share_fields(value)
+            return value
+        if shared is None:
+            self._share_fields(value)
+            # the key of the shared object refers to the shared strings
+            key = _freeze(value)
+            self._objects[key] = value
+            self._key_bytes += _key_size(key)
+            return value
+        if shared is not value:
+            self._objects_shared += 1
+            self._bytes_saved += self._size(value)
+        return shared
+
+    def _size(self, value: Any) -> int:
+        """The bytes of a value and what it refers to, not counting the strings the batch shares."""
+        if value is None or type(value) is bool:  # pylint: disable=unidiomatic-typecheck
+            return 0
+        if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+            return 0 if self._strings.get(value) is value else sys.getsizeof(value)
+        size = sys.getsizeof(value)
+        if isinstance(value, BaseModel):
+            size += self._size(value.__dict__)
+            state = (getattr(value, name, None) for name in _MODEL_STATE)
+            size += sum(sys.getsizeof(item) for item in state if item is not None)
+        elif isinstance(value, (list, tuple)):
+            size += sum(self._size(item) for item in value)
+        elif isinstance(value, dict):
+            size += sum(self._size(key) + self._size(item) for key, item in value.items())
+        return size
+
+
+def _freeze(value: Any) -> Hashable:
+    """A hashable key which is equal for equal values, raising TypeError for unhashable values."""
+    if isinstance(value, BaseModel):
+        return (type(value),) + tuple(_freeze(item) for item in value.__dict__.values())
+    if isinstance(value, (list, tuple)):
+        return (list,) + tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return (dict,) + tuple((key, _freeze(item)) for key, item in value.items())
+    hash(value)
+    # keep 1, 1.0 and True apart, which are equal but serialize differently
+    return value if type(value) is str else (type(value), value)  # pylint: disable=unidiomatic-typecheck
+
+
+def _key_size(key: Any) -> int:
+    """The bytes of the tuples of a key, whose other values are held by the shared object."""
+    if type(key) is not tuple:  # pylint: disable=unidiomatic-typecheck
+        return 0
+    return sys.getsizeof(key) + sum(_key_size(item) for item in key)
@@ -0,0 +1,366 @@
+"""
+mapping converts the records of other systems, such as the JSON objects of their APIs, into
+ImportAssets according to a declarative mapping.
+
+A mapping names where each ImportAsset field is found in a record. It is compiled once, when the
+:class:`AssetMapping` is created, into a list of steps which convert each record without
+re-reading the mapping. The mapping is plain data, so connectors may load it from a configuration
+file: ``AssetMapping(**json.load(file))``.
+"""
+
+import copy
+import datetime
+import json
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from runzero._pydantic import parse
+from runzero._trusted import field_plans
+from runzero.types import ImportAsset
+
+from .parallel import AssetChunk, RecordError, build_asset_chunks
+
+__all__ = [
+    "AssetMapping",
+    "MappedAssets",
+]
+
+Source = Union[str, Mapping[str, Any]]
+"""Where a value is found in a record: a path, or an object with a path and options"""
+
+_MISSING = object()
+
+# fields holding lists of strings, which a single string from a record is put in
+_STRING_LISTS = {"hostnames", "tags"}
+
+_INTERFACE_KEYS = {"each", "mac_address", "addresses", "ipv4_addresses", "ipv6_addresses"}
+
+
+class MappedAssets(NamedTuple):
+    """
+    The assets a mapping built from records.
+
+    :param assets: the valid assets, in the order of their records
+    :param errors: the records which could not be built into a valid asset
+    """
+
+    assets: List[ImportAsset]
+    errors: List[RecordError]
+
+
+Getter = Callable[[Any], Any]
+
+
+def _keys(path: str) -> Tuple[str, ...]:
+    """The keys of a dotted path."""
+    if not path:
+        raise ValueError("a path must not be empty")
+    return tuple(path.split("."))
+
+
+def _is_list(obj: Any) -> bool:
+    return isinstance(obj, Sequence) and not isinstance(obj, (str, bytes))
+
+
+def _getter(keys: Tuple[str, ...]) -> Getter:
+    """
+    A function reading the value at a path, which returns _MISSING if there is none. Numeric keys
+    index lists, and are looked up as they are written in objects.
+    """
+    indexes = tuple(int(key) if key.isdigit() else None for key in keys)
+    if len(keys) == 1 and indexes[0] is None:
+        key = keys[0]
+
+        def get_one(obj: Any) -> Any:
+            try:
+                return obj[key]
+            except (KeyError, IndexError, TypeError):
+                return _MISSING
+
+        return get_one
+
+    steps = tuple(zip(keys, indexes))
+
+    def get(obj: Any) -> Any:
+        try:
+            for key, index in steps:
+                obj = obj[index] if index is not None and _is_list(obj) else obj[key]
+        except (KeyError, IndexError, TypeError):
+            return _MISSING
+        return obj
+
+    return get
+
+
+class _Step(NamedTuple):
+    """A compiled source: how to read one value from a record."""
+
+    keys: Tuple[str, ...]
+    get: Getter
+    default: Any
+    split: Optional[str]
+
+    def read(self, obj: Any) -> Any:
+        """The value of the source in an object, or its default."""
+        value = self.get(obj)
+        if value is _MISSING or value is None:
+            return copy.deepcopy(self.default) if isinstance(self.default, (list, dict)) else self.default
+        if self.split is not None and isinstance(value, str):
+            return [part.strip() for part in value.split(self.split) if part.strip()]
+        return value
+
+
+def _step(source: Source) -> _Step:
+    if isinstance(source, str):
+        keys = _keys(source)
+        return _Step(keys, _getter(keys), None, None)
+    unknown = set(source) - {"path", "default", "split"}
+    if unknown or "path" not in source:
+        raise ValueError(f"a source must have a path, and may have a default and split, not {sorted(unknown)}")
+    keys = _keys(source["path"])
+    return _Step(keys, _getter(keys), source.get("default"), source.get("split"))
+
+
+def _json_default(value: Any) -> Any:
+    """The JSON of values json does not encode, such as the timestamps of Parquet and Arrow data."""
+    isoformat = getattr(value, "isoformat", None)
+    return isoformat() if isoformat is not None else str(value)
+
+
+def _attribute(value: Any) -> str:
+    """The text of a custom attribute value, writing values other than strings as JSON."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return json.dumps(value, separators=(",", ":"), default=_json_default)
+
+
+def _split_addresses(addresses: Any, ipv4s: List[Any], ipv6s: List[Any]) -> None:
+    """Sorts addresses by IP version, leaving validation of each address to the asset."""
+    for address in addresses if isinstance(addresses, list) else [addresses]:
+        if isinstance(address, str):
+            (ipv6s if ":" in address else ipv4s).append(address)
+        elif getattr(address, "version", None) == 6:
+            ipv6s.append(address)
+        else:
+            ipv4s.append(address)
+
+
+class _Interface(NamedTuple):
+    """A compiled network interface mapping."""
+
+    each: Optional[_Step]
+    mac_address: Optional[_Step]
+    addresses: Optional[_Step]
+    ipv4_addresses: Optional[_Step]
+    ipv6_addresses: Optional[_Step]
+
+    def read(self, record: Any) -> List[Dict[str, Any]]:
+        """The network interfaces of a record which have a MAC or IP address."""
+        if self.each is None:
+            items = [record]
+        else:
+            items = self.each.read(record)
+            if not isinstance(items, list):
+                items = [] if items is None else [items]
+        interfaces = []
+        for item in items:
+            interface: Dict[str, Any] = {}
+            ipv4s: List[Any] = []
+            ipv6s: List[Any] = []
+            if self.mac_address is not None:
+                mac = self.mac_address.read(item)
+                if mac is not None:
+                    interface["mac_address"] = mac
+            for step, column in ((self.ipv4_addresses, ipv4s), (self.ipv6_addresses, ipv6s)):
+                if step is not None:
+                    value = step.read(item)
+                    if value is not None:
+                        column.extend(value if isinstance(value, list) else [value])
+            if self.addresses is not None:
+                value = self.addresses.read(item)
+                if value is not None:
+                    _split_addresses(value, ipv4s, ipv6s)
+            if ipv4s:
+                interface["ipv4_addresses"] = ipv4s
+            if ipv6s:
+                interface["ipv6_addresses"] = ipv6s
+            if interface:
+                interfaces.append(interface)
+        return interfaces
+
+
+def _interface(spec: Mapping[str, Any]) -> _Interface:
+    unknown = set(spec) - _INTERFACE_KEYS
+    if unknown:
+        raise ValueError(f"unknown network interface keys {sorted(unknown)}")
+    steps = {key: _step(spec[key]) if key in spec else None for key in sorted(_INTERFACE_KEYS)}
+    return _Interface(**steps)
+
+
+class AssetMapping:
+    """
+    AssetMapping converts records, such as the JSON objects of another system's API, to the
+    decoded JSON objects of ImportAssets.
+
+    Each source names where a value is found in a record, with a path of keys joined by dots,
+    such as ``"asset_id"`` or ``"system.os.name"``, in which numbers index lists, as in
+    ``"addresses.0"``, and are keys like any other in objects, as in ``"ports.80"``. A source may
+    instead be an object with the path and options:
+
+    * ``default``: the value used when the record has no value at the path, or it is null
+    * ``split``: a separator which splits a string value into a list, such as ``","``
+
+    Missing values without a default are left out of the asset. A string is put in a list for
+    ``hostnames`` and ``tags``.
+
+    Network interfaces are described by objects with sources for ``mac_address``, ``addresses``,
+    whose IPv4 and IPv6 addresses are sorted by version, ``ipv4_addresses`` and
+    ``ipv6_addresses``. With ``each``, the source of a list in the record, the interface is read
+    from each object of the list, relative to which its other paths are read.
+
+    A mapping is a callable mapper for :func:`runzero.api.imports.build_asset_chunks` which can be
+    sent to worker processes.
+
+    :param fields: the source of each ImportAsset field, by field name or alias, except network
+        interfaces and custom attributes
+    :param interfaces: Optional network interface mappings, each of which adds the interfaces it
+        finds in a record to the asset
+    :param custom_attributes: Optional source of each custom attribute, by attribute name. Values
+        other than strings are written as JSON, and dates and times in ISO 8601 format
+    :param leftovers: whether to add every value of a record which no source reads to the custom
+        attributes, keyed by its path. Values of nested objects are added individually, and explicit
+        custom attributes take precedence
+
+    :raises: ValueError if the mapping is invalid
+    """
+
+    def __init__(
+        self,
+        fields: Mapping[str, Source],
+        interfaces: Iterable[Mapping[str, Any]] = (),
+        custom_attributes: Optional[Mapping[str, Source]] = None,
+        leftovers: bool = False,
+    ) -> None:
+        self._spec: Dict[str, Any] = {
+            "fields": dict(fields),
+            "interfaces": [dict(interface) for interface in interfaces],
+            "custom_attributes": dict(custom_attributes or {}),
+            "leftovers": leftovers,
+        }
+        names = {}
+        for plan in field_plans(ImportAsset):
+            names[plan.name] = names[plan.alias] = plan.name
+        self._fields: List[Tuple[str, _Step]] = []
+        for target, source in self._spec["fields"].items():
+            name = names.get(target)
+            if name is None or name in ("network_interfaces", "custom_attributes"):
+                raise ValueError(f"{target} is not an ImportAsset field which may be mapped by a source")
+            self._fields.append((name, _step(source)))
+        self._interfaces = [_interface(interface) for interface in self._spec["interfaces"]]
+        self._attributes = [(name, _step(source)) for name, source in self._spec["custom_attributes"].items()]
+        self._leftovers = leftovers
+        # the paths sources read, and the paths of the objects and lists which hold them
+        self._read: Set[Tuple[str, ...]] = set()
+        for _, step in self._fields + self._attributes:
+            self._read.add(step.keys)
+        for interface in self._interfaces:
+            if interface.each is not None:
+                self._read.add(interface.each.keys)
+            else:
+                self._read.update(step.keys for step in interface[1:] if step is not None)
+        self._holders = {keys[:end] for keys in self._read for end in range(1, len(keys))}
+
+    def __call__(self, record: Any) -> Dict[str, Any]:
+        """
+        Converts a record to the decoded JSON object of an ImportAsset, keyed by field name.
+
+        :param record: the record
+
+        :returns: the object, which is not yet validated
+        """
+        asset: Dict[str, Any] = {}
+        for name, step in self._fields:
+            value = step.read(record)
+            if value is not None:
+                asset[name] = [value] if name in _STRING_LISTS and isinstance(value, str) else value
+        interfaces = []
+        for interface in self._interfaces:
+            interfaces.extend(interface.read(record))
+        if interfaces:
+            asset["network_interfaces"] = interfaces
+        attributes: Dict[str, str] = {}
+        if self._leftovers and isinstance(record, Mapping):
+            self._flatten(record, (), attributes)
+        for name, step in self._attributes:
+            value = step.read(record)
+            if value is not None:
+                attributes[name] = _attribute(value)
+        if attributes:
+            asset["custom_attributes"] = attributes
+        return asset
+
+    def _flatten(self, obj: Mapping[str, Any], path: Tuple[str, ...], attributes: Dict[str, str]) -> None:
+        """Adds the values no source reads to the custom attributes."""
+        for key, value in obj.items():
+            keys = path + (key,)
+            if keys in self._read or value is None:
+                continue
+            if isinstance(value, Mapping):
+                self._flatten(value, keys, attributes)
+            elif isinstance(value, list) and keys in self._holders:
+                # a list from which sources read some items
+                continue
+            else:
+                attributes[".".join(keys)] = _attribute(value)
+
+    def build(self, records: Iterable[Any]) -> MappedAssets:
+        """
+        Converts and validates records in this process.
+
+        :param records: the records
+
+        :returns: the valid assets, and an error for each record which could not be built
+        """
+        assets: List[ImportAsset] = []
+        errors: List[RecordError] = []
+        for position, record in enumerate(records):
+            try:
+                assets.append(parse(ImportAsset, self(record)))
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                errors.append(RecordError(position, f"{type(exc).__name__}: {exc}"))
+        return MappedAssets(assets, errors)
+
+    def chunks(self, records: Iterable[Any], **kwargs: Any) -> Iterator[AssetChunk]:
+        """
+        Converts and validates records in worker processes, as :func:`build_asset_chunks` does
+        with this mapping as the mapper.
+
+        :param records: the records
+        :param kwargs: options of :func:`build_asset_chunks`, such as chunk_size and max_workers
+
+        :returns: an iterator of the chunks, each reporting the records which failed to build
+        """
+        return build_asset_chunks(records, self, **kwargs)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # the mapping is compiled again from its spec in worker processes
+        return _mapping, (self._spec,)
+
+
+def _mapping(spec: Dict[str, Any]) -> AssetMapping:
+    return AssetMapping(**spec)
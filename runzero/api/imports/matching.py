@@ -0,0 +1,435 @@
+"""
+matching resolves the runZero ID of ImportAssets locally, so their imports force a merge into the
+runZero asset they describe.
+
+:class:`MatchIndex` is built once from a runZero asset export in JSONL format, and keeps each MAC
+address, IP address, hostname and external ID of the exported assets in a hash table in a file.
+The file is memory mapped rather than read, so an index of tens of millions of keys is shared with
+the operating system's page cache instead of held in the memory of the process, and opening it again
+costs nothing. Keys are stored as 64-bit hashes, so two keys are confused with a probability of about
+one in ten billion for an index of a million keys.
+"""
+
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import uuid
+from socket import AF_INET, AF_INET6, inet_pton
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from runzero._pydantic import root
+from runzero.types import ImportAsset
+
+__all__ = [
+    "MatchIndex",
+    "foreign_ids",
+]
+
+PathType = Union[str, "os.PathLike[str]"]
+
+KINDS = ("external_id", "mac", "hostname", "ip")
+"""The kinds of keys an index holds, and the default precedence of their matches"""
+
+_PREFIXES = {"external_id": b"e", "mac": b"m", "hostname": b"h", "ip": b"i"}
+
+_MAGIC = b"RZMATCH1"
+# magic, capacity, assets, keys
+_HEADER = struct.Struct("<8sQQQ")
+_ENTRY = struct.Struct("<QI")
+# the asset of a key which several assets have, which matches none of them
+_AMBIGUOUS = 0xFFFFFFFF
+_EMPTY = 0
+_MAC_SEPARATORS = str.maketrans("", "", ":-. ")
+
+
+def _hash(kind: bytes, key: bytes) -> int:
+    value = int.from_bytes(hashlib.blake2b(kind + key, digest_size=8).digest(), "little")
+    # 0 marks an empty slot
+    return value or 1
+
+
+def _mac_key(value: Any) -> Optional[bytes]:
+    if not isinstance(value, str):
+        return None
+    mac = value.translate(_MAC_SEPARATORS).lower()
+    return mac.encode() if mac else None
+
+
+def _ip_key(value: Any) -> Optional[bytes]:
+    packed = getattr(value, "packed", None)
+    if packed is not None:
+        return packed
+    if not isinstance(value, str):
+        return None
+    try:
+        return inet_pton(AF_INET6 if ":" in value else AF_INET, value)
+    except (OSError, ValueError):
+        return None
+
+
+def _hostname_key(value: Any) -> Optional[bytes]:
+    if isinstance(value, BaseModel):
+        value = root(value)
+    if not isinstance(value, str):
+        return None
+    hostname = value.strip().rstrip(".").lower()
+    return hostname.encode() if hostname else None
+
+
+def _external_key(value: Any) -> Optional[bytes]:
+    return str(value).encode() if value is not None and value != "" else None
+
+
+_NORMALIZERS: Dict[str, Callable[[Any], Optional[bytes]]] = {
+    "external_id": _external_key,
+    "mac": _mac_key,
+    "hostname": _hostname_key,
+    "ip": _ip_key,
+}
+
+
+def _strings(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def foreign_ids(record: Mapping[str, Any]) -> List[Any]:
+    """
+    The external IDs of an exported runZero asset: the ``id`` of each of its foreign attribute
+    records, which for assets imported by a custom integration is the ImportAsset's ID.
+
+    :param record: the decoded JSON object of the exported asset
+
+    :returns: the external IDs
+    """
+    ids: List[Any] = []
+    for entries in (record.get("foreign_attributes") or {}).values():
+        for entry in entries if isinstance(entries, list) else [entries]:
+            if isinstance(entry, Mapping):
+                ids.extend(_strings(entry.get("id")))
+    return ids
+
+
+def _export_keys(
+    record: Mapping[str, Any], external_ids: Callable[[Mapping[str, Any]], Iterable[Any]]
+) -> Iterator[Tuple[str, Any]]:
+    for value in external_ids(record):
+        yield "external_id", value
+    for value in _strings(record.get("macs")):
+        yield "mac", value
+    for value in _strings(record.get("names")):
+        yield "hostname", value
+    for value in _strings(record.get("addresses")) + _strings(record.get("addresses_extra")):
+        yield "ip", value
+
+
+def _asset_keys(asset: ImportAsset, kind: str) -> List[Any]:
+    if kind == "external_id":
+        return [asset.id]
+    if kind == "hostname":
+        return list(asset.hostnames or [])
+    keys: List[Any] = []
+    for interface in asset.network_interfaces or []:
+        if kind == "mac":
+            keys.append(interface.mac_address)
+        else:
+            keys.extend(interface.ipv4_addresses or [])
+            keys.extend(interface.ipv6_addresses or [])
+    return keys
+
+
+def _read_export(export: PathType) -> Iterator[Mapping[str, Any]]:
+    path = os.fspath(export)
+    opener: Callable[..., IO[bytes]] = gzip.open if path.endswith(".gz") else open  # type: ignore[assignment]
+    with opener(path, "rb") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _capacity(keys: int) -> int:
+    """A power of two at least twice the number of keys, which keeps probe sequences short."""
+    capacity = 8
+    while capacity < 2 * keys:
+        capacity *= 2
+    return capacity
+
+
+class MatchIndex:
+    """
+    MatchIndex finds the runZero asset an ImportAsset describes by its external ID, the MAC and IP
+    addresses of its network interfaces or its hostnames, in an index built from a runZero asset
+    export by :meth:`build`.
+
+    A key which several exported assets have, such as an IP address assigned to different assets
+    over time, matches none of them. Keys of each kind are tried in the order of the precedence: an
+    asset is matched by the first kind of which its keys match exactly one runZero asset.
+
+    Indexes are opened read only and can be shared by threads and sent to worker processes, which
+    open the file again. ``assets`` is the number of exported assets in the index, and ``keys`` the
+    number of keys they have.
+
+    :param path: the path of an index file built by :meth:`build`
+    :param precedence: the kinds of keys to match by, from ``"external_id"``, ``"mac"``,
+        ``"hostname"`` and ``"ip"``, in the order they are tried
+
+    :raises: ValueError if the file is not an index, or precedence names an unknown kind of key
+    """
+
+    def __init__(self, path: PathType, precedence: Sequence[str] = KINDS) -> None:
+        unknown = [kind for kind in precedence if kind not in _PREFIXES]
+        if unknown:
+            raise ValueError(f"unknown kinds of keys {unknown}, which must be among {list(KINDS)}")
+        self.path = os.fspath(path)
+        self.precedence = tuple(precedence)
+        with open(self.path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _HEADER.size:
+            self._map.close()
+            raise ValueError(f"{self.path} is not a match index")
+        magic, capacity, assets, keys = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or capacity & (capacity - 1) or len(self._map) != _HEADER.size + capacity * 12 + assets * 16:
+            self._map.close()
+            raise ValueError(f"{self.path} is not a match index")
+        self.assets: int = assets
+        self.keys: int = keys
+        self._capacity: int = capacity
+        self._mask = capacity - 1
+        self._view = view = memoryview(self._map)
+        self._hashes = view[_HEADER.size : _HEADER.size + capacity * 8].cast("Q")
+        self._values = view[_HEADER.size + capacity * 8 : _HEADER.size + capacity * 12].cast("I")
+        self._ids = view[_HEADER.size + capacity * 12 :]
+
+    @classmethod
+    def build(
+        cls,
+        path: PathType,
+        export: Union[PathType, Iterable[Mapping[str, Any]]],
+        *,
+        external_ids: Callable[[Mapping[str, Any]], Iterable[Any]] = foreign_ids,
+        precedence: Sequence[str] = KINDS,
+    ) -> "MatchIndex":
+        """
+        Builds an index file from a runZero asset export and opens it.
+
+        The export is read once, writing its keys to a temporary file beside the index, which are
+        then inserted into a table sized for them, so building holds neither the export nor its
+        keys in memory. Each exported asset's ``id``, ``macs``, ``names``, ``addresses`` and
+        ``addresses_extra`` are indexed, along with the external IDs external_ids returns.
+
+        :param path: the path of the index file to write, which is replaced
+        :param export: the path of a JSONL export, which may be gzip-compressed with a ``.gz``
+            suffix, or the decoded JSON objects of the exported assets
+        :param external_ids: Optional function which returns the external IDs of an exported asset,
+            by default :func:`foreign_ids`
+        :param precedence: the precedence of the opened index
+
+        :returns: the opened index
+        :raises: ValueError if an exported asset has no valid runZero ID
+        """
+        path = os.fspath(path)
+        records = _read_export(export) if isinstance(export, (str, os.PathLike)) else export
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.TemporaryFile(dir=directory) as keys, tempfile.TemporaryFile(dir=directory) as ids:
+            assets, count = _write_keys(records, external_ids, keys, ids)
+            if assets >= _AMBIGUOUS:
+                raise ValueError(f"an index holds fewer than {_AMBIGUOUS} assets")
+            _write_table(path, keys, ids, assets, count)
+        return cls(path, precedence)
+
+    def lookup(self, kind: str, value: Any) -> Optional[uuid.UUID]:
+        """
+        Finds the runZero asset with a key.
+
+        :param kind: the kind of the key, such as ``"mac"``
+        :param value: the key, such as a MAC address
+
+        :returns: the runZero ID of the only asset with the key, or None if no asset or several
+            assets have it
+        :raises: KeyError if the kind of key is unknown
+        """
+        key = _NORMALIZERS[kind](value)
+        if key is None:
+            return None
+        position = self._find(_hash(_PREFIXES[kind], key))
+        if position is None or position == _AMBIGUOUS:
+            return None
+        return uuid.UUID(bytes=bytes(self._ids[position * 16 : position * 16 + 16]))
+
+    def _find(self, key_hash: int) -> Optional[int]:
+        """The asset of a key hash, _AMBIGUOUS, or None if the index does not have it."""
+        hashes = self._hashes
+        slot = key_hash & self._mask
+        while True:
+            found = hashes[slot]
+            if found == key_hash:
+                return self._values[slot]
+            if found == _EMPTY:
+                return None
+            slot = (slot + 1) & self._mask
+
+    def match(self, asset: ImportAsset) -> Optional[uuid.UUID]:
+        """
+        Finds the runZero asset an ImportAsset describes, trying each kind of key in the order of
+        the precedence.
+
+        :param asset: the ImportAsset
+
+        :returns: the runZero ID of the asset, or None if no kind of key matches exactly one asset
+        """
+        for kind in self.precedence:
+            prefix = _PREFIXES[kind]
+            normalize = _NORMALIZERS[kind]
+            found: Optional[int] = None
+            for value in _asset_keys(asset, kind):
+                key = normalize(value)
+                if key is None:
+                    continue
+                position = self._find(_hash(prefix, key))
+                if position is None or position == _AMBIGUOUS:
+                    continue
+                if found is not None and found != position:
+                    # the keys of this kind match different assets
+                    found = _AMBIGUOUS
+                    break
+                found = position
+            if found is not None and found != _AMBIGUOUS:
+                return uuid.UUID(bytes=bytes(self._ids[found * 16 : found * 16 + 16]))
+        return None
+
+    def assign(self, assets: Iterable[ImportAsset], overwrite: bool = False) -> Iterator[ImportAsset]:
+        """
+        Sets the runZero ID of each ImportAsset the index matches, so its import is force merged
+        into that asset, and yields the assets as they are read. Pass them straight to
+        :meth:`runzero.api.CustomAssets.upload_assets`.
+
+        :param assets: the ImportAssets
+        :param overwrite: whether to replace runZero IDs the assets already have
+
+        :returns: an iterator of the assets
+        """
+        for asset in assets:
+            if overwrite or asset.run_zero_id is None:
+                run_zero_id = self.match(asset)
+                if run_zero_id is not None:
+                    asset.run_zero_id = run_zero_id
+            yield asset
+
+    def close(self) -> None:
+        """Unmaps the index file."""
+        for view in (self._hashes, self._values, self._ids, self._view):
+            view.release()
+        self._map.close()
+
+    def __enter__(self) -> "MatchIndex":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # worker processes map the file themselves
+        return MatchIndex, (self.path, self.precedence)
+
+
+def _write_keys(
+    records: Iterable[Mapping[str, Any]],
+    external_ids: Callable[[Mapping[str, Any]], Iterable[Any]],
+    keys: IO[bytes],
+    ids: IO[bytes],
+) -> Tuple[int, int]:
+    """Writes the key hashes and runZero IDs of exported assets to temporary files, returning their numbers."""
+    assets = 0
+    count = 0
+    for record in records:
+        try:
+            asset_id = uuid.UUID(str(record["id"]))
+        except (KeyError, ValueError) as exc:
+            raise ValueError(f"exported asset {assets} has no valid runZero ID") from exc
+        ids.write(asset_id.bytes)
+        entries = bytearray()
+        for kind, value in _export_keys(record, external_ids):
+            key = _NORMALIZERS[kind](value)
+            if key is not None:
+                entries += _ENTRY.pack(_hash(_PREFIXES[kind], key), assets)
+                count += 1
+        keys.write(entries)
+        assets += 1
+    return assets, count
+
+
+def _write_table(path: str, keys: IO[bytes], ids: IO[bytes], assets: int, count: int) -> None:
+    """
+    Writes an index file from the temporary files of :func:`_write_keys`. The index is written
+    beside the path and moved onto it, so indexes already open on the path keep mapping the old file.
+    """
+    fd, tmp = tempfile.mkstemp(prefix=".match-", suffix=".idx", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "w+b") as file:
+            _fill_table(file, keys, ids, assets, count)
+        os.replace(tmp, path)
+    finally:
+        # the temporary file is only left behind when writing or moving it failed
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def _fill_table(file: IO[bytes], keys: IO[bytes], ids: IO[bytes], assets: int, count: int) -> None:
+    """Sizes an empty index file for its keys and assets, and writes the table and runZero IDs to it."""
+    capacity = _capacity(count)
+    file.truncate(_HEADER.size + capacity * 12 + assets * 16)
+    with mmap.mmap(file.fileno(), 0) as table:
+        _HEADER.pack_into(table, 0, _MAGIC, capacity, assets, count)
+        view = memoryview(table)
+        hashes = view[_HEADER.size : _HEADER.size + capacity * 8].cast("Q")
+        values = view[_HEADER.size + capacity * 8 : _HEADER.size + capacity * 12].cast("I")
+        try:
+            keys.seek(0)
+            for block in iter(lambda: keys.read(_ENTRY.size * 65536), b""):
+                _insert(hashes, values, capacity - 1, block)
+        finally:
+            hashes.release()
+            values.release()
+            view.release()
+        ids.seek(0)
+        table.seek(_HEADER.size + capacity * 12)
+        for block in iter(lambda: ids.read(1 << 20), b""):
+            table.write(block)
+        table.flush()
+
+
+def _insert(hashes: memoryview, values: memoryview, mask: int, block: bytes) -> None:
+    """Inserts the key hashes and assets of a block of entries into a table."""
+    for key_hash, asset in _ENTRY.iter_unpack(block):
+        slot = key_hash & mask
+        while True:
+            found = hashes[slot]
+            if found == _EMPTY:
+                hashes[slot] = key_hash
+                values[slot] = asset
+                break
+            if found == key_hash:
+                if values[slot] != asset:
+                    values[slot] = _AMBIGUOUS
+                break
+            slot = (slot + 1) & mask
@@ -0,0 +1,316 @@
+"""
+merge collapses ImportAssets which share an ID into one asset before they are uploaded.
+
+Combined sources often describe the same asset several times, each with part of its data. Merging
+them in the client sends each asset once, which shrinks the upload and the merging the server does
+while importing it. Each field is merged by a :data:`MergeRule`; the rules of this module are the
+defaults, and may be replaced per field.
+"""
+
+import heapq
+import itertools
+import json
+import tempfile
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from runzero._pydantic import dump_json, parse
+from runzero._trusted import field_plans
+from runzero.types import ImportAsset, NetworkInterface
+
+__all__ = [
+    "AssetMerger",
+    "MergeReport",
+    "MergeRule",
+    "first_wins",
+    "last_wins",
+    "merge_attributes",
+    "merge_interfaces",
+    "union",
+]
+
+MergeRule = Callable[[Any, Any], Any]
+"""A function which merges the value of a field already kept with the value of a later asset"""
+
+Asset = Dict[str, Any]
+
+MAX_CUSTOM_ATTRIBUTES = 1024
+"""The greatest number of custom attributes an ImportAsset may have"""
+
+
+def last_wins(kept: Any, new: Any) -> Any:  # pylint: disable=unused-argument
+    """Keeps the value of the later asset, the default rule of scalar fields."""
+    return new
+
+
+def first_wins(kept: Any, new: Any) -> Any:  # pylint: disable=unused-argument
+    """Keeps the value of the earlier asset."""
+    return kept
+
+
+def _key(value: Any) -> Any:
+    return value if isinstance(value, str) else json.dumps(value, sort_keys=True)
+
+
+def _max_items(model: Any) -> Dict[str, int]:
+    """The greatest length of each limited field of a model, by alias."""
+    return {plan.alias: plan.max_length for plan in field_plans(model) if plan.max_length is not None}
+
+
+def union(kept: List[Any], new: List[Any], max_items: Optional[int] = None) -> List[Any]:
+    """
+    Adds the items of the later list which the kept list does not have, in order, until the list
+    has max_items items.
+    """
+    seen = {_key(item) for item in kept}
+    merged = list(kept)
+    for item in new:
+        if max_items is not None and len(merged) >= max_items:
+            break
+        key = _key(item)
+        if key not in seen:
+            seen.add(key)
+            merged.append(item)
+    return merged
+
+
+def merge_interfaces(kept: List[Asset], new: List[Asset]) -> List[Asset]:
+    """
+    Merges network interfaces with the same MAC address, taking the union of their IP addresses up
+    to the most an interface may have. Interfaces without a MAC address are added unless an equal
+    interface is kept.
+    """
+    limits = _max_items(NetworkInterface)
+    merged = [dict(interface) for interface in kept]
+    by_mac = {interface["macAddress"].lower(): interface for interface in merged if interface.get("macAddress")}
+    for interface in new:
+        mac = interface.get("macAddress")
+        target = by_mac.get(mac.lower()) if mac else None
+        if target is None:
+            if interface not in merged:
+                merged.append(dict(interface))
+                if mac:
+                    by_mac[mac.lower()] = merged[-1]
+            continue
+        for key, value in interface.items():
+            if isinstance(value, list) and isinstance(target.get(key), list):
+                target[key] = union(target[key], value, limits.get(key))
+            elif value is not None:
+                target[key] = value
+    return merged
+
+
+def merge_attributes(kept: Dict[str, str], new: Dict[str, str]) -> Dict[str, str]:
+    """
+    Merges custom attributes, keeping the values of the later asset. Attributes the kept asset does
+    not have are added until it has the most an asset may have, and the rest are dropped.
+    """
+    merged = dict(kept)
+    for name, value in new.items():
+        if name in merged or len(merged) < MAX_CUSTOM_ATTRIBUTES:
+            merged[name] = value
+    return merged
+
+
+_DEFAULT_RULES: Dict[str, MergeRule] = {
+    "networkInterfaces": merge_interfaces,
+    "hostnames": union,
+    "tags": union,
+    "services": union,
+    "software": union,
+    "vulnerabilities": union,
+    "customAttributes": merge_attributes,
+}
+
+
+class MergeReport(NamedTuple):
+    """
+    What an AssetMerger has merged.
+
+    :param added: the number of assets added to the merger
+    :param merged: the number of those assets which were merged into another with the same ID
+    :param spilled: the number of runs of assets written to disk to bound memory
+    """
+
+    added: int
+    merged: int
+    spilled: int
+
+
+def _asset_id(asset: Asset) -> str:
+    return asset["id"]
+
+
+def _read_run(run: IO[str]) -> Iterator[Asset]:
+    run.seek(0)
+    for line in run:
+        yield json.loads(line)
+
+
+class AssetMerger:
+    """
+    AssetMerger collapses the ImportAssets added to it which share an ID into one asset each, so
+    partial descriptions of an asset from several sources are uploaded as one.
+
+    Assets are merged in the order they are added. Fields an asset leaves unset or null keep the
+    values of earlier assets. Other fields are merged by their rule: by default, network interfaces
+    with the same MAC address are merged and other interfaces added, hostnames, tags, services,
+    software and vulnerabilities are combined without duplicates, custom attributes are combined
+    with later values winning, and the later value of any other field wins. Merged lists and custom
+    attributes are cut to the most an ImportAsset may have, dropping the items added last.
+
+    At most max_assets distinct assets are kept in memory. Beyond that, they are written to a
+    temporary file sorted by ID, and the files are merged when the merged assets are read, so a
+    merger holds a stream of any size in bounded memory.
+
+    :param rules: Optional merge rules by field name or alias, which replace the default rules
+    :param max_assets: the number of distinct assets kept in memory before they are spilled to disk
+    :param spill_dir: Optional directory of the temporary files, which defaults to the system's
+
+    :raises: ValueError if a rule names a field ImportAsset does not have, or max_assets is less
+        than 1
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Mapping[str, MergeRule]] = None,
+        max_assets: int = 100000,
+        spill_dir: Optional[str] = None,
+    ) -> None:
+        if max_assets < 1:
+            raise ValueError("max_assets must be at least 1")
+        aliases = {}
+        for plan in field_plans(ImportAsset):
+            aliases[plan.name] = aliases[plan.alias] = plan.alias
+        self._rules = dict(_DEFAULT_RULES)
+        for field, rule in (rules or {}).items():
+            if field not in aliases:
+                raise ValueError(f"{field} is not an ImportAsset field")
+            self._rules[aliases[field]] = rule
+        self._limits = _max_items(ImportAsset)
+        self._max_assets = max_assets
+        self._spill_dir = spill_dir
+        self._assets: Dict[str, Asset] = {}
+        self._runs: List[IO[str]] = []
+        self._added = 0
+        self._merged = 0
+
+    def add(self, asset: Union[ImportAsset, Mapping[str, Any]]) -> None:
+        """
+        Adds an asset, merging it into a kept asset with the same ID.
+
+        :param asset: the asset, or the decoded JSON object of one, which is validated
+
+        :raises: ValidationError if the decoded JSON object is not a valid ImportAsset
+        """
+        if not isinstance(asset, ImportAsset):
+            asset = parse(ImportAsset, asset)
+        obj = json.loads(dump_json(asset, by_alias=True, exclude_unset=True, exclude_none=True))
+        self._added += 1
+        kept = self._assets.get(obj["id"])
+        if kept is None:
+            self._assets[obj["id"]] = obj
+            if len(self._assets) > self._max_assets:
+                self._spill()
+        else:
+            self._merge(kept, obj)
+
+    def extend(self, assets: Iterable[Union[ImportAsset, Mapping[str, Any]]]) -> None:
+        """
+        Adds several assets.
+
+        :param assets: the assets, or the decoded JSON objects of them
+        """
+        for asset in assets:
+            self.add(asset)
+
+    def _merge(self, kept: Asset, new: Asset) -> None:
+        self._merged += 1
+        for key, value in new.items():
+            if key in kept:
+                value = self._rules.get(key, last_wins)(kept[key], value)
+                limit = self._limits.get(key)
+                if limit is not None and isinstance(value, list) and len(value) > limit:
+                    # items past the limit are dropped, keeping those of earlier assets
+                    value = value[:limit]
+                kept[key] = value
+            else:
+                kept[key] = value
+
+    def _spill(self) -> None:
+        # pylint: disable-next=consider-using-with
+        run = tempfile.TemporaryFile(mode="w+", encoding="utf-8", dir=self._spill_dir)
+        for asset_id in sorted(self._assets):
+            run.write(json.dumps(self._assets[asset_id], separators=(",", ":")) + "\n")
+        self._runs.append(run)
+        self._assets = {}
+
+    def report(self) -> MergeReport:
+        """
+        Reports what the merger has merged so far. Merges of assets spilled to different runs are
+        counted as the merged assets are read.
+
+        :returns: the report
+        """
+        return MergeReport(self._added, self._merged, len(self._runs))
+
+    def merged_objects(self) -> Iterator[Asset]:
+        """
+        Reads the merged assets as decoded JSON objects keyed by alias, emptying the merger.
+
+        Without spilled runs, the assets are in the order their IDs were first added, and otherwise
+        in the order of their IDs.
+
+        :returns: an iterator of the decoded JSON objects
+        """
+        assets, self._assets = self._assets, {}
+        runs, self._runs = self._runs, []
+        if not runs:
+            yield from assets.values()
+            return
+        try:
+            streams = [_read_run(run) for run in runs]
+            # earlier runs come first among equal IDs, so the later assets of each ID are merged last
+            streams.append(iter(sorted(assets.values(), key=_asset_id)))
+            for _, group in itertools.groupby(heapq.merge(*streams, key=_asset_id), key=_asset_id):
+                kept, *later = group
+                for asset in later:
+                    self._merge(kept, asset)
+                yield kept
+        finally:
+            for run in runs:
+                run.close()
+
+    def merged(self) -> Iterator[ImportAsset]:
+        """
+        Reads the merged assets, emptying the merger. Pass them straight to
+        :meth:`runzero.api.CustomAssets.upload_assets`, which uploads them as they are read.
+
+        :returns: an iterator of the merged assets, ordered as :meth:`merged_objects` orders them
+        """
+        for obj in self.merged_objects():
+            yield parse(ImportAsset, obj)
+
+    def close(self) -> None:
+        """Removes the spilled runs without reading them."""
+        for run in self._runs:
+            run.close()
+        self._runs = []
+        self._assets = {}
+
+    def __enter__(self) -> "AssetMerger":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
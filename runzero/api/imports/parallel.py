@@ -0,0 +1,168 @@
+"""
+parallel builds and validates ImportAssets on every core of the host.
+
+Validating assets is CPU-bound, so a single process validates on one core however many it has.
+:func:`build_asset_chunks` partitions records among worker processes, which map, validate and
+serialize them, returning only compressed JSONL and error messages to the parent process.
+"""
+
+import gzip
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from runzero._pydantic import dump_json, parse
+from runzero.types import ImportAsset
+
+__all__ = [
+    "AssetChunk",
+    "RecordError",
+    "build_asset_chunks",
+]
+
+Mapper = Callable[[Any], Union[ImportAsset, Mapping[str, Any]]]
+
+
+class RecordError(NamedTuple):
+    """
+    A record which could not be built into a valid ImportAsset.
+
+    :param record: the position of the record among all the records
+    :param message: why the record could not be built, such as the validation errors of its fields
+    """
+
+    record: int
+    message: str
+
+
+class AssetChunk(NamedTuple):
+    """
+    The assets built from consecutive records, ready to upload.
+
+    :param data: the valid assets as gzip-compressed JSONL, which may be concatenated with the data
+        of other chunks into one gzip stream
+    :param first: the position of the chunk's first record among all the records
+    :param records: the number of records in the chunk
+    :param assets: the number of valid assets in data
+    :param errors: the records of the chunk which are not in data
+    """
+
+    data: bytes
+    first: int
+    records: int
+    assets: int
+    errors: List[RecordError]
+
+
+def _build_chunk(mapper: Optional[Mapper], first: int, records: List[Any], compresslevel: int) -> AssetChunk:
+    """Builds the assets of a chunk of records in a worker process."""
+    lines: List[str] = []
+    errors: List[RecordError] = []
+    for position, record in enumerate(records, start=first):
+        try:
+            asset = record if mapper is None else mapper(record)
+            if not isinstance(asset, ImportAsset):
+                asset = parse(ImportAsset, asset)
+            lines.append(dump_json(asset, by_alias=True))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # errors, which may not pickle, are returned to the parent process as text
+            errors.append(RecordError(position, f"{type(exc).__name__}: {exc}"))
+    data = "".join(line + "\n" for line in lines).encode("utf-8")
+    return AssetChunk(gzip.compress(data, compresslevel, mtime=0), first, len(records), len(lines), errors)
+
+
+def _partition(records: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    chunk: List[Any] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# pylint: disable-next=too-many-arguments
+def build_asset_chunks(
+    records: Iterable[Any],
+    mapper: Optional[Mapper] = None,
+    *,
+    chunk_size: int = 1000,
+    max_workers: Optional[int] = None,
+    compresslevel: int = 6,
+    executor: Optional[Executor] = None,
+) -> Iterator[AssetChunk]:
+    """
+    Builds and validates ImportAssets from records in worker processes, yielding them as chunks of
+    compressed JSONL in the order of the records.
+
+    Records are read lazily and only a few chunks per worker are in progress at a time, so records
+    may be streamed from a file or query of any size. Upload the chunks with
+    :meth:`runzero.api.CustomAssets.upload_asset_chunks`.
+
+    The mapper, and the records, are sent to the worker processes, so they must be picklable: the
+    mapper should be a function defined at the top level of a module.
+
+    :param records: the records to build assets from
+    :param mapper: Optional function which converts a record to an ImportAsset, or to the decoded
+        JSON object of one. Without it, records must be decoded JSON objects of ImportAssets
+    :param chunk_size: the number of records in each chunk
+    :param max_workers: the number of worker processes, which defaults to the number of CPUs, or 0
+        to build the chunks in this process as they are read
+    :param compresslevel: the gzip compression level of the chunks, from 0 to 9
+    :param executor: Optional executor to run the workers in, such as a ProcessPoolExecutor shared
+        by several imports, instead of a new pool of max_workers processes
+
+    :returns: an iterator of the chunks, each reporting the records which failed to build
+    :raises: ValueError if chunk_size is less than 1
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    return _build_chunks(records, mapper, chunk_size, max_workers, compresslevel, executor)
+
+
+# pylint: disable-next=too-many-arguments
+def _build_chunks(
+    records: Iterable[Any],
+    mapper: Optional[Mapper],
+    chunk_size: int,
+    max_workers: Optional[int],
+    compresslevel: int,
+    executor: Optional[Executor],
+) -> Iterator[AssetChunk]:
+    if executor is None and max_workers == 0:
+        first = 0
+        for chunk in _partition(records, chunk_size):
+            yield _build_chunk(mapper, first, chunk, compresslevel)
+            first += len(chunk)
+        return
+    in_flight = 2 * (max_workers or os.cpu_count() or 1)
+    pool = executor if executor is not None else ProcessPoolExecutor(max_workers=max_workers)
+    pending: Deque["Future[AssetChunk]"] = deque()
+    try:
+        first = 0
+        for chunk in _partition(records, chunk_size):
+            pending.append(pool.submit(_build_chunk, mapper, first, chunk, compresslevel))
+            first += len(chunk)
+            if len(pending) >= in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # the caller stopped early, or a worker failed
+        for future in pending:
+            future.cancel()
+        if executor is None:
+            pool.shutdown()
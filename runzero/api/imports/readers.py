@@ -0,0 +1,126 @@
+"""
+readers stream tabular files, such as the CSV exports of other systems, as batches of records for
+an :class:`runzero.api.imports.AssetMapping`.
+
+Rows are read a batch at a time and converted a column at a time, so a file of any size is imported
+without holding more than a batch of its rows, and the assets built from it are never all in memory
+at once. Readers for Parquet files, Arrow tables and pandas DataFrames are in
+:mod:`runzero.api.imports.arrow`, which needs pyarrow.
+"""
+
+import csv
+import os
+from typing import (
+    IO,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+__all__ = [
+    "read_csv",
+]
+
+Record = Dict[str, Any]
+
+# the number of distinct values of a column whose strings are shared, which covers columns of
+# repeated values, such as OS names and device types, but not identifiers
+_SHARED_LIMIT = 1024
+
+
+def _convert_column(cells: Sequence[str], nulls: FrozenSet[str], shared: Dict[str, str]) -> List[Optional[str]]:
+    """Converts the cells of a column, leaving out null cells and sharing repeated values."""
+    if len(shared) >= _SHARED_LIMIT:
+        return [None if cell in nulls else cell for cell in cells]
+    return [None if cell in nulls else shared.setdefault(cell, cell) for cell in cells]
+
+
+def _records(
+    header: List[str], rows: List[List[str]], nulls: FrozenSet[str], shared: List[Dict[str, str]]
+) -> List[Record]:
+    width = len(header)
+    for position, row in enumerate(rows):
+        if len(row) != width:
+            # cells beyond the header are ignored, and missing cells are null
+            rows[position] = row[:width] + [""] * (width - len(row))
+    columns = [_convert_column(cells, nulls, shared[i]) for i, cells in enumerate(zip(*rows))]
+    return [{name: value for name, value in zip(header, row) if value is not None} for row in zip(*columns)]
+
+
+def _read_rows(
+    file: IO[str], fieldnames: Optional[Sequence[str]], batch_size: int, nulls: FrozenSet[str], fmtparams: Any
+) -> Iterator[List[Record]]:
+    reader = csv.reader(file, **fmtparams)
+    header = list(fieldnames) if fieldnames is not None else next(reader, [])
+    shared: List[Dict[str, str]] = [{} for _ in header]
+    rows: List[List[str]] = []
+    for row in reader:
+        if not row:
+            # blank lines are skipped, as csv.DictReader does
+            continue
+        rows.append(row)
+        if len(rows) == batch_size:
+            yield _records(header, rows, nulls, shared)
+            rows = []
+    if rows:
+        yield _records(header, rows, nulls, shared)
+
+
+def _read_csv(
+    source: Union[str, "os.PathLike[str]", IO[str]],
+    fieldnames: Optional[Sequence[str]],
+    batch_size: int,
+    nulls: FrozenSet[str],
+    encoding: str,
+    fmtparams: Any,
+) -> Iterator[List[Record]]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, newline="", encoding=encoding) as file:
+            yield from _read_rows(file, fieldnames, batch_size, nulls, fmtparams)
+    else:
+        yield from _read_rows(source, fieldnames, batch_size, nulls, fmtparams)
+
+
+# pylint: disable-next=too-many-arguments
+def read_csv(
+    source: Union[str, "os.PathLike[str]", IO[str]],
+    *,
+    fieldnames: Optional[Sequence[str]] = None,
+    batch_size: int = 10000,
+    null_values: Iterable[str] = ("",),
+    encoding: str = "utf-8-sig",
+    **fmtparams: Any,
+) -> Iterator[List[Record]]:
+    """
+    Reads a CSV file in batches of records keyed by column name, which an AssetMapping converts to
+    ImportAssets with the column names as paths.
+
+    Null cells are left out of their records, so the mapping treats them as missing values. A cell
+    holding several values, such as a list of IP addresses or tags, is split by the ``split`` option
+    of its source in the mapping. Values repeated in a column share one string.
+
+    Records stream from the file into worker processes and are uploaded as compressed chunks::
+
+        records = itertools.chain.from_iterable(read_csv("assets.csv"))
+        chunks = list(mapping.chunks(records))
+        CustomAssets(client).upload_asset_chunks(org_id, site_id, custom_integration_id, chunks)
+
+    :param source: the path of the file, or a text file opened with ``newline=""``
+    :param fieldnames: Optional column names, for files without a header row
+    :param batch_size: the number of rows in each batch
+    :param null_values: the cells which mean a value is missing
+    :param encoding: the encoding of the file at the path, which ignores a byte order mark by default
+    :param fmtparams: options of :func:`csv.reader`, such as delimiter
+
+    :returns: an iterator of the batches of records
+    :raises: ValueError if batch_size is less than 1
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    return _read_csv(source, fieldnames, batch_size, frozenset(null_values), encoding, fmtparams)
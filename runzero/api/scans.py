@@ -48,4 +48,4 @@ class Scans:
         res = self._client.execute(
             "PUT", f"{self._ENDPOINT}/{site_id}/scan", params={"_oid": org_id}, data=scan_options
         )
-        return Task.parse_obj(res.json_obj)
+        return res.model(Task)
@@ -6,7 +6,7 @@ import uuid
 from typing import List, Optional
 
 from runzero.client import Client
-from runzero.types import Site, SiteOptions
+from runzero.types import Site, SiteOptions, SiteView
 
 __all__ = [
     "SiteOptions",
@@ -41,10 +41,21 @@ class Sites:
         """
         params = {"_oid": org_id}
         res = self._client.execute("GET", self._ENDPOINT, params=params)
-        result: List[Site] = []
-        for site in res.json_obj:
-            result.append(Site.parse_obj(site))
-        return result
+        return res.models(Site)
+
+    def get_all_views(self, org_id: uuid.UUID) -> List[SiteView]:
+        """
+        Retrieves all runZero Sites available within the given organization as read-only views, which
+        take a fraction of the memory of :meth:`get_all`'s models when scanning many of them.
+
+        :param org_id: The ID of the organization to operate against
+
+        :returns: a list of :class:`runzero.types.SiteView`, whose ``to_model()`` returns the Site
+        :raises: AuthError, ClientError, ServerError
+        """
+        params = {"_oid": org_id}
+        res = self._client.execute("GET", self._ENDPOINT, params=params)
+        return res.views(SiteView)
 
     def get(self, org_id: uuid.UUID, name: Optional[str] = None, site_id: Optional[uuid.UUID] = None) -> Optional[Site]:
         """
@@ -70,7 +81,7 @@ class Sites:
             if data_obj:
                 site_obj = data_obj
 
-            return Site.parse_obj(site_obj)
+            return res.model(Site, site_obj)
         # name
         for site in self.get_all(org_id):
             if site.name == name:
@@ -92,7 +103,7 @@ class Sites:
         site_data = res.json_obj.get("data", "")
         if site_data:
             return self.get(org_id=org_id, name=site_options.name)
-        return Site.parse_obj(res.json_obj)
+        return res.model(Site)
 
     def update(self, org_id: uuid.UUID, site_id: uuid.UUID, site_options: SiteOptions) -> Optional[Site]:
         """
@@ -110,7 +121,7 @@ class Sites:
         site_data = res.json_obj.get("data", "")
         if site_data:
             return self.get(org_id=org_id, name=site_options.name)
-        return Site.parse_obj(res.json_obj)
+        return res.model(Site)
 
     def delete(self, org_id: uuid.UUID, site_id: uuid.UUID) -> None:
         """
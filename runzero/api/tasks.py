@@ -2,11 +2,70 @@
 Management of runZero tasks.
 """
 
+import asyncio
+import contextvars
+import time
 import uuid
-from typing import Dict, List, Optional, Union
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+)
 
 from runzero.client import Client
-from runzero.types import Task, TaskOptions
+from runzero.client._http.io import Response
+from runzero.errors import Error
+from runzero.types import Task, TaskOptions, TaskView
+
+__all__ = [
+    "TERMINAL_TASK_STATUSES",
+    "TaskStatusChange",
+    "TaskWaitTimeoutError",
+    "Tasks",
+]
+
+TERMINAL_TASK_STATUSES: FrozenSet[str] = frozenset(["processed", "failed", "error", "stopped"])
+"""Task statuses after which a task's status no longer changes."""
+
+
+class TaskWaitTimeoutError(Error, TimeoutError):
+    """
+    TaskWaitTimeoutError is a named Exception class raised when watched tasks do not reach a
+    terminal status before the wait timeout.
+
+    :param pending: the statuses of tasks which had not finished, by task ID
+    """
+
+    def __init__(self, pending: Dict[uuid.UUID, Optional[str]]):
+        """Constructor method"""
+        super().__init__(f"{len(pending)} task(s) did not finish before the timeout")
+        self.pending = pending
+
+
+@dataclass
+class TaskStatusChange:
+    """A change in the observed status of a watched task.
+
+    :param task_id: the ID of the task
+    :param previous_status: the status observed before this change, or None on first observation
+    :param status: the newly observed status
+    :param task: the task as retrieved when the change was observed
+    :param terminal: True if the new status is terminal and the task is no longer watched
+    """
+
+    task_id: uuid.UUID
+    previous_status: Optional[str]
+    status: Optional[str]
+    task: Task
+    terminal: bool
 
 
 class Tasks:
@@ -33,17 +92,31 @@ class Tasks:
             Query string format is the same as in-UI search. See https://www.runzero.com/docs/search-query-tasks/
         :returns: A list of all tasks
         """
+        return self._list(org_id, status, query).models(Task)
+
+    def get_all_views(
+        self, org_id: uuid.UUID, status: Optional[str] = None, query: Optional[str] = None
+    ) -> List[TaskView]:
+        """
+        Retrieves all runZero Tasks available within the given Organization as read-only views, which
+        take a fraction of the memory of :meth:`get_all`'s models when scanning many tasks.
+
+        :param org_id: The unique ID of the organization to retrieve the tasks from.
+        :param status: An optional status value to filter tasks by. This is a
+            case-insensitive string match, stripped of surrounding whitespace.
+        :param query: An optional query to filter returned tasks.
+            Query string format is the same as in-UI search. See https://www.runzero.com/docs/search-query-tasks/
+        :returns: A list of :class:`runzero.types.TaskView`, whose ``to_model()`` returns the Task
+        """
+        return self._list(org_id, status, query).views(TaskView)
+
+    def _list(self, org_id: uuid.UUID, status: Optional[str], query: Optional[str]) -> Response:
         params: Dict[str, Union[str, uuid.UUID]] = {"_oid": org_id}
         if query is not None:
             params["search"] = query.strip()
         if status is not None:
             params["status"] = status.strip()
-        res = self._client.execute("GET", self._ENDPOINT, params=params)
-        result: List[Task] = []
-        for obj in res.json_obj:
-            task = Task.parse_obj(obj)
-            result.append(task)
-        return result
+        return self._client.execute("GET", self._ENDPOINT, params=params)
 
     def get(self, org_id: uuid.UUID, name: Optional[str] = None, task_id: Optional[uuid.UUID] = None) -> Optional[Task]:
         """
@@ -61,7 +134,7 @@ class Tasks:
             raise ValueError("must provide either task_id or task name")
         if task_id is not None:
             res = self._client.execute("GET", f"{self._ENDPOINT}/{task_id}", params=params)
-            return Task.parse_obj(res.json_obj)
+            return res.model(Task)
         # name
         for task in self.get_all(org_id):
             if task.name == name:
@@ -80,11 +153,84 @@ class Tasks:
         """
         params = {"_oid": org_id}
         res = self._client.execute("GET", f"{self._ENDPOINT}/{task_id}", params=params)
-        task = Task.parse_obj(res.json_obj)
+        task = res.model(Task)
         if task is None:
             return None
         return task.status
 
+    def wait_for(
+        self,
+        org_id: uuid.UUID,
+        task_ids: Iterable[uuid.UUID],
+        timeout: Optional[float] = None,
+        terminal_statuses: Iterable[str] = TERMINAL_TASK_STATUSES,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Iterator[TaskStatusChange]:
+        """
+        Watches tasks until each reaches a terminal status, yielding status changes as they are observed.
+
+        All watched tasks are polled together with one task query per batch of IDs. Polling starts at
+        ``initial_interval`` and backs off towards ``max_interval`` while nothing changes, returning to
+        the initial interval whenever a task changes status. The first status observed for each task is
+        yielded as a change from None.
+
+        Polling bypasses any response cache configured on the client.
+
+        :param org_id: ID of the organization the tasks are in
+        :param task_ids: IDs of the tasks to watch, such as those returned by
+            :meth:`runzero.api.CustomAssets.upload_assets` or :meth:`runzero.api.Scans.create`
+        :param timeout: Optional number of seconds to wait for all tasks to finish
+        :param terminal_statuses: statuses after which a task is no longer watched
+        :param initial_interval: seconds between the first polls
+        :param max_interval: the longest number of seconds between polls
+
+        :returns: an iterator of TaskStatusChange
+        :raises: AuthError, ClientError, ServerError,
+            TaskWaitTimeoutError if tasks are unfinished when the timeout elapses
+        """
+        watcher = _TaskWatcher(self, org_id, task_ids, timeout, terminal_statuses, initial_interval, max_interval)
+        while not watcher.done:
+            yield from watcher.poll()
+            delay = watcher.next_delay()
+            if delay:
+                time.sleep(delay)
+
+    async def async_wait_for(
+        self,
+        org_id: uuid.UUID,
+        task_ids: Iterable[uuid.UUID],
+        timeout: Optional[float] = None,
+        terminal_statuses: Iterable[str] = TERMINAL_TASK_STATUSES,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> AsyncIterator[TaskStatusChange]:
+        """
+        Asynchronous variant of :meth:`wait_for`. Requests are run in the event loop's default executor,
+        within the caller's context, so timeouts and priorities set around the call apply to them.
+
+        :param org_id: ID of the organization the tasks are in
+        :param task_ids: IDs of the tasks to watch
+        :param timeout: Optional number of seconds to wait for all tasks to finish
+        :param terminal_statuses: statuses after which a task is no longer watched
+        :param initial_interval: seconds between the first polls
+        :param max_interval: the longest number of seconds between polls
+
+        :returns: an async iterator of TaskStatusChange
+        :raises: AuthError, ClientError, ServerError,
+            TaskWaitTimeoutError if tasks are unfinished when the timeout elapses
+        """
+        watcher = _TaskWatcher(self, org_id, task_ids, timeout, terminal_statuses, initial_interval, max_interval)
+        loop = asyncio.get_running_loop()
+        while not watcher.done:
+            # executors do not carry context variables, such as the client's deadline and priority, over
+            polled = await loop.run_in_executor(None, contextvars.copy_context().run, watcher.poll)
+            for change in polled:
+                yield change
+            delay = watcher.next_delay()
+            if delay:
+                await asyncio.sleep(delay)
+
     def update(self, org_id: uuid.UUID, task_id: uuid.UUID, task_options: TaskOptions) -> Task:
         """
         Updates task parameters with provided task options values.
@@ -98,7 +244,7 @@ class Tasks:
         """
         params = {"_oid": org_id}
         res = self._client.execute("PATCH", f"{self._ENDPOINT}/{task_id}", data=task_options, params=params)
-        return Task.parse_obj(res.json_obj)
+        return res.model(Task)
 
     def stop(self, org_id: uuid.UUID, task_id: uuid.UUID) -> Task:
         """
@@ -113,7 +259,7 @@ class Tasks:
         """
         params = {"_oid": org_id}
         res = self._client.execute("POST", f"{self._ENDPOINT}/{task_id}/stop", params=params)
-        return Task.parse_obj(res.json_obj)
+        return res.model(Task)
 
     def hide(self, org_id: uuid.UUID, task_id: uuid.UUID) -> Task:
         """
@@ -127,4 +273,111 @@ class Tasks:
         """
         params = {"_oid": org_id}
         res = self._client.execute("POST", f"{self._ENDPOINT}/{task_id}/hide", params=params)
-        return Task.parse_obj(res.json_obj)
+        return res.model(Task)
+
+
+# the status of a watched task which has not been retrieved yet
+_UNSEEN = object()
+
+
+class _TaskWatcher:
+    """Polling state shared by the synchronous and asynchronous task watchers."""
+
+    # keeps the search query, and therefore the request URL, to a reasonable length
+    _BATCH_SIZE = 50
+    _BACKOFF = 1.5
+
+    def __init__(
+        self,
+        tasks: Tasks,
+        org_id: uuid.UUID,
+        task_ids: Iterable[uuid.UUID],
+        timeout: Optional[float],
+        terminal_statuses: Iterable[str],
+        initial_interval: float,
+        max_interval: float,
+    ):
+        if initial_interval <= 0 or max_interval < initial_interval:
+            raise ValueError("intervals must be positive and max_interval at least initial_interval")
+        self._tasks = tasks
+        self._org_id = org_id
+        self._pending: Dict[uuid.UUID, Any] = {task_id: _UNSEEN for task_id in task_ids}
+        # tasks search did not list, which are retrieved one by one rather than searched for again
+        self._direct: Set[uuid.UUID] = set()
+        self._terminal = frozenset(status.lower() for status in terminal_statuses)
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._interval = initial_interval
+
+    @property
+    def done(self) -> bool:
+        """True when no watched task is still pending."""
+        return not self._pending
+
+    def poll(self) -> List[TaskStatusChange]:
+        """Retrieves all pending tasks once and returns the status changes observed."""
+        changes: List[TaskStatusChange] = []
+        searched = [task_id for task_id in self._pending if task_id not in self._direct]
+        found: Dict[uuid.UUID, Task] = {}
+        for start in range(0, len(searched), self._BATCH_SIZE):
+            found.update(self._search(searched[start : start + self._BATCH_SIZE]))
+        for task_id in self._pending:
+            if task_id not in found:
+                # hidden tasks are not listed by search but can still be retrieved directly
+                self._direct.add(task_id)
+                found[task_id] = self._get(task_id)
+        for task_id, task in found.items():
+            previous = self._pending[task_id]
+            if task.status == previous:
+                continue
+            if previous is _UNSEEN:
+                previous = None
+            terminal = (task.status or "").lower() in self._terminal
+            changes.append(TaskStatusChange(task_id, previous, task.status, task, terminal))
+            if terminal:
+                del self._pending[task_id]
+            else:
+                self._pending[task_id] = task.status
+        if changes:
+            self._interval = self._initial_interval
+        return changes
+
+    def next_delay(self) -> float:
+        """The seconds to wait before the next poll, advancing the backoff.
+
+        :raises: TaskWaitTimeoutError if the deadline has passed with tasks pending
+        """
+        if self.done:
+            return 0
+        delay = self._interval
+        self._interval = min(self._interval * self._BACKOFF, self._max_interval)
+        if self._deadline is not None:
+            remaining = self._deadline - time.monotonic()
+            if remaining <= 0:
+                raise TaskWaitTimeoutError(
+                    {task_id: None if status is _UNSEEN else status for task_id, status in self._pending.items()}
+                )
+            delay = min(delay, remaining)
+        return delay
+
+    def _search(self, task_ids: List[uuid.UUID]) -> Dict[uuid.UUID, Task]:
+        """Retrieves the tasks of a batch which search lists, with one query."""
+        client = self._tasks._client  # pylint: disable=protected-access
+        endpoint = self._tasks._ENDPOINT  # pylint: disable=protected-access
+        params: Dict[str, Union[str, uuid.UUID]] = {
+            "_oid": self._org_id,
+            "search": " OR ".join(f"id:{task_id}" for task_id in task_ids),
+        }
+        found: Dict[uuid.UUID, Task] = {}
+        wanted = set(task_ids)
+        for task in client.execute("GET", endpoint, params=params, cache=False).models(Task):
+            if task.id in wanted:
+                found[task.id] = task
+        return found
+
+    def _get(self, task_id: uuid.UUID) -> Task:
+        """Retrieves one task directly."""
+        client = self._tasks._client  # pylint: disable=protected-access
+        endpoint = f"{self._tasks._ENDPOINT}/{task_id}"  # pylint: disable=protected-access
+        return client.execute("GET", endpoint, params={"_oid": self._org_id}, cache=False).model(Task)
@@ -3,15 +3,40 @@
 The Client is responsible for communication with runZero services.
 """
 
+from runzero.client.cache import CacheStats, ResponseCache
+from runzero.client.circuit import CircuitBreaker, CircuitState, CircuitStatus
 from runzero.client.client import Client
+from runzero.client.concurrency import AdaptiveConcurrencyLimiter, LimitDecision
+from runzero.client.config import ClientConfig
 from runzero.client.errors import AuthError, ClientError, RateLimitError, ServerError
+from runzero.client.instrumentation import RequestEvent, RequestHooks, RequestTiming
+from runzero.client.metrics import EndpointMetrics, MetricsCollector, MetricsSnapshot
+from runzero.client.scheduling import Priority, RequestScheduler
+from runzero.client.token_cache import TokenCache
 from runzero.types import RateLimitInformation
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
     "AuthError",
+    "CacheStats",
+    "CircuitBreaker",
+    "CircuitState",
+    "CircuitStatus",
     "Client",
+    "ClientConfig",
     "ClientError",
+    "EndpointMetrics",
+    "LimitDecision",
+    "MetricsCollector",
+    "MetricsSnapshot",
+    "Priority",
     "RateLimitError",
     "RateLimitInformation",
+    "RequestEvent",
+    "RequestHooks",
+    "RequestScheduler",
+    "RequestTiming",
+    "ResponseCache",
     "ServerError",
+    "TokenCache",
 ]
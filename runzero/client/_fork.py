@@ -0,0 +1,44 @@
+"""
+_fork re-initializes process-local state of objects a child process inherits through os.fork().
+"""
+
+import os
+import threading
+import weakref
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+# objects alive in this process, each with a callback re-initializing it in a child process
+_tracked: "weakref.WeakKeyDictionary[Any, Callable[[Any], None]]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def track(obj: T, after_fork: Callable[[T], None]) -> None:
+    """
+    Calls after_fork with obj in the child process whenever this process forks.
+
+    :param obj: the object to re-initialize, which is not kept alive by tracking
+    :param after_fork: the unbound method re-initializing obj
+    """
+    _tracked[obj] = after_fork
+
+
+def lock() -> threading.Lock:
+    """
+    A lock for re-initializing objects which notice a fork that bypassed :func:`os.register_at_fork`.
+
+    :returns: the lock, which is replaced in every child process
+    """
+    return _lock
+
+
+def _after_fork_in_child() -> None:
+    global _lock  # pylint: disable=global-statement
+    _lock = threading.Lock()
+    for obj, after_fork in list(_tracked.items()):
+        after_fork(obj)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -2,16 +2,22 @@
 auth provides authentication helper classes to support bearer and OAuth token usage
 """
 
+import time
 from datetime import datetime
-from typing import Dict
+from typing import Any, Dict
 
 import requests
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from requests.auth import AuthBase
 
 
 class OAuthToken(BaseModel):
-    """Handles OAuth tokens for the runZero platform"""
+    """Handles OAuth tokens for the runZero platform
+
+    Token lifetime is measured on a monotonic clock, so it is unaffected by wall clock changes.
+    ``created_at`` records the wall clock issue time. When it is provided, as for a token restored
+    from a :class:`runzero.client.TokenCache`, the token's age is taken from it.
+    """
 
     access_token: str = Field(...)
 
@@ -19,7 +25,23 @@ class OAuthToken(BaseModel):
 
     expires_in: int = Field(...)
 
-    created_at: datetime = datetime.now()
+    created_at: datetime = Field(default_factory=datetime.now)
+
+    _issued_at: float = PrivateAttr(default_factory=time.monotonic)
+
+    def __init__(self, **data: Any):
+        super().__init__(**data)
+        if "created_at" in data:
+            age = (datetime.now(self.created_at.tzinfo) - self.created_at).total_seconds()
+            self._issued_at -= max(0.0, age)
+
+    def seconds_remaining(self) -> float:
+        """
+        The number of seconds until the oauth token expires
+
+        :returns: seconds of validity left, negative once the token has expired
+        """
+        return self.expires_in - (time.monotonic() - self._issued_at)
 
     def is_expired(self) -> bool:
         """
@@ -27,8 +49,7 @@ class OAuthToken(BaseModel):
 
         :returns: Returns a bool of whether the token is expired or about to
         """
-        delta = datetime.now() - self.created_at
-        return delta.total_seconds() >= (self.expires_in - 60)
+        return self.seconds_remaining() <= 60
 
 
 class BearerToken(AuthBase):
@@ -0,0 +1,71 @@
+"""
+dns caches host name resolution for connections opened by a Client.
+"""
+
+import socket
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+from urllib3.util.connection import allowed_gai_family
+
+
+class DNSCache:
+    """Caches the addresses a host name resolves to for a fixed time.
+
+    :param ttl_seconds: how long a resolution is reused before the host name is resolved again
+    """
+
+    def __init__(self, ttl_seconds: float = 60):
+        """Constructor method"""
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be greater than 0")
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self._clock: Callable[[], float] = time.monotonic
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        """
+        The addresses for a host, in the order the resolver returned them.
+
+        :param host: the host name to resolve
+        :param port: the port which will be connected to
+
+        :returns: a list of IP addresses, empty if the host name could not be resolved
+        """
+        key = (host, port)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+        try:
+            infos = socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+        except (OSError, UnicodeError):
+            # let the connection resolve the name itself and report the failure
+            return []
+        addresses: List[str] = []
+        for _, _, _, _, sockaddr in infos:
+            address = str(sockaddr[0])
+            if address not in addresses:
+                addresses.append(address)
+        if addresses:
+            with self._lock:
+                self._entries[key] = (now + self.ttl_seconds, addresses)
+        return addresses
+
+    def discard(self, host: str, port: int) -> None:
+        """
+        Forgets the addresses for a host, so the next connection resolves it again.
+
+        :param host: the host name
+        :param port: the port
+        """
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def clear(self) -> None:
+        """Forgets every cached resolution."""
+        with self._lock:
+            self._entries.clear()
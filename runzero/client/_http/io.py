@@ -2,8 +2,21 @@
 io contains classes which wrap network communication and handle errors in a consistent fashion.
 """
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
+from pydantic import BaseModel
 from requests import JSONDecodeError, PreparedRequest
 from requests import Request as RequestsRequest
 from requests import Response as RequestsResponse
@@ -12,8 +25,12 @@ from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import ConnectTimeout as RequestsConnectTimeout
 from requests.exceptions import ContentDecodingError
 from requests.exceptions import HTTPError as RequestsHTTPError
+from requests.exceptions import ReadTimeout as RequestsReadTimeout
 
+from runzero._pydantic import copy, parse
+from runzero._trusted import construct
 from runzero.client._http.auth import BearerToken
+from runzero.client._http.timing import TimedHTTPAdapter, recording
 from runzero.client.errors import (
     AuthError,
     ClientError,
@@ -26,6 +43,7 @@ from runzero.client.errors import (
     UnknownAPIError,
     UnsupportedRequestError,
 )
+from runzero.client.instrumentation import RequestTiming
 from runzero.types import RateLimitInformation
 
 ALLOWED_VERBS = frozenset(["GET", "POST", "PUT", "DELETE", "PATCH"])
@@ -35,10 +53,17 @@ DEFAULT_CONTENT_HEADERS = {"content-type": "application/json"}
 if TYPE_CHECKING:
     from mypy_extensions import Arg, KwArg
 
+    from runzero.types import ModelView
+
     HandlerType = Callable[[Arg(RequestsResponse, "response"), KwArg(Any)], RequestsResponse]
 else:
     HandlerType = Callable[[RequestsResponse], RequestsResponse]
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+ViewT = TypeVar("ViewT", bound="ModelView[Any]")
+
+TimeoutType = Union[float, Tuple[float, float]]
+
 
 class Response:
     """The response from an HTTP request."""
@@ -48,11 +73,77 @@ class Response:
         self.status_code = response.status_code
         self.headers = response.headers
         self.rate_limit_information = RateLimitInformation.from_headers(response.headers)
+        self.etag: Optional[str] = response.headers.get("ETag")
+        self.last_modified: Optional[str] = response.headers.get("Last-Modified")
+        self.shared = False
+        self.trusted = False
+        self._parsed: Dict[Type[BaseModel], List[BaseModel]] = {}
         try:
             self.json_obj = response.json()
         except JSONDecodeError:
             self.json_obj = None
 
+    @property
+    def not_modified(self) -> bool:
+        """True if the server answered a conditional request with 304 Not Modified."""
+        return self.status_code == 304
+
+    def model(self, model: Type[ModelT], obj: Optional[Any] = None) -> ModelT:
+        """Parses a JSON object body into a model.
+
+        Trusted responses, those of a client created with ``trusted_responses=True``, are not
+        validated. Their fields are converted as they are first read.
+
+        :param model: the pydantic model type of the body
+        :param obj: Optional part of the body to parse instead of the whole, such as the object
+            under its "data" key
+
+        :returns: the model
+        :raises: ValidationError
+        """
+        if obj is None:
+            obj = self.json_obj
+        if self.trusted:
+            return construct(model, obj)
+        return parse(model, obj)
+
+    def views(self, view: Type[ViewT]) -> List[ViewT]:
+        """Wraps a JSON list body in read-only views, which take far less memory than models.
+
+        Equal strings across the list, such as organization and site IDs, are stored once.
+
+        :param view: the :class:`runzero.types.ModelView` type of each list item
+
+        :returns: a list of views
+        """
+        memo: Dict[str, str] = {}
+        return [view(obj, memo) for obj in self.json_obj or []]
+
+    def models(self, model: Type[ModelT]) -> List[ModelT]:
+        """Parses a JSON list body into models.
+
+        Responses which are shared, such as those held by a response cache, are parsed once
+        per model type. Later calls return shallow copies of the parsed models rather than
+        validating the body again.
+
+        Trusted responses, those of a client created with ``trusted_responses=True``, are not
+        validated. Their models are built anew on every call, as converting fields as they are
+        read changes the models.
+
+        :param model: the pydantic model type of each list item
+
+        :returns: a list of models
+        """
+        if self.trusted:
+            return [construct(model, obj) for obj in self.json_obj or []]
+        if not self.shared:
+            return [parse(model, obj) for obj in self.json_obj or []]
+        parsed = self._parsed.get(model)
+        if parsed is None:
+            parsed = [parse(model, obj) for obj in self.json_obj or []]
+            self._parsed[model] = parsed
+        return [copy(item) for item in parsed]  # type: ignore[misc]
+
 
 class Request:
     """A wrapper around API http requests to keep all callers in-bounds.
@@ -61,11 +152,19 @@ class Request:
     :param method: The REST verb to use
     :param handlers: A list of handler functions to apply to each request
     :param params: Any additional query parameters
+    :param timeout: Optional timeout in seconds, either one value for both connecting and reading,
+        or a (connect, read) tuple
     :param validate_certificate: False to disable server certificate validation. Default is True (validate).
     :param data: The data to send in form body (POST, PATCH, PUT)
     :param files: For multipart form data or file uploads. Format varies.
     :param multipart: True if using a multipart form data (combination file[s] and form data)
+    :param headers: Optional additional request headers
+    :param session: Optional Session to send the request through, reusing its pooled connections.
+        By default each request opens its own connection.
 
+    After :meth:`execute` returns or raises, ``sent_at`` (a :func:`time.perf_counter` reading),
+    ``status_code``, ``bytes_sent``, ``bytes_received``, and the connect, TLS, time-to-first-byte
+    and body read phases of ``timing`` describe the exchange as far as it got.
     """
 
     def __init__(
@@ -75,11 +174,13 @@ class Request:
         method: str,
         handlers: Optional[List[HandlerType]] = None,
         params: Optional[Dict[str, Any]] = None,
-        timeout: Optional[int] = None,
+        timeout: Optional[TimeoutType] = None,
         validate_certificate: Optional[bool] = None,
         data: Optional[Any] = None,
         files: Optional[Any] = None,
         multipart: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+        session: Optional[Session] = None,
     ):
         """Class constructor"""
         self.url = url
@@ -90,7 +191,7 @@ class Request:
             self.handlers = handlers
         self.token = token
         self.params = params
-        self.timeout: Optional[int] = timeout
+        self.timeout: Optional[TimeoutType] = timeout
         if validate_certificate is None:
             self._validate_cert = True
         else:
@@ -102,18 +203,36 @@ class Request:
             self.multipart = False
         else:
             self.multipart = True
+        self.headers = headers
+        self.session = session
+        self.timing = RequestTiming()
+        self.sent_at: Optional[float] = None
+        self.status_code: Optional[int] = None
+        self.bytes_sent: Optional[int] = None
+        self.bytes_received: Optional[int] = None
+
+    def _record_status(self, response: RequestsResponse, **kwargs: Any) -> RequestsResponse:
+        # pylint: disable=unused-argument
+        self.status_code = response.status_code
+        return response
+
+    def _since_connected(self, start: float) -> float:
+        return time.perf_counter() - start - (self.timing.connect or 0.0) - (self.timing.tls or 0.0)
 
     def _prepare(self) -> PreparedRequest:
         if self.method not in ALLOWED_VERBS:
             raise UnsupportedRequestError(f"Unsupported http verb {self.method}")
 
-        headers = {}
+        headers: Dict[str, str] = {}
         if not self.multipart:
             # With requests files= arg for multipart,
             # setting the content type explicitly to form/multipart
             # with boundaries is discouraged. 'requests' handles automatically.
-            headers = DEFAULT_CONTENT_HEADERS
+            headers.update(DEFAULT_CONTENT_HEADERS)
+        if self.headers:
+            headers.update(self.headers)
 
+        self.handlers.insert(0, self._record_status)
         self.handlers.append(_error_handler)
         req = RequestsRequest(
             method=self.method,
@@ -136,11 +255,28 @@ class Request:
                 to the server.
         """
         prepared_request = self._prepare()
-        session = Session()
+        self.bytes_sent = _body_size(prepared_request)
+        session = self.session
+        if session is None:
+            session = Session()
+            session.mount("https://", TimedHTTPAdapter())
         try:
-            response = session.send(prepared_request, verify=self.validate_certificate, timeout=self.timeout)
+            start = self.sent_at = time.perf_counter()
+            with recording(self.timing):
+                try:
+                    response = session.send(
+                        prepared_request, verify=self.validate_certificate, timeout=self.timeout, stream=True
+                    )
+                finally:
+                    # error responses are raised from within send, after their headers arrived
+                    if self.status_code is not None:
+                        self.timing.ttfb = self._since_connected(start)
+                headers_at = time.perf_counter()
+                content = response.content
+            self.timing.body_read = time.perf_counter() - headers_at
+            self.bytes_received = _received_size(response, content)
             return Response(response)
-        except RequestsConnectTimeout as exc:
+        except (RequestsConnectTimeout, RequestsReadTimeout) as exc:
             raise ConnTimeoutError from exc
         except (RequestsConnectionError, ConnectionRefusedError) as exc:
             raise ConnError from exc
@@ -148,6 +284,29 @@ class Request:
             raise CommunicationError from exc
 
 
+def _body_size(request: PreparedRequest) -> int:
+    length = request.headers.get("Content-Length")
+    if length is not None and length.isdigit():
+        return int(length)
+    body = request.body
+    if isinstance(body, (bytes, str)):
+        return len(body.encode("utf-8") if isinstance(body, str) else body)
+    return 0
+
+
+def _received_size(response: RequestsResponse, content: Optional[bytes]) -> int:
+    # prefer the bytes read from the wire, which differ from the decoded body when compressed
+    tell = getattr(response.raw, "tell", None)
+    if callable(tell):
+        try:
+            read = tell()
+            if isinstance(read, int) and read > 0:
+                return read
+        except (OSError, ValueError):
+            pass
+    return len(content or b"")
+
+
 def _error_handler(response: RequestsResponse, **kwargs: Any) -> RequestsResponse:
     # pylint: disable=unused-argument
     if not 400 <= response.status_code <= 599:
@@ -0,0 +1,206 @@
+"""
+pool provides the long-lived connection pool each Client sends its requests through.
+"""
+
+import socket
+import ssl
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type, cast
+
+from requests import PreparedRequest, Session
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.exceptions import HTTPError as URLLib3HTTPError
+
+from runzero.client._http.dns import DNSCache
+from runzero.client._http.timing import TimedHTTPAdapter
+
+if TYPE_CHECKING:
+    from urllib3._base_connection import BaseHTTPConnection
+
+
+class _RememberingSSLSocket(ssl.SSLSocket):  # pylint: disable=abstract-method
+    """An SSLSocket which hands its TLS session to its context before closing."""
+
+    def _real_close(self) -> None:
+        context = self.context
+        if isinstance(context, _ResumingSSLContext):
+            context.remember(self)
+        super()._real_close()  # type: ignore[misc]
+
+
+class _ResumingSSLContext(ssl.SSLContext):
+    """An SSLContext which offers each server the TLS session from its most recent connection."""
+
+    sslsocket_class = _RememberingSSLSocket
+
+    def __init__(self, protocol: int = ssl.PROTOCOL_TLS_CLIENT):
+        # pylint: disable=unused-argument
+        super().__init__()
+        self._session_lock = threading.Lock()
+        self._sessions: Dict[str, ssl.SSLSession] = {}
+        self._sockets: "weakref.WeakValueDictionary[str, ssl.SSLSocket]" = weakref.WeakValueDictionary()
+        self._loaded: Set[Tuple[Any, Any, Any]] = set()
+
+    def load_verify_locations(self, cafile: Any = None, capath: Any = None, cadata: Any = None) -> None:
+        # urllib3 loads the CA bundle before every handshake; parse it once per context instead
+        key = (cafile, capath, cadata if not isinstance(cadata, bytearray) else bytes(cadata))
+        with self._session_lock:
+            if key in self._loaded:
+                return
+            super().load_verify_locations(cafile, capath, cadata)
+            self._loaded.add(key)
+
+    def wrap_socket(  # type: ignore[override]
+        self,
+        sock: socket.socket,
+        server_side: bool = False,
+        do_handshake_on_connect: bool = True,
+        suppress_ragged_eofs: bool = True,
+        server_hostname: Optional[str] = None,
+        session: Optional[ssl.SSLSession] = None,
+    ) -> ssl.SSLSocket:
+        if session is None and server_hostname is not None and not server_side:
+            session = self._session_for(server_hostname)
+        wrapped = super().wrap_socket(
+            sock,
+            server_side=server_side,
+            do_handshake_on_connect=do_handshake_on_connect,
+            suppress_ragged_eofs=suppress_ragged_eofs,
+            server_hostname=server_hostname,
+            session=session,
+        )
+        if server_hostname is not None and not server_side:
+            with self._session_lock:
+                self._sockets[server_hostname] = wrapped
+        return wrapped
+
+    def remember(self, sock: ssl.SSLSocket) -> None:
+        """Keeps the resumable TLS session of sock for its server's next connection."""
+        hostname = sock.server_hostname
+        if hostname is None:
+            return
+        try:
+            session = sock.session
+        except (OSError, ValueError):
+            return
+        if session is not None and session.has_ticket:
+            with self._session_lock:
+                self._sessions[hostname] = session
+
+    def _session_for(self, hostname: str) -> Optional[ssl.SSLSession]:
+        # TLS 1.3 tickets arrive after the handshake, so the latest open socket may hold a newer session
+        with self._session_lock:
+            latest = self._sockets.get(hostname)
+        if latest is not None:
+            self.remember(latest)
+        with self._session_lock:
+            return self._sessions.get(hostname)
+
+
+def _resuming_context(validate_certificate: bool) -> ssl.SSLContext:
+    # mirrors urllib3's defaults, except that session tickets stay enabled so sessions can resume;
+    # the CA bundle is loaded by urllib3 as it would be for its own contexts
+    context = _ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.options |= ssl.OP_NO_COMPRESSION
+    context.post_handshake_auth = True
+    if not validate_certificate:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def _with_dns_cache(pool_cls: Type[HTTPConnectionPool], dns_cache: DNSCache) -> Type[HTTPConnectionPool]:
+    connection_cls = type(pool_cls.ConnectionCls.__name__, (pool_cls.ConnectionCls,), {"dns_cache": dns_cache})
+    return type(pool_cls.__name__, (pool_cls,), {"ConnectionCls": connection_cls})
+
+
+class PooledHTTPAdapter(TimedHTTPAdapter):
+    """A timed adapter which keeps connections to the server open across requests.
+
+    :param validate_certificate: False to disable server certificate validation
+    :param max_connections: the number of idle connections kept per host
+    :param dns_cache: Optional cache used to resolve host names when opening connections
+    :param resume_tls_sessions: True to share one SSLContext and resume TLS sessions on reconnect
+    """
+
+    def __init__(
+        self,
+        validate_certificate: bool = True,
+        max_connections: int = 10,
+        dns_cache: Optional[DNSCache] = None,
+        resume_tls_sessions: bool = True,
+    ):
+        """Constructor method"""
+        # init_poolmanager runs within the base constructor and needs these
+        self.dns_cache = dns_cache
+        self._ssl_context = _resuming_context(validate_certificate) if resume_tls_sessions else None
+        self.max_connections = max_connections
+        super().__init__(pool_maxsize=max_connections)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        if self._ssl_context is not None:
+            pool_kwargs.setdefault("ssl_context", self._ssl_context)
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        if self.dns_cache is not None:
+            self.poolmanager.pool_classes_by_scheme = {
+                scheme: _with_dns_cache(pool_cls, self.dns_cache)
+                for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+            }
+
+    def warm_up(self, url: str, connections: int, verify: bool, timeout: float) -> int:
+        """
+        Opens connections to the host of url and leaves them idle in the pool.
+
+        :param url: any url on the host to connect to
+        :param connections: the number of connections wanted, capped at the pool size
+        :param verify: whether to verify the server certificate
+        :param timeout: the connect timeout for each connection, in seconds
+
+        :returns: the number of connections open and idle in the pool afterwards
+        :raises: urllib3.exceptions.HTTPError or OSError if no connection could be opened
+        """
+        request = PreparedRequest()
+        request.prepare(method="GET", url=url)
+        pool = cast(HTTPConnectionPool, self.get_connection_with_tls_context(request, verify))
+        self.cert_verify(pool, url, verify, None)
+        # pylint: disable=protected-access
+        conns: List["BaseHTTPConnection"] = [pool._get_conn() for _ in range(min(connections, self.max_connections))]
+        with ThreadPoolExecutor(max_workers=len(conns) or 1) as executor:
+            results = list(executor.map(lambda conn: _connect(conn, timeout), conns))
+        for conn, _ in results:
+            pool._put_conn(conn)
+        errors = [error for _, error in results if error is not None]
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        return len(results) - len(errors)
+
+
+def _connect(conn: "BaseHTTPConnection", timeout: float) -> Tuple["BaseHTTPConnection", Optional[Exception]]:
+    if conn.is_connected:
+        return conn, None
+    conn.timeout = timeout
+    try:
+        conn.connect()
+    except (URLLib3HTTPError, OSError) as exc:
+        conn.close()
+        return conn, exc
+    return conn, None
+
+
+def pooled_session(adapter: PooledHTTPAdapter) -> Session:
+    """
+    A Session sending every request through adapter, which stores no cookies between requests.
+
+    :param adapter: the adapter to mount for http and https
+
+    :returns: the Session
+    """
+    session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
@@ -0,0 +1,136 @@
+"""
+timing provides a requests transport adapter which measures connection setup for instrumentation.
+"""
+
+import ssl
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.wait import wait_for_read
+
+from runzero.client._http.dns import DNSCache
+from runzero.client.instrumentation import RequestTiming
+
+_recording = threading.local()
+
+
+@contextmanager
+def recording(timing: RequestTiming) -> Iterator[RequestTiming]:
+    """Records connect and TLS time for connections opened by the current thread into timing."""
+    previous: Optional[RequestTiming] = getattr(_recording, "timing", None)
+    _recording.timing = timing
+    try:
+        yield timing
+    finally:
+        _recording.timing = previous
+
+
+def _current() -> Optional[RequestTiming]:
+    timing: Optional[RequestTiming] = getattr(_recording, "timing", None)
+    return timing
+
+
+def _open_socket(conn: HTTPConnection, new_conn: Callable[[], Any], dns_cache: Optional[DNSCache]) -> Any:
+    """Opens the socket for conn, timing it and resolving the host through dns_cache when one is set."""
+    start = time.perf_counter()
+    sock = new_conn() if dns_cache is None else _open_resolved(conn, new_conn, dns_cache)
+    timing = _current()
+    if timing is not None:
+        timing.connect = time.perf_counter() - start
+    return sock
+
+
+def _open_resolved(conn: HTTPConnection, new_conn: Callable[[], Any], dns_cache: DNSCache) -> Any:
+    # urllib3 connects to _dns_host while verifying TLS against host, so only the former is swapped
+    host = conn._dns_host  # pylint: disable=protected-access
+    port = conn.port or 0
+    error: Optional[NewConnectionError] = None
+    for address in dns_cache.resolve(host, port):
+        conn._dns_host = address  # pylint: disable=protected-access
+        try:
+            return new_conn()
+        except NewConnectionError as exc:
+            error = exc
+        finally:
+            conn._dns_host = host  # pylint: disable=protected-access
+    if error is None:
+        return new_conn()
+    # every cached address failed; the host may have moved
+    dns_cache.discard(host, port)
+    raise error
+
+
+def _read_session_tickets(sock: ssl.SSLSocket) -> None:
+    """
+    Reads TLS records pending on an idle socket, expecting only post-handshake messages.
+
+    :raises: OSError if the server sent data or closed the connection
+    """
+    timeout = sock.gettimeout()
+    sock.setblocking(False)
+    try:
+        sock.recv(1)
+    except ssl.SSLWantReadError:
+        return
+    finally:
+        sock.settimeout(timeout)
+    raise ConnectionError("unexpected data on an idle connection")
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    dns_cache: Optional[DNSCache] = None
+
+    def _new_conn(self) -> Any:
+        return _open_socket(self, super()._new_conn, self.dns_cache)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    dns_cache: Optional[DNSCache] = None
+
+    def _new_conn(self) -> Any:
+        return _open_socket(self, super()._new_conn, self.dns_cache)
+
+    @property
+    def is_connected(self) -> bool:
+        sock = self.sock
+        if isinstance(sock, ssl.SSLSocket) and sock.version() == "TLSv1.3" and wait_for_read(sock, timeout=0.0):
+            # a TLS 1.3 server sends session tickets after the handshake, which leave an idle
+            # connection readable; process them rather than mistake the connection for dropped
+            try:
+                _read_session_tickets(sock)
+            except OSError:
+                return False
+        return super().is_connected
+
+    def connect(self) -> None:
+        start = time.perf_counter()
+        super().connect()
+        timing = _current()
+        if timing is not None:
+            # connect() opens the socket through _new_conn, then performs the handshake
+            timing.tls = max(0.0, time.perf_counter() - start - (timing.connect or 0.0))
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """An HTTPAdapter whose connections report their setup time to :func:`recording`."""
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
@@ -0,0 +1,63 @@
+"""
+refresher runs periodic background renewal of short-lived credentials.
+"""
+
+import threading
+from typing import Callable, Optional
+
+
+class BackgroundRefresher:
+    """Calls refresh in a daemon thread whenever it becomes due.
+
+    Failed refreshes are retried with exponential backoff. Callers which need a credential before
+    the refresher has renewed it remain responsible for refreshing it themselves.
+
+    :param due_in: returns the number of seconds until the next refresh is due, or None to stop
+    :param refresh: renews the credential
+    :param retry_interval: seconds to wait after the first failed refresh
+    :param max_retry_interval: the longest wait between failed refreshes
+    """
+
+    def __init__(
+        self,
+        due_in: Callable[[], Optional[float]],
+        refresh: Callable[[], None],
+        retry_interval: float = 5.0,
+        max_retry_interval: float = 60.0,
+    ):
+        self._due_in = due_in
+        self._refresh = refresh
+        self._retry_interval = retry_interval
+        self._max_retry_interval = max_retry_interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="runzero-token-refresh", daemon=True)
+
+    def start(self) -> None:
+        """Starts the refresher thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the refresher thread. Safe to call more than once."""
+        self._stop.set()
+
+    @property
+    def running(self) -> bool:
+        """True while the refresher thread is alive."""
+        return self._thread.is_alive()
+
+    def _run(self) -> None:
+        retry = self._retry_interval
+        while not self._stop.is_set():
+            delay = self._due_in()
+            if delay is None:
+                return
+            if delay > 0:
+                self._stop.wait(delay)
+                continue
+            try:
+                self._refresh()
+                retry = self._retry_interval
+            except Exception:  # pylint: disable=broad-except
+                # the request path surfaces the failure if the credential actually expires
+                self._stop.wait(retry)
+                retry = min(retry * 2, self._max_retry_interval)
@@ -0,0 +1,93 @@
+"""
+singleflight collapses concurrent identical calls into a single execution whose outcome is shared.
+"""
+
+import threading
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+ResultT = TypeVar("ResultT")
+
+
+class WaitTimeoutError(TimeoutError):
+    """Raised to a caller whose wait for another caller's in-flight execution timed out."""
+
+
+class _Call(Generic[ResultT]):
+    """An in-flight call and its eventual outcome."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[ResultT] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight(Generic[ResultT]):
+    """Runs at most one call per key at a time.
+
+    The first caller for a key executes the call. Callers arriving with the same key while it is in
+    flight wait for it and receive the same result, or have the same exception raised.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call[ResultT]] = {}
+        self._shared = 0
+
+    @property
+    def shared(self) -> int:
+        """The number of calls answered by another caller's in-flight execution."""
+        return self._shared
+
+    def do(
+        self,
+        key: Hashable,
+        func: Callable[[], ResultT],
+        on_shared: Optional[Callable[[ResultT], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> ResultT:
+        """Executes func, or waits for the in-flight execution with the same key.
+
+        :param key: identifies calls which are interchangeable
+        :param func: the call to execute
+        :param on_shared: Optional callback invoked with the result by the executing caller, before
+            any waiting callers are released, when the result is going to be shared.
+        :param timeout: Optional number of seconds to wait for another caller's execution. The
+            executing caller is not limited by it.
+
+        :returns: the result of func
+        :raises: whatever func raises, or WaitTimeoutError if the wait for another caller's execution
+            timed out
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+                self._shared += 1
+        if not leader:
+            if not call.done.wait(timeout):
+                raise WaitTimeoutError("timed out waiting for an in-flight call")
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            try:
+                if call.waiters and call.error is None and on_shared is not None:
+                    on_shared(call.result)  # type: ignore[arg-type]
+            finally:
+                call.done.set()
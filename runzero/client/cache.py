@@ -0,0 +1,293 @@
+"""
+cache provides an optional, in-memory response cache for read requests made by the Client.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    from runzero.client._http.io import Response
+
+__all__ = [
+    "CacheStats",
+    "ResponseCache",
+]
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...], str, str]
+
+
+@dataclass
+class CacheStats:
+    """A point-in-time view of :class:`ResponseCache` effectiveness.
+
+    :param hits: number of lookups answered from the cache
+    :param misses: number of lookups which required a request to the server
+    :param evictions: number of entries removed to stay within the size cap
+    :param invalidations: number of entries removed because a write touched their resource
+    :param revalidations: number of expired entries the server confirmed unchanged with 304 Not Modified
+    :param size: number of entries currently held
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    revalidations: int
+    size: int
+
+
+class _Entry:
+    """A single cached response and the bookkeeping needed to expire it."""
+
+    __slots__ = ("endpoint", "response", "expires_at")
+
+    def __init__(self, endpoint: str, response: Response, expires_at: float):
+        self.endpoint = endpoint
+        self.response = response
+        self.expires_at = expires_at
+
+    @property
+    def has_validators(self) -> bool:
+        """True if the response can be revalidated with a conditional request."""
+        return bool(self.response.etag or self.response.last_modified)
+
+
+class ResponseCache:
+    """A size-capped, least-recently-used cache of GET responses with per-endpoint time-to-live.
+
+    Provide an instance to :class:`runzero.Client` to enable caching. Entries are keyed by endpoint,
+    query parameters, and the auth scope used for the request. Any PUT, PATCH, POST, or DELETE sent
+    through the same Client invalidates cached entries for the resource it touched, its parent
+    collection, and anything beneath it.
+
+    Cached responses are shared between callers and must be treated as read-only.
+
+    When the server provides ``ETag`` or ``Last-Modified`` validators, expired entries are kept
+    and the next request for them is made conditional. A 304 Not Modified answer refreshes the
+    entry and the cached response, including its already-parsed models, is returned without
+    transferring or decoding the body again. Setting a time-to-live of 0 with revalidation enabled
+    makes every request conditional.
+
+    :param default_ttl_seconds: time-to-live for endpoints without an entry in ``ttls``.
+        A value of 0 disables caching for those endpoints.
+    :param ttls: Optional mapping of endpoint path prefix to time-to-live in seconds, such as
+        ``{"api/v1.0/org/sites": 300}``. The longest matching prefix wins.
+    :param max_entries: the maximum number of responses held before least-recently-used entries
+        are evicted.
+    :param revalidate: whether to keep responses which carry validators past their time-to-live
+        and make conditional requests for them. Default is True.
+
+    :raises: ValueError for negative time-to-live values or a non-positive size cap
+    """
+
+    def __init__(
+        self,
+        default_ttl_seconds: float = 60,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_entries: int = 256,
+        revalidate: bool = True,
+    ):
+        """Constructor method"""
+        if default_ttl_seconds < 0:
+            raise ValueError("default_ttl_seconds must not be negative")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        self._default_ttl = float(default_ttl_seconds)
+        self._ttls: List[Tuple[str, float]] = []
+        for prefix, ttl in (ttls or {}).items():
+            if ttl < 0:
+                raise ValueError(f"ttl for {prefix} must not be negative")
+            self._ttls.append((prefix.strip("/"), float(ttl)))
+        # longest prefix first so the most specific rule wins
+        self._ttls.sort(key=lambda item: len(item[0]), reverse=True)
+        self._max_entries = max_entries
+        self._revalidate = revalidate
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._clock: Callable[[], float] = time.monotonic
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._revalidations = 0
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Mapping[str, Any]], scope: str, identity: str = "") -> CacheKey:
+        """Builds the cache key for a request.
+
+        :param endpoint: the path the request is sent to
+        :param params: URL query parameters of the request
+        :param scope: the auth scope the request is made with
+        :param identity: a fingerprint of the server and credential the request is made with, so
+            clients sharing a cache never read each other's responses
+
+        :returns: a hashable key
+        """
+        normalized: Tuple[Tuple[str, str], ...] = ()
+        if params:
+            normalized = tuple(sorted((str(k), str(v)) for k, v in params.items()))
+        return endpoint.strip("/"), normalized, scope, identity
+
+    def ttl_for(self, endpoint: str) -> float:
+        """The time-to-live in seconds applied to responses from the given endpoint.
+
+        :param endpoint: the path the request is sent to
+
+        :returns: time-to-live in seconds
+        """
+        endpoint = endpoint.strip("/")
+        for prefix, ttl in self._ttls:
+            if endpoint == prefix or endpoint.startswith(prefix + "/"):
+                return ttl
+        return self._default_ttl
+
+    def get(self, key: CacheKey) -> Optional[Response]:
+        """Retrieves a fresh response for the key, counting the lookup as a hit or miss.
+
+        :param key: a key built by :meth:`key`
+
+        :returns: the cached response, or None if absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= self._clock():
+                if not (self._revalidate and entry.has_validators):
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.response
+
+    def put(self, key: CacheKey, response: Response) -> None:
+        """Stores a response, evicting the least-recently-used entries if needed.
+
+        Responses for endpoints with a time-to-live of 0 are only stored when they carry
+        validators and revalidation is enabled.
+
+        :param key: a key built by :meth:`key`
+        :param response: the response to store
+        """
+        endpoint = key[0]
+        ttl = self.ttl_for(endpoint)
+        entry = _Entry(endpoint, response, self._clock() + ttl)
+        if ttl <= 0 and not (self._revalidate and entry.has_validators):
+            return
+        response.shared = True
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def conditional_headers(self, key: CacheKey) -> Dict[str, str]:
+        """The conditional request headers to revalidate an expired entry with the server.
+
+        :param key: a key built by :meth:`key`
+
+        :returns: If-None-Match and/or If-Modified-Since headers, or an empty dict when there is
+            nothing to revalidate
+        """
+        headers: Dict[str, str] = {}
+        if not self._revalidate:
+            return headers
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return headers
+        if entry.response.etag:
+            headers["If-None-Match"] = entry.response.etag
+        if entry.response.last_modified:
+            headers["If-Modified-Since"] = entry.response.last_modified
+        return headers
+
+    def revalidated(self, key: CacheKey) -> Optional[Response]:
+        """Marks an entry as confirmed unchanged by the server, renewing its time-to-live.
+
+        :param key: a key built by :meth:`key`
+
+        :returns: the cached response, or None if it was evicted or invalidated meanwhile
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.expires_at = self._clock() + self.ttl_for(entry.endpoint)
+            self._entries.move_to_end(key)
+            self._revalidations += 1
+            return entry.response
+
+    def invalidate(self, endpoint: str) -> int:
+        """Removes entries affected by a write to the given endpoint.
+
+        Affected entries are those for the endpoint itself, any of its ancestors within the resource
+        collection, and anything beneath it. Account and organization scoped paths to the same
+        resource are treated as the same resource.
+
+        :param endpoint: the path a write request was sent to
+
+        :returns: the number of entries removed
+        """
+        written = _resource_path(endpoint)
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if _resources_overlap(written, _resource_path(entry.endpoint))
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Removes all entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Current cache counters.
+
+        :returns: a :class:`CacheStats` snapshot
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                revalidations=self._revalidations,
+                size=len(self._entries),
+            )
+
+
+_SCOPE_SEGMENTS = frozenset(["org", "account"])
+
+
+def _resource_path(endpoint: str) -> List[str]:
+    """Splits an endpoint into resource segments, dropping the api version and auth scope prefix."""
+    parts = [part for part in endpoint.strip("/").split("/") if part]
+    if len(parts) >= 2 and parts[0] == "api":
+        parts = parts[2:]
+    if parts and parts[0] in _SCOPE_SEGMENTS:
+        parts = parts[1:]
+    return parts
+
+
+def _resources_overlap(written: List[str], cached: List[str]) -> bool:
+    """True if one path is a prefix of the other, down to the resource collection."""
+    if not written or not cached:
+        return written == cached
+    if written[0] != cached[0]:
+        return False
+    shortest = min(len(written), len(cached))
+    return written[:shortest] == cached[:shortest]
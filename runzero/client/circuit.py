@@ -0,0 +1,226 @@
+"""
+circuit provides a per-endpoint circuit breaker which makes a Client fail fast against a degraded console.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict, Optional
+
+from runzero.client.errors import (
+    CircuitOpenError,
+    ConnError,
+    ConnTimeoutError,
+    DeadlineExceededError,
+    ServerError,
+)
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitState",
+    "CircuitStatus",
+]
+
+
+class CircuitState(str, Enum):
+    """The states of a circuit."""
+
+    CLOSED = "closed"
+    """Requests are sent normally."""
+
+    OPEN = "open"
+    """Requests fail fast with CircuitOpenError."""
+
+    HALF_OPEN = "half_open"
+    """A limited number of probe requests are sent to test whether the endpoint has recovered."""
+
+
+@dataclass(frozen=True)
+class CircuitStatus:
+    """A point-in-time view of one endpoint template's circuit.
+
+    :param template: the endpoint template
+    :param state: the :class:`CircuitState`
+    :param consecutive_failures: failures since the last success
+    :param times_opened: how many times the circuit has opened
+    """
+
+    template: str
+    state: CircuitState
+    consecutive_failures: int
+    times_opened: int
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probes", "times_opened")
+
+    def __init__(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.times_opened = 0
+
+
+class Attempt:
+    """A request let through by :meth:`CircuitBreaker.attempt`, whose outcome must be reported once."""
+
+    __slots__ = ("_breaker", "_template", "_probe", "_done")
+
+    def __init__(self, breaker: "CircuitBreaker", template: str, probe: bool):
+        self._breaker = breaker
+        self._template = template
+        self._probe = probe
+        self._done = False
+
+    def record(self, error: Optional[BaseException] = None, latency: Optional[float] = None) -> None:
+        """
+        Reports the outcome of the request.
+
+        :param error: the exception the request failed with, if any
+        :param latency: Optional request latency in seconds, compared against the slow call threshold
+        """
+        if self._done:
+            return
+        self._done = True
+        # pylint: disable-next=protected-access
+        self._breaker._record(self._template, self._probe, _is_failure(error, latency, self._breaker))
+
+    def cancel(self) -> None:
+        """Reports that the request was never sent, so it counts as neither success nor failure."""
+        if self._done:
+            return
+        self._done = True
+        # pylint: disable-next=protected-access
+        self._breaker._cancel(self._template, self._probe)
+
+
+class CircuitBreaker:
+    """Stops sending requests to an endpoint template after consecutive failures, then probes for recovery.
+
+    A :class:`runzero.client.errors.ConnError`, :class:`runzero.client.errors.ConnTimeoutError` or
+    :class:`runzero.client.ServerError`, or a request slower than ``slow_call_seconds``, is a
+    failure. After ``failure_threshold`` consecutive failures for an endpoint template the circuit
+    opens, and requests to it raise :class:`runzero.client.errors.CircuitOpenError` without being
+    sent. After ``reset_timeout_seconds`` the circuit is half-open: up to ``half_open_probes``
+    requests are sent, and the circuit closes if one succeeds or opens again if one fails.
+
+    Provide an instance to :class:`runzero.Client` with ``circuit_breaker``.
+
+    :param failure_threshold: consecutive failures which open the circuit
+    :param reset_timeout_seconds: how long the circuit stays open before probing
+    :param slow_call_seconds: Optional latency beyond which a successful request counts as a failure
+    :param half_open_probes: the number of requests let through at once while half-open
+
+    :raises: ValueError for non-positive settings
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30,
+        slow_call_seconds: Optional[float] = None,
+        half_open_probes: int = 1,
+    ):
+        """Constructor method"""
+        if failure_threshold <= 0 or half_open_probes <= 0:
+            raise ValueError("failure_threshold and half_open_probes must be greater than 0")
+        if reset_timeout_seconds <= 0 or (slow_call_seconds is not None and slow_call_seconds <= 0):
+            raise ValueError("reset_timeout_seconds and slow_call_seconds must be greater than 0")
+        self._threshold = failure_threshold
+        self._reset_timeout = reset_timeout_seconds
+        self.slow_call_seconds = slow_call_seconds
+        self._max_probes = half_open_probes
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+        self._clock: Callable[[], float] = time.monotonic
+
+    def attempt(self, template: str) -> Attempt:
+        """
+        Asks to send a request to an endpoint template.
+
+        :param template: the endpoint template, see :func:`runzero.client.instrumentation.endpoint_template`
+
+        :returns: an :class:`Attempt` whose outcome must be recorded
+        :raises: CircuitOpenError if the circuit is open, or half-open with all probes in flight
+        """
+        with self._lock:
+            circuit = self._circuits.get(template)
+            if circuit is None:
+                circuit = self._circuits[template] = _Circuit()
+            if circuit.state is CircuitState.CLOSED:
+                return Attempt(self, template, probe=False)
+            retry_after = circuit.opened_at + self._reset_timeout - self._clock()
+            if circuit.state is CircuitState.OPEN:
+                if retry_after > 0:
+                    raise CircuitOpenError(template, retry_after)
+                circuit.state = CircuitState.HALF_OPEN
+            if circuit.probes >= self._max_probes:
+                raise CircuitOpenError(template, max(0.0, retry_after))
+            circuit.probes += 1
+            return Attempt(self, template, probe=True)
+
+    def state(self, template: str) -> CircuitStatus:
+        """
+        The current status of an endpoint template's circuit.
+
+        :param template: the endpoint template
+
+        :returns: a :class:`CircuitStatus`
+        """
+        with self._lock:
+            return _status(template, self._circuits.get(template) or _Circuit())
+
+    def states(self) -> Dict[str, CircuitStatus]:
+        """
+        The current status of every circuit which has seen a request.
+
+        :returns: statuses keyed by endpoint template
+        """
+        with self._lock:
+            return {template: _status(template, circuit) for template, circuit in self._circuits.items()}
+
+    def reset(self) -> None:
+        """Closes every circuit and forgets recorded failures."""
+        with self._lock:
+            self._circuits.clear()
+
+    def _record(self, template: str, probe: bool, failed: bool) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(template, _Circuit())
+            if probe:
+                circuit.probes = max(0, circuit.probes - 1)
+            if not failed:
+                circuit.failures = 0
+                if circuit.state is CircuitState.HALF_OPEN and probe:
+                    circuit.state = CircuitState.CLOSED
+                return
+            circuit.failures += 1
+            reopen = circuit.state is CircuitState.HALF_OPEN and probe
+            if reopen or (circuit.state is CircuitState.CLOSED and circuit.failures >= self._threshold):
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = self._clock()
+                circuit.times_opened += 1
+
+    def _cancel(self, template: str, probe: bool) -> None:
+        if not probe:
+            return
+        with self._lock:
+            circuit = self._circuits.get(template)
+            if circuit is not None:
+                circuit.probes = max(0, circuit.probes - 1)
+
+
+def _status(template: str, circuit: _Circuit) -> CircuitStatus:
+    return CircuitStatus(template, circuit.state, circuit.failures, circuit.times_opened)
+
+
+def _is_failure(error: Optional[BaseException], latency: Optional[float], breaker: CircuitBreaker) -> bool:
+    if error is None:
+        slow = breaker.slow_call_seconds
+        return slow is not None and latency is not None and latency > slow
+    if isinstance(error, DeadlineExceededError):
+        # the caller ran out of time, which says nothing about the endpoint
+        return False
+    return isinstance(error, (ConnError, ConnTimeoutError, ServerError))
@@ -3,10 +3,20 @@ client provides the runZero platform Client which must be provided to all object
 with the runZero API.
 """
 
+# pylint: disable=too-many-lines
+
 from __future__ import annotations
 
+import hashlib
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple, Union
 from urllib.parse import urlparse
 
 import requests
@@ -15,15 +25,38 @@ from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import ConnectTimeout as RequestsConnectTimeout
 from requests.exceptions import ContentDecodingError
 from requests.exceptions import HTTPError as RequestsHTTPError
+from urllib3.exceptions import ConnectTimeoutError as URLLib3ConnectTimeoutError
+from urllib3.exceptions import HTTPError as URLLib3HTTPError
+from urllib3.exceptions import NewConnectionError
 
+from runzero._pydantic import dump_json, parse
 from runzero.types import RateLimitInformation
 
+from . import _fork
 from ._http.auth import OAuthToken, RegisteredAPIClient
-from ._http.io import Request, Response
-from .errors import AuthError
+from ._http.dns import DNSCache
+from ._http.io import Request, Response, TimeoutType
+from ._http.pool import PooledHTTPAdapter, pooled_session
+from ._refresher import BackgroundRefresher
+from ._singleflight import SingleFlight, WaitTimeoutError
+from .cache import CacheKey, ResponseCache
+from .circuit import Attempt, CircuitBreaker
+from .concurrency import AdaptiveConcurrencyLimiter, Permit
+from .config import ClientConfig, OAuthTokenState
+from .errors import AuthError, ConnError, ConnTimeoutError, DeadlineExceededError
+from .instrumentation import (
+    RequestEvent,
+    RequestHooks,
+    begin_event,
+    complete_event,
+    endpoint_template,
+)
+from .metrics import MetricsCollector, MetricsSnapshot
+from .scheduling import Priority, RequestScheduler, Ticket
+from .token_cache import TokenCache
 
 
-class Client:
+class Client:  # pylint: disable=too-many-public-methods
     """
     The authenticated connection to your runZero service destination.
 
@@ -52,16 +85,97 @@ class Client:
         'https://console.runzero.com' is used.
     :type server_url: str
 
+    :param timeout_seconds: Optional number of seconds to wait for the server to send data once
+        connected. Default is 180.
+    :type timeout_seconds: int
+
+    :param connect_timeout_seconds: Optional number of seconds to wait for a connection to the
+        server to be established. Defaults to the lesser of 10 and timeout_seconds, so an
+        unreachable server fails fast while large transfers keep the full read timeout.
+    :type connect_timeout_seconds: float
+
     :param validate_certificate: Optional bool to change whether Client checks
         the validity of the API server's certificate before proceeding. We recommend
         not setting this to false unless you are doing local development or testing.
         Ignoring certificate validation errors can result in credential theft or other
         bad outcomes.
     :type validate_certificate: bool
+
+    :param response_cache: Optional :class:`runzero.client.ResponseCache` which holds GET
+        responses for reuse. Writes made through this client invalidate affected entries.
+        If not provided, every request is sent to the server.
+    :type response_cache: ResponseCache
+
+    :param coalesce_requests: Optional bool to share a single in-flight GET between concurrent
+        callers requesting the same endpoint with the same parameters and auth scope. Waiting callers
+        receive the same response, or the same exception. Default is False.
+    :type coalesce_requests: bool
+
+    :param token_cache: Optional :class:`runzero.client.TokenCache` which lets :meth:`oauth_login`
+        reuse a still-valid OAuth token saved by an earlier process, and saves tokens this client
+        obtains. If not provided, every login requests a new token.
+    :type token_cache: TokenCache
+
+    :param background_token_refresh: Optional bool to renew the OAuth token in a background thread
+        ahead of its expiry, so no request waits on a token refresh. Call :meth:`close` to stop the
+        thread. Default is False.
+    :type background_token_refresh: bool
+
+    :param request_hooks: Optional sequence of :class:`runzero.client.instrumentation.RequestHooks`
+        notified before each request is sent and after it completes or fails, with the endpoint
+        template, status, bytes transferred, and a timing breakdown.
+    :type request_hooks: Sequence[RequestHooks]
+
+    :param concurrency_limiter: Optional :class:`runzero.client.AdaptiveConcurrencyLimiter` which
+        bounds the number of requests this client has in flight across threads, adapting the bound
+        to rate limiting, server errors and latency. Requests beyond the limit wait for a slot.
+    :type concurrency_limiter: AdaptiveConcurrencyLimiter
+
+    :param scheduler: Optional :class:`runzero.client.RequestScheduler` which admits requests in
+        priority order when more are waiting than may be in flight, so interactive calls overtake
+        queued bulk work. Set priorities with :meth:`priority`. To adapt the scheduler's capacity,
+        give it the concurrency limiter rather than passing concurrency_limiter here.
+    :type scheduler: RequestScheduler
+
+    :param circuit_breaker: Optional :class:`runzero.client.CircuitBreaker` which stops sending
+        requests to an endpoint after consecutive connection failures, timeouts, server errors or
+        slow responses, raising :class:`runzero.client.errors.CircuitOpenError` until a probe
+        request succeeds. A breaker may be shared by several clients talking to the same console.
+    :type circuit_breaker: CircuitBreaker
+
+    :param collect_metrics: Optional bool to aggregate request counts, errors, latency histograms and
+        bytes transferred per endpoint template, available from :meth:`metrics`. Default is False.
+    :type collect_metrics: bool
+
+    :param max_connections: Optional number of idle connections to the server kept open for reuse
+        across requests. Default is 10.
+    :type max_connections: int
+
+    :param dns_cache_seconds: Optional number of seconds to reuse the addresses the server's host
+        name resolved to when opening connections. Default is 60; 0 disables the cache.
+    :type dns_cache_seconds: float
+
+    :param trusted_responses: Optional bool to build models from the server's responses without
+        validating them. Fields such as UUIDs and timestamps are converted as they are first read,
+        which makes listing large numbers of objects several times faster. Leave False, the
+        default, to validate every response in full, for example while debugging an integration.
+    :type trusted_responses: bool
+
+    A Client is safe to share between threads. When an OAuth token expires, a single thread
+    refreshes it while other threads needing a token wait for and reuse the result.
+
+    A Client inherited by a child process through ``fork``, as in pre-fork servers and
+    ``multiprocessing`` workers, replaces its pooled connections and locks before its first use in
+    the child, keeping its credentials and OAuth token. To create clients in processes which are not
+    forked, pass :meth:`config` to them and call :meth:`runzero.client.ClientConfig.build`.
     """
 
     __default_timeout__ = 180
+    __default_connect_timeout__ = 10
     __default_server_url__ = "https://console.runzero.com"
+    __token_refresh_ahead__ = 300
+    __default_max_connections__ = 10
+    __default_dns_cache_seconds__ = 60
 
     class _Paths(str, Enum):
         """Enum of resource paths for the runZero APIs"""
@@ -81,8 +195,22 @@ class Client:
         server_url: Optional[str] = None,
         timeout_seconds: Optional[int] = None,
         validate_certificate: Optional[bool] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: Optional[bool] = None,
+        token_cache: Optional[TokenCache] = None,
+        background_token_refresh: Optional[bool] = None,
+        request_hooks: Optional[Sequence[RequestHooks]] = None,
+        collect_metrics: Optional[bool] = None,
+        connect_timeout_seconds: Optional[float] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        max_connections: Optional[int] = None,
+        dns_cache_seconds: Optional[float] = None,
+        trusted_responses: Optional[bool] = None,
     ):
         """Constructor method"""
+        # pylint: disable=too-many-locals,too-many-statements
         self.__account_key: Optional[str] = account_key
         self.__org_key: Optional[str] = org_key
         self._use_token: bool = False
@@ -99,11 +227,57 @@ class Client:
         if timeout_seconds is not None and timeout_seconds <= 0:
             raise ValueError("Timeout must be greater than 0")
         self._timeout = timeout_seconds or self.__default_timeout__
+        if connect_timeout_seconds is not None and connect_timeout_seconds <= 0:
+            raise ValueError("Connect timeout must be greater than 0")
+        self._connect_timeout: float = connect_timeout_seconds or min(self.__default_connect_timeout__, self._timeout)
+        self._call_timeouts: ContextVar[Optional[_CallTimeouts]] = ContextVar(
+            f"runzero_client_timeouts_{id(self)}", default=None
+        )
         if validate_certificate is None:
             self._validate_cert = True
         else:
             self._validate_cert = validate_certificate
+        if max_connections is not None and max_connections <= 0:
+            raise ValueError("max_connections must be greater than 0")
+        if dns_cache_seconds is not None and dns_cache_seconds < 0:
+            raise ValueError("dns_cache_seconds must not be negative")
+        self._max_connections: int = max_connections or self.__default_max_connections__
+        self._dns_cache_seconds: float = (
+            self.__default_dns_cache_seconds__ if dns_cache_seconds is None else dns_cache_seconds
+        )
+        self._trusted_responses: bool = bool(trusted_responses)
+        self._adapter, self._session = self._new_session()
+        self._pid = os.getpid()
+        self._resume_token_refresher = False
         self._rate_limit_information: Optional[RateLimitInformation] = None
+        self._rate_limit_lock = threading.Lock()
+        self._thread_state = threading.local()
+        self._token_lock = threading.RLock()
+        self._token_refresh: SingleFlight[Optional[OAuthToken]] = SingleFlight()
+        self._response_cache: Optional[ResponseCache] = response_cache
+        self._identity: Optional[Tuple[Tuple[str, ...], str]] = None
+        self._in_flight: Optional[SingleFlight[Response]] = SingleFlight() if coalesce_requests else None
+        self._token_cache: Optional[TokenCache] = token_cache
+        # the access token loaded from the token cache while it is in use, and the last one the server rejected
+        self._cached_token: Optional[str] = None
+        self._rejected_cached_token: Optional[str] = None
+        self._background_token_refresh: bool = bool(background_token_refresh)
+        self._token_refresher: Optional[BackgroundRefresher] = None
+        self._hooks_lock = threading.Lock()
+        self._request_hooks: Tuple[RequestHooks, ...] = tuple(request_hooks or ())
+        if concurrency_limiter is not None and scheduler is not None:
+            raise ValueError("provide the concurrency limiter to the scheduler instead of the client")
+        self._concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = concurrency_limiter
+        self._scheduler: Optional[RequestScheduler] = scheduler
+        self._circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
+        self._priority: ContextVar[Priority] = ContextVar(
+            f"runzero_client_priority_{id(self)}", default=Priority.NORMAL
+        )
+        self._metrics: Optional[MetricsCollector] = None
+        if collect_metrics:
+            self._metrics = MetricsCollector()
+            self._request_hooks += (self._metrics,)
+        _fork.track(self, Client._after_fork)
 
     @property
     def oauth_token_is_expired(self) -> bool:
@@ -145,10 +319,90 @@ class Client:
 
         :raises: AuthError: Exception for invalid OAuth configurations
         """
-        self.__client_id = client_id
-        self.__client_secret = client_secret
-        self._use_token = True
-        return self._login()
+        self._oauth_login(client_id, client_secret, None)
+
+    def _oauth_login(self, client_id: str, client_secret: str, token: Optional[OAuthToken]) -> None:
+        """Enables OAuth, using token if provided, then a cached token, and otherwise logging in."""
+        self._check_fork()
+        with self._token_lock:
+            self.__client_id = client_id
+            self.__client_secret = client_secret
+            self._use_token = True
+            self._cached_token = None
+            if token is None and self._token_cache is not None:
+                token = self._token_cache.load(self.server_url, client_id, client_secret)
+                self._cached_token = None if token is None else token.access_token
+            if token is not None:
+                self.__token = token
+            else:
+                self._login()
+            if self._background_token_refresh:
+                self._start_token_refresher()
+
+    def config(self) -> ClientConfig:
+        """
+        The client's settings and credentials, including its current OAuth token, in a picklable form.
+
+        Pass the result to worker processes and call :meth:`runzero.client.ClientConfig.build` there
+        to create equivalent clients.
+
+        :returns: a :class:`runzero.client.ClientConfig`
+        """
+        with self._token_lock:
+            token = self.__token if self._use_token else None
+            return ClientConfig(
+                server_url=self.server_url,
+                account_key=self.__account_key,
+                org_key=self.__org_key,
+                client_id=self.__client_id if self._use_token else None,
+                client_secret=self.__client_secret if self._use_token else None,
+                oauth_token=None if token is None else OAuthTokenState.of(token),
+                timeout_seconds=self._timeout,
+                connect_timeout_seconds=self._connect_timeout,
+                validate_certificate=self._validate_cert,
+                coalesce_requests=self._in_flight is not None,
+                background_token_refresh=self._background_token_refresh,
+                collect_metrics=self._metrics is not None,
+                max_connections=self._max_connections,
+                dns_cache_seconds=self._dns_cache_seconds,
+                token_cache_path=None if self._token_cache is None else str(self._token_cache.path),
+                trusted_responses=self._trusted_responses,
+            )
+
+    def close(self) -> None:
+        """
+        Stops background work started by the client, such as background OAuth token refresh, and
+        closes idle connections to the server.
+
+        The client remains usable afterwards, refreshing its token and reconnecting on demand.
+        """
+        with self._token_lock:
+            if self._token_refresher is not None:
+                self._token_refresher.stop()
+                self._token_refresher = None
+        self._session.close()
+
+    def warm_up(self, connections: int = 1) -> int:
+        """
+        Opens connections to the server ahead of the first request, so that requests do not wait
+        on DNS resolution or TCP and TLS setup. The connections wait idle in the client's pool.
+
+        :param connections: the number of connections to open, up to max_connections
+
+        :returns: the number of connections open and idle
+        :raises: ValueError, ConnError, ConnTimeoutError
+        """
+        if connections <= 0:
+            raise ValueError("connections must be greater than 0")
+        self._check_fork()
+        try:
+            return self._adapter.warm_up(self.server_url, connections, self._validate_cert, self._connect_timeout)
+        except (URLLib3ConnectTimeoutError, TimeoutError) as exc:
+            if isinstance(exc, NewConnectionError):
+                raise ConnError from exc
+            raise ConnTimeoutError from exc
+        except (URLLib3HTTPError, OSError) as exc:
+            raise ConnError from exc
 
     @property
     def url(self) -> str:
@@ -168,14 +422,14 @@ class Client:
         if not self._use_token or (self.__client_id is None or self.__client_secret is None):
             raise AuthError("invalid auth configuration")
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self.server_url}/{self._Paths.TOKEN.value}",
                 data=RegisteredAPIClient(self.__client_id, self.__client_secret).register(),
-                timeout=self._timeout,
+                timeout=self._request_timeout(None),
                 verify=self._validate_cert,
             )
             resp.raise_for_status()
-            self.__token = resp.json(object_hook=OAuthToken.parse_obj)
+            self.__token = parse(OAuthToken, resp.json())
         except (
             RequestsConnectTimeout,
             RequestsConnectionError,
@@ -184,6 +438,12 @@ class Client:
             ConnectionRefusedError,
         ) as exc:
             raise AuthError("failed to authenticate") from exc
+        if self._token_cache is not None and self.__token is not None:
+            try:
+                self._token_cache.store(self.server_url, self.__client_id, self.__client_secret, self.__token)
+            except OSError:
+                # the cache only saves future logins; this login still succeeded
+                pass
 
     def _get_auth_token(self, scope: _AuthScope) -> str:
         """
@@ -200,11 +460,13 @@ class Client:
         self._validate_scope_permissions(scope)
 
         if self._use_token:
-            if self.__token is not None:
+            token = self.__token
+            if token is not None:
                 # this handles refreshing the token if necessary
-                if self.__token.is_expired():
-                    self._login()
-                return self.__token.access_token
+                if token.is_expired():
+                    token = self._refresh_token(token)
+                if token is not None:
+                    return token.access_token
         if scope == self._AuthScope.ACCOUNT:
             if self.__account_key is not None:
                 return self.__account_key
@@ -215,6 +477,133 @@ class Client:
                 return self.__org_key
         raise AuthError("invalid credential configurations")
 
+    def _refresh_token(self, stale: OAuthToken) -> Optional[OAuthToken]:
+        """
+        Replaces an expired OAuth token once, no matter how many threads find it expired.
+
+        Threads arriving while a refresh is in flight wait for it and share its outcome, including
+        any AuthError. Threads arriving after another thread already replaced the token reuse it.
+
+        :param stale: the expired token observed by the caller
+        :returns: the current token
+        :raises: AuthError
+        """
+
+        def refresh() -> Optional[OAuthToken]:
+            with self._token_lock:
+                if self.__token is stale:
+                    self._login()
+                return self.__token
+
+        return self._token_refresh.do("oauth", refresh)
+
+    def _replace_cached_token(self, rejected: str) -> Optional[str]:
+        """
+        Replaces an OAuth token loaded from the token cache which the server rejected, such as one
+        revoked before it expired, by discarding it from the cache and logging in once.
+
+        :param rejected: the access token the server rejected
+        :returns: the access token to retry with, or None if the rejected token was not a cached one
+        :raises: AuthError
+        """
+        with self._token_lock:
+            if rejected == self._cached_token:
+                self._cached_token = None
+                self._rejected_cached_token = rejected
+                if self._token_cache is not None and self.__client_id is not None and self.__client_secret is not None:
+                    try:
+                        self._token_cache.discard(self.server_url, self.__client_id, self.__client_secret)
+                    except OSError:
+                        pass
+                self._login()
+            elif rejected != self._rejected_cached_token:
+                return None
+            # threads rejected with the same cached token retry with the token which replaced it
+            return None if self.__token is None else self.__token.access_token
+
+    def _start_token_refresher(self) -> None:
+        """Starts renewing the OAuth token in the background, if not already doing so."""
+        if self._token_refresher is not None and self._token_refresher.running:
+            return
+        # the refresher thread must not keep an abandoned client alive
+        ref = weakref.ref(self)
+
+        def due_in() -> Optional[float]:
+            client = ref()
+            return None if client is None else client._token_refresh_due_in()  # pylint: disable=protected-access
+
+        def refresh() -> None:
+            client = ref()
+            if client is not None:
+                client._refresh_token_ahead()  # pylint: disable=protected-access
+
+        refresher = BackgroundRefresher(due_in, refresh)
+        weakref.finalize(self, refresher.stop)
+        self._token_refresher = refresher
+        refresher.start()
+
+    def _new_session(self) -> Tuple[PooledHTTPAdapter, requests.Session]:
+        """Creates the connection pool requests are sent through."""
+        adapter = PooledHTTPAdapter(
+            validate_certificate=self._validate_cert,
+            max_connections=self._max_connections,
+            dns_cache=DNSCache(self._dns_cache_seconds) if self._dns_cache_seconds else None,
+        )
+        return adapter, pooled_session(adapter)
+
+    def _check_fork(self) -> None:
+        """Rebuilds process-local state if the client was inherited from a parent process."""
+        if self._pid == os.getpid():
+            if self._resume_token_refresher:
+                with self._token_lock:
+                    if self._resume_token_refresher:
+                        self._resume_token_refresher = False
+                        self._start_token_refresher()
+            return
+        with _fork.lock():
+            if self._pid != os.getpid():
+                self._after_fork()
+        self._check_fork()
+
+    def _after_fork(self) -> None:
+        """
+        Replaces state which must not be shared with the parent process: pooled connections, whose
+        sockets the parent is still using, and locks, which may have been held by parent threads that
+        do not exist in the child. Credentials and the current OAuth token are kept.
+        """
+        self._pid = os.getpid()
+        self._token_lock = threading.RLock()
+        self._token_refresh = SingleFlight()
+        # threads do not survive a fork; the refresher is restarted by the next call
+        self._resume_token_refresher = self._token_refresher is not None
+        self._token_refresher = None
+        self._rate_limit_lock = threading.Lock()
+        self._thread_state = threading.local()
+        self._hooks_lock = threading.Lock()
+        if self._in_flight is not None:
+            self._in_flight = SingleFlight()
+        if self._metrics is not None:
+            # each process reports its own requests
+            metrics = MetricsCollector()
+            self._request_hooks = tuple(metrics if hook is self._metrics else hook for hook in self._request_hooks)
+            self._metrics = metrics
+        # abandon rather than close the inherited connections, which the parent is still using
+        self._adapter, self._session = self._new_session()
+
+    def _token_refresh_due_in(self) -> Optional[float]:
+        """Seconds until the OAuth token should be renewed, or None when there is nothing to renew."""
+        token = self.__token
+        if not self._use_token or token is None:
+            return None
+        ahead = min(self.__token_refresh_ahead__, token.expires_in / 2)
+        return token.seconds_remaining() - ahead
+
+    def _refresh_token_ahead(self) -> None:
+        """Renews the OAuth token before it expires."""
+        token = self.__token
+        if token is not None:
+            self._refresh_token(token)
+
     def _validate_scope_permissions(self, scope: _AuthScope) -> None:
         if self._use_token:
             if self.__token is None:
@@ -233,11 +622,19 @@ class Client:
     @property
     def last_rate_limit_information(self) -> Optional[RateLimitInformation]:
         """
-        The last rate limit information retrieved from the server.
+        The last rate limit information retrieved from the server by the calling thread.
+
+        If the calling thread has not made a request, the most recent information retrieved by any
+        thread is returned. Rate limit information for a specific request is always available as
+        :attr:`Response.rate_limit_information` on the response returned by :meth:`execute`.
 
         :returns: Rate limit information when provided.
         """
-        return self._rate_limit_information
+        info: Optional[RateLimitInformation] = getattr(self._thread_state, "rate_limit_information", None)
+        if info is not None:
+            return info
+        with self._rate_limit_lock:
+            return self._rate_limit_information
 
     @property
     def timeout(self) -> int:
@@ -248,6 +645,203 @@ class Client:
         """
         return self._timeout
 
+    @property
+    def connect_timeout(self) -> float:
+        """
+        The set connection timeout value in seconds
+
+        :returns: timeout in seconds
+        """
+        return self._connect_timeout
+
+    @contextmanager
+    def timeouts(
+        self,
+        connect_seconds: Optional[float] = None,
+        read_seconds: Optional[float] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> Iterator[None]:
+        """
+        Overrides timeouts for requests made with this client by the current thread or task while
+        the context is active. Every API method called within the context is affected.
+
+        A deadline bounds the total time of all requests in the context: each request's timeouts
+        are shortened to the time remaining, and a request which would start after the deadline
+        raises :class:`runzero.client.errors.DeadlineExceededError` instead. Nested contexts
+        inherit unspecified timeouts, and can shorten but not extend an outer deadline.
+
+        Example::
+
+            with client.timeouts(connect_seconds=2, deadline_seconds=30):
+                sites = Sites(client).get_all(org_id)
+
+        :param connect_seconds: Optional connection timeout in seconds
+        :param read_seconds: Optional read timeout in seconds
+        :param deadline_seconds: Optional number of seconds from now by which all requests must finish
+
+        :raises: ValueError for values which are not greater than 0
+        """
+        for value in (connect_seconds, read_seconds, deadline_seconds):
+            if value is not None and value <= 0:
+                raise ValueError("Timeouts must be greater than 0")
+        outer = self._call_timeouts.get()
+        deadline = None if deadline_seconds is None else time.monotonic() + deadline_seconds
+        if outer is not None:
+            connect_seconds = connect_seconds or outer.connect
+            read_seconds = read_seconds or outer.read
+            if outer.deadline is not None:
+                deadline = outer.deadline if deadline is None else min(deadline, outer.deadline)
+        token = self._call_timeouts.set(_CallTimeouts(connect_seconds, read_seconds, deadline))
+        try:
+            yield
+        finally:
+            self._call_timeouts.reset(token)
+
+    def _request_timeout(self, override: Optional[TimeoutType]) -> Tuple[float, float]:
+        """
+        Resolves the (connect, read) timeout for a request about to be sent, from the per-call
+        override, any active :meth:`timeouts` context, and the client defaults.
+
+        :raises: DeadlineExceededError if the active deadline has passed
+        """
+        connect, read = self._connect_timeout, float(self._timeout)
+        scoped = self._call_timeouts.get()
+        if scoped is not None:
+            connect = scoped.connect or connect
+            read = scoped.read or read
+        if isinstance(override, tuple):
+            connect, read = override
+        elif override is not None:
+            connect = read = override
+        if scoped is not None and scoped.deadline is not None:
+            remaining = scoped.deadline - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceededError("deadline exceeded before the request was sent")
+            connect, read = min(connect, remaining), min(read, remaining)
+        return connect, read
+
+    def _deadline_remaining(self) -> Optional[float]:
+        scoped = self._call_timeouts.get()
+        if scoped is None or scoped.deadline is None:
+            return None
+        return max(0.0, scoped.deadline - time.monotonic())
+
+    def _deadline_passed(self) -> bool:
+        scoped = self._call_timeouts.get()
+        return scoped is not None and scoped.deadline is not None and scoped.deadline <= time.monotonic()
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """
+        The response cache in use by the client, including its hit and miss counters.
+
+        :returns: the ResponseCache or None if responses are not cached
+        """
+        return self._response_cache
+
+    @property
+    def concurrency_limiter(self) -> Optional[AdaptiveConcurrencyLimiter]:
+        """
+        The concurrency limiter in use by the client, including its current limit and decisions.
+
+        :returns: the AdaptiveConcurrencyLimiter or None if concurrency is not limited
+        """
+        if self._scheduler is not None:
+            return self._scheduler.limiter
+        return self._concurrency_limiter
+
+    @property
+    def scheduler(self) -> Optional[RequestScheduler]:
+        """
+        The request scheduler in use by the client, including its queue lengths.
+
+        :returns: the RequestScheduler or None if requests are not scheduled
+        """
+        return self._scheduler
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """
+        The circuit breaker in use by the client, including the state of each endpoint's circuit.
+
+        :returns: the CircuitBreaker or None if circuits are not in use
+        """
+        return self._circuit_breaker
+
+    @contextmanager
+    def priority(self, priority: Priority) -> Iterator[None]:
+        """
+        Sets the priority of requests made with this client by the current thread or task while the
+        context is active. Priorities only take effect when the client has a scheduler.
+
+        Example::
+
+            with client.priority(Priority.LOW):
+                CustomIntegrationAssetAdmin(client).update_asset(...)
+
+        :param priority: the :class:`runzero.client.Priority` class of the requests
+        """
+        token = self._priority.set(Priority(priority))
+        try:
+            yield
+        finally:
+            self._priority.reset(token)
+
+    @property
+    def coalesced_request_count(self) -> int:
+        """
+        The number of GET requests answered by sharing another caller's in-flight request.
+
+        :returns: count of coalesced requests, always 0 if coalescing is not enabled
+        """
+        if self._in_flight is None:
+            return 0
+        return self._in_flight.shared
+
+    @property
+    def request_hooks(self) -> Tuple[RequestHooks, ...]:
+        """
+        The request lifecycle hooks notified of each request, in the order they are called.
+
+        :returns: the registered hooks
+        """
+        return self._request_hooks
+
+    def metrics(self) -> MetricsSnapshot:
+        """
+        Aggregated metrics for the requests sent by this client, per endpoint template and method.
+
+        Use :meth:`runzero.client.metrics.MetricsSnapshot.to_prometheus` to export them.
+
+        :returns: a :class:`runzero.client.metrics.MetricsSnapshot`, empty unless the client was
+            created with ``collect_metrics=True``
+        """
+        if self._metrics is None:
+            return MetricsSnapshot()
+        return self._metrics.snapshot()
+
+    def add_request_hooks(self, hooks: RequestHooks) -> None:
+        """
+        Registers hooks to be notified of each request sent from now on.
+
+        :param hooks: the :class:`runzero.client.instrumentation.RequestHooks` to add
+        """
+        with self._hooks_lock:
+            self._request_hooks = self._request_hooks + (hooks,)
+
+    def remove_request_hooks(self, hooks: RequestHooks) -> None:
+        """
+        Stops notifying previously registered hooks.
+
+        :param hooks: the :class:`runzero.client.instrumentation.RequestHooks` to remove
+
+        :raises: ValueError if the hooks are not registered
+        """
+        with self._hooks_lock:
+            remaining = list(self._request_hooks)
+            remaining.remove(hooks)
+            self._request_hooks = tuple(remaining)
+
     @property
     def validate_cert(self) -> bool:
         """
@@ -265,6 +859,9 @@ class Client:
         data: Optional[BaseModel] = None,
         files: Optional[Any] = None,
         multipart: Optional[bool] = None,
+        cache: bool = True,
+        timeout: Optional[TimeoutType] = None,
+        priority: Optional[Priority] = None,
     ) -> Response:
         """Executes the request
 
@@ -274,32 +871,259 @@ class Client:
         :param data: The data to send in form body (POST, PATCH, PUT)
         :param files: For multipart form data or file uploads. Format varies.
         :param multipart: True if using a multipart form data (combination file[s] and form data)
+        :param cache: False to bypass any response cache for a GET which must observe current server state.
+            Writes always invalidate the cache.
+        :param timeout: Optional timeout in seconds for this request, either one value for both
+            connecting and reading or a (connect, read) tuple. See also :meth:`timeouts`.
+        :param priority: Optional priority class of the request when the client has a scheduler.
+            Defaults to the priority set with :meth:`priority`, or NORMAL.
 
         :returns: The result of the execution as class:.`Response`
-        :raises: ValidationError, ConnTimeoutError, ConnError, CommunicationError
+        :raises: ValidationError, ConnTimeoutError, DeadlineExceededError, ConnError, CommunicationError
         """
-        token: str = ""
-        try:
-            token = self._get_auth_token(self._AuthScope.ACCOUNT)
-        except AuthError:
-            pass
+        scope, call = self._begin_call(timeout, priority)
+        if method != "GET":
+            return self._write(method, endpoint, call, params, data, files, multipart)
+
+        key = ResponseCache.key(endpoint, params, scope.name, self._cache_identity())
+        if cache and self._response_cache is not None:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                return cached
+        if self._in_flight is not None:
+            # cached and uncached reads of the same resource must not share a flight
+            try:
+                return self._in_flight.do(
+                    (key, cache),
+                    lambda: self._get(key, endpoint, call, params, cache),
+                    on_shared=_mark_shared,
+                    timeout=self._deadline_remaining(),
+                )
+            except WaitTimeoutError as exc:
+                raise DeadlineExceededError("deadline exceeded while waiting for a coalesced request") from exc
+        return self._get(key, endpoint, call, params, cache)
 
-        if not token:
-            token = self._get_auth_token(self._AuthScope.ORG)
+    def _begin_call(self, timeout: Optional[TimeoutType], priority: Optional[Priority]) -> Tuple[_AuthScope, _Call]:
+        """Starts the clock on an :meth:`execute` call and resolves the credentials it is made with."""
+        started = time.perf_counter()
+        self._check_fork()
+        if self._deadline_passed():
+            raise DeadlineExceededError("deadline exceeded before the request was sent")
+        scope, token = self._resolve_request_token()
+        call = _Call(
+            token=token,
+            started=started,
+            timeout=timeout,
+            priority=self._priority.get() if priority is None else Priority(priority),
+        )
+        return scope, call
+
+    def _write(
+        self,
+        method: str,
+        endpoint: str,
+        call: _Call,
+        params: Optional[Any],
+        data: Optional[BaseModel],
+        files: Optional[Any],
+        multipart: Optional[bool],
+    ) -> Response:
+        """Sends a PUT, PATCH, POST or DELETE, invalidating affected response cache entries."""
         form_data = None
         if data:
-            form_data = data.json()
-        resp = Request(
+            form_data = dump_json(data)
+        try:
+            return self._send(method, endpoint, call, params=params, data=form_data, files=files, multipart=multipart)
+        finally:
+            # a failed write may still have been applied, so invalidate regardless of outcome
+            if self._response_cache is not None:
+                self._response_cache.invalidate(endpoint)
+
+    def _cache_identity(self) -> str:
+        """
+        A fingerprint of the server and credentials requests are made with, which keeps the responses of
+        clients for different servers, accounts or organizations apart in a shared response cache.
+        """
+        credentials = (
+            self.server_url,
+            self.__account_key or "",
+            self.__org_key or "",
+            (self.__client_id or "") if self._use_token else "",
+        )
+        identity = self._identity
+        if identity is None or identity[0] != credentials:
+            identity = (credentials, hashlib.sha256("\0".join(credentials).encode("utf-8")).hexdigest())
+            self._identity = identity
+        return identity[1]
+
+    def _get(self, key: CacheKey, endpoint: str, call: _Call, params: Optional[Any], use_cache: bool) -> Response:
+        """Sends a GET, revalidating and storing the response when a response cache is in use."""
+        cache = self._response_cache
+        if cache is None or not use_cache:
+            return self._send("GET", endpoint, call, params=params)
+        headers = cache.conditional_headers(key)
+        resp = self._send("GET", endpoint, call, params=params, headers=headers)
+        if resp.not_modified and headers:
+            cached = cache.revalidated(key)
+            if cached is not None:
+                return cached
+            # the entry disappeared while the request was in flight; fetch the full body
+            resp = self._send("GET", endpoint, call, params=params)
+        cache.put(key, resp)
+        return resp
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        call: _Call,
+        params: Optional[Any] = None,
+        data: Optional[str] = None,
+        files: Optional[Any] = None,
+        multipart: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """
+        Sends a single request to the server, notifying request hooks and recording rate limit information.
+
+        A request rejected because its token came from the token cache and is no longer valid is sent
+        once more with a freshly issued token, unless it uploads files which may already be consumed.
+        """
+        try:
+            return self._send_once(method, endpoint, call, params, data, files, multipart, headers)
+        except AuthError:
+            token = None if files is not None else self._replace_cached_token(call.token)
+            if token is None:
+                raise
+        return self._send_once(method, endpoint, replace(call, token=token), params, data, files, multipart, headers)
+
+    def _send_once(
+        self,
+        method: str,
+        endpoint: str,
+        call: _Call,
+        params: Optional[Any],
+        data: Optional[str],
+        files: Optional[Any],
+        multipart: Optional[bool],
+        headers: Optional[Dict[str, str]],
+    ) -> Response:
+        """Sends a request once, notifying request hooks and recording rate limit information."""
+        hooks = self._request_hooks
+        event: Optional[RequestEvent] = None
+        if hooks:
+            event = begin_event(hooks, method, endpoint, headers)
+            headers = event.request_headers
+        request = Request(
             url=f"{self.url}/{endpoint}",
-            token=token,
+            token=call.token,
             method=method,
             handlers=None,
             params=params,
-            timeout=self.timeout,
             validate_certificate=self.validate_cert,
-            data=form_data,
+            data=data,
             files=files,
             multipart=multipart,
-        ).execute()
-        self._rate_limit_information = resp.rate_limit_information
+            headers=headers,
+            session=self._session,
+        )
+        try:
+            resp = self._execute_request(request, endpoint, call)
+        except Exception as exc:
+            if event is not None:
+                complete_event(hooks, event, request, call.started, exc)
+            raise
+        if event is not None:
+            complete_event(hooks, event, request, call.started, None)
+        resp.trusted = self._trusted_responses
+        self._thread_state.rate_limit_information = resp.rate_limit_information
+        with self._rate_limit_lock:
+            self._rate_limit_information = resp.rate_limit_information
+        return resp
+
+    def _execute_request(self, request: Request, endpoint: str, call: _Call) -> Response:
+        """Sends a request once admitted by the circuit breaker and the scheduler or concurrency limiter,
+        within the current deadline."""
+        template = endpoint_template(endpoint)
+        attempt: Optional[Attempt] = None
+        if self._circuit_breaker is not None:
+            attempt = self._circuit_breaker.attempt(template)
+        try:
+            permit = self._admit(call)
+        except BaseException:
+            if attempt is not None:
+                attempt.cancel()
+            raise
+        try:
+            request.timeout = self._request_timeout(call.timeout)
+            resp = request.execute()
+        except BaseException as exc:
+            error = exc
+            if isinstance(exc, ConnTimeoutError) and self._deadline_passed():
+                error = DeadlineExceededError("deadline exceeded while waiting on the server")
+            if permit is not None:
+                permit.release(error, endpoint=template)
+            if attempt is not None:
+                attempt.record(error)
+            if error is exc:
+                raise
+            raise error from exc
+        if permit is not None:
+            permit.release(endpoint=template)
+        if attempt is not None:
+            attempt.record(None, None if request.sent_at is None else time.perf_counter() - request.sent_at)
         return resp
+
+    def _admit(self, call: _Call) -> Optional[Union[Permit, Ticket]]:
+        """Waits for the request's turn to be sent, if the client has a scheduler or concurrency limiter."""
+        admission: Optional[Union[Permit, Ticket]] = None
+        if self._scheduler is not None:
+            with self._rate_limit_lock:
+                info = self._rate_limit_information
+            admission = self._scheduler.acquire(call.priority, self._deadline_remaining(), info)
+        elif self._concurrency_limiter is not None:
+            admission = self._concurrency_limiter.acquire(self._deadline_remaining())
+        else:
+            return None
+        if admission is None:
+            raise DeadlineExceededError("deadline exceeded while waiting for a concurrency slot")
+        return admission
+
+    def _resolve_request_token(self) -> Tuple[_AuthScope, str]:
+        """
+        Resolves the broadest-scoped bearer token available for a request.
+
+        :returns: the auth scope resolved and its bearer token
+        :raises: AuthError
+        """
+        try:
+            token = self._get_auth_token(self._AuthScope.ACCOUNT)
+            if token:
+                return self._AuthScope.ACCOUNT, token
+        except AuthError:
+            pass
+        return self._AuthScope.ORG, self._get_auth_token(self._AuthScope.ORG)
+
+
+@dataclass(frozen=True)
+class _Call:
+    """State shared by every request sent on behalf of one :meth:`Client.execute` call."""
+
+    token: str
+    started: float
+    timeout: Optional[TimeoutType]
+    priority: Priority
+
+
+@dataclass(frozen=True)
+class _CallTimeouts:
+    """Timeouts in effect within a :meth:`Client.timeouts` context."""
+
+    connect: Optional[float]
+    read: Optional[float]
+    deadline: Optional[float]
+
+
+def _mark_shared(response: Response) -> None:
+    """Flags a response handed to several callers so parsed models are copied, not shared."""
+    response.shared = True
@@ -0,0 +1,268 @@
+"""
+concurrency provides an adaptive limit on the number of requests a Client has in flight at once.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+from runzero.client.errors import (
+    ConnTimeoutError,
+    DeadlineExceededError,
+    RateLimitError,
+    ServerError,
+)
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "LimitDecision",
+    "Permit",
+]
+
+
+@dataclass(frozen=True)
+class LimitDecision:
+    """A change to the concurrency limit made by an :class:`AdaptiveConcurrencyLimiter`.
+
+    :param timestamp: wall clock time of the change, in seconds since the epoch
+    :param previous: the limit before the change
+    :param limit: the limit after the change
+    :param reason: why the limit changed: ``increase`` after a window of healthy requests, or
+        ``rate_limited``, ``server_error``, ``timeout`` or ``latency`` when backing off
+    """
+
+    timestamp: float
+    previous: int
+    limit: int
+    reason: str
+
+
+class Permit:
+    """A slot granted by :meth:`AdaptiveConcurrencyLimiter.acquire`, to be released exactly once."""
+
+    __slots__ = ("_limiter", "_epoch", "_saturated", "_started", "_released")
+
+    def __init__(self, limiter: "AdaptiveConcurrencyLimiter", epoch: int, saturated: bool):
+        self._limiter = limiter
+        self._epoch = epoch
+        self._saturated = saturated
+        self._started = time.monotonic()
+        self._released = False
+
+    def release(
+        self, error: Optional[BaseException] = None, latency: Optional[float] = None, endpoint: Optional[str] = None
+    ) -> None:
+        """
+        Returns the slot, feeding the outcome of the request it was used for into the limit.
+
+        :param error: the exception the request failed with, if any
+        :param latency: Optional request latency in seconds. Defaults to the time since the permit
+            was granted.
+        :param endpoint: Optional endpoint template of the request, whose latency is compared only
+            with the baseline of the same endpoint, see
+            :func:`runzero.client.instrumentation.endpoint_template`
+        """
+        if self._released:
+            return
+        self._released = True
+        if latency is None:
+            latency = time.monotonic() - self._started
+        # pylint: disable-next=protected-access
+        self._limiter._release(self._epoch, self._saturated, error, latency, endpoint)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits requests in flight, adapting the limit with additive increase, multiplicative decrease.
+
+    While requests succeed with stable latency and the limit is being used, the limit grows by one
+    for each limit's worth of completed requests. A :class:`runzero.client.RateLimitError`,
+    :class:`runzero.client.ServerError`, timeout, or a request slower than ``latency_tolerance``
+    times the baseline latency of its endpoint cuts the limit by ``backoff_ratio``. Requests which were started
+    before a cut do not trigger another, so a burst of failures from one overload backs off once.
+
+    Provide an instance to :class:`runzero.Client` to gate every request it sends. A limiter may be
+    shared by several clients talking to the same console.
+
+    :param initial_limit: the limit to start with
+    :param min_limit: the limit is never cut below this
+    :param max_limit: the limit is never raised above this
+    :param backoff_ratio: the factor applied to the limit when backing off, between 0 and 1
+    :param latency_tolerance: how many times the baseline latency a request may take before it is
+        considered a latency spike
+    :param history: the number of most recent :class:`LimitDecision` entries kept
+
+    :raises: ValueError for inconsistent limits or ratios
+    """
+
+    _WARMUP_SAMPLES = 5
+    _BASELINE_WEIGHT = 0.1
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 3.0,
+        history: int = 100,
+    ):
+        """Constructor method"""
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        if latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be greater than 1")
+        self._limit = initial_limit
+        self._min = min_limit
+        self._max = max_limit
+        self._backoff = backoff_ratio
+        self._tolerance = latency_tolerance
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._epoch = 0
+        self._successes = 0
+        # latency baselines by endpoint template, as endpoints differ widely in how long they take
+        self._baselines: Dict[Optional[str], _Baseline] = {}
+        self._decisions: Deque[LimitDecision] = deque(maxlen=history)
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently in flight."""
+        return self._in_flight
+
+    @property
+    def baseline_latency(self) -> Optional[float]:
+        """
+        The smoothed latency in seconds of healthy requests released without an endpoint, or None
+        until enough have completed.
+        """
+        with self._cond:
+            baseline = self._baselines.get(None)
+            return None if baseline is None or baseline.samples < self._WARMUP_SAMPLES else baseline.latency
+
+    def baseline_latencies(self) -> Dict[str, float]:
+        """
+        The smoothed latency in seconds of healthy requests to each endpoint which enough have
+        completed for.
+
+        :returns: a dict of latencies by endpoint template
+        """
+        with self._cond:
+            return {
+                endpoint: baseline.latency
+                for endpoint, baseline in self._baselines.items()
+                if endpoint is not None and baseline.samples >= self._WARMUP_SAMPLES
+            }
+
+    def decisions(self) -> List[LimitDecision]:
+        """
+        The most recent changes to the limit, oldest first.
+
+        :returns: a list of :class:`LimitDecision`
+        """
+        with self._cond:
+            return list(self._decisions)
+
+    def try_acquire(self) -> Optional[Permit]:
+        """
+        Takes a slot if one is free, without waiting.
+
+        :returns: a :class:`Permit`, or None if the limit has been reached
+        """
+        with self._cond:
+            return self._take()
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[Permit]:
+        """
+        Waits for a free slot.
+
+        :param timeout: Optional number of seconds to wait
+
+        :returns: a :class:`Permit`, or None if no slot became free within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                permit = self._take()
+                if permit is not None:
+                    return permit
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+
+    def _take(self) -> Optional[Permit]:
+        """Grants a permit if under the limit. Must hold the condition."""
+        if self._in_flight >= self._limit:
+            return None
+        self._in_flight += 1
+        return Permit(self, self._epoch, self._in_flight >= self._limit)
+
+    def _release(
+        self, epoch: int, saturated: bool, error: Optional[BaseException], latency: float, endpoint: Optional[str]
+    ) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            reason = _backoff_reason(error)
+            if reason is None and error is None:
+                reason = self._observe_latency(latency, endpoint)
+            if reason is not None:
+                if epoch == self._epoch:
+                    self._set_limit(max(self._min, int(self._limit * self._backoff)), reason)
+            elif error is None and saturated:
+                self._successes += 1
+                if self._successes >= self._limit and self._limit < self._max:
+                    self._set_limit(self._limit + 1, "increase")
+            self._cond.notify_all()
+
+    def _observe_latency(self, latency: float, endpoint: Optional[str]) -> Optional[str]:
+        """Folds a healthy request's latency into its endpoint's baseline, or reports it as a spike."""
+        baseline = self._baselines.get(endpoint)
+        if baseline is None:
+            self._baselines[endpoint] = _Baseline(latency)
+            return None
+        baseline.samples += 1
+        if baseline.samples > self._WARMUP_SAMPLES and latency > baseline.latency * self._tolerance:
+            return "latency"
+        baseline.latency += (latency - baseline.latency) * self._BASELINE_WEIGHT
+        return None
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        if reason != "increase":
+            # requests granted before the cut report on the old limit and must not cut again
+            self._epoch += 1
+        self._successes = 0
+        if limit != self._limit:
+            self._decisions.append(LimitDecision(time.time(), self._limit, limit, reason))
+            self._limit = limit
+
+
+class _Baseline:
+    """The smoothed latency of one endpoint's healthy requests."""
+
+    __slots__ = ("latency", "samples")
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.samples = 1
+
+
+def _backoff_reason(error: Optional[BaseException]) -> Optional[str]:
+    if isinstance(error, DeadlineExceededError):
+        # the caller ran out of time; that says nothing about the server
+        return None
+    if isinstance(error, RateLimitError):
+        return "rate_limited"
+    if isinstance(error, ServerError):
+        return "server_error"
+    if isinstance(error, (ConnTimeoutError, TimeoutError)):
+        return "timeout"
+    return None
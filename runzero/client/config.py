@@ -0,0 +1,126 @@
+"""
+config provides a picklable description of a Client, for building equivalent clients in other processes.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional
+
+from runzero.client._http.auth import OAuthToken
+from runzero.client.token_cache import TokenCache
+
+if TYPE_CHECKING:
+    from runzero.client.client import Client
+
+__all__ = [
+    "ClientConfig",
+]
+
+
+@dataclass(frozen=True)
+class OAuthTokenState:
+    """An OAuth token with its wall clock issue time, which unlike its monotonic age survives a process boundary.
+
+    :param access_token: the bearer token
+    :param token_type: the token type
+    :param expires_in: the token lifetime in seconds
+    :param issued_at: when the token was issued, in seconds since the epoch
+    """
+
+    access_token: str = field(repr=False)
+    token_type: str
+    expires_in: int
+    issued_at: float
+
+    @classmethod
+    def of(cls, token: OAuthToken) -> "OAuthTokenState":
+        """
+        Captures a token.
+
+        :param token: the token to capture
+
+        :returns: the token's state
+        """
+        age = token.expires_in - token.seconds_remaining()
+        return cls(token.access_token, token.token_type, token.expires_in, datetime.now(timezone.utc).timestamp() - age)
+
+    def restore(self) -> OAuthToken:
+        """
+        Rebuilds the token, aged by the time since it was issued.
+
+        :returns: the token
+        """
+        return OAuthToken(
+            access_token=self.access_token,
+            token_type=self.token_type,
+            expires_in=self.expires_in,
+            created_at=datetime.fromtimestamp(self.issued_at, timezone.utc),
+        )
+
+
+@dataclass(frozen=True)
+class ClientConfig:
+    """The settings and credentials of a :class:`runzero.Client`, which can be pickled and rebuilt.
+
+    Use :meth:`runzero.Client.config` to capture a client's configuration and :meth:`build` to create
+    an equivalent client, for example in each worker of a ``ProcessPoolExecutor``. An OAuth token the
+    client already holds is carried along, so workers do not each log in while it remains valid.
+
+    Objects holding process-local state, such as response caches, request hooks, concurrency limiters,
+    schedulers and circuit breakers, are not part of the configuration. Create them in each process.
+
+    The configuration contains credentials. Treat it, and anything it is pickled to, as a secret.
+    """
+
+    server_url: str
+    account_key: Optional[str] = field(default=None, repr=False)
+    org_key: Optional[str] = field(default=None, repr=False)
+    client_id: Optional[str] = None
+    client_secret: Optional[str] = field(default=None, repr=False)
+    oauth_token: Optional[OAuthTokenState] = field(default=None, repr=False)
+    timeout_seconds: Optional[int] = None
+    connect_timeout_seconds: Optional[float] = None
+    validate_certificate: bool = True
+    coalesce_requests: bool = False
+    background_token_refresh: bool = False
+    collect_metrics: bool = False
+    max_connections: Optional[int] = None
+    dns_cache_seconds: Optional[float] = None
+    token_cache_path: Optional[str] = None
+    trusted_responses: bool = False
+
+    def build(self) -> "Client":
+        """
+        Creates a client with this configuration.
+
+        If the configuration has OAuth credentials but no token, or its token has expired, the client
+        logs in, or reuses a token from the token cache when one is configured.
+
+        :returns: a new :class:`runzero.Client`
+        :raises: AuthError
+        """
+        # pylint: disable-next=import-outside-toplevel,cyclic-import
+        from runzero.client.client import Client
+
+        client = Client(
+            account_key=self.account_key,
+            org_key=self.org_key,
+            server_url=self.server_url,
+            timeout_seconds=self.timeout_seconds,
+            connect_timeout_seconds=self.connect_timeout_seconds,
+            validate_certificate=self.validate_certificate,
+            coalesce_requests=self.coalesce_requests,
+            token_cache=None if self.token_cache_path is None else TokenCache(self.token_cache_path),
+            background_token_refresh=self.background_token_refresh,
+            collect_metrics=self.collect_metrics,
+            max_connections=self.max_connections,
+            dns_cache_seconds=self.dns_cache_seconds,
+            trusted_responses=self.trusted_responses,
+        )
+        if self.client_id is not None and self.client_secret is not None:
+            token = None if self.oauth_token is None else self.oauth_token.restore()
+            if token is not None and token.is_expired():
+                token = None
+            # pylint: disable-next=protected-access
+            client._oauth_login(self.client_id, self.client_secret, token)
+        return client
@@ -204,6 +204,25 @@ class ConnError(Error, ConnectionError):
     pass
 
 
+class CircuitOpenError(ConnError):
+    """
+    CircuitOpenError is a named Exception class raised without contacting the runZero service
+    when the Client's circuit breaker for the endpoint is open after repeated failures.
+
+    :param template: the endpoint template whose circuit is open
+    :type template: str
+
+    :param retry_after: the number of seconds until the circuit lets a probe request through
+    :type retry_after: float
+    """
+
+    def __init__(self, template: str, retry_after: float):
+        """Constructor method"""
+        super().__init__(f"circuit open for {template}, retry after {retry_after:.1f}s")
+        self.template: str = template
+        self.retry_after: float = retry_after
+
+
 class ConnTimeoutError(Error, TimeoutError):
     """
     ConnTimeoutError is a named Exception class raised when an API request to runZero
@@ -212,3 +231,12 @@ class ConnTimeoutError(Error, TimeoutError):
     """
 
     pass
+
+
+class DeadlineExceededError(ConnTimeoutError):
+    """
+    DeadlineExceededError is a named Exception class raised when the deadline set with
+    :meth:`runzero.Client.timeouts` passes before an API request to runZero service can complete.
+    """
+
+    pass
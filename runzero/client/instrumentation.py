@@ -0,0 +1,158 @@
+"""
+instrumentation provides hooks for observing every request the Client sends to the runZero API.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
+
+if TYPE_CHECKING:
+    from runzero.client._http.io import Request
+
+__all__ = [
+    "RequestEvent",
+    "RequestHooks",
+    "RequestTiming",
+    "endpoint_template",
+]
+
+_ID_SEGMENT = re.compile(r"^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$")
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Replaces resource identifiers in an endpoint with a placeholder so requests to the same API
+    can be grouped, such as ``api/v1.0/org/sites/{id}``.
+
+    :param endpoint: the path a request is sent to
+
+    :returns: the endpoint with each UUID path segment replaced by ``{id}``
+    """
+    path = endpoint.split("?", 1)[0].strip("/")
+    return "/".join("{id}" if _ID_SEGMENT.match(part) else part for part in path.split("/"))
+
+
+@dataclass
+class RequestTiming:
+    """Where the time went for a single request, in seconds.
+
+    The phases do not overlap. Phases which did not happen, such as connect and TLS for a request
+    sent on a reused connection, are None.
+
+    :param queued: from the call to :meth:`runzero.Client.execute` until the request began
+    :param connect: establishing the TCP connection
+    :param tls: the TLS handshake
+    :param ttfb: from the connection being ready until the response headers arrived
+    :param body_read: reading the response body
+    :param total: from the call to :meth:`runzero.Client.execute` until the body was read or
+        the request failed
+    """
+
+    queued: Optional[float] = None
+    connect: Optional[float] = None
+    tls: Optional[float] = None
+    ttfb: Optional[float] = None
+    body_read: Optional[float] = None
+    total: Optional[float] = None
+
+
+@dataclass
+class RequestEvent:
+    """A request sent by the Client, passed to each :class:`RequestHooks` callback.
+
+    The same event object is passed to :meth:`RequestHooks.on_request` and then to either
+    :meth:`RequestHooks.on_response` or :meth:`RequestHooks.on_error`, with the outcome filled in.
+
+    :param method: the HTTP verb
+    :param endpoint: the path the request is sent to
+    :param template: the endpoint with resource identifiers replaced, see :func:`endpoint_template`
+    :param request_headers: additional headers to send. Hooks may add to these in
+        :meth:`RequestHooks.on_request`, for example to propagate trace context.
+    :param status: the HTTP status of the response, if one was received
+    :param bytes_sent: size of the request body
+    :param bytes_received: size of the response body as transferred
+    :param timing: the :class:`RequestTiming` breakdown
+    :param error: the exception raised for a failed request
+    :param user_data: storage for hooks to carry their own state from one callback to the next
+    """
+
+    method: str
+    endpoint: str
+    template: str
+    request_headers: Dict[str, str] = field(default_factory=dict)
+    status: Optional[int] = None
+    bytes_sent: Optional[int] = None
+    bytes_received: Optional[int] = None
+    timing: RequestTiming = field(default_factory=RequestTiming)
+    error: Optional[BaseException] = None
+    user_data: Dict[str, Any] = field(default_factory=dict)
+
+
+class RequestHooks:
+    """Base class for request lifecycle callbacks. Override the callbacks of interest.
+
+    Provide instances to :class:`runzero.Client` with ``request_hooks`` or
+    :meth:`runzero.Client.add_request_hooks`. Callbacks run synchronously on the thread making the
+    request, so they should be fast and must not raise.
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        """
+        Called before a request is sent.
+
+        :param event: the request about to be sent
+        """
+
+    def on_response(self, event: RequestEvent) -> None:
+        """
+        Called after a successful response is received and read.
+
+        :param event: the completed request
+        """
+
+    def on_error(self, event: RequestEvent) -> None:
+        """
+        Called when a request fails, whether or not a response was received.
+
+        :param event: the failed request, with ``error`` set, and ``status`` set if the server
+            responded with an error status
+        """
+
+
+def begin_event(
+    hooks: Sequence[RequestHooks], method: str, endpoint: str, headers: Optional[Dict[str, str]]
+) -> RequestEvent:
+    """Creates the instrumentation event for a request and notifies hooks that it is about to be sent."""
+    event = RequestEvent(
+        method=method,
+        endpoint=endpoint,
+        template=endpoint_template(endpoint),
+        request_headers=dict(headers or {}),
+    )
+    for hook in hooks:
+        hook.on_request(event)
+    return event
+
+
+def complete_event(
+    hooks: Sequence[RequestHooks],
+    event: RequestEvent,
+    request: "Request",
+    started: float,
+    error: Optional[BaseException],
+) -> None:
+    """Copies the outcome of a request onto its instrumentation event and notifies hooks."""
+    event.status = request.status_code
+    event.bytes_sent = request.bytes_sent
+    event.bytes_received = request.bytes_received
+    event.timing = request.timing
+    if request.sent_at is not None:
+        event.timing.queued = request.sent_at - started
+    event.timing.total = time.perf_counter() - started
+    event.error = error
+    for hook in hooks:
+        if error is None:
+            hook.on_response(event)
+        else:
+            hook.on_error(event)
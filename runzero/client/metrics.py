@@ -0,0 +1,326 @@
+"""
+metrics aggregates request counts, errors, latency and bytes per endpoint from Client request hooks.
+"""
+
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from runzero.client.instrumentation import RequestEvent, RequestHooks
+
+__all__ = [
+    "EndpointMetrics",
+    "MetricsCollector",
+    "MetricsSnapshot",
+]
+
+#: Upper bounds, in seconds, of the latency histogram buckets: powers of the square root of two
+#: from one millisecond to about seventeen minutes. Requests slower than the last bound are counted
+#: in an overflow bucket.
+LATENCY_BUCKETS: Tuple[float, ...] = tuple(0.001 * 2 ** (i / 2) for i in range(41))
+
+SeriesKey = Tuple[str, str]
+
+
+class _Series:
+    """Running totals for one method and endpoint template, written only by its owning thread."""
+
+    __slots__ = ("requests", "errors", "buckets", "latency_sum", "latency_max", "bytes_sent", "bytes_received")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors: Dict[str, int] = {}
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def merge(self, other: "_Series") -> None:
+        """Adds another series' totals to this one."""
+        self.requests += other.requests
+        for name, count in list(other.errors.items()):
+            self.errors[name] = self.errors.get(name, 0) + count
+        for i, count in enumerate(list(other.buckets)):
+            self.buckets[i] += count
+        self.latency_sum += other.latency_sum
+        self.latency_max = max(self.latency_max, other.latency_max)
+        self.bytes_sent += other.bytes_sent
+        self.bytes_received += other.bytes_received
+
+
+class _Shard:
+    """The series recorded by a single thread."""
+
+    __slots__ = ("thread", "series")
+
+    def __init__(self, thread: threading.Thread) -> None:
+        self.thread = thread
+        self.series: Dict[SeriesKey, _Series] = {}
+
+
+@dataclass
+class EndpointMetrics:
+    """Aggregated measurements for requests to one endpoint template with one method.
+
+    :param method: the HTTP verb
+    :param template: the endpoint template, such as ``api/v1.0/org/sites/{id}``
+    :param requests: the number of requests sent, including failed requests
+    :param errors: the number of failed requests by exception class name, such as ``ClientError``,
+        ``ServerError``, ``RateLimitError`` or ``ConnTimeoutError``
+    :param latency_buckets: request counts per latency bucket. Entry ``i`` counts requests no slower
+        than ``LATENCY_BUCKETS[i]`` and slower than the previous bound; the last entry counts
+        requests slower than every bound.
+    :param latency_sum: total latency of all requests, in seconds
+    :param latency_max: latency of the slowest request, in seconds
+    :param bytes_sent: total request body bytes
+    :param bytes_received: total response body bytes
+    """
+
+    method: str
+    template: str
+    requests: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+    latency_buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+    @property
+    def error_count(self) -> int:
+        """The number of failed requests."""
+        return sum(self.errors.values())
+
+    @property
+    def p50(self) -> Optional[float]:
+        """The estimated median latency in seconds, or None if there were no requests."""
+        return self.quantile(0.5)
+
+    @property
+    def p95(self) -> Optional[float]:
+        """The estimated 95th percentile latency in seconds, or None if there were no requests."""
+        return self.quantile(0.95)
+
+    @property
+    def p99(self) -> Optional[float]:
+        """The estimated 99th percentile latency in seconds, or None if there were no requests."""
+        return self.quantile(0.99)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates a latency quantile by interpolating within the histogram bucket holding it.
+
+        :param q: the quantile, between 0 and 1
+
+        :returns: the estimated latency in seconds, or None if there were no requests
+        :raises: ValueError if q is out of range
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("quantile must be between 0 and 1")
+        total = sum(self.latency_buckets)
+        if total == 0:
+            return None
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(self.latency_buckets):
+            if count and seen + count >= rank:
+                if i == len(LATENCY_BUCKETS):
+                    return self.latency_max
+                lower = LATENCY_BUCKETS[i - 1] if i else 0.0
+                upper = min(LATENCY_BUCKETS[i], self.latency_max)
+                return lower + (max(upper, lower) - lower) * (rank - seen) / count
+            seen += count
+        return self.latency_max
+
+
+@dataclass
+class MetricsSnapshot:
+    """A point-in-time copy of the metrics gathered by a :class:`MetricsCollector`.
+
+    :param endpoints: metrics keyed by ``(method, template)``
+    """
+
+    endpoints: Dict[SeriesKey, EndpointMetrics] = field(default_factory=dict)
+
+    def __iter__(self) -> Iterator[EndpointMetrics]:
+        return iter(self.endpoints.values())
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def get(self, method: str, template: str) -> Optional[EndpointMetrics]:
+        """
+        Retrieves the metrics for one endpoint template and method.
+
+        :param method: the HTTP verb
+        :param template: the endpoint template, such as ``api/v1.0/org/sites/{id}``
+
+        :returns: the metrics, or None if no such request was made
+        """
+        return self.endpoints.get((method, template))
+
+    def to_prometheus(self, prefix: str = "runzero_sdk") -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format.
+
+        :param prefix: the prefix for each metric name
+
+        :returns: the exposition text
+        """
+        lines: List[str] = []
+        ordered = sorted(self.endpoints.values(), key=lambda m: (m.template, m.method))
+
+        def header(name: str, kind: str, help_text: str) -> str:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            return f"{prefix}_{name}"
+
+        name = header("requests_total", "counter", "Requests sent to the runZero API.")
+        for m in ordered:
+            lines.append(f"{name}{{{_labels(m)}}} {m.requests}")
+
+        name = header("request_errors_total", "counter", "Failed requests to the runZero API by error class.")
+        for m in ordered:
+            for error, count in sorted(m.errors.items()):
+                lines.append(f'{name}{{{_labels(m)},error="{_escape(error)}"}} {count}')
+
+        name = header("request_duration_seconds", "histogram", "Latency of requests to the runZero API.")
+        for m in ordered:
+            labels = _labels(m)
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, m.latency_buckets):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound:.6g}"}} {cumulative}')
+            cumulative += m.latency_buckets[-1]
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {m.latency_sum:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {cumulative}")
+
+        name = header("request_bytes_sent_total", "counter", "Request body bytes sent to the runZero API.")
+        for m in ordered:
+            lines.append(f"{name}{{{_labels(m)}}} {m.bytes_sent}")
+
+        name = header("response_bytes_received_total", "counter", "Response body bytes received from the runZero API.")
+        for m in ordered:
+            lines.append(f"{name}{{{_labels(m)}}} {m.bytes_received}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(m: EndpointMetrics) -> str:
+    return f'method="{_escape(m.method)}",endpoint="{_escape(m.template)}"'
+
+
+class MetricsCollector(RequestHooks):
+    """Request hooks which aggregate metrics per endpoint template and method.
+
+    Each thread records into its own shard without taking a lock, so collection is cheap enough to
+    leave enabled. Shards are combined when a :meth:`snapshot` is taken. Shards of threads which have
+    exited are folded together so thread churn does not grow memory.
+
+    A collector is created for :class:`runzero.Client` with ``collect_metrics=True`` and read with
+    :meth:`runzero.Client.metrics`. A collector may also be shared between several clients by passing
+    it in their ``request_hooks``.
+    """
+
+    def __init__(self) -> None:
+        """Constructor method"""
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[_Shard] = []
+        self._retired: Dict[SeriesKey, _Series] = {}
+
+    def on_response(self, event: RequestEvent) -> None:
+        """
+        Records a successful request.
+
+        :param event: the completed request
+        """
+        self._record(event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        """
+        Records a failed request.
+
+        :param event: the failed request
+        """
+        self._record(event)
+
+    def _shard(self) -> _Shard:
+        shard: Optional[_Shard] = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard(threading.current_thread())
+            with self._lock:
+                self._retire_dead_shards()
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _record(self, event: RequestEvent) -> None:
+        series_map = self._shard().series
+        key = (event.method, event.template)
+        series = series_map.get(key)
+        if series is None:
+            series = series_map[key] = _Series()
+        series.requests += 1
+        if event.error is not None:
+            name = type(event.error).__name__
+            series.errors[name] = series.errors.get(name, 0) + 1
+        latency = event.timing.total or 0.0
+        series.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        series.latency_sum += latency
+        series.latency_max = max(series.latency_max, latency)
+        series.bytes_sent += event.bytes_sent or 0
+        series.bytes_received += event.bytes_received or 0
+
+    def _retire_dead_shards(self) -> None:
+        """Folds the shards of exited threads into the retired totals. Must hold the lock."""
+        alive = []
+        for shard in self._shards:
+            if shard.thread.is_alive():
+                alive.append(shard)
+            else:
+                _merge_into(self._retired, shard.series)
+        self._shards = alive
+
+    def snapshot(self) -> MetricsSnapshot:
+        """
+        Combines the metrics recorded by all threads so far.
+
+        :returns: a :class:`MetricsSnapshot`
+        """
+        totals: Dict[SeriesKey, _Series] = {}
+        with self._lock:
+            self._retire_dead_shards()
+            _merge_into(totals, self._retired)
+            for shard in self._shards:
+                _merge_into(totals, shard.series)
+        snapshot = MetricsSnapshot()
+        for (method, template), series in totals.items():
+            snapshot.endpoints[(method, template)] = EndpointMetrics(
+                method=method,
+                template=template,
+                requests=series.requests,
+                errors=dict(series.errors),
+                latency_buckets=list(series.buckets),
+                latency_sum=series.latency_sum,
+                latency_max=series.latency_max,
+                bytes_sent=series.bytes_sent,
+                bytes_received=series.bytes_received,
+            )
+        return snapshot
+
+
+def _merge_into(totals: Dict[SeriesKey, _Series], series_map: Dict[SeriesKey, _Series]) -> None:
+    # copying the items is atomic, so a thread adding a series meanwhile cannot break iteration
+    for key, series in list(series_map.items()):
+        total = totals.get(key)
+        if total is None:
+            total = totals[key] = _Series()
+        total.merge(series)
@@ -0,0 +1,102 @@
+"""
+otel reports Client requests as OpenTelemetry spans.
+
+This module requires the ``opentelemetry-api`` package, installable with the ``opentelemetry``
+extra: ``pip install runzero-sdk[opentelemetry]``. Spans are exported by whichever OpenTelemetry
+SDK and exporter the application configures.
+"""
+
+from typing import Any, Optional
+
+from opentelemetry import trace
+from opentelemetry.propagate import inject
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+import runzero.version
+from runzero.client.instrumentation import RequestEvent, RequestHooks
+
+__all__ = [
+    "OpenTelemetryHooks",
+]
+
+_SPAN_KEY = "opentelemetry.span"
+
+
+class OpenTelemetryHooks(RequestHooks):
+    """Request hooks which record a client span for each request.
+
+    Spans are named by method and endpoint template, such as ``GET api/v1.0/org/sites/{id}``, and
+    carry the HTTP semantic convention attributes along with the timing breakdown as
+    ``runzero.timing.*`` attributes. Trace context is propagated to the server in request headers.
+
+    :param tracer_provider: Optional OpenTelemetry TracerProvider. Defaults to the global provider.
+    :param propagate: whether to inject trace context headers into requests. Default is True.
+
+    Example::
+
+        client = runzero.Client(request_hooks=[OpenTelemetryHooks()])
+    """
+
+    def __init__(self, tracer_provider: Optional[Any] = None, propagate: bool = True):
+        """Constructor method"""
+        self._tracer = trace.get_tracer("runzero", runzero.version.__version__, tracer_provider=tracer_provider)
+        self._propagate = propagate
+
+    def on_request(self, event: RequestEvent) -> None:
+        """
+        Starts the span for a request.
+
+        :param event: the request about to be sent
+        """
+        span = self._tracer.start_span(
+            f"{event.method} {event.template}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "http.request.method": event.method,
+                "url.template": event.template,
+            },
+        )
+        event.user_data[_SPAN_KEY] = span
+        if self._propagate:
+            inject(event.request_headers, context=trace.set_span_in_context(span))
+
+    def on_response(self, event: RequestEvent) -> None:
+        """
+        Ends the span for a successful request.
+
+        :param event: the completed request
+        """
+        span = event.user_data.pop(_SPAN_KEY, None)
+        if span is None:
+            return
+        _set_outcome(span, event)
+        span.end()
+
+    def on_error(self, event: RequestEvent) -> None:
+        """
+        Ends the span for a failed request, recording the exception.
+
+        :param event: the failed request
+        """
+        span = event.user_data.pop(_SPAN_KEY, None)
+        if span is None:
+            return
+        _set_outcome(span, event)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_attribute("error.type", type(event.error).__qualname__)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+
+def _set_outcome(span: Any, event: RequestEvent) -> None:
+    if event.status is not None:
+        span.set_attribute("http.response.status_code", event.status)
+    if event.bytes_sent is not None:
+        span.set_attribute("http.request.body.size", event.bytes_sent)
+    if event.bytes_received is not None:
+        span.set_attribute("http.response.body.size", event.bytes_received)
+    for phase in ("queued", "connect", "tls", "ttfb", "body_read", "total"):
+        value = getattr(event.timing, phase)
+        if value is not None:
+            span.set_attribute(f"runzero.timing.{phase}", value)
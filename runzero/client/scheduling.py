@@ -0,0 +1,235 @@
+"""
+scheduling orders requests from a shared Client by priority class, with weighted fair queuing.
+"""
+
+import threading
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Deque, Dict, Mapping, Optional
+
+from runzero.client.concurrency import AdaptiveConcurrencyLimiter, Permit
+from runzero.client.errors import RateLimitError
+from runzero.types import RateLimitInformation
+
+__all__ = [
+    "Priority",
+    "RequestScheduler",
+    "Ticket",
+]
+
+
+class Priority(IntEnum):
+    """Priority classes for requests scheduled by a :class:`RequestScheduler`."""
+
+    HIGH = 0
+    """Interactive requests, such as lookups made on behalf of a waiting user."""
+
+    NORMAL = 1
+    """The default class."""
+
+    LOW = 2
+    """Background and bulk work, such as imports and mass updates."""
+
+
+DEFAULT_WEIGHTS: Mapping[Priority, int] = {Priority.HIGH: 16, Priority.NORMAL: 4, Priority.LOW: 1}
+
+
+class Ticket:
+    """Admission to send a request, granted by :meth:`RequestScheduler.acquire` and released once."""
+
+    __slots__ = ("_scheduler", "_permit", "_released")
+
+    def __init__(self, scheduler: "RequestScheduler", permit: Optional[Permit]):
+        self._scheduler = scheduler
+        self._permit = permit
+        self._released = False
+
+    def release(self, error: Optional[BaseException] = None, endpoint: Optional[str] = None) -> None:
+        """
+        Frees the slot for the next queued request.
+
+        :param error: the exception the request failed with, if any, which is passed to the
+            scheduler's concurrency limiter
+        :param endpoint: Optional endpoint template of the request, which is passed to the
+            scheduler's concurrency limiter
+        """
+        if self._released:
+            return
+        self._released = True
+        # pylint: disable-next=protected-access
+        self._scheduler._release(self._permit, error, endpoint)
+
+
+class _Waiter:
+    __slots__ = ("priority", "tag", "granted", "ticket")
+
+    def __init__(self, priority: Priority, tag: float):
+        self.priority = priority
+        self.tag = tag
+        self.granted = threading.Event()
+        self.ticket: Optional[Ticket] = None
+
+
+class RequestScheduler:
+    """Admits requests from a shared Client in priority order, sharing capacity fairly between classes.
+
+    Requests wait in one queue per :class:`Priority`. When capacity frees up, the next request is
+    chosen by start-time fair queuing: each class receives a share of admissions proportional to its
+    weight, so a high priority request overtakes queued bulk work while bulk work still progresses.
+    Requests within a class are admitted in arrival order.
+
+    Capacity is either a fixed number of requests in flight, or the permits of an
+    :class:`runzero.client.AdaptiveConcurrencyLimiter`, which then adapts it.
+
+    Provide an instance to :class:`runzero.Client` with ``scheduler``, and set priorities with
+    :meth:`runzero.Client.priority` or the ``priority`` argument of :meth:`runzero.Client.execute`.
+
+    :param max_concurrency: the number of requests allowed in flight when no limiter is provided.
+        Default is 8.
+    :param limiter: Optional concurrency limiter which decides how many requests may be in flight
+    :param weights: Optional share of admissions per priority class. Defaults to 16, 4 and 1 for
+        HIGH, NORMAL and LOW.
+    :param rate_limit_reserve: Optional number of API calls in the account's usage allowance reserved
+        for HIGH priority requests. Once the console reports no more than this many remaining, other
+        requests raise RateLimitError without being sent.
+
+    :raises: ValueError for non-positive capacity or weights, or both capacity and a limiter
+    """
+
+    # how often waiters re-check a limiter which other clients may release permits to
+    _POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        weights: Optional[Mapping[Priority, int]] = None,
+        rate_limit_reserve: Optional[int] = None,
+    ):
+        """Constructor method"""
+        if max_concurrency is not None and limiter is not None:
+            raise ValueError("provide either max_concurrency or a limiter, not both")
+        if max_concurrency is None and limiter is None:
+            max_concurrency = 8
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be greater than 0")
+        merged = dict(DEFAULT_WEIGHTS)
+        merged.update(weights or {})
+        if any(weight <= 0 for weight in merged.values()):
+            raise ValueError("weights must be greater than 0")
+        self._max_concurrency = max_concurrency
+        self._limiter = limiter
+        self._weights = {priority: float(weight) for priority, weight in merged.items()}
+        self._reserve = rate_limit_reserve
+        self._lock = threading.Lock()
+        self._queues: Dict[Priority, Deque[_Waiter]] = {priority: deque() for priority in Priority}
+        self._last_tag: Dict[Priority, float] = {priority: 0.0 for priority in Priority}
+        self._virtual_time = 0.0
+        self._in_flight = 0
+        self._admitted: Dict[Priority, int] = {priority: 0 for priority in Priority}
+
+    @property
+    def limiter(self) -> Optional[AdaptiveConcurrencyLimiter]:
+        """The concurrency limiter providing capacity, if any."""
+        return self._limiter
+
+    @property
+    def in_flight(self) -> int:
+        """The number of admitted requests which have not been released."""
+        return self._in_flight
+
+    def queued(self) -> Dict[Priority, int]:
+        """
+        The number of requests waiting in each priority class.
+
+        :returns: queue lengths by priority
+        """
+        with self._lock:
+            return {priority: len(queue) for priority, queue in self._queues.items()}
+
+    def admitted(self) -> Dict[Priority, int]:
+        """
+        The number of requests admitted in each priority class so far.
+
+        :returns: admission counts by priority
+        """
+        with self._lock:
+            return dict(self._admitted)
+
+    def acquire(
+        self,
+        priority: Priority = Priority.NORMAL,
+        timeout: Optional[float] = None,
+        rate_limit_information: Optional[RateLimitInformation] = None,
+    ) -> Optional[Ticket]:
+        """
+        Waits for the request's turn to be sent.
+
+        :param priority: the priority class of the request
+        :param timeout: Optional number of seconds to wait
+        :param rate_limit_information: Optional latest rate limit information from the console,
+            used to enforce ``rate_limit_reserve``
+
+        :returns: a :class:`Ticket`, or None if the request was not admitted within the timeout
+        :raises: RateLimitError if the remaining usage allowance is reserved for higher priorities
+        """
+        self._check_reserve(priority, rate_limit_information)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            tag = max(self._virtual_time, self._last_tag[priority]) + 1 / self._weights[priority]
+            self._last_tag[priority] = tag
+            waiter = _Waiter(priority, tag)
+            self._queues[priority].append(waiter)
+            self._dispatch()
+        while True:
+            wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if self._limiter is not None:
+                wait = self._POLL_INTERVAL if wait is None else min(wait, self._POLL_INTERVAL)
+            if waiter.granted.wait(wait):
+                return waiter.ticket
+            with self._lock:
+                self._dispatch()
+                if waiter.granted.is_set():
+                    return waiter.ticket
+                if deadline is not None and time.monotonic() >= deadline:
+                    self._queues[priority].remove(waiter)
+                    return None
+
+    def _check_reserve(self, priority: Priority, info: Optional[RateLimitInformation]) -> None:
+        if self._reserve is None or priority is Priority.HIGH or info is None:
+            return
+        remaining = info.usage_remaining
+        if isinstance(remaining, int) and remaining <= self._reserve:
+            raise RateLimitError(
+                rate_limit_information=info,
+                message=f"The remaining {remaining} API calls are reserved for high priority requests.",
+            )
+
+    def _dispatch(self) -> None:
+        """Admits queued requests while capacity allows. Must hold the lock."""
+        while True:
+            heads = [queue[0] for queue in self._queues.values() if queue]
+            if not heads:
+                return
+            permit = None
+            if self._limiter is not None:
+                permit = self._limiter.try_acquire()
+                if permit is None:
+                    return
+            elif self._max_concurrency is not None and self._in_flight >= self._max_concurrency:
+                return
+            waiter = min(heads, key=lambda w: (w.tag, w.priority))
+            self._queues[waiter.priority].popleft()
+            self._virtual_time = waiter.tag
+            self._in_flight += 1
+            self._admitted[waiter.priority] += 1
+            waiter.ticket = Ticket(self, permit)
+            waiter.granted.set()
+
+    def _release(self, permit: Optional[Permit], error: Optional[BaseException], endpoint: Optional[str]) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if permit is not None:
+                permit.release(error, endpoint=endpoint)
+            self._dispatch()
@@ -0,0 +1,163 @@
+"""
+token_cache provides an optional on-disk cache of OAuth tokens shared between Client instances and processes.
+"""
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from runzero.client._http.auth import OAuthToken
+
+__all__ = [
+    "TokenCache",
+]
+
+
+def _default_path() -> Path:
+    """The default token cache location, following the XDG base directory convention."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "runzero" / "tokens.json"
+
+
+class TokenCache:
+    """A permission-restricted file holding OAuth tokens for reuse across short-lived processes.
+
+    Provide an instance to :class:`runzero.Client` to have :meth:`runzero.Client.oauth_login` reuse a
+    still-valid token instead of requesting a new one, and to have newly issued tokens saved.
+    Tokens are keyed by server URL, client ID and a hash of the client secret, so a rotated or
+    mistyped secret never reuses a token issued for another. Client secrets are never written.
+
+    The file and its directory are created readable only by the current user. On POSIX systems a
+    file which is accessible to other users is ignored rather than trusted.
+
+    :param path: Optional location of the cache file. Defaults to ``runzero/tokens.json`` under
+        ``$XDG_CACHE_HOME``, or ``~/.cache`` when that is not set.
+    :type path: str or os.PathLike
+    """
+
+    def __init__(self, path: Optional[Union[str, "os.PathLike[str]"]] = None):
+        """Constructor method"""
+        self._path = Path(path) if path is not None else _default_path()
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """
+        The location of the cache file
+
+        :returns: path to the cache file
+        """
+        return self._path
+
+    @staticmethod
+    def _key(server_url: str, client_id: str, client_secret: str) -> str:
+        secret = hashlib.sha256(client_secret.encode("utf-8")).hexdigest()
+        return hashlib.sha256(f"{server_url.rstrip('/')}\n{client_id}\n{secret}".encode("utf-8")).hexdigest()
+
+    def load(self, server_url: str, client_id: str, client_secret: str) -> Optional[OAuthToken]:
+        """
+        Retrieves a token which has not yet expired.
+
+        :param server_url: the runZero server URL the token was issued by
+        :param client_id: the API client ID the token was issued to
+        :param client_secret: the API client secret the token was issued for
+
+        :returns: the cached token, or None if there is no usable token
+        """
+        with self._lock:
+            entry = self._read().get(self._key(server_url, client_id, client_secret))
+        if not isinstance(entry, dict):
+            return None
+        try:
+            token = OAuthToken(
+                access_token=entry["access_token"],
+                token_type=entry["token_type"],
+                expires_in=entry["expires_in"],
+                created_at=datetime.fromtimestamp(float(entry["issued_at"]), timezone.utc),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+        if token.is_expired():
+            return None
+        return token
+
+    def store(self, server_url: str, client_id: str, client_secret: str, token: OAuthToken) -> None:
+        """
+        Saves a token, replacing any previous token for the same server and client credentials.
+
+        Expired tokens for other clients are dropped at the same time.
+
+        :param server_url: the runZero server URL the token was issued by
+        :param client_id: the API client ID the token was issued to
+        :param client_secret: the API client secret the token was issued for
+        :param token: the token to save
+
+        :raises: OSError if the cache file cannot be written
+        """
+        issued_at = datetime.now(timezone.utc).timestamp() - (token.expires_in - token.seconds_remaining())
+        with self._lock:
+            entries = {k: v for k, v in self._read().items() if not _expired(v)}
+            entries[self._key(server_url, client_id, client_secret)] = {
+                "access_token": token.access_token,
+                "token_type": token.token_type,
+                "expires_in": token.expires_in,
+                "issued_at": issued_at,
+            }
+            self._write(entries)
+
+    def discard(self, server_url: str, client_id: str, client_secret: str) -> None:
+        """
+        Removes the token for a server and client credentials, such as after it has been revoked.
+
+        :param server_url: the runZero server URL the token was issued by
+        :param client_id: the API client ID the token was issued to
+        :param client_secret: the API client secret the token was issued for
+
+        :raises: OSError if the cache file cannot be written
+        """
+        with self._lock:
+            entries = self._read()
+            if entries.pop(self._key(server_url, client_id, client_secret), None) is not None:
+                self._write(entries)
+
+    def _read(self) -> Dict[str, Any]:
+        """Reads all entries, treating a missing, unreadable, or unsafe file as empty."""
+        try:
+            with open(self._path, "rb") as fp:
+                if os.name == "posix" and os.fstat(fp.fileno()).st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+                    return {}
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, entries: Dict[str, Any]) -> None:
+        """Atomically replaces the cache file so concurrent readers never see a partial write."""
+        self._path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".tokens-", dir=self._path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                json.dump(entries, fp)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self._path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+def _expired(entry: Any) -> bool:
+    """True for entries which are malformed or past their lifetime on the wall clock."""
+    try:
+        expires_at = float(entry["issued_at"]) + float(entry["expires_in"])
+    except (KeyError, TypeError, ValueError):
+        return True
+    return expires_at <= datetime.now(timezone.utc).timestamp()
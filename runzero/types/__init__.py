@@ -8,58 +8,84 @@ OpenAPI specs, are usable in this project today.
 """
 
 from ipaddress import AddressValueError, IPv4Address, IPv6Address
+from typing import TYPE_CHECKING
 
-from pydantic import ValidationError
+from runzero._lazy import attach
 
-from runzero.types._data_models_gen import Agent as Explorer
-from runzero.types._data_models_gen import AgentSiteID as ExplorerSiteID
-from runzero.types._data_models_gen import (
-    BaseCustomIntegration,
-    HostedZone,
-    ImportTask,
-    NewAssetImport,
-    NewCustomIntegration,
-    Organization,
-    OrgOptions,
-    Problem,
-    Site,
-    SiteOptions,
-    Task,
-    TaskOptions,
-)
-from runzero.types._rate_limit_information import RateLimitInformation
-from runzero.types._wrapped import (
-    CustomAttribute,
-    CustomIntegration,
-    Hostname,
-    ImportAsset,
-    NetworkInterface,
-    ScanOptions,
-    ScanTemplate,
-    ScanTemplateOptions,
-    Service,
-    ServiceProtocolData,
-    Software,
-    Tag,
-    Vulnerability,
-)
+if TYPE_CHECKING:
+    from pydantic import ValidationError
+
+    from runzero.types._addresses import (
+        AddressError,
+        normalize_ipv4_column,
+        normalize_ipv6_column,
+        normalize_mac_column,
+        normalize_network_interfaces,
+    )
+    from runzero.types._data_models_gen import Agent as Explorer
+    from runzero.types._data_models_gen import AgentSiteID as ExplorerSiteID
+    from runzero.types._data_models_gen import (
+        BaseCustomIntegration,
+        HostedZone,
+        ImportTask,
+        NewAssetImport,
+        NewCustomIntegration,
+        Organization,
+        OrgOptions,
+        Problem,
+        Site,
+        SiteOptions,
+        Task,
+        TaskOptions,
+    )
+    from runzero.types._rate_limit_information import RateLimitInformation
+    from runzero.types._views import (
+        ExplorerView,
+        HostedZoneView,
+        ModelView,
+        SiteView,
+        TaskView,
+    )
+    from runzero.types._wrapped import (
+        CustomAttribute,
+        CustomIntegration,
+        Hostname,
+        ImportAsset,
+        NetworkInterface,
+        ScanOptions,
+        ScanTemplate,
+        ScanTemplateOptions,
+        Service,
+        ServiceProtocolData,
+        Software,
+        Tag,
+        Vulnerability,
+    )
 
 __all__ = [
+    "AddressError",
     "AddressValueError",
     "BaseCustomIntegration",
     "CustomAttribute",
     "CustomIntegration",
     "Explorer",
     "ExplorerSiteID",
+    "ExplorerView",
     "HostedZone",
+    "HostedZoneView",
     "Hostname",
     "IPv4Address",
     "IPv6Address",
     "ImportAsset",
     "ImportTask",
+    "ModelView",
     "NetworkInterface",
     "NewAssetImport",
     "NewCustomIntegration",
+    "normalize_ipv4_column",
+    "normalize_ipv6_column",
+    "normalize_mac_column",
+    "normalize_network_interfaces",
     "Organization",
     "OrgOptions",
     "Problem",
@@ -72,9 +98,59 @@ __all__ = [
     "Software",
     "Site",
     "SiteOptions",
+    "SiteView",
     "Tag",
     "Task",
     "TaskOptions",
+    "TaskView",
     "ValidationError",
     "Vulnerability",
 ]
+
+
+# the generated models take most of the SDK's import time, so they are imported on first use
+__getattr__, __dir__ = attach(
+    __name__,
+    globals(),
+    {
+        "AddressError": "._addresses",
+        "BaseCustomIntegration": "._data_models_gen",
+        "CustomAttribute": "._wrapped",
+        "CustomIntegration": "._wrapped",
+        "Explorer": "._data_models_gen:Agent",
+        "ExplorerSiteID": "._data_models_gen:AgentSiteID",
+        "ExplorerView": "._views",
+        "HostedZone": "._data_models_gen",
+        "HostedZoneView": "._views",
+        "Hostname": "._wrapped",
+        "ImportAsset": "._wrapped",
+        "ImportTask": "._data_models_gen",
+        "ModelView": "._views",
+        "NetworkInterface": "._wrapped",
+        "NewAssetImport": "._data_models_gen",
+        "NewCustomIntegration": "._data_models_gen",
+        "normalize_ipv4_column": "._addresses",
+        "normalize_ipv6_column": "._addresses",
+        "normalize_mac_column": "._addresses",
+        "normalize_network_interfaces": "._addresses",
+        "Organization": "._data_models_gen",
+        "OrgOptions": "._data_models_gen",
+        "Problem": "._data_models_gen",
+        "RateLimitInformation": "._rate_limit_information",
+        "ScanOptions": "._wrapped",
+        "ScanTemplate": "._wrapped",
+        "ScanTemplateOptions": "._wrapped",
+        "Service": "._wrapped",
+        "ServiceProtocolData": "._wrapped",
+        "Software": "._wrapped",
+        "Site": "._data_models_gen",
+        "SiteOptions": "._data_models_gen",
+        "SiteView": "._views",
+        "Tag": "._wrapped",
+        "Task": "._data_models_gen",
+        "TaskOptions": "._data_models_gen",
+        "TaskView": "._views",
+        "ValidationError": "pydantic",
+        "Vulnerability": "._wrapped",
+    },
+)
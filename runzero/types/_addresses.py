@@ -0,0 +1,260 @@
+"""
+_addresses validates and normalizes the IP and MAC addresses of many network interfaces at once.
+
+Building a :class:`runzero.types.NetworkInterface` parses every address into an ``ipaddress``
+object, which dominates the cost of validating large asset imports. The column functions here check
+a whole list of address strings with the C address parser of the socket module and return the
+canonical text that the SDK sends to the server, the same text as ``str(IPv4Address(value))``.
+:func:`normalize_network_interfaces` applies them to the network interfaces of a batch of assets in
+their JSON form, reporting which asset and field hold each invalid address.
+"""
+
+import re
+from functools import lru_cache
+from ipaddress import IPv4Address, IPv6Address
+from socket import AF_INET, AF_INET6, inet_ntop, inet_pton
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+)
+
+from runzero._pydantic import PYDANTIC_V2
+from runzero.types._data_models_gen import NetworkInterface as RESTNetworkInterface
+
+__all__ = [
+    "AddressError",
+    "normalize_ipv4_column",
+    "normalize_ipv6_column",
+    "normalize_mac_column",
+    "normalize_network_interfaces",
+]
+
+
+class AddressError(NamedTuple):
+    """
+    An invalid address, or list of addresses, of a network interface in a batch of assets.
+
+    :param asset: the index of the asset in the batch
+    :param asset_id: the ``id`` of the asset, if it has one
+    :param field: the path of the invalid value within the asset, such as
+        ``network_interfaces[0].ipv4_addresses[3]``
+    :param value: the invalid value
+    :param message: why the value is invalid
+    """
+
+    asset: int
+    asset_id: Optional[str]
+    field: str
+    value: Any
+    message: str
+
+
+def _ipv4_text(value: Any) -> Optional[str]:
+    """The canonical text of an IPv4 address, or None if the value is not one."""
+    if isinstance(value, str):
+        try:
+            return inet_ntop(AF_INET, inet_pton(AF_INET, value))
+        except (OSError, ValueError):
+            pass
+    elif not isinstance(value, IPv4Address):
+        return None
+    # inet_pton is stricter than ipaddress, which decides whatever it rejects
+    try:
+        return str(IPv4Address(value))
+    except ValueError:
+        return None
+
+
+def _ipv6_packed_text(packed: bytes) -> str:
+    """The canonical text of a packed IPv6 address."""
+    text = inet_ntop(AF_INET6, packed)
+    # inet_ntop writes the IPv4 part of mapped and compatible addresses in dotted form
+    return text if "." not in text else str(IPv6Address(packed))
+
+
+def _ipv6_text(value: Any) -> Optional[str]:
+    """The canonical text of an IPv6 address, or None if the value is not one."""
+    if isinstance(value, str):
+        try:
+            packed = inet_pton(AF_INET6, value)
+        except (OSError, ValueError):
+            packed = None
+        if packed is not None:
+            return _ipv6_packed_text(packed)
+    elif not isinstance(value, IPv6Address):
+        return None
+    try:
+        return str(IPv6Address(value))
+    except ValueError:
+        return None
+
+
+def _ipv4_address(value: Any) -> Any:
+    """Converts a string to an IPv4Address, raising AddressValueError as ipaddress does."""
+    if not isinstance(value, str):
+        return value
+    try:
+        packed = inet_pton(AF_INET, value)
+    except (OSError, ValueError):
+        return IPv4Address(value)
+    return IPv4Address(packed)
+
+
+def _ipv6_address(value: Any) -> Any:
+    """Converts a string to an IPv6Address, raising AddressValueError as ipaddress does."""
+    if not isinstance(value, str):
+        return value
+    try:
+        packed = inet_pton(AF_INET6, value)
+    except (OSError, ValueError):
+        return IPv6Address(value)
+    return IPv6Address(packed)
+
+
+if TYPE_CHECKING or not PYDANTIC_V2:
+
+    def _constraint(field: str, name: str) -> Any:
+        """A constraint of a field of the generated NetworkInterface, named as in pydantic 2."""
+        field_info = RESTNetworkInterface.__fields__[field].field_info
+        return getattr(field_info, {"pattern": "regex", "max_length": "max_items"}[name])
+
+else:
+
+    def _constraint(field: str, name: str) -> Any:  # pylint: disable=missing-function-docstring
+        for meta in RESTNetworkInterface.model_fields[field].metadata:  # pylint: disable=no-member
+            if getattr(meta, name, None) is not None:
+                return getattr(meta, name)
+        return None
+
+
+@lru_cache(maxsize=None)
+def _mac_pattern() -> Pattern[str]:
+    return re.compile(_constraint("mac_address", "pattern"))
+
+
+def normalize_ipv4_column(values: Iterable[Any]) -> List[Optional[str]]:
+    """
+    Validates and normalizes a column of IPv4 addresses.
+
+    :param values: address strings or IPv4Addresses
+
+    :returns: the canonical text of each address, in order, with None in place of each value which
+        is not an IPv4 address
+    """
+    return list(map(_ipv4_text, values))
+
+
+def normalize_ipv6_column(values: Iterable[Any]) -> List[Optional[str]]:
+    """
+    Validates and normalizes a column of IPv6 addresses.
+
+    :param values: address strings or IPv6Addresses
+
+    :returns: the canonical text of each address, in order, with None in place of each value which
+        is not an IPv6 address
+    """
+    return list(map(_ipv6_text, values))
+
+
+def normalize_mac_column(values: Iterable[Any]) -> List[Optional[str]]:
+    """
+    Validates a column of MAC addresses in any of the forms a NetworkInterface accepts.
+
+    The server normalizes MAC addresses itself, so valid addresses are returned unchanged.
+
+    :param values: address strings
+
+    :returns: each valid address, in order, with None in place of each invalid value
+    """
+    match = _mac_pattern().fullmatch
+    return [value if isinstance(value, str) and match(value) else None for value in values]
+
+
+_COLUMNS: Tuple[Tuple[str, str, str, Callable[[Iterable[Any]], List[Optional[str]]]], ...] = (
+    ("ipv4_addresses", "ipv4Addresses", "IPv4 address", normalize_ipv4_column),
+    ("ipv6_addresses", "ipv6Addresses", "IPv6 address", normalize_ipv6_column),
+)
+
+
+def _get(obj: MutableMapping[str, Any], name: str, alias: str) -> Any:
+    """The value of a field, which JSON objects may hold by alias or by name."""
+    value = obj.get(alias)
+    return obj.get(name) if value is None else value
+
+
+# pylint: disable-next=too-many-locals,too-many-branches
+def normalize_network_interfaces(assets: Sequence[MutableMapping[str, Any]]) -> List[AddressError]:
+    """
+    Validates and normalizes, in place, the addresses of the network interfaces of a batch of
+    assets in their JSON form, before they are built into ImportAssets.
+
+    The addresses of every interface of every asset are checked together as one column per field.
+    Valid IP addresses are replaced by their canonical text. Fields may be keyed by their API
+    aliases, such as ``networkInterfaces`` and ``ipv4Addresses``, or by their names, such as
+    ``network_interfaces``. Invalid values are left as they are and reported.
+
+    :param assets: the decoded JSON objects of the assets
+
+    :returns: an error for each invalid address or list of addresses, which is empty when every
+        address is valid
+    """
+    errors: List[AddressError] = []
+    # the interfaces of the batch, with the asset and position of each
+    interfaces: List[Tuple[int, int, MutableMapping[str, Any]]] = []
+    for index, asset in enumerate(assets):
+        value = _get(asset, "network_interfaces", "networkInterfaces")
+        if value is None:
+            continue
+        if not isinstance(value, list):
+            errors.append(AddressError(index, asset.get("id"), "network_interfaces", value, "not a list"))
+            continue
+        for position, interface in enumerate(value):
+            if isinstance(interface, MutableMapping):
+                interfaces.append((index, position, interface))
+            else:
+                field = f"network_interfaces[{position}]"
+                errors.append(AddressError(index, asset.get("id"), field, interface, "not an object"))
+
+    def error(index: int, position: int, field: str, value: Any, message: str) -> None:
+        field = f"network_interfaces[{position}].{field}"
+        errors.append(AddressError(index, assets[index].get("id"), field, value, message))
+
+    for name, alias, kind, normalize in _COLUMNS:
+        limit = _constraint(name, "max_length")
+        column: List[Any] = []
+        lists: List[Tuple[int, int, List[Any]]] = []
+        for index, position, interface in interfaces:
+            value = _get(interface, name, alias)
+            if value is None:
+                continue
+            if not isinstance(value, list):
+                error(index, position, name, value, "not a list")
+                continue
+            if limit is not None and len(value) > limit:
+                error(index, position, name, value, f"more than {limit} addresses")
+            column.extend(value)
+            lists.append((index, position, value))
+
+        texts = iter(normalize(column))
+        for index, position, addresses in lists:
+            for offset, value in enumerate(addresses):
+                text = next(texts)
+                if text is None:
+                    error(index, position, f"{name}[{offset}]", value, f"not a valid {kind}")
+                else:
+                    addresses[offset] = text
+
+    values = [_get(interface, "mac_address", "macAddress") for _, _, interface in interfaces]
+    for (index, position, _), value, mac in zip(interfaces, values, normalize_mac_column(values)):
+        if mac is None and value is not None:
+            error(index, position, "mac_address", value, "not a valid MAC address")
+    return errors
@@ -0,0 +1,177 @@
+"""
+_views provides lightweight, read-only views of the JSON objects the runZero server returns.
+
+A view keeps the JSON values of a model's fields in a tuple and converts a field each time it is
+read. Strings repeated across the objects of one response, such as organization and site IDs, are
+stored once. Scanning many tasks or sites through views takes a fraction of the memory of holding
+them as models, or of holding the decoded JSON objects themselves.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from pydantic import BaseModel
+
+from runzero._pydantic import ModelT, parse
+from runzero._trusted import Convert, field_plans
+from runzero.types._data_models_gen import Agent, HostedZone, Site, Task
+
+__all__ = [
+    "ExplorerView",
+    "HostedZoneView",
+    "ModelView",
+    "SiteView",
+    "TaskView",
+]
+
+_MISSING = object()
+
+
+class _ViewField:
+    """A read-only descriptor reading one field of a model from a view's values."""
+
+    __slots__ = ("index", "convert", "default")
+
+    def __init__(self, index: int, convert: Optional[Convert], default: Callable[[], Any]) -> None:
+        self.index = index
+        self.convert = convert
+        self.default = default
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        value = instance._values[self.index]  # pylint: disable=protected-access
+        if value is _MISSING:
+            return self.default()
+        return value if self.convert is None else self.convert(value)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        raise AttributeError(f"{type(instance).__name__} is read-only")
+
+
+class ModelView(Generic[ModelT]):
+    """A read-only view of a JSON object the server returned, with the attributes of a model.
+
+    Attributes have the names and types of the model's fields. Plain values such as strings and
+    numbers are returned as the server sent them, while values such as UUIDs are converted on every
+    read, so keep a converted value rather than reading it repeatedly in a tight loop. Fields are
+    not validated until :meth:`to_model` is called. Keys of the JSON object which are not fields of
+    the model are dropped.
+
+    Subclasses set ``_model`` to the model they view.
+
+    :param obj: the decoded JSON object
+    :param memo: Optional dict shared by the views of one response, through which equal strings
+        are stored once
+    """
+
+    __slots__ = ("_values",)
+
+    _model: ClassVar[Type[BaseModel]] = BaseModel
+    _names: ClassVar[Tuple[str, ...]] = ()
+    _keys: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        model = cls.__dict__.get("_model")
+        if model is None:
+            return
+        plans = field_plans(model)
+        for index, plan in enumerate(plans):
+            setattr(cls, plan.name, _ViewField(index, plan.convert, plan.default))
+        cls._names = tuple(plan.name for plan in plans)
+        cls._keys = tuple((plan.alias, plan.name) for plan in plans)
+
+    def __init__(self, obj: Dict[str, Any], memo: Optional[Dict[str, str]] = None) -> None:
+        values = []
+        for alias, name in self._keys:
+            value = obj.get(alias, _MISSING)
+            if value is _MISSING and alias != name:
+                value = obj.get(name, _MISSING)
+            if memo is not None and type(value) is str:  # pylint: disable=unidiomatic-typecheck
+                value = memo.setdefault(value, value)
+            values.append(value)
+        object.__setattr__(self, "_values", tuple(values))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        The JSON object of the view's fields, keyed as the server sent them.
+
+        :returns: a new dict
+        """
+        return {alias: value for (alias, _), value in zip(self._keys, self._values) if value is not _MISSING}
+
+    def to_model(self) -> ModelT:
+        """
+        Validates the view's fields as a model.
+
+        :returns: the model
+        :raises: ValidationError
+        """
+        return parse(self._model, self.to_dict())  # type: ignore[return-value]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):  # pylint: disable=unidiomatic-typecheck
+            return NotImplemented
+        return bool(self._values == other._values)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.to_dict(),)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._names)
+        return f"{type(self).__name__}({fields})"
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()) | set(self._names))
+
+    if TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            """Type checkers see a model's fields on its view, which are added when the view class is created."""
+
+
+class TaskView(ModelView[Task]):
+    """A read-only view of a :class:`runzero.types.Task` the server returned."""
+
+    __slots__ = ()
+    _model = Task
+
+
+class SiteView(ModelView[Site]):
+    """A read-only view of a :class:`runzero.types.Site` the server returned."""
+
+    __slots__ = ()
+    _model = Site
+
+
+class ExplorerView(ModelView[Agent]):
+    """A read-only view of a :class:`runzero.types.Explorer` the server returned."""
+
+    __slots__ = ()
+    _model = Agent
+
+
+class HostedZoneView(ModelView[HostedZone]):
+    """A read-only view of a :class:`runzero.types.HostedZone` the server returned."""
+
+    __slots__ = ()
+    _model = HostedZone
@@ -10,12 +10,14 @@ was insufficient.
 """
 
 from ipaddress import IPv4Address, IPv6Address, ip_address
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Union
 from warnings import warn
 
-# Note: `validator` has been replaced with `field_validator` in v2+
-from pydantic import BaseModel, Field, ValidationError, validator
+from pydantic import BaseModel, Field
 
+from runzero._pydantic import PYDANTIC_V2, ROOT, before_validator, root
+
+from ._addresses import _ipv4_address, _ipv6_address
 from ._data_models_gen import CustomIntegration as RESTCustomIntegration
 from ._data_models_gen import Hostname as RESTHostname
 from ._data_models_gen import ImportAsset as RESTImportAsset
@@ -30,7 +32,7 @@ from ._data_models_gen import Tag as RESTTag
 from ._data_models_gen import Vulnerability as RESTVulnerability
 
 
-class CustomIntegration(RESTCustomIntegration):
+class CustomIntegration(RESTCustomIntegration):  # pylint: disable=too-many-ancestors
     """CustomIntegration represents a custom asset data source for custom integrations use"""
 
     # The REST API uses base-64 encoded strings, but inside this SDK
@@ -48,18 +50,54 @@ class CustomIntegration(RESTCustomIntegration):
     """
 
 
-class __CustomAttribute(BaseModel):  # pylint: disable=C0103
-    """
-    __RESTCustomAttribute is vestigial from an earlier version of the SDK and is being kept here for backwards
-    compatability purposes. This will be removed as part of the SDK 1.0 release.
-    """
+if TYPE_CHECKING or not PYDANTIC_V2:
+
+    class __CustomAttribute(BaseModel):  # pylint: disable=C0103
+        """
+        __RESTCustomAttribute is vestigial from an earlier version of the SDK and is being kept here for backwards
+        compatability purposes. This will be removed as part of the SDK 1.0 release.
+        """
 
-    class Config:
-        """Config for pydantic model"""
+        class Config:
+            """Config for pydantic model"""
 
-        allow_population_by_field_name = True
+            allow_population_by_field_name = True
 
-    __root__: str = Field(..., max_length=1024)
+        __root__: str = Field(..., max_length=1024)
+
+    class _ByAliasJSON(BaseModel):
+        """Serializes to JSON with the API's field names unless told otherwise."""
+
+        def json(self, *args: Any, **kwargs: Any) -> str:
+            """Ensure kebab-case is kept when converting to JSON"""
+            kwargs.setdefault("by_alias", True)
+            return super().json(*args, **kwargs)
+
+else:
+    # pylint: disable-next=no-name-in-module,ungrouped-imports
+    from pydantic import ConfigDict, RootModel
+
+    class __CustomAttribute(RootModel[str]):  # pylint: disable=C0103
+        """
+        __RESTCustomAttribute is vestigial from an earlier version of the SDK and is being kept here for backwards
+        compatability purposes. This will be removed as part of the SDK 1.0 release.
+        """
+
+        model_config = ConfigDict(populate_by_name=True)
+
+        root: str = Field(..., max_length=1024)
+
+    class _ByAliasJSON(BaseModel):
+        """Serializes to JSON with the API's field names unless told otherwise."""
+
+        def model_dump_json(self, **kwargs: Any) -> str:
+            """Ensure kebab-case is kept when converting to JSON"""
+            kwargs.setdefault("by_alias", True)
+            return super().model_dump_json(**kwargs)  # pylint: disable=no-member
+
+        def json(self, **kwargs: Any) -> str:  # type: ignore[override]
+            """Ensure kebab-case is kept when converting to JSON"""
+            return self.model_dump_json(**kwargs)
 
 
 class CustomAttribute(__CustomAttribute):
@@ -79,7 +117,7 @@ class CustomAttribute(__CustomAttribute):
             DeprecationWarning,
             stacklevel=2,
         )
-        super().__init__(__root__=attr)
+        super().__init__(**{ROOT: attr})
 
 
 class Hostname(RESTHostname):
@@ -91,7 +129,7 @@ class Hostname(RESTHostname):
     """
 
     def __init__(self, hostname: str):
-        super().__init__(__root__=hostname)
+        super().__init__(**{ROOT: hostname})
 
 
 class Tag(RESTTag):
@@ -100,7 +138,7 @@ class Tag(RESTTag):
     """
 
     def __init__(self, tag: str):
-        super().__init__(__root__=tag)
+        super().__init__(**{ROOT: tag})
 
 
 class ImportAsset(RESTImportAsset):
@@ -108,14 +146,14 @@ class ImportAsset(RESTImportAsset):
     Represents a custom asset to be created or merged after import.
     """
 
-    __MAX_ATTRS = 1024
-    __MAX_ATTR_KEY_LEN = 256
-    __MAX_ATTR_VAL_LEN = 1024
+    __MAX_ATTRS: ClassVar[int] = 1024
+    __MAX_ATTR_KEY_LEN: ClassVar[int] = 256
+    __MAX_ATTR_VAL_LEN: ClassVar[int] = 1024
 
     def __int__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
-    @validator("hostnames", pre=True)
+    @before_validator("hostnames")
     def _hostnames_str_conversion(cls, hosts: List[Union[str, Hostname]]) -> List[Hostname]:  # pylint: disable=E0213
         """
         Handles conversion of strings to Hostname class for user convenience.
@@ -131,7 +169,7 @@ class ImportAsset(RESTImportAsset):
 
         return result
 
-    @validator("tags", pre=True)
+    @before_validator("tags")
     def _tag_str_conversion(cls, tags: List[Union[str, Tag]]) -> List[Tag]:  # pylint: disable=E0213
         """
         Handles conversion of strings to Tags for user convenience.
@@ -147,7 +185,7 @@ class ImportAsset(RESTImportAsset):
 
         return result
 
-    @validator("custom_attributes", pre=True)
+    @before_validator("custom_attributes")
     def _custom_attributes_length(  # pylint: disable=E0213
         cls, attrs: Dict[str, Union[CustomAttribute, str]]
     ) -> Dict[str, str]:
@@ -156,32 +194,27 @@ class ImportAsset(RESTImportAsset):
         that each key in that dict does not itself exceed a length of 256 characters.
         """
         if len(attrs) > cls.__MAX_ATTRS:
-            raise ValidationError(
-                f"custom attributes exceeds length of 256 with length of {len(attrs)}",
-                ImportAsset,
-            )
+            raise ValueError(f"custom attributes exceeds length of 256 with length of {len(attrs)}")
 
         # store for return value after type casting to handle CustomAttribute instances
         processed_attrs: Dict[str, str] = {}
 
         for k, val in attrs.items():
             if len(k) > cls.__MAX_ATTR_KEY_LEN:
-                raise ValidationError(
-                    f"key {k[:25]}... in custom_attributes exceeds maximum length of 256 with length of {len(k)}",
-                    ImportAsset,
+                raise ValueError(
+                    f"key {k[:25]}... in custom_attributes exceeds maximum length of 256 with length of {len(k)}"
                 )
 
             # CustomAttribute used to be the required type for the custom attributes value field
             # Now we use strings - but still support CustomAttribute for backwards compatability
             # Thus we need to cast any CustomAttribute() to a string because the wrapped type uses strings
             if isinstance(val, CustomAttribute):
-                val = val.__root__
+                val = str(root(val))
                 attrs[k] = val
             if len(val) > cls.__MAX_ATTR_VAL_LEN:
-                raise ValidationError(
+                raise ValueError(
                     f"key {k[:25]}... in custom_attributes has a value which the exceeds maximum length of 1024 with"
-                    f" length of {len(str(val))}",
-                    ImportAsset,
+                    f" length of {len(str(val))}"
                 )
             processed_attrs[k] = val
 
@@ -196,7 +229,7 @@ class NetworkInterface(RESTNetworkInterface):
     def __int__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
-    @validator("ipv4_addresses", pre=True)
+    @before_validator("ipv4_addresses")
     def _ipv4_str_conversion(  # pylint: disable=E0213
         cls, ipv4s: Optional[List[Union[str, IPv4Address]]]
     ) -> Optional[List[IPv4Address]]:
@@ -206,16 +239,9 @@ class NetworkInterface(RESTNetworkInterface):
         if ipv4s is None:
             return None
 
-        result: List[IPv4Address] = []
-
-        for ipv4 in ipv4s:
-            if isinstance(ipv4, str):
-                ipv4 = IPv4Address(ipv4)
-            result.append(ipv4)
+        return [_ipv4_address(ipv4) for ipv4 in ipv4s]
 
-        return result
-
-    @validator("ipv6_addresses", pre=True)
+    @before_validator("ipv6_addresses")
     def _ipv6_str_conversion(  # pylint: disable=E0213
         cls, ipv6s: Optional[List[Union[str, IPv6Address]]]
     ) -> Optional[List[IPv6Address]]:
@@ -225,57 +251,38 @@ class NetworkInterface(RESTNetworkInterface):
         if ipv6s is None:
             return None
 
-        result: List[IPv6Address] = []
-
-        for ipv6 in ipv6s:
-            if isinstance(ipv6, str):
-                ipv6 = IPv6Address(ipv6)
-            result.append(ipv6)
-
-        return result
+        return [_ipv6_address(ipv6) for ipv6 in ipv6s]
 
 
-class ScanOptions(RESTScanOptions):
+class ScanOptions(RESTScanOptions, _ByAliasJSON):
     """Options which can be set to create or modify a scan."""
 
-    # enable kebab-case json response
-    def json(self, *args: Iterable[Any], **kwargs: Any) -> str:
-        """Ensure kebab-case is kept when converting to JSON"""
-        kwargs.setdefault("by_alias", True)
-        return super().json(*args, **kwargs)
+    # serializes to JSON with the kebab-case API field names by default
 
 
-class ScanTemplate(RESTScanTemplate):
+class ScanTemplate(RESTScanTemplate, _ByAliasJSON):
     """A scan template object"""
 
-    # enable kebab-case json response
-    def json(self, *args: Iterable[Any], **kwargs: Any) -> str:
-        """Ensure kebab-case is kept when converting to JSON"""
-        kwargs.setdefault("by_alias", True)
-        return super().json(*args, **kwargs)
+    # serializes to JSON with the kebab-case API field names by default
 
 
-class ScanTemplateOptions(RESTScanTemplateOptions):
+class ScanTemplateOptions(RESTScanTemplateOptions, _ByAliasJSON):
     """Options which can be set to create or modify a scan template."""
 
-    # enable kebab-case json response
-    def json(self, *args: Iterable[Any], **kwargs: Any) -> str:
-        """Ensure kebab-case is kept when converting to JSON"""
-        kwargs.setdefault("by_alias", True)
-        return super().json(*args, **kwargs)
+    # serializes to JSON with the kebab-case API field names by default
 
 
 class Service(RESTService):
     """A service running on an asset."""
 
-    __MAX_ATTRS = 1024
-    __MAX_ATTR_KEY_LEN = 256
-    __MAX_ATTR_VAL_LEN = 1024
+    __MAX_ATTRS: ClassVar[int] = 1024
+    __MAX_ATTR_KEY_LEN: ClassVar[int] = 256
+    __MAX_ATTR_VAL_LEN: ClassVar[int] = 1024
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
-    @validator("address", pre=True)
+    @before_validator("address")
     def _address_str_conversion(  # pylint: disable=E0213
         cls, addr: Union[str, IPv4Address, IPv6Address]
     ) -> Union[IPv4Address, IPv6Address]:
@@ -286,7 +293,7 @@ class Service(RESTService):
             addr = ip_address(addr)
         return addr
 
-    @validator("transport", pre=True)
+    @before_validator("transport")
     def _lower_case_transport(cls, attr: str) -> str:  # pylint: disable=E0213
         # disabled pylint because @validator turns the method into a classmethod
         """
@@ -294,7 +301,7 @@ class Service(RESTService):
         """
         return attr.lower()
 
-    @validator("custom_attributes", pre=True)
+    @before_validator("custom_attributes")
     def _custom_attributes_length(  # pylint: disable=E0213
         cls, attrs: Dict[str, Union[CustomAttribute, str]]
     ) -> Dict[str, str]:
@@ -306,32 +313,27 @@ class Service(RESTService):
         - that the length of each value does not exceed a length of 1024 characters
         """
         if len(attrs) > cls.__MAX_ATTRS:
-            raise ValidationError(
-                f"custom attributes exceeds length of 256 with length of {len(attrs)}",
-                ImportAsset,
-            )
+            raise ValueError(f"custom attributes exceeds length of 256 with length of {len(attrs)}")
 
         # store for return value after type casting to handle CustomAttribute instances
         processed_attrs: Dict[str, str] = {}
 
         for k, val in attrs.items():
             if len(k) > cls.__MAX_ATTR_KEY_LEN:
-                raise ValidationError(
-                    f"key {k[:25]}... in custom_attributes exceeds maximum length of 256 with length of {len(k)}",
-                    ImportAsset,
+                raise ValueError(
+                    f"key {k[:25]}... in custom_attributes exceeds maximum length of 256 with length of {len(k)}"
                 )
 
             # CustomAttribute used to be the required type for the custom attributes value field
             # Now we use strings - but still support CustomAttribute for backwards compatability
             # Thus we need to cast any CustomAttribute() to a string because the wrapped type uses strings
             if isinstance(val, CustomAttribute):
-                val = val.__root__
+                val = str(root(val))
                 attrs[k] = val
             if len(val) > cls.__MAX_ATTR_VAL_LEN:
-                raise ValidationError(
+                raise ValueError(
                     f"key {k[:25]}... in custom_attributes has a value which the exceeds maximum length of 1024 with"
-                    f" length of {len(str(val))}",
-                    ImportAsset,
+                    f" length of {len(str(val))}"
                 )
             processed_attrs[k] = val
 
@@ -343,14 +345,14 @@ class ServiceProtocolData(RESTServiceProtocolData):
     ServiceProtocolData represents the attributes associated with a given service protocol
     """
 
-    __MAX_ATTRS = 1024
-    __MAX_ATTR_KEY_LEN = 256
-    __MAX_ATTR_VAL_LEN = 1024
+    __MAX_ATTRS: ClassVar[int] = 1024
+    __MAX_ATTR_KEY_LEN: ClassVar[int] = 256
+    __MAX_ATTR_VAL_LEN: ClassVar[int] = 1024
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
-    @validator("name", pre=True)
+    @before_validator("name")
     def _lower_case_name(cls, attr: str) -> str:  # pylint: disable=E0213
         # disabled pylint because @validator turns the method into a classmethod
         """
@@ -358,7 +360,7 @@ class ServiceProtocolData(RESTServiceProtocolData):
         """
         return attr.lower()
 
-    @validator("attributes", pre=True)
+    @before_validator("attributes")
     def _attributes_length(  # pylint: disable=E0213
         cls, attrs: Dict[str, Union[CustomAttribute, str]]
     ) -> Dict[str, str]:
@@ -370,32 +372,27 @@ class ServiceProtocolData(RESTServiceProtocolData):
         - that the length of each value does not exceed a length of 1024 characters
         """
         if len(attrs) > cls.__MAX_ATTRS:
-            raise ValidationError(
-                f"custom attributes exceeds length of 256 with length of {len(attrs)}",
-                ImportAsset,
-            )
+            raise ValueError(f"custom attributes exceeds length of 256 with length of {len(attrs)}")
 
         # store for return value after type casting to handle CustomAttribute instances
         processed_attrs: Dict[str, str] = {}
 
         for k, val in attrs.items():
             if len(k) > cls.__MAX_ATTR_KEY_LEN:
-                raise ValidationError(
-                    f"key {k[:25]}... in custom_attributes exceeds maximum length of 256 with length of {len(k)}",
-                    ImportAsset,
+                raise ValueError(
+                    f"key {k[:25]}... in custom_attributes exceeds maximum length of 256 with length of {len(k)}"
                 )
 
             # CustomAttribute used to be the required type for the custom attributes value field
             # Now we use strings - but still support CustomAttribute for backwards compatability
             # Thus we need to cast any CustomAttribute() to a string because the wrapped type uses strings
             if isinstance(val, CustomAttribute):
-                val = val.__root__
+                val = str(root(val))
                 attrs[k] = val
             if len(val) > cls.__MAX_ATTR_VAL_LEN:
-                raise ValidationError(
+                raise ValueError(
                     f"key {k[:25]}... in custom_attributes has a value which the exceeds maximum length of 1024 with"
-                    f" length of {len(str(val))}",
-                    ImportAsset,
+                    f" length of {len(str(val))}"
                 )
             processed_attrs[k] = val
 
@@ -407,14 +404,14 @@ class Software(RESTSoftware):
     Represents a piece of installed software on a particular asset.
     """
 
-    __MAX_ATTRS = 1024
-    __MAX_ATTR_KEY_LEN = 256
-    __MAX_ATTR_VAL_LEN = 1024
+    __MAX_ATTRS: ClassVar[int] = 1024
+    __MAX_ATTR_KEY_LEN: ClassVar[int] = 256
+    __MAX_ATTR_VAL_LEN: ClassVar[int] = 1024
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
-    @validator("service_transport", pre=True)
+    @before_validator("service_transport")
     def _lower_case_service_transport(cls, attr: str) -> str:  # pylint: disable=E0213
         # disabled pylint because @validator turns the method into a classmethod
         """
@@ -422,7 +419,7 @@ class Software(RESTSoftware):
         """
         return attr.lower()
 
-    @validator("cpe23", pre=True)
+    @before_validator("cpe23")
     def _lower_case_cpe(cls, attr: str) -> str:  # pylint: disable=E0213
         # disabled pylint because @validator turns the method into a classmethod
         """
@@ -431,7 +428,7 @@ class Software(RESTSoftware):
         """
         return attr.lower()
 
-    @validator("service_address", pre=True)
+    @before_validator("service_address")
     def _service_address_str_conversion(  # pylint: disable=E0213
         cls, addr: Union[str, IPv4Address, IPv6Address]
     ) -> Union[IPv4Address, IPv6Address]:
@@ -442,7 +439,7 @@ class Software(RESTSoftware):
             addr = ip_address(addr)
         return addr
 
-    @validator("custom_attributes", pre=True)
+    @before_validator("custom_attributes")
     def _custom_attributes_length(  # pylint: disable=E0213
         cls, attrs: Dict[str, Union[CustomAttribute, str]]
     ) -> Dict[str, str]:
@@ -454,32 +451,27 @@ class Software(RESTSoftware):
         - that the length of each value does not exceed a length of 1024 characters
         """
         if len(attrs) > cls.__MAX_ATTRS:
-            raise ValidationError(
-                f"custom attributes exceeds length of 256 with length of {len(attrs)}",
-                ImportAsset,
-            )
+            raise ValueError(f"custom attributes exceeds length of 256 with length of {len(attrs)}")
 
         # store for return value after type casting to handle CustomAttribute instances
         processed_attrs: Dict[str, str] = {}
 
         for k, val in attrs.items():
             if len(k) > cls.__MAX_ATTR_KEY_LEN:
-                raise ValidationError(
-                    f"key {k[:25]}... in custom_attributes exceeds maximum length of 256 with length of {len(k)}",
-                    ImportAsset,
+                raise ValueError(
+                    f"key {k[:25]}... in custom_attributes exceeds maximum length of 256 with length of {len(k)}"
                 )
 
             # CustomAttribute used to be the required type for the custom attributes value field
             # Now we use strings - but still support CustomAttribute for backwards compatability
             # Thus we need to cast any CustomAttribute() to a string because the wrapped type uses strings
             if isinstance(val, CustomAttribute):
-                val = val.__root__
+                val = str(root(val))
                 attrs[k] = val
             if len(val) > cls.__MAX_ATTR_VAL_LEN:
-                raise ValidationError(
+                raise ValueError(
                     f"key {k[:25]}... in custom_attributes has a value which the exceeds maximum length of 1024 with"
-                    f" length of {len(str(val))}",
-                    ImportAsset,
+                    f" length of {len(str(val))}"
                 )
             processed_attrs[k] = val
 
@@ -491,14 +483,14 @@ class Vulnerability(RESTVulnerability):
     Represents a vulnerability present on a particular asset.
     """
 
-    __MAX_ATTRS = 1024
-    __MAX_ATTR_KEY_LEN = 256
-    __MAX_ATTR_VAL_LEN = 1024
+    __MAX_ATTRS: ClassVar[int] = 1024
+    __MAX_ATTR_KEY_LEN: ClassVar[int] = 256
+    __MAX_ATTR_VAL_LEN: ClassVar[int] = 1024
 
     def __int__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
-    @validator("service_transport", pre=True)
+    @before_validator("service_transport")
     def _lower_case_service_transport(cls, attr: str) -> str:  # pylint: disable=E0213
         # disabled pylint because @validator turns the method into a classmethod
         """
@@ -506,7 +498,7 @@ class Vulnerability(RESTVulnerability):
         """
         return attr.lower()
 
-    @validator("cpe23", pre=True)
+    @before_validator("cpe23")
     def _lower_case_cpe(cls, attr: str) -> str:  # pylint: disable=E0213
         # disabled pylint because @validator turns the method into a classmethod
         """
@@ -515,7 +507,7 @@ class Vulnerability(RESTVulnerability):
         """
         return attr.lower()
 
-    @validator("cve", pre=True)
+    @before_validator("cve")
     def _upper_case_cve(cls, attr: str) -> str:  # pylint: disable=E0213
         # disabled pylint because @validator turns the method into a classmethod
         """
@@ -523,7 +515,7 @@ class Vulnerability(RESTVulnerability):
         """
         return attr.upper()
 
-    @validator("service_address", pre=True)
+    @before_validator("service_address")
     def _service_address_str_conversion(  # pylint: disable=E0213
         cls, addr: Union[str, IPv4Address, IPv6Address]
     ) -> Union[IPv4Address, IPv6Address]:
@@ -534,7 +526,7 @@ class Vulnerability(RESTVulnerability):
             addr = ip_address(addr)
         return addr
 
-    @validator("custom_attributes", pre=True)
+    @before_validator("custom_attributes")
     def _custom_attributes_length(  # pylint: disable=E0213
         cls, attrs: Dict[str, Union[CustomAttribute, str]]
     ) -> Dict[str, str]:
@@ -546,32 +538,27 @@ class Vulnerability(RESTVulnerability):
         - that the length of each value does not exceed a length of 1024 characters
         """
         if len(attrs) > cls.__MAX_ATTRS:
-            raise ValidationError(
-                f"custom attributes exceeds length of 256 with length of {len(attrs)}",
-                ImportAsset,
-            )
+            raise ValueError(f"custom attributes exceeds length of 256 with length of {len(attrs)}")
 
         # store for return value after type casting to handle CustomAttribute instances
         processed_attrs: Dict[str, str] = {}
 
         for k, val in attrs.items():
             if len(k) > cls.__MAX_ATTR_KEY_LEN:
-                raise ValidationError(
-                    f"key {k[:25]}... in custom_attributes exceeds maximum length of 256 with length of {len(k)}",
-                    ImportAsset,
+                raise ValueError(
+                    f"key {k[:25]}... in custom_attributes exceeds maximum length of 256 with length of {len(k)}"
                 )
 
             # CustomAttribute used to be the required type for the custom attributes value field
             # Now we use strings - but still support CustomAttribute for backwards compatability
             # Thus we need to cast any CustomAttribute() to a string because the wrapped type uses strings
             if isinstance(val, CustomAttribute):
-                val = val.__root__
+                val = str(root(val))
                 attrs[k] = val
             if len(val) > cls.__MAX_ATTR_VAL_LEN:
-                raise ValidationError(
+                raise ValueError(
                     f"key {k[:25]}... in custom_attributes has a value which the exceeds maximum length of 1024 with"
-                    f" length of {len(str(val))}",
-                    ImportAsset,
+                    f" length of {len(str(val))}"
                 )
             processed_attrs[k] = val
 
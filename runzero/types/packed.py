@@ -0,0 +1,101 @@
+"""
+packed converts columns of IP addresses to and from NumPy arrays of packed integers.
+
+A packed column takes a fraction of the memory of the address strings, and can be sorted, compared
+and searched as a whole. Packing validates every address of the column, so it also serves as a fast
+check of a large column that is expected to be valid. This module needs NumPy, which is installed
+with the ``numpy`` extra: ``pip install runzero-sdk[numpy]``.
+"""
+
+from ipaddress import AddressValueError, IPv4Address, IPv6Address
+from socket import AF_INET, AF_INET6, inet_ntop, inet_pton
+from typing import Any, Callable, List, Optional, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from runzero.types._addresses import (
+    _ipv6_packed_text,
+    normalize_ipv4_column,
+    normalize_ipv6_column,
+)
+
+__all__ = [
+    "pack_ipv4_column",
+    "pack_ipv6_column",
+    "unpack_ipv4_column",
+    "unpack_ipv6_column",
+]
+
+
+def _pack(
+    values: Sequence[Any],
+    family: int,
+    normalize: Callable[[Sequence[Any]], List[Optional[str]]],
+    address: Callable[[str], Any],
+    kind: str,
+) -> bytes:
+    """The packed addresses of a column, concatenated."""
+    try:
+        return b"".join([inet_pton(family, value) for value in values])
+    except (OSError, TypeError, ValueError):
+        pass
+    # some value is invalid, or valid in a form only ipaddress accepts
+    texts = normalize(values)
+    for index, text in enumerate(texts):
+        if text is None:
+            raise AddressValueError(f"values[{index}] is not a valid {kind}: {values[index]!r}")
+    return b"".join([address(text).packed for text in texts])  # type: ignore[arg-type]
+
+
+def pack_ipv4_column(values: Sequence[Any]) -> "NDArray[np.uint32]":
+    """
+    Validates a column of IPv4 addresses and packs them into an array of integers.
+
+    :param values: address strings or IPv4Addresses
+
+    :returns: an array of the addresses as unsigned 32-bit integers, in order
+    :raises: AddressValueError naming the position and value of the first invalid address
+    """
+    data = _pack(values, AF_INET, normalize_ipv4_column, IPv4Address, "IPv4 address")
+    return np.frombuffer(data, dtype=">u4").astype(np.uint32)
+
+
+def pack_ipv6_column(values: Sequence[Any]) -> "NDArray[np.uint64]":
+    """
+    Validates a column of IPv6 addresses and packs them into an array of integers.
+
+    Scope IDs, as in ``fe80::1%eth0``, are dropped.
+
+    :param values: address strings or IPv6Addresses
+
+    :returns: an array with a row for each address, in order, holding its high and low 64 bits as
+        unsigned integers
+    :raises: AddressValueError naming the position and value of the first invalid address
+    """
+    data = _pack(values, AF_INET6, normalize_ipv6_column, IPv6Address, "IPv6 address")
+    return np.frombuffer(data, dtype=">u8").reshape(-1, 2).astype(np.uint64)
+
+
+def unpack_ipv4_column(packed: "NDArray[Any]") -> List[str]:
+    """
+    Converts an array made by :func:`pack_ipv4_column` back to addresses.
+
+    :param packed: the array of addresses
+
+    :returns: the canonical text of each address, in order
+    """
+    data = np.asarray(packed, dtype=">u4").tobytes()
+    return [inet_ntop(AF_INET, data[start : start + 4]) for start in range(0, len(data), 4)]
+
+
+def unpack_ipv6_column(packed: "NDArray[Any]") -> List[str]:
+    """
+    Converts an array made by :func:`pack_ipv6_column` back to addresses.
+
+    :param packed: the array of addresses
+
+    :returns: the canonical text of each address, in order
+    """
+    data = np.asarray(packed, dtype=">u8").tobytes()
+    return [_ipv6_packed_text(data[start : start + 16]) for start in range(0, len(data), 16)]
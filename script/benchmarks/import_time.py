@@ -0,0 +1,61 @@
+"""
+import_time measures how long importing the SDK takes in a fresh interpreter.
+
+Each statement runs in its own subprocess, several times, and the median wall time is reported.
+Pass --importtime to also print the slowest modules reported by ``python -X importtime``.
+
+    python script/benchmarks/import_time.py [--runs N] [--importtime]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+STATEMENTS = [
+    "pass",
+    "import runzero",
+    "import runzero; runzero.Client",
+    "from runzero.api import Sites",
+    "from runzero.types import ImportAsset",
+]
+
+
+def _run(statement: str, importtime: bool = False) -> Tuple[float, str]:
+    args = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", statement]
+    started = time.perf_counter()
+    result = subprocess.run(args, capture_output=True, text=True, check=True)
+    return time.perf_counter() - started, result.stderr
+
+
+def _slowest(report: str, count: int) -> List[Tuple[int, str]]:
+    modules = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.append((int(cumulative), name.rstrip()))
+    return sorted(modules, reverse=True)[:count]
+
+
+def main() -> None:
+    """Runs the benchmark and prints a table of median import times."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=9, help="subprocesses per statement")
+    parser.add_argument("--importtime", action="store_true", help="show the slowest modules of each statement")
+    args = parser.parse_args()
+
+    baseline = statistics.median(_run("pass")[0] for _ in range(args.runs))
+    print(f"{'statement':<45} {'median':>9} {'over python':>12}")
+    for statement in STATEMENTS:
+        median = statistics.median(_run(statement)[0] for _ in range(args.runs))
+        print(f"{statement:<45} {median * 1000:>7.1f}ms {(median - baseline) * 1000:>10.1f}ms")
+        if args.importtime and statement != "pass":
+            for cumulative, name in _slowest(_run(statement, importtime=True)[1], 8):
+                print(f"    {cumulative / 1000:>7.1f}ms {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+models measures how quickly the installed pydantic validates and serializes asset import payloads,
+how quickly network interfaces with many addresses are validated as models and as columns, how
+quickly trusted server responses are built without validation, how much memory listed tasks take
+as models and as views, and how much memory import assets take with and without shared values.
+
+Run it once with pydantic 1 and once with pydantic 2 installed to compare the two backends.
+
+    python script/benchmarks/models.py [--assets N] [--runs N]
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import pydantic
+
+from runzero._pydantic import dump_json, parse
+from runzero._trusted import construct
+from runzero.api import AssetBatch
+from runzero.types import (
+    ImportAsset,
+    NetworkInterface,
+    Task,
+    TaskView,
+    normalize_network_interfaces,
+)
+
+
+def _asset(i: int) -> Dict[str, Any]:
+    """An import asset shaped like those of a typical integration, in its decoded JSON form."""
+    return {
+        "id": f"asset-{i}",
+        "hostnames": [f"host-{i}.example.com", f"host-{i}"],
+        "domain": "example.com",
+        "firstSeenTS": "2023-03-06T18:14:50.52Z",
+        "os": "Ubuntu Linux",
+        "osVersion": "22.04",
+        "manufacturer": "Dell",
+        "model": "PowerEdge R650",
+        "tags": ["prod", "linux", f"rack-{i % 40}"],
+        "deviceType": "Server",
+        "networkInterfaces": [
+            {
+                "macAddress": f"00:1b:44:11:{i // 256 % 256:02x}:{i % 256:02x}",
+                "ipv4Addresses": [f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}"],
+                "ipv6Addresses": ["fe80::21b:44ff:fe11:3ab7"],
+            }
+        ],
+        "services": [
+            {
+                "address": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+                "port": port,
+                "transport": "tcp",
+                "protocolData": [{"name": "http", "attributes": {"title": "index", "server": "nginx"}}],
+            }
+            for port in (22, 80, 443)
+        ],
+        "software": [
+            {"id": f"sw-{i}-{n}", "vendor": "Canonical", "product": f"package-{n}", "version": "1.2.3"}
+            for n in range(5)
+        ],
+        "vulnerabilities": [
+            {
+                "id": f"vuln-{i}",
+                "name": "Outdated OpenSSH",
+                "cve": "CVE-2023-38408",
+                "riskRank": 3,
+                "cvss3BaseScore": 9.8,
+            }
+        ],
+        "customAttributes": {f"attr-{n}": f"value-{i}-{n}" for n in range(10)},
+    }
+
+
+def _interface(i: int) -> Dict[str, Any]:
+    """A network interface with many addresses, in its decoded JSON form."""
+    return {
+        "macAddress": f"00:1b:44:11:{i // 256 % 256:02x}:{i % 256:02x}",
+        "ipv4Addresses": [f"10.{i % 256}.{n}.1" for n in range(64)],
+        "ipv6Addresses": [f"fe80::21b:44ff:{i:x}:{n:x}" for n in range(16)],
+    }
+
+
+def _task(i: int) -> Dict[str, Any]:
+    """A task as the server lists it, in its decoded JSON form."""
+    return {
+        "id": f"f6cfb91a-52ea-4a86-bf9a-{i:012x}",
+        "name": "asset import",
+        "description": "imported by an integration",
+        "client_id": "e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8",
+        "organization_id": "e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8",
+        "site_id": "e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8",
+        "created_at": 1576300370 + i,
+        "created_by": "user@example.com",
+        "created_by_user_id": "e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8",
+        "custom_integration_id": "f6cfb91a-52ea-4a86-bf9a-5a891a26f52b",
+        "updated_at": 1576300370 + i,
+        "status": "processed" if i % 10 else "failed",
+        "type": "import",
+        "params": {"custom-integration-id": "f6cfb91a-52ea-4a86-bf9a-5a891a26f52b"},
+        "stats": {"change.newAssets": 10},
+        "hidden": False,
+        "recur": False,
+    }
+
+
+def _measure(runs: int, func: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def _memory_per_item(payload: str, build: Callable[[List[Dict[str, Any]]], List[Any]]) -> float:
+    """The bytes each item built from a decoded JSON list retains, once the list itself is freed."""
+    gc.collect()
+    tracemalloc.start()
+    items = build(json.loads(payload))
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained / len(items)
+
+
+def _views(objs: List[Dict[str, Any]]) -> List[TaskView]:
+    memo: Dict[str, str] = {}
+    return [TaskView(obj, memo) for obj in objs]
+
+
+def _batch(objs: List[Dict[str, Any]], share_values: bool) -> List[ImportAsset]:
+    batch = AssetBatch(share_values=share_values)
+    batch.extend(objs)
+    return batch.assets
+
+
+def main() -> None:
+    """Runs the benchmark and prints the median throughput of each operation."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=2000, help="import assets per run")
+    parser.add_argument("--runs", type=int, default=5, help="runs per operation")
+    args = parser.parse_args()
+
+    payloads = [_asset(i) for i in range(args.assets)]
+    assets: List[ImportAsset] = [parse(ImportAsset, payload) for payload in payloads]
+    tasks = [_task(i) for i in range(args.assets)]
+    interfaces = [_interface(i) for i in range(args.assets)]
+    interface_assets = [{"networkInterfaces": [interface]} for interface in interfaces]
+
+    operations = {
+        "validate ImportAsset": lambda: [parse(ImportAsset, payload) for payload in payloads],
+        "serialize ImportAsset": lambda: [dump_json(asset, by_alias=True, exclude_none=True) for asset in assets],
+        "validate NetworkInterface": lambda: [parse(NetworkInterface, interface) for interface in interfaces],
+        "normalize interfaces": lambda: normalize_network_interfaces(interface_assets),
+        "validate Task": lambda: [parse(Task, task) for task in tasks],
+        "trusted Task": lambda: [construct(Task, task) for task in tasks],
+        "trusted Task, read id": lambda: [construct(Task, task).id for task in tasks],
+    }
+    print(f"pydantic {pydantic.VERSION}, {args.assets} items per run, median of {args.runs} runs")
+    for name, operation in operations.items():
+        seconds = _measure(args.runs, operation)
+        print(f"{name:<26} {seconds * 1000:>9.1f}ms {args.assets / seconds:>12,.0f}/s")
+
+    payload = json.dumps(tasks)
+    memory: Dict[str, Callable[[List[Dict[str, Any]]], List[Any]]] = {
+        "Task models": lambda objs: [parse(Task, obj) for obj in objs],
+        "trusted Task models": lambda objs: [construct(Task, obj) for obj in objs],
+        "TaskViews": _views,
+    }
+    for name, build in memory.items():
+        print(f"{name:<26} {_memory_per_item(payload, build):>9,.0f} bytes each")
+
+    payload = json.dumps(payloads)
+    memory = {
+        "ImportAssets": lambda objs: _batch(objs, share_values=False),
+        "ImportAssets, shared": lambda objs: _batch(objs, share_values=True),
+    }
+    for name, build in memory.items():
+        print(f"{name:<26} {_memory_per_item(payload, build):>9,.0f} bytes each")
+
+
+if __name__ == "__main__":
+    main()
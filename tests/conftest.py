@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import json
 import os
 import re
 import signal
 import time
 import uuid
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
 from uuid import UUID
 
 import pytest
+import requests
 import toml
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 
 from runzero.api import (
     CustomIntegrationsAdmin,
@@ -304,3 +309,71 @@ def get_path_to_config() -> Path:
 @pytest.fixture
 def uuid_nil() -> uuid.UUID:
     return uuid.UUID("00000000-0000-0000-0000-000000000000")
+
+
+class FakeServer:
+    """An in-process stand-in for the runZero API used by unit tests.
+
+    Routes are registered by method and path. A route's body may be a callable taking the
+    PreparedRequest, which returns either a body or a (status, body, headers) tuple.
+    """
+
+    URL = "https://runzero.test"
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], Any] = {}
+        self.requests: List[requests.PreparedRequest] = []
+
+    def add(
+        self, method: str, path: str, body: Any = None, status: int = 200, headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        self.routes[(method, path.strip("/"))] = (status, body, headers or {})
+
+    def count(self, method: Optional[str] = None, path: Optional[str] = None) -> int:
+        return len(
+            [
+                r
+                for r in self.requests
+                if (method is None or r.method == method) and (path is None or self.path(r) == path.strip("/"))
+            ]
+        )
+
+    @staticmethod
+    def path(request: requests.PreparedRequest) -> str:
+        return urlparse(request.url).path.strip("/")
+
+    @staticmethod
+    def query(request: requests.PreparedRequest) -> Dict[str, List[str]]:
+        return parse_qs(urlparse(request.url).query)
+
+    def client(self, **kwargs) -> Client:
+        kwargs.setdefault("account_key", "CTtest")
+        return Client(server_url=self.URL, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        self.requests.append(request)
+        try:
+            status, body, headers = self.routes[(request.method, self.path(request))]
+        except KeyError:
+            status, body, headers = 404, {"title": "not found", "detail": self.path(request)}, {}
+        if callable(body):
+            result = body(request)
+            if isinstance(result, tuple):
+                status, body, headers = result
+            else:
+                body = result
+        resp = requests.Response()
+        resp.status_code = status
+        resp.reason = "OK" if status < 400 else "Error"
+        resp.headers = CaseInsensitiveDict({"Content-Type": "application/json", **headers})
+        resp._content = b"" if body is None else json.dumps(body).encode("utf-8")
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+
+@pytest.fixture
+def fake_server(monkeypatch) -> FakeServer:
+    server = FakeServer()
+    monkeypatch.setattr(HTTPAdapter, "send", lambda adapter, request, **kwargs: server.send(request, **kwargs))
+    return server
@@ -0,0 +1,147 @@
+import ipaddress
+
+import pytest
+
+from runzero._pydantic import dump_json, parse
+from runzero.types import (
+    AddressError,
+    ImportAsset,
+    IPv4Address,
+    IPv6Address,
+    NetworkInterface,
+    ValidationError,
+    normalize_ipv4_column,
+    normalize_ipv6_column,
+    normalize_mac_column,
+    normalize_network_interfaces,
+)
+
+IPV4S = ["10.0.0.1", "0.0.0.0", "255.255.255.255", "010.0.0.1", "1.2.3", "256.1.1.1", " 1.2.3.4", "1.2.3.4\x00", ""]
+IPV6S = [
+    "fe80::1",
+    "FE80:0:0:0:0:0:0:1",
+    "1:0:1:0:0:1:0:1",
+    "::",
+    "::ffff:1.2.3.4",
+    "::1.2.3.4",
+    "::ffff:0:1.2.3.4",
+    "64:ff9b::1.2.3.4",
+    "fe80::1%eth0",
+    "2001:db8::g",
+    "1::2::3",
+    "10.0.0.1",
+    "",
+]
+
+
+def _expected(address_type, value):
+    try:
+        return str(address_type(value))
+    except ValueError:
+        return None
+
+
+def test_ip_columns_match_ipaddress():
+    assert normalize_ipv4_column(IPV4S) == [_expected(ipaddress.IPv4Address, value) for value in IPV4S]
+    assert normalize_ipv6_column(IPV6S) == [_expected(ipaddress.IPv6Address, value) for value in IPV6S]
+    assert normalize_ipv4_column([IPv4Address("10.0.0.1"), 167772161, None]) == ["10.0.0.1", None, None]
+    assert normalize_ipv6_column([IPv6Address("fe80::1"), b"x" * 16]) == ["fe80::1", None]
+
+
+def test_mac_column_matches_model():
+    values = ["00:1b:44:11:3a:b7", "0123.4567.89ab", "01 23 45 67", "00:1b:44:11:3a", "zz", None, 7]
+    assert normalize_mac_column(values) == values[:2] + [None] * 5
+
+    for value in values[:5]:
+        valid = normalize_mac_column([value])[0] is not None
+        try:
+            parse(NetworkInterface, {"macAddress": value})
+        except ValidationError:
+            assert not valid
+        else:
+            assert valid
+
+
+def test_interfaces_are_normalized_in_place_with_errors_located():
+    assets = [
+        {
+            "id": "a",
+            "networkInterfaces": [
+                {"ipv4Addresses": ["10.0.0.1"], "macAddress": "00:1b:44:11:3a:b7"},
+                {"ipv4Addresses": ["10.0.0.2", "10.0.0"], "ipv6Addresses": ["FE80::0:1"], "macAddress": "zz"},
+            ],
+        },
+        {"network_interfaces": [{"ipv6_addresses": ["::1", "not"]}, "eth0"]},
+        {"id": "c", "hostnames": ["h"]},
+        {"id": "d", "networkInterfaces": [{"ipv4Addresses": ["1.1.1.1"] * 257, "ipv6Addresses": "::1"}]},
+    ]
+
+    errors = normalize_network_interfaces(assets)
+
+    assert all(isinstance(error, AddressError) for error in errors)
+    assert sorted((error.asset, error.asset_id, error.field, error.value) for error in errors) == [
+        (0, "a", "network_interfaces[1].ipv4_addresses[1]", "10.0.0"),
+        (0, "a", "network_interfaces[1].mac_address", "zz"),
+        (1, None, "network_interfaces[0].ipv6_addresses[1]", "not"),
+        (1, None, "network_interfaces[1]", "eth0"),
+        (3, "d", "network_interfaces[0].ipv4_addresses", ["1.1.1.1"] * 257),
+        (3, "d", "network_interfaces[0].ipv6_addresses", "::1"),
+    ]
+    assert assets[0]["networkInterfaces"][1]["ipv6Addresses"] == ["fe80::1"]
+    assert assets[1]["network_interfaces"][0]["ipv6_addresses"] == ["::1", "not"]
+    for asset in (assets[0], assets[1], assets[3]):
+        with pytest.raises(ValidationError):
+            parse(ImportAsset, asset)
+
+
+def test_normalized_assets_serialize_as_before():
+    payload = {
+        "id": "a",
+        "networkInterfaces": [
+            {
+                "ipv4Addresses": ["10.0.0.1", "192.168.1.20"],
+                "ipv6Addresses": ["FE80:0000::21B:44FF:FE11:3AB7", "::ffff:10.0.0.1", "fe80::1%eth0"],
+                "macAddress": "00-1B-44-11-3A-B7",
+            }
+        ],
+    }
+    expected = dump_json(parse(ImportAsset, payload), by_alias=True, exclude_none=True)
+
+    assert normalize_network_interfaces([payload]) == []
+    assert dump_json(parse(ImportAsset, payload), by_alias=True, exclude_none=True) == expected
+    assert payload["networkInterfaces"][0]["ipv6Addresses"] == [
+        "fe80::21b:44ff:fe11:3ab7",
+        "::ffff:a00:1",
+        "fe80::1%eth0",
+    ]
+
+
+def test_network_interface_still_rejects_invalid_addresses():
+    interface = NetworkInterface(ipv4_addresses=["10.0.0.1", IPv4Address("10.0.0.2")], ipv6_addresses=["fe80::1%eth0"])
+    assert interface.ipv4_addresses == [IPv4Address("10.0.0.1"), IPv4Address("10.0.0.2")]
+    assert str(interface.ipv6_addresses[0]) == "fe80::1%eth0"
+
+    for field, value in (("ipv4_addresses", "010.0.0.1"), ("ipv6_addresses", "1::2::3")):
+        with pytest.raises(ValidationError):
+            NetworkInterface(**{field: [value]})
+
+
+def test_packed_columns_round_trip():
+    packed = pytest.importorskip("runzero.types.packed")
+
+    ipv4 = packed.pack_ipv4_column(["10.0.0.1", IPv4Address("255.255.255.255")])
+    assert ipv4.dtype.name == "uint32"
+    assert ipv4.tolist() == [167772161, 4294967295]
+    assert packed.unpack_ipv4_column(ipv4) == ["10.0.0.1", "255.255.255.255"]
+
+    values = [value for value in IPV6S if normalize_ipv6_column([value])[0] is not None]
+    ipv6 = packed.pack_ipv6_column(values)
+    assert ipv6.shape == (len(values), 2)
+    assert ipv6[0].tolist() == [0xFE80 << 48, 1]
+    assert packed.unpack_ipv6_column(ipv6) == [str(IPv6Address(value.split("%")[0])) for value in values]
+    assert packed.pack_ipv4_column([]).shape == (0,)
+
+    with pytest.raises(ipaddress.AddressValueError, match=r"values\[1\] .* '1.2.3'"):
+        packed.pack_ipv4_column(["10.0.0.1", "1.2.3"])
+    with pytest.raises(ipaddress.AddressValueError, match=r"values\[0\]"):
+        packed.pack_ipv6_column([None])
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from runzero._pydantic import dump_json, parse
+from runzero.api import AssetBatch, SharingReport
+from runzero.types import ImportAsset, ValidationError
+
+
+def _asset(i):
+    return {
+        "id": f"asset-{i}",
+        "os": "Ubuntu Linux",
+        "manufacturer": "Dell",
+        "tags": ["prod", f"rack-{i % 2}"],
+        "hostnames": [f"host-{i}"],
+        "software": [{"id": "sw-1", "vendor": "Canonical", "product": "openssl", "version": "3.0.2"}],
+        "vulnerabilities": [{"id": "vuln-1", "name": "Outdated OpenSSH", "cvss3BaseScore": 9.8}],
+        "customAttributes": {"rack": str(i % 2)},
+    }
+
+
+def test_shared_batch_serializes_like_unshared_batch():
+    payloads = [_asset(i) for i in range(4)]
+    shared = AssetBatch(share_values=True)
+    shared.extend(json.loads(json.dumps(payloads)))
+    plain = AssetBatch()
+    plain.extend(json.loads(json.dumps(payloads)))
+
+    assert len(shared) == 4
+    assert [dump_json(asset, by_alias=True) for asset in shared] == [
+        dump_json(asset, by_alias=True) for asset in plain.assets
+    ]
+    assert plain.sharing() == SharingReport(4, 0, 0, 0, 0, 0)
+
+
+def test_equal_values_become_one_object():
+    batch = AssetBatch(share_values=True)
+    first, second, third = (batch.add(_asset(i)) for i in range(3))
+
+    assert first.os is second.os
+    assert first.tags[0] is second.tags[0] is third.tags[0]
+    assert first.tags[1] is not second.tags[1]
+    assert first.tags[1] is third.tags[1]
+    assert first.software[0] is second.software[0]
+    assert first.vulnerabilities[0] is third.vulnerabilities[0]
+    assert first.hostnames[0] is not second.hostnames[0]
+    assert list(first.custom_attributes)[0] is list(second.custom_attributes)[0]
+
+    report = batch.sharing()
+    assert report.assets == 3
+    assert report.objects_shared == 2 * 3 + 1
+    assert report.strings_shared > 0
+    assert report.bytes_saved > 0
+
+
+def test_only_equal_records_are_shared():
+    batch = AssetBatch(share_values=True)
+    scores = [{"id": "v", "name": "n", "riskRank": rank} for rank in (1, 2, 1)]
+    assets = [batch.add({"id": f"a{i}", "vulnerabilities": [score]}) for i, score in enumerate(scores)]
+
+    first, second, third = (asset.vulnerabilities[0] for asset in assets)
+    assert first is third
+    assert first is not second
+    assert second.risk_rank == 2
+
+
+def test_models_are_added_and_invalid_objects_raise():
+    batch = AssetBatch(share_values=True)
+    model = parse(ImportAsset, _asset(0))
+    assert batch.add(model) is model
+    assert batch.add(parse(ImportAsset, _asset(2))).tags[1] is model.tags[1]
+
+    with pytest.raises(ValidationError):
+        batch.add({"id": "a", "tags": [1] * 1000})
+    assert len(batch) == 2
@@ -0,0 +1,132 @@
+import gzip
+import json
+import pickle
+
+import pytest
+
+from runzero._pydantic import dump_json
+from runzero.api import AssetMapping
+
+RECORD = {
+    "asset_id": "someId1",
+    "asset_domain": "some.domain.com",
+    "other_attribute": "small",
+    "type": "Tablet",
+    "mac": "6F:C2:BF:22:E8:38",
+    "ip_addresses": ["101.82.74.140", "6946:e4fb:963b:9ab2:1943:b4d6:7d14:b041"],
+    "drive_type": "ssd",
+    "unexpected_attribute": "XL",
+}
+
+MAPPING = AssetMapping(
+    fields={"id": "asset_id", "domain": "asset_domain", "deviceType": {"path": "type", "default": "Unknown"}},
+    interfaces=[{"mac_address": "mac", "addresses": "ip_addresses"}],
+    custom_attributes={"otherAttribute": "other_attribute", "driveType": "drive_type"},
+    leftovers=True,
+)
+
+
+def test_record_is_mapped_like_the_hand_written_example():
+    assert MAPPING(RECORD) == {
+        "id": "someId1",
+        "domain": "some.domain.com",
+        "device_type": "Tablet",
+        "network_interfaces": [
+            {
+                "mac_address": "6F:C2:BF:22:E8:38",
+                "ipv4_addresses": ["101.82.74.140"],
+                "ipv6_addresses": ["6946:e4fb:963b:9ab2:1943:b4d6:7d14:b041"],
+            }
+        ],
+        "custom_attributes": {"unexpected_attribute": "XL", "otherAttribute": "small", "driveType": "ssd"},
+    }
+    assert MAPPING({"asset_id": "a", "type": None})["device_type"] == "Unknown"
+
+
+def test_nested_paths_lists_and_leftovers():
+    mapping = AssetMapping(
+        fields={
+            "id": "meta.id",
+            "os": "system.os.name",
+            "hostnames": "name",
+            "tags": {"path": "labels", "split": ","},
+            "first_seen_ts": "seen.0",
+        },
+        interfaces=[{"each": "nics", "mac_address": "hw", "ipv4_addresses": "v4", "ipv6_addresses": "v6"}],
+        custom_attributes={"os.version": "system.os.version", "size": "size"},
+        leftovers=True,
+    )
+    record = {
+        "meta": {"id": "a", "source": "cmdb"},
+        "system": {"os": {"name": "Linux", "version": 6, "arch": "x86_64"}, "up": True},
+        "name": "host-1",
+        "labels": "prod, linux,",
+        "seen": ["2023-03-06T18:14:50Z", "2023-03-07T18:14:50Z"],
+        "nics": [{"hw": "00:1b:44:11:3a:b7", "v4": "10.0.0.1"}, {"v6": ["fe80::1"]}, {}],
+        "size": {"disk": 512},
+        "owner": None,
+    }
+
+    asset = mapping(record)
+
+    assert asset["id"] == "a"
+    assert asset["os"] == "Linux"
+    assert asset["hostnames"] == ["host-1"]
+    assert asset["tags"] == ["prod", "linux"]
+    assert asset["network_interfaces"] == [
+        {"mac_address": "00:1b:44:11:3a:b7", "ipv4_addresses": ["10.0.0.1"]},
+        {"ipv6_addresses": ["fe80::1"]},
+    ]
+    assert asset["custom_attributes"] == {
+        "meta.source": "cmdb",
+        "system.os.arch": "x86_64",
+        "system.up": "true",
+        "os.version": "6",
+        "size": '{"disk":512}',
+    }
+    assert mapping({"meta": {"id": "b"}}) == {"id": "b"}
+
+
+def test_numeric_keys_of_objects_are_read():
+    mapping = AssetMapping(fields={"id": "id", "os": "ports.80", "os_version": "builds.1"}, leftovers=True)
+
+    asset = mapping({"id": "a", "ports": {"80": "http", "443": "https"}, "builds": ["6.0", "6.1"]})
+
+    assert asset["os"] == "http"
+    assert asset["os_version"] == "6.1"
+    assert asset["custom_attributes"] == {"ports.443": "https"}
+
+
+def test_invalid_mappings_raise():
+    for kwargs in (
+        {"fields": {"not_a_field": "x"}},
+        {"fields": {"network_interfaces": "x"}},
+        {"fields": {"id": {"path": "x", "fallback": "y"}}},
+        {"fields": {"id": {"default": "y"}}},
+        {"fields": {"id": ""}},
+        {"fields": {}, "interfaces": [{"mac": "x"}]},
+    ):
+        with pytest.raises(ValueError):
+            AssetMapping(**kwargs)
+
+
+def test_records_are_built_with_errors_per_record():
+    records = [RECORD, {**RECORD, "ip_addresses": ["not-an-address"]}, {"type": "Tablet"}]
+
+    built = MAPPING.build(records)
+
+    assert [asset.id for asset in built.assets] == ["someId1"]
+    assert [error.record for error in built.errors] == [1, 2]
+    assert "ipv4" in built.errors[0].message
+
+
+def test_mapping_runs_in_worker_processes():
+    assert pickle.loads(pickle.dumps(MAPPING))(RECORD) == MAPPING(RECORD)
+
+    records = [{**RECORD, "asset_id": f"asset-{i}"} for i in range(5)] + [{"type": "Tablet"}]
+    chunks = list(MAPPING.chunks(records, chunk_size=2, max_workers=1))
+
+    assert [error.record for chunk in chunks for error in chunk.errors] == [5]
+    lines = gzip.decompress(b"".join(chunk.data for chunk in chunks)).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [f"asset-{i}" for i in range(5)]
+    assert lines[0].decode() == dump_json(MAPPING.build(records[:1]).assets[0], by_alias=True)
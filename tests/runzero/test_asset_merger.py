@@ -0,0 +1,120 @@
+import pytest
+
+from runzero.api import AssetMerger
+from runzero.api.imports.merge import MAX_CUSTOM_ATTRIBUTES, first_wins
+from runzero.types import ImportAsset
+
+PARTS = [
+    {
+        "id": "a",
+        "os": "Linux",
+        "hostnames": ["web-1"],
+        "networkInterfaces": [{"macAddress": "00:1b:44:11:3a:b7", "ipv4Addresses": ["10.0.0.1"]}],
+        "customAttributes": {"source": "cmdb", "rack": "r1"},
+        "trustOS": True,
+    },
+    {"id": "b", "deviceType": "Printer", "tags": ["floor=2"]},
+    ImportAsset(
+        id="a",
+        os_version="6.1",
+        hostnames=["web-1", "web-1.example.com"],
+        network_interfaces=[
+            {"mac_address": "00:1B:44:11:3A:B7", "ipv4_addresses": ["10.0.0.2"], "ipv6_addresses": ["fe80::1"]},
+            {"ipv4_addresses": ["192.168.1.5"]},
+        ],
+        custom_attributes={"source": "edr"},
+    ),
+    {"id": "a", "os": "Ubuntu", "tags": ["prod"]},
+]
+
+
+def test_assets_with_the_same_id_are_merged():
+    merger = AssetMerger()
+    merger.extend(PARTS)
+
+    assert merger.report() == (4, 2, 0)
+    a, b = merger.merged_objects()
+    assert a == {
+        "id": "a",
+        "os": "Ubuntu",
+        "osVersion": "6.1",
+        "hostnames": ["web-1", "web-1.example.com"],
+        "networkInterfaces": [
+            {
+                "macAddress": "00:1B:44:11:3A:B7",
+                "ipv4Addresses": ["10.0.0.1", "10.0.0.2"],
+                "ipv6Addresses": ["fe80::1"],
+            },
+            {"ipv4Addresses": ["192.168.1.5"]},
+        ],
+        "customAttributes": {"source": "edr", "rack": "r1"},
+        # unset fields, such as trustOS of the later parts, do not overwrite earlier values
+        "trustOS": True,
+        "tags": ["prod"],
+    }
+    assert b == {"id": "b", "deviceType": "Printer", "tags": ["floor=2"]}
+    assert list(merger.merged()) == []
+
+
+def test_rules_are_pluggable():
+    merger = AssetMerger(rules={"os": first_wins, "tags": lambda kept, new: kept + new})
+    merger.extend(PARTS + [{"id": "a", "tags": ["prod"]}])
+
+    (a, _) = merger.merged()
+
+    assert a.os == "Linux"
+    assert [tag.root if hasattr(tag, "root") else tag.__root__ for tag in a.tags] == ["prod", "prod"]
+
+    with pytest.raises(ValueError):
+        AssetMerger(rules={"not_a_field": first_wins})
+
+
+def test_spilled_runs_merge_like_memory(tmp_path):
+    parts = PARTS + [{"id": f"c{i % 5}", "customAttributes": {f"attr{i}": str(i)}} for i in range(20)]
+    in_memory = AssetMerger()
+    in_memory.extend(parts)
+
+    with AssetMerger(max_assets=2, spill_dir=str(tmp_path)) as spilled:
+        spilled.extend(parts)
+        assert spilled.report().spilled > 1
+        merged = list(spilled.merged_objects())
+
+    assert merged == sorted(in_memory.merged_objects(), key=lambda asset: asset["id"])
+    assert spilled.report().merged == 2 + 15
+    assert [asset["customAttributes"] for asset in merged if asset["id"] == "c0"] == [
+        {"attr0": "0", "attr5": "5", "attr10": "10", "attr15": "15"}
+    ]
+    assert not list(tmp_path.iterdir())
+
+
+def test_custom_attributes_stay_within_the_limit():
+    merger = AssetMerger()
+    merger.add({"id": "a", "customAttributes": {f"k{i}": "old" for i in range(MAX_CUSTOM_ATTRIBUTES - 1)}})
+    merger.add({"id": "a", "customAttributes": {"k0": "new", "extra1": "x", "extra2": "y"}})
+
+    (asset,) = merger.merged()
+
+    assert len(asset.custom_attributes) == MAX_CUSTOM_ATTRIBUTES
+    assert asset.custom_attributes["k0"] == "new"
+    assert "extra1" in asset.custom_attributes and "extra2" not in asset.custom_attributes
+
+
+def test_merged_lists_stay_within_the_limits():
+    merger = AssetMerger()
+    for part in ("a", "b"):
+        merger.add(
+            {
+                "id": "x",
+                "tags": [f"{part}{i}" for i in range(80)],
+                "networkInterfaces": [
+                    {"macAddress": "00:1b:44:11:3a:b7", "ipv6Addresses": [f"fe80::{part}:{i}" for i in range(80)]}
+                ]
+                + [{"ipv4Addresses": [f"10.0.{ord(part)}.{i}"]} for i in range(200)],
+            }
+        )
+
+    (asset,) = merger.merged()
+
+    assert len(asset.tags) == 100
+    assert len(asset.network_interfaces) == 256
+    assert len(asset.network_interfaces[0].ipv6_addresses) == 100
@@ -69,3 +69,69 @@ def test_client_auth_attempt_with_server_down(integration_config):
     c = Client(server_url="https://server.not.there", validate_certificate=integration_config.validate_cert)
     with pytest.raises(AuthError):
         c.oauth_login(integration_config.client_id, integration_config.client_secret)
+
+
+def test_client_oauth_refresh_is_single_flight(fake_server, monkeypatch):
+    """
+    This test ensures that many threads finding the OAuth token expired cause only one login
+    """
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from runzero.client._http.auth import OAuthToken
+
+    logins = []
+
+    def token_route(request):
+        logins.append(request)
+        time.sleep(0.05)
+        return {"access_token": f"token-{len(logins)}", "token_type": "bearer", "expires_in": 3600}
+
+    fake_server.add("POST", Client._Paths.TOKEN.value, token_route)
+    fake_server.add("GET", "api/v1.0/account/orgs", [])
+    c = Client(server_url=fake_server.URL)
+    c.oauth_login("id", "secret")
+    assert len(logins) == 1
+
+    original = OAuthToken.is_expired
+    monkeypatch.setattr(OAuthToken, "is_expired", lambda self: self.access_token == "token-1" or original(self))
+
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        list(pool.map(lambda _: OrgsAdmin(client=c).get_all(), range(64)))
+
+    assert len(logins) == 2
+    tokens = {r.headers["Authorization"] for r in fake_server.requests if r.method == "GET"}
+    assert tokens == {"Bearer token-2"}
+
+
+def test_client_oauth_refresh_failure_is_shared(fake_server, monkeypatch):
+    """
+    This test ensures waiting threads share a failed refresh rather than each retrying the login
+    """
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from runzero.client._http.auth import OAuthToken
+
+    attempts = []
+
+    def token_route(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            return {"access_token": "token-1", "token_type": "bearer", "expires_in": 3600}
+        time.sleep(0.05)
+        return 401, {"error": "bad secret"}, {}
+
+    fake_server.add("POST", Client._Paths.TOKEN.value, token_route)
+    c = Client(server_url=fake_server.URL)
+    c.oauth_login("id", "secret")
+    monkeypatch.setattr(OAuthToken, "is_expired", lambda self: True)
+
+    def call(_):
+        with pytest.raises(AuthError):
+            OrgsAdmin(client=c).get_all()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(call, range(8)))
+
+    assert 2 <= len(attempts) < 9
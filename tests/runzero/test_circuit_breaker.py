@@ -0,0 +1,113 @@
+import uuid
+
+import pytest
+
+from runzero.api import Tasks
+from runzero.client import CircuitBreaker, CircuitState, ClientError, ServerError
+from runzero.client.errors import CircuitOpenError, ConnError, DeadlineExceededError
+
+ORG_ID = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+TASK_ID = uuid.UUID("f6cfb91a-52ea-4a86-bf9a-5a891a26f52b")
+TEMPLATE = "api/v1.0/org/tasks/{id}"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(**kwargs):
+    breaker = CircuitBreaker(**kwargs)
+    clock = _Clock()
+    breaker._clock = clock
+    return breaker, clock
+
+
+def _fail(breaker, error, times=1):
+    for _ in range(times):
+        breaker.attempt(TEMPLATE).record(error)
+
+
+def test_opens_after_consecutive_failures():
+    breaker, _ = _breaker(failure_threshold=3)
+    _fail(breaker, ServerError(), 2)
+    breaker.attempt(TEMPLATE).record()
+    _fail(breaker, ConnError(), 2)
+    assert breaker.state(TEMPLATE).state is CircuitState.CLOSED
+
+    _fail(breaker, ServerError())
+    assert breaker.state(TEMPLATE).state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.attempt(TEMPLATE)
+    assert exc_info.value.template == TEMPLATE
+    assert exc_info.value.retry_after == pytest.approx(30)
+    # other endpoints are unaffected
+    breaker.attempt("api/v1.0/org/sites").record()
+
+
+def test_client_errors_and_deadlines_are_not_failures():
+    breaker, _ = _breaker(failure_threshold=1)
+    _fail(breaker, ClientError())
+    _fail(breaker, DeadlineExceededError())
+    _fail(breaker, ValueError())
+    assert breaker.state(TEMPLATE).state is CircuitState.CLOSED
+
+
+def test_slow_calls_are_failures():
+    breaker, _ = _breaker(failure_threshold=2, slow_call_seconds=1)
+    breaker.attempt(TEMPLATE).record(latency=0.5)
+    breaker.attempt(TEMPLATE).record(latency=2)
+    breaker.attempt(TEMPLATE).record(latency=2)
+    assert breaker.state(TEMPLATE).state is CircuitState.OPEN
+
+
+def test_half_open_probe_closes_or_reopens():
+    breaker, clock = _breaker(failure_threshold=1, reset_timeout_seconds=10)
+    _fail(breaker, ServerError())
+    clock.now += 10
+
+    probe = breaker.attempt(TEMPLATE)
+    assert breaker.state(TEMPLATE).state is CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.attempt(TEMPLATE)
+    probe.record(ServerError())
+    assert breaker.state(TEMPLATE).state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.attempt(TEMPLATE)
+
+    clock.now += 10
+    probe = breaker.attempt(TEMPLATE)
+    probe.cancel()
+    breaker.attempt(TEMPLATE).record()
+    status = breaker.state(TEMPLATE)
+    assert status.state is CircuitState.CLOSED
+    assert status.times_opened == 2
+    assert breaker.states() == {TEMPLATE: status}
+
+
+def test_breaker_validation():
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(reset_timeout_seconds=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(slow_call_seconds=-1)
+
+
+def test_client_fails_fast_while_open(fake_server):
+    fake_server.add("GET", f"api/v1.0/org/tasks/{TASK_ID}", {"title": "down", "detail": "down"}, status=503)
+    breaker = CircuitBreaker(failure_threshold=2)
+    client = fake_server.client(circuit_breaker=breaker)
+    tasks = Tasks(client)
+
+    for _ in range(2):
+        with pytest.raises(ServerError):
+            tasks.get_status(ORG_ID, TASK_ID)
+    with pytest.raises(CircuitOpenError):
+        tasks.get_status(ORG_ID, TASK_ID)
+
+    assert fake_server.count("GET", f"api/v1.0/org/tasks/{TASK_ID}") == 2
+    assert client.circuit_breaker.state(TEMPLATE).state is CircuitState.OPEN
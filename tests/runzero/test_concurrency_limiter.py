@@ -0,0 +1,154 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from runzero.api import Tasks
+from runzero.client import (
+    AdaptiveConcurrencyLimiter,
+    ClientError,
+    RateLimitError,
+    ServerError,
+)
+from runzero.types import RateLimitInformation
+
+ORG_ID = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+
+
+def _saturate(limiter):
+    return [limiter.try_acquire() for _ in range(limiter.limit)]
+
+
+def test_limit_increases_additively_while_saturated():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+    for _ in range(20):
+        for permit in _saturate(limiter):
+            permit.release(latency=0.01)
+    assert limiter.limit == 4
+    assert [d.reason for d in limiter.decisions()] == ["increase", "increase"]
+    assert [(d.previous, d.limit) for d in limiter.decisions()] == [(2, 3), (3, 4)]
+
+
+def test_limit_does_not_grow_when_unused():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+    for _ in range(100):
+        limiter.try_acquire().release(latency=0.01)
+    assert limiter.limit == 4
+    assert limiter.decisions() == []
+
+
+@pytest.mark.parametrize(
+    "error,reason",
+    [
+        (ServerError(), "server_error"),
+        (
+            RateLimitError(RateLimitInformation(usage_limit=10, usage_remaining=0, usage_today=10, usage_total=10)),
+            "rate_limited",
+        ),
+        (TimeoutError(), "timeout"),
+    ],
+)
+def test_limit_backs_off_once_per_overload(error, reason):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+    permits = _saturate(limiter)
+    for permit in permits:
+        permit.release(error)
+    # every permit was granted before the first cut, so only one cut is made
+    assert limiter.limit == 8
+    assert [d.reason for d in limiter.decisions()] == [reason]
+    assert limiter.in_flight == 0
+
+    limiter.try_acquire().release(error)
+    assert limiter.limit == 4
+
+
+def test_client_errors_do_not_change_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+    for permit in _saturate(limiter):
+        permit.release(ClientError())
+    assert limiter.limit == 4
+
+
+def test_limit_backs_off_on_latency_spike():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=2, latency_tolerance=3)
+    for _ in range(10):
+        limiter.try_acquire().release(latency=0.1)
+    assert limiter.baseline_latency == pytest.approx(0.1)
+    limiter.try_acquire().release(latency=1.0)
+    limiter.try_acquire().release(latency=1.0)
+    limiter.try_acquire().release(latency=1.0)
+    assert limiter.limit == 2
+    assert [d.reason for d in limiter.decisions()] == ["latency", "latency"]
+
+
+def test_latency_baseline_is_kept_per_endpoint():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_tolerance=3)
+    for _ in range(10):
+        limiter.try_acquire().release(latency=0.1, endpoint="api/v1.0/org/tasks/{id}")
+        limiter.try_acquire().release(latency=2.0, endpoint="api/v1.0/export/org/assets.json")
+
+    # a slow export is not a spike against the baseline of fast task lookups
+    assert limiter.limit == 8
+    assert limiter.baseline_latencies() == {
+        "api/v1.0/org/tasks/{id}": pytest.approx(0.1),
+        "api/v1.0/export/org/assets.json": pytest.approx(2.0),
+    }
+    assert limiter.baseline_latency is None
+    limiter.try_acquire().release(latency=1.0, endpoint="api/v1.0/org/tasks/{id}")
+    assert [d.reason for d in limiter.decisions()] == ["latency"]
+
+
+def test_limiter_validation():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(initial_limit=0)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(backoff_ratio=1)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(latency_tolerance=1)
+
+
+def test_acquire_times_out():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    permit = limiter.acquire()
+    assert limiter.acquire(timeout=0.01) is None
+    permit.release()
+    permit.release()
+    assert limiter.in_flight == 0
+
+
+def test_client_requests_are_limited(fake_server):
+    lock = threading.Lock()
+    active = [0]
+    peak = [0]
+
+    def route(request):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return 503, {"title": "busy", "detail": "busy"}, {}
+
+    task_ids = [uuid.UUID(int=i + 1) for i in range(16)]
+    for task_id in task_ids:
+        fake_server.add("GET", f"api/v1.0/org/tasks/{task_id}", route)
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+    client = fake_server.client(concurrency_limiter=limiter)
+    tasks = Tasks(client)
+
+    def get(task_id):
+        with pytest.raises(ServerError):
+            tasks.get_status(ORG_ID, task_id)
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(get, task_ids))
+
+    assert peak[0] <= 4
+    assert limiter.in_flight == 0
+    assert limiter.limit < 4
+    assert client.concurrency_limiter is limiter
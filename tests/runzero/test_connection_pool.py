@@ -0,0 +1,117 @@
+import socket
+import threading
+import time
+import uuid
+
+import pytest
+
+from runzero import Client
+from runzero.api import Tasks
+from runzero.client._http.dns import DNSCache
+from runzero.client._http.pool import PooledHTTPAdapter
+from runzero.client.errors import ConnError
+
+ORG_ID = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+TASK_ID = uuid.UUID("f6cfb91a-52ea-4a86-bf9a-5a891a26f52b")
+
+
+@pytest.fixture
+def listener():
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(16)
+    accepted = []
+
+    def accept():
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+            accepted.append(conn)
+
+    threading.Thread(target=accept, daemon=True).start()
+    yield server.getsockname()[1], accepted
+    server.close()
+    for conn in accepted:
+        conn.close()
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    calls = []
+    getaddrinfo = socket.getaddrinfo
+
+    def counting(host, *args, **kwargs):
+        calls.append(host)
+        return getaddrinfo(host, *args, **kwargs)
+
+    monkeypatch.setattr(socket, "getaddrinfo", counting)
+    return calls
+
+
+def test_dns_cache_expires(lookups):
+    cache = DNSCache(ttl_seconds=10)
+    now = [100.0]
+    cache._clock = lambda: now[0]
+
+    assert cache.resolve("localhost", 80)
+    assert cache.resolve("localhost", 80)
+    assert lookups.count("localhost") == 1
+    now[0] += 10
+    cache.resolve("localhost", 80)
+    assert lookups.count("localhost") == 2
+    cache.discard("localhost", 80)
+    cache.resolve("localhost", 80)
+    assert lookups.count("localhost") == 3
+    assert cache.resolve("host.invalid", 80) == []
+
+
+def test_warm_up_opens_pooled_connections(listener, lookups):
+    port, accepted = listener
+    adapter = PooledHTTPAdapter(max_connections=4, dns_cache=DNSCache())
+
+    assert adapter.warm_up(f"http://localhost:{port}/", 3, True, 5) == 3
+    # connections already open and idle are counted again, not reopened
+    assert adapter.warm_up(f"http://localhost:{port}/", 8, True, 5) == 4
+    assert lookups.count("localhost") == 1
+
+    deadline = time.monotonic() + 5
+    while len(accepted) < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(accepted) == 4
+
+
+def test_client_warm_up_reports_connection_errors():
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    port = server.getsockname()[1]
+    server.close()
+
+    client = Client(account_key="CTtest", server_url=f"https://127.0.0.1:{port}")
+    with pytest.raises(ConnError):
+        client.warm_up(2)
+    with pytest.raises(ValueError):
+        client.warm_up(0)
+
+
+def test_client_reuses_one_adapter(fake_server, monkeypatch):
+    fake_server.add("GET", f"api/v1.0/org/tasks/{TASK_ID}", {"id": str(TASK_ID), "status": "processed"})
+    adapters = []
+
+    def send(adapter, request, **kwargs):
+        adapters.append(adapter)
+        return fake_server.send(request, **kwargs)
+
+    monkeypatch.setattr(PooledHTTPAdapter, "send", send)
+    client = fake_server.client()
+    tasks = Tasks(client)
+    for _ in range(3):
+        tasks.get_status(ORG_ID, TASK_ID)
+
+    assert len(adapters) == 3
+    assert len(set(map(id, adapters))) == 1
+    with pytest.raises(ValueError):
+        fake_server.client(max_connections=0)
+    with pytest.raises(ValueError):
+        fake_server.client(dns_cache_seconds=-1)
@@ -0,0 +1,80 @@
+import os
+import pickle
+
+import pytest
+
+from runzero.api import OrgsAdmin
+from runzero.client import Client, ClientConfig
+
+
+@pytest.fixture
+def token_route(fake_server):
+    logins = []
+
+    def route(request):
+        logins.append(request)
+        return {"access_token": f"token-{len(logins)}", "token_type": "bearer", "expires_in": 3600}
+
+    fake_server.add("POST", Client._Paths.TOKEN.value, route)
+    fake_server.add("GET", "api/v1.0/account/orgs", [])
+    return logins
+
+
+def test_config_round_trip_reuses_oauth_token(fake_server, token_route, tmp_path):
+    client = fake_server.client(account_key=None, timeout_seconds=30, max_connections=4, collect_metrics=True)
+    client.oauth_login("id", "secret")
+    config = pickle.loads(pickle.dumps(client.config()))
+
+    assert isinstance(config, ClientConfig)
+    assert "secret" not in repr(config)
+    assert config.client_id == "id"
+    assert config.timeout_seconds == 30
+    assert config.max_connections == 4
+
+    worker = config.build()
+    OrgsAdmin(worker).get_all()
+    assert len(token_route) == 1
+    assert fake_server.requests[-1].headers["Authorization"] == "Bearer token-1"
+    assert worker.metrics() is not None
+
+
+def test_config_build_logs_in_without_a_valid_token(fake_server, token_route):
+    config = ClientConfig(server_url=fake_server.URL, client_id="id", client_secret="secret")
+    OrgsAdmin(config.build()).get_all()
+    assert len(token_route) == 1
+
+
+def test_client_rebuilds_pool_after_pid_change(fake_server, token_route, monkeypatch):
+    client = fake_server.client()
+    OrgsAdmin(client).get_all()
+    adapter = client._adapter
+    token_lock = client._token_lock
+
+    pid = os.getpid()
+    monkeypatch.setattr(os, "getpid", lambda: pid + 1)
+    OrgsAdmin(client).get_all()
+
+    assert client._adapter is not adapter
+    assert client._token_lock is not token_lock
+    adapter = client._adapter
+    OrgsAdmin(client).get_all()
+    assert client._adapter is adapter
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_client_is_reinitialized_in_forked_child(fake_server, token_route):
+    client = fake_server.client()
+    OrgsAdmin(client).get_all()
+    adapter = client._adapter
+
+    child = os.fork()
+    if child == 0:
+        ok = client._adapter is not adapter and client._pid == os.getpid()
+        try:
+            OrgsAdmin(client).get_all()
+        except Exception:  # pylint: disable=broad-except
+            ok = False
+        os._exit(0 if ok else 1)
+    _, status = os.waitpid(child, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+    assert client._adapter is adapter
@@ -0,0 +1,104 @@
+import datetime
+import gzip
+import io
+import itertools
+import json
+
+import pytest
+
+from runzero.api import AssetMapping, read_csv
+
+CSV = """\
+asset_id,type,mac,ips,tags,owner
+someId1,Tablet,6F:C2:BF:22:E8:38,"101.82.74.140, 6946:e4fb:963b:9ab2:1943:b4d6:7d14:b041","prod,linux",alice
+someId2,Tablet,,140.0.21.251,,
+,Server,A6:C5:E7:6A:85:4A,180.169.16.247
+
+someId4,NULL
+"""
+
+
+def test_csv_is_read_in_batches_of_records():
+    batches = list(read_csv(io.StringIO(CSV), batch_size=2, null_values=("", "NULL")))
+
+    assert [len(batch) for batch in batches] == [2, 2]
+    assert batches[0][1] == {"asset_id": "someId2", "type": "Tablet", "ips": "140.0.21.251"}
+    assert batches[1] == [
+        {"type": "Server", "mac": "A6:C5:E7:6A:85:4A", "ips": "180.169.16.247"},
+        {"asset_id": "someId4"},
+    ]
+    # repeated values of a column share one string
+    assert batches[0][0]["type"] is batches[0][1]["type"]
+
+    with pytest.raises(ValueError):
+        read_csv(io.StringIO(CSV), batch_size=0)
+
+
+def test_csv_records_stream_into_chunks(tmp_path):
+    path = tmp_path / "assets.csv"
+    path.write_text("\ufeff" + CSV.replace(",", ";"), encoding="utf-8")
+    mapping = AssetMapping(
+        fields={"id": "asset_id", "tags": {"path": "tags", "split": ";"}},
+        interfaces=[{"mac_address": "mac", "addresses": {"path": "ips", "split": ";"}}],
+    )
+    records = itertools.chain.from_iterable(read_csv(path, delimiter=";", batch_size=2))
+
+    chunks = list(mapping.chunks(records, chunk_size=3, max_workers=0))
+
+    assert [error.record for chunk in chunks for error in chunk.errors] == [2]
+    assets = [json.loads(line) for line in gzip.decompress(b"".join(chunk.data for chunk in chunks)).splitlines()]
+    assert [asset["id"] for asset in assets] == ["someId1", "someId2", "someId4"]
+    assert assets[0]["tags"] == ["prod", "linux"]
+    assert assets[0]["networkInterfaces"][0]["ipv6Addresses"] == ["6946:e4fb:963b:9ab2:1943:b4d6:7d14:b041"]
+
+
+def test_arrow_and_parquet_are_read_in_batches(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    from runzero.api.imports.arrow import read_arrow, read_parquet
+
+    seen = datetime.datetime(2023, 3, 6, 18, 14, 50, tzinfo=datetime.timezone.utc)
+    table = pa.table(
+        {
+            "asset_id": ["a", "b", "c"],
+            "type": pa.array(["Tablet", "Tablet", None]).dictionary_encode(),
+            "ips": [["10.0.0.1", "fe80::1"], [], None],
+            "seen": [seen, None, seen],
+            "cores": [4, 8, None],
+        }
+    )
+    pq.write_table(table, tmp_path / "assets.parquet")
+
+    batches = list(read_arrow(table, batch_size=2))
+    from_parquet = list(read_parquet(tmp_path / "assets.parquet", batch_size=2, read_dictionary=["type"]))
+
+    assert from_parquet == batches
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert batches[0][0] == {
+        "asset_id": "a",
+        "type": "Tablet",
+        "ips": ["10.0.0.1", "fe80::1"],
+        "seen": seen,
+        "cores": 4,
+    }
+    assert batches[1] == [{"asset_id": "c", "seen": seen}]
+    assert from_parquet[0][0]["type"] is from_parquet[0][1]["type"]
+
+    mapping = AssetMapping(
+        fields={"id": "asset_id", "device_type": "type"}, interfaces=[{"addresses": "ips"}], leftovers=True
+    )
+    built = mapping.build(itertools.chain.from_iterable(batches))
+    assert not built.errors
+    assert built.assets[0].custom_attributes == {"seen": "2023-03-06T18:14:50+00:00", "cores": "4"}
+
+
+def test_dataframes_are_read_in_batches():
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    from runzero.api.imports.arrow import read_dataframe
+
+    frame = pd.DataFrame({"asset_id": ["a", "b", "c"], "cores": [4.0, float("nan"), 2.0]})
+
+    batches = list(read_dataframe(frame, batch_size=2))
+
+    assert batches == [[{"asset_id": "a", "cores": 4.0}, {"asset_id": "b"}], [{"asset_id": "c", "cores": 2.0}]]
@@ -0,0 +1,110 @@
+import uuid
+
+import pytest
+
+from runzero.api import Sites, Tasks
+from runzero.client import ClientError, RequestHooks
+from runzero.client.instrumentation import endpoint_template
+from runzero.types import SiteOptions
+
+ORG_ID = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+TASK_ID = uuid.UUID("f6cfb91a-52ea-4a86-bf9a-5a891a26f52b")
+
+
+class Recorder(RequestHooks):
+    def __init__(self):
+        self.calls = []
+
+    def on_request(self, event):
+        self.calls.append(("request", event))
+        event.user_data["seen"] = True
+        event.request_headers["traceparent"] = "00-trace-span-01"
+
+    def on_response(self, event):
+        self.calls.append(("response", event))
+
+    def on_error(self, event):
+        self.calls.append(("error", event))
+
+
+@pytest.mark.parametrize(
+    "endpoint,expected",
+    [
+        ("api/v1.0/org/sites", "api/v1.0/org/sites"),
+        (f"/api/v1.0/org/sites/{TASK_ID}/", "api/v1.0/org/sites/{id}"),
+        (f"api/v1.0/org/tasks/{TASK_ID.hex}/data", "api/v1.0/org/tasks/{id}/data"),
+        (f"api/v1.0/account/orgs/{ORG_ID}?_oid={ORG_ID}", "api/v1.0/account/orgs/{id}"),
+    ],
+)
+def test_endpoint_template(endpoint, expected):
+    assert endpoint_template(endpoint) == expected
+
+
+def test_hooks_observe_successful_request(fake_server):
+    fake_server.add("GET", f"api/v1.0/org/tasks/{TASK_ID}", {"id": str(TASK_ID), "status": "processed"})
+    hooks = Recorder()
+    client = fake_server.client(request_hooks=[hooks])
+
+    assert Tasks(client).get_status(ORG_ID, TASK_ID) == "processed"
+
+    assert [kind for kind, _ in hooks.calls] == ["request", "response"]
+    event = hooks.calls[-1][1]
+    assert event is hooks.calls[0][1]
+    assert event.method == "GET"
+    assert event.template == "api/v1.0/org/tasks/{id}"
+    assert event.status == 200
+    assert event.bytes_sent == 0
+    assert event.bytes_received > 0
+    assert event.error is None
+    assert event.user_data["seen"]
+    assert event.timing.queued >= 0
+    assert event.timing.total >= event.timing.queued
+    assert event.timing.ttfb is not None
+    assert event.timing.body_read is not None
+    # no connection was opened by the fake transport
+    assert event.timing.connect is None and event.timing.tls is None
+    assert fake_server.requests[-1].headers["traceparent"] == "00-trace-span-01"
+
+
+def test_hooks_observe_failed_request(fake_server):
+    fake_server.add("PUT", "api/v1.0/org/sites", {"title": "bad", "detail": "bad site"}, status=400)
+    hooks = Recorder()
+    client = fake_server.client()
+    client.add_request_hooks(hooks)
+
+    with pytest.raises(ClientError) as exc_info:
+        Sites(client).create(ORG_ID, site_options=SiteOptions(name="x"))
+
+    assert [kind for kind, _ in hooks.calls] == ["request", "error"]
+    event = hooks.calls[-1][1]
+    assert event.method == "PUT"
+    assert event.status == 400
+    assert event.bytes_sent > 0
+    assert event.error is exc_info.value
+
+    client.remove_request_hooks(hooks)
+    assert client.request_hooks == ()
+
+
+def test_opentelemetry_hooks_record_spans(fake_server):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    from runzero.client.otel import OpenTelemetryHooks
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    fake_server.add("GET", f"api/v1.0/org/tasks/{TASK_ID}", {"id": str(TASK_ID), "status": "processed"})
+    client = fake_server.client(request_hooks=[OpenTelemetryHooks(tracer_provider=provider)])
+
+    Tasks(client).get_status(ORG_ID, TASK_ID)
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "GET api/v1.0/org/tasks/{id}"
+    assert span.attributes["http.response.status_code"] == 200
+    assert "traceparent" in fake_server.requests[-1].headers
@@ -0,0 +1,44 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import runzero
+
+
+def _loaded_after(statement):
+    check = f"import sys; {statement}; print(' '.join(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+def test_import_runzero_defers_dependencies():
+    loaded = _loaded_after("import runzero")
+    assert "runzero" in loaded
+    for module in ("requests", "pydantic", "runzero.client", "runzero.api", "runzero.types._data_models_gen"):
+        assert module not in loaded
+
+
+def test_api_imports_only_used_modules():
+    loaded = _loaded_after("from runzero.api import Sites")
+    assert "runzero.api.sites" in loaded
+    assert "runzero.api.admin" not in loaded
+    assert "runzero.api.scans" not in loaded
+
+
+@pytest.mark.parametrize("package", ["runzero", "runzero.api", "runzero.api.admin", "runzero.types"])
+def test_public_names_resolve(package):
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+    with pytest.raises(AttributeError):
+        getattr(module, "NotAName")
+
+
+def test_submodules_reachable_from_package():
+    assert runzero.api.admin.OrgsAdmin is importlib.import_module("runzero.api.admin.orgs").OrgsAdmin
+    assert runzero.types.Explorer is importlib.import_module("runzero.types._data_models_gen").Agent
+    assert runzero.Client is runzero.client.Client
+    assert runzero.version.__version__ == runzero.__version__
@@ -0,0 +1,93 @@
+import gzip
+import json
+import pickle
+import uuid
+
+import pytest
+
+from runzero.api import MatchIndex
+from runzero.types import ImportAsset
+
+SERVER = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+LAPTOP = uuid.UUID("2f6c9a1e-2d42-4f4a-9d6c-0b6f2b8a3c11")
+PRINTER = uuid.UUID("8b1d5f3a-7c2e-4e8b-a1f4-3d9e6c2b7a55")
+
+EXPORT = [
+    {
+        "id": str(SERVER),
+        "macs": ["00:1b:44:11:3a:b7"],
+        "names": ["WEB-1.example.com"],
+        "addresses": ["10.0.0.1"],
+        "addresses_extra": ["2001:db8::1"],
+        "foreign_attributes": {"@cmdb.import": [{"id": "cmdb-1", "owner": "ops"}]},
+    },
+    {"id": str(LAPTOP), "macs": ["a4:83:e7:00:00:01"], "addresses": ["10.0.0.2", "192.168.1.10"], "names": ["laptop"]},
+    # the printer was given the laptop's old address
+    {"id": str(PRINTER), "macs": ["a4-83-e7-00-00-02"], "addresses": ["192.168.1.10"]},
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    with MatchIndex.build(tmp_path / "assets.idx", EXPORT) as built:
+        yield built
+
+
+def test_keys_of_each_kind_are_looked_up(index):
+    assert (index.assets, index.keys) == (3, 11)
+    assert index.lookup("external_id", "cmdb-1") == SERVER
+    assert index.lookup("mac", "00-1B-44-11-3A-B7") == SERVER
+    assert index.lookup("mac", "a4:83:e7:00:00:02") == PRINTER
+    assert index.lookup("hostname", "web-1.example.com.") == SERVER
+    assert index.lookup("ip", "2001:0db8::0001") == SERVER
+    assert index.lookup("ip", "10.0.0.2") == LAPTOP
+    # keys several assets have match none of them
+    assert index.lookup("ip", "192.168.1.10") is None
+    assert index.lookup("ip", "not-an-address") is None
+    assert index.lookup("external_id", "10.0.0.1") is None
+
+
+def test_assets_are_assigned_by_precedence(index, tmp_path):
+    assets = [
+        ImportAsset(id="cmdb-1", network_interfaces=[{"ipv4_addresses": ["10.0.0.2"]}]),
+        ImportAsset(id="other", hostnames=["laptop"], network_interfaces=[{"mac_address": "a4:83:e7:00:00:02"}]),
+        ImportAsset(id="conflict", network_interfaces=[{"ipv4_addresses": ["10.0.0.1", "10.0.0.2"]}]),
+        ImportAsset(id="forced", run_zero_id=PRINTER, network_interfaces=[{"ipv4_addresses": ["10.0.0.1"]}]),
+    ]
+
+    assigned = [asset.run_zero_id for asset in index.assign(assets)]
+
+    assert assigned == [SERVER, PRINTER, None, PRINTER]
+    ip_first = MatchIndex(index.path, precedence=["ip", "hostname"])
+    assert [ip_first.match(asset) for asset in assets] == [LAPTOP, LAPTOP, None, SERVER]
+    assert [asset.run_zero_id for asset in ip_first.assign(assets, overwrite=True)][3] == SERVER
+    ip_first.close()
+
+    with pytest.raises(ValueError):
+        MatchIndex(index.path, precedence=["serial"])
+    (tmp_path / "not.idx").write_bytes(b"RZMATCH1" + bytes(40))
+    with pytest.raises(ValueError):
+        MatchIndex(tmp_path / "not.idx")
+
+
+def test_index_is_built_from_a_jsonl_export_and_pickles_by_path(tmp_path):
+    path = tmp_path / "export.jsonl.gz"
+    path.write_bytes(gzip.compress("".join(json.dumps(record) + "\n" for record in EXPORT).encode()))
+
+    with MatchIndex.build(tmp_path / "assets.idx", path, external_ids=lambda record: []) as index:
+        assert index.keys == 10
+        assert index.lookup("external_id", "cmdb-1") is None
+        copied = pickle.loads(pickle.dumps(index))
+        assert copied.lookup("hostname", "laptop") == LAPTOP
+        copied.close()
+
+
+def test_rebuilding_leaves_open_indexes_intact(index, tmp_path):
+    with MatchIndex.build(index.path, EXPORT[1:]) as rebuilt:
+        assert rebuilt.lookup("external_id", "cmdb-1") is None
+        # the open index still maps the file it was opened on
+        assert index.lookup("external_id", "cmdb-1") == SERVER
+
+    with pytest.raises(ValueError):
+        MatchIndex.build(tmp_path / "other.idx", EXPORT + [{"macs": ["00:1b:44:11:3a:b8"]}])
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["assets.idx"]
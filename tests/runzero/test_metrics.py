@@ -0,0 +1,107 @@
+import threading
+import uuid
+
+import pytest
+
+from runzero.api import Tasks
+from runzero.client import ClientError, ServerError
+from runzero.client.instrumentation import RequestEvent
+from runzero.client.metrics import LATENCY_BUCKETS, EndpointMetrics, MetricsCollector
+
+ORG_ID = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+TASK_IDS = [uuid.UUID(int=i + 1) for i in range(4)]
+
+
+def _event(method="GET", template="api/v1.0/org/tasks/{id}", total=0.01, error=None, sent=0, received=100):
+    event = RequestEvent(method=method, endpoint=template, template=template)
+    event.timing.total = total
+    event.bytes_sent = sent
+    event.bytes_received = received
+    event.error = error
+    return event
+
+
+def test_client_metrics_per_endpoint(fake_server):
+    for task_id in TASK_IDS[:3]:
+        fake_server.add("GET", f"api/v1.0/org/tasks/{task_id}", {"id": str(task_id), "status": "processed"})
+    fake_server.add("GET", f"api/v1.0/org/tasks/{TASK_IDS[3]}", {"title": "gone", "detail": "gone"}, status=404)
+    client = fake_server.client(collect_metrics=True)
+    tasks = Tasks(client)
+
+    for task_id in TASK_IDS[:3]:
+        tasks.get_status(ORG_ID, task_id)
+    with pytest.raises(ClientError):
+        tasks.get_status(ORG_ID, TASK_IDS[3])
+
+    snapshot = client.metrics()
+    assert len(snapshot) == 1
+    m = snapshot.get("GET", "api/v1.0/org/tasks/{id}")
+    assert m.requests == 4
+    assert m.errors == {"ClientError": 1}
+    assert m.error_count == 1
+    assert m.bytes_received > 0
+    assert sum(m.latency_buckets) == 4
+    assert 0 < m.p50 <= m.p95 <= m.p99 <= m.latency_max
+
+
+def test_client_metrics_disabled_by_default(fake_server):
+    fake_server.add("GET", f"api/v1.0/org/tasks/{TASK_IDS[0]}", {"id": str(TASK_IDS[0]), "status": "processed"})
+    client = fake_server.client()
+    Tasks(client).get_status(ORG_ID, TASK_IDS[0])
+    assert len(client.metrics()) == 0
+
+
+def test_collector_aggregates_across_threads():
+    collector = MetricsCollector()
+
+    def work():
+        for _ in range(100):
+            collector.on_response(_event())
+        collector.on_error(_event(error=ServerError("boom")))
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # recorded after the other threads exited and were folded together
+    collector.on_response(_event(method="PUT", template="api/v1.0/org/sites", sent=10))
+
+    snapshot = collector.snapshot()
+    get = snapshot.get("GET", "api/v1.0/org/tasks/{id}")
+    assert get.requests == 808
+    assert get.errors == {"ServerError": 8}
+    assert get.bytes_received == 80800
+    put = snapshot.get("PUT", "api/v1.0/org/sites")
+    assert put.requests == 1
+    assert put.bytes_sent == 10
+
+
+def test_quantiles_interpolate_within_buckets():
+    collector = MetricsCollector()
+    for latency in [0.002] * 90 + [0.5] * 9 + [3.0]:
+        collector.on_response(_event(total=latency))
+    m = collector.snapshot().get("GET", "api/v1.0/org/tasks/{id}")
+    assert 0.001 < m.p50 <= 0.002
+    assert 0.25 < m.p95 <= 0.5
+    assert 0.5 < m.p99 <= 3.0
+    assert m.quantile(1.0) == pytest.approx(3.0)
+    assert EndpointMetrics(method="GET", template="x").p50 is None
+    with pytest.raises(ValueError):
+        m.quantile(1.5)
+
+
+def test_prometheus_exposition():
+    collector = MetricsCollector()
+    collector.on_response(_event(total=0.003))
+    collector.on_error(_event(total=2000.0, error=ClientError("no")))
+    text = collector.snapshot().to_prometheus()
+
+    labels = 'method="GET",endpoint="api/v1.0/org/tasks/{id}"'
+    assert "# TYPE runzero_sdk_request_duration_seconds histogram" in text
+    assert f"runzero_sdk_requests_total{{{labels}}} 2" in text
+    assert f'runzero_sdk_request_errors_total{{{labels},error="ClientError"}} 1' in text
+    assert f'runzero_sdk_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"runzero_sdk_request_duration_seconds_count{{{labels}}} 2" in text
+    assert f'runzero_sdk_request_duration_seconds_bucket{{{labels},le="{LATENCY_BUCKETS[-1]:.6g}"}} 1' in text
+    assert text.endswith("\n")
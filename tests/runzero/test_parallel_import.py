@@ -0,0 +1,73 @@
+import gzip
+import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from runzero._pydantic import dump_json, parse
+from runzero.api import CustomAssets, build_asset_chunks
+from runzero.types import ImportAsset
+
+ORG_ID = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+
+
+def _to_asset(record):
+    name, address = record.split(",")
+    return {"id": name, "hostnames": [name], "networkInterfaces": [{"ipv4Addresses": [address]}]}
+
+
+RECORDS = [f"host-{i},10.0.0.{i}" for i in range(250, 260)]
+
+
+def test_chunks_are_built_in_worker_processes():
+    chunks = list(build_asset_chunks(RECORDS, _to_asset, chunk_size=4, max_workers=2))
+
+    assert [(chunk.first, chunk.records) for chunk in chunks] == [(0, 4), (4, 4), (8, 2)]
+    assert [error.record for chunk in chunks for error in chunk.errors] == [6, 7, 8, 9]
+    assert "ipv4" in chunks[1].errors[0].message
+    assert sum(chunk.assets for chunk in chunks) == 6
+
+    lines = gzip.decompress(b"".join(chunk.data for chunk in chunks)).decode("utf-8").splitlines()
+    valid = [_to_asset(record) for record in RECORDS[:6]]
+    assert lines == [dump_json(parse(ImportAsset, asset), by_alias=True) for asset in valid]
+
+
+def test_mapper_errors_and_models_are_handled_per_record():
+    records = [ImportAsset(id="model"), {"id": "json"}, {"hostnames": "not-a-list"}, "not-an-object"]
+    with ThreadPoolExecutor() as executor:
+        (chunk,) = build_asset_chunks(records, executor=executor)
+        (mapped,) = build_asset_chunks(["a", "b"], lambda record: 1 / 0, executor=executor)
+
+    assert chunk.assets == 2
+    assert [error.record for error in chunk.errors] == [2, 3]
+    assert chunk.errors[1].message.startswith("ValidationError")
+    assert [json.loads(line)["id"] for line in gzip.decompress(chunk.data).splitlines()] == ["model", "json"]
+    assert mapped.assets == 0
+    assert mapped.errors[0].message == "ZeroDivisionError: division by zero"
+
+    with pytest.raises(ValueError):
+        build_asset_chunks(records, chunk_size=0)
+
+
+def _asset_data(request):
+    """The assetData file of a multipart upload."""
+    boundary = request.headers["Content-Type"].split("boundary=")[1].encode()
+    for part in request.body.split(b"--" + boundary):
+        if b'name="assetData"' in part:
+            return part.split(b"\r\n\r\n", 1)[1][: -len(b"\r\n")]
+    raise AssertionError("no assetData")
+
+
+def test_chunks_upload_as_one_task(fake_server):
+    task = {"id": str(uuid.uuid4()), "name": "import", "status": "new"}
+    fake_server.add("POST", f"api/v1.0/import/org/{ORG_ID}/assets", task)
+    records = [{"id": f"asset-{i}"} for i in range(5)]
+    with ThreadPoolExecutor() as executor:
+        chunks = list(build_asset_chunks(records, chunk_size=2, executor=executor))
+
+    created = CustomAssets(fake_server.client()).upload_asset_chunks(ORG_ID, uuid.uuid4(), uuid.uuid4(), chunks)
+
+    assert str(created.id) == task["id"]
+    lines = gzip.decompress(_asset_data(fake_server.requests[0])).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [record["id"] for record in records]
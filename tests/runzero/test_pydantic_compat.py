@@ -0,0 +1,66 @@
+import json
+
+import pydantic
+import pytest
+
+from runzero._pydantic import PYDANTIC_V2, copy, dump_json, parse, root
+from runzero.types import (
+    CustomAttribute,
+    Hostname,
+    ImportAsset,
+    ScanOptions,
+    Tag,
+    Task,
+    ValidationError,
+)
+
+TASK = {
+    "id": "f6cfb91a-52ea-4a86-bf9a-5a891a26f52b",
+    "name": "import",
+    "created_at": 1576300370,
+    "organization_id": "e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8",
+    "status": "processed",
+}
+
+
+def test_backend_matches_installed_pydantic():
+    assert PYDANTIC_V2 == (int(pydantic.VERSION.split(".")[0]) >= 2)
+    assert ImportAsset.__mro__[-2].__module__.startswith("pydantic")
+
+
+def test_parse_and_dump_use_api_field_names():
+    task = parse(Task, TASK)
+    assert str(task.id) == TASK["id"]
+    assert task.created_at == 1576300370
+    assert str(task.organization_id) == TASK["organization_id"]
+
+    asset = parse(ImportAsset, {"id": "a", "osVersion": "22.04", "hostnames": ["h"], "tags": ["t"]})
+    dumped = json.loads(dump_json(asset, by_alias=True, exclude_none=True))
+    assert dumped["osVersion"] == "22.04"
+    assert dumped["hostnames"] == ["h"]
+    assert dumped["tags"] == ["t"]
+
+    duplicate = copy(asset)
+    assert duplicate == asset
+    assert duplicate is not asset
+
+
+def test_root_models():
+    assert root(Hostname("host.example.com")) == "host.example.com"
+    assert root(Tag("prod")) == "prod"
+    with pytest.deprecated_call():
+        assert root(CustomAttribute("value")) == "value"
+    with pytest.raises(ValidationError):
+        Tag("t" * 1025)
+
+
+def test_numbers_coerced_to_strings():
+    # pydantic 1 coerces numbers into string fields; the pydantic 2 models keep that behavior
+    assert ImportAsset(id=123, os_version=22.04).id == "123"
+
+
+def test_scan_options_serialize_by_alias():
+    options = ScanOptions(targets="10.0.0.0/24", scan_name="weekly")
+    assert json.loads(options.json())["scan-name"] == "weekly"
+    assert json.loads(dump_json(options))["scan-name"] == "weekly"
+    assert json.loads(dump_json(options, by_alias=False))["scan_name"] == "weekly"
@@ -0,0 +1,140 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from runzero.api import Sites, Tasks
+from runzero.client import ServerError
+from runzero.client.errors import DeadlineExceededError
+
+ORG_ID = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+TASK_ID = uuid.UUID("f6cfb91a-52ea-4a86-bf9a-5a891a26f52b")
+SITES = "api/v1.0/org/sites"
+CALLERS = 8
+
+
+def _wait_for_waiters(client, count):
+    deadline = time.monotonic() + 5
+    while client.coalesced_request_count < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_concurrent_identical_gets_are_coalesced(fake_server):
+    client = fake_server.client(coalesce_requests=True)
+
+    def task_route(request):
+        _wait_for_waiters(client, CALLERS - 1)
+        return {"id": str(TASK_ID), "status": "processed"}
+
+    fake_server.add("GET", f"api/v1.0/org/tasks/{TASK_ID}", task_route)
+    tasks = Tasks(client)
+
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        results = list(pool.map(lambda _: tasks.get_status(ORG_ID, TASK_ID), range(CALLERS)))
+
+    assert results == ["processed"] * CALLERS
+    assert fake_server.count("GET") == 1
+    assert client.coalesced_request_count == CALLERS - 1
+
+
+def test_coalesced_callers_receive_independent_models(fake_server):
+    client = fake_server.client(coalesce_requests=True)
+
+    def sites_route(request):
+        _wait_for_waiters(client, 1)
+        return [{"id": str(TASK_ID), "name": "Primary"}]
+
+    fake_server.add("GET", SITES, sites_route)
+    sites = Sites(client)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first, second = pool.map(lambda _: sites.get_all(ORG_ID), range(2))
+
+    assert fake_server.count("GET") == 1
+    assert first == second
+    assert first[0] is not second[0]
+
+
+def test_coalesced_callers_share_exceptions(fake_server):
+    client = fake_server.client(coalesce_requests=True)
+
+    def sites_route(request):
+        _wait_for_waiters(client, CALLERS - 1)
+        return 503, {"title": "unavailable"}, {}
+
+    fake_server.add("GET", SITES, sites_route)
+    sites = Sites(client)
+    errors = []
+
+    def call(_):
+        try:
+            sites.get_all(ORG_ID)
+        except ServerError as exc:
+            errors.append(exc)
+
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        list(pool.map(call, range(CALLERS)))
+
+    assert len(errors) == CALLERS
+    assert fake_server.count("GET") == 1
+
+
+def test_coalesced_callers_keep_their_deadline(fake_server):
+    client = fake_server.client(coalesce_requests=True)
+    started = threading.Event()
+    release = threading.Event()
+
+    def sites_route(request):
+        started.set()
+        release.wait(5)
+        return [{"id": str(TASK_ID), "name": "Primary"}]
+
+    fake_server.add("GET", SITES, sites_route)
+    sites = Sites(client)
+
+    def waiter():
+        started.wait(5)
+        began = time.monotonic()
+        try:
+            with client.timeouts(deadline_seconds=0.05):
+                sites.get_all(ORG_ID)
+        except DeadlineExceededError:
+            return time.monotonic() - began
+        finally:
+            release.set()
+        return None
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(sites.get_all, ORG_ID)
+        waited = pool.submit(waiter).result()
+
+    assert waited is not None and waited < 1
+    assert len(leader.result()) == 1
+    assert fake_server.count("GET") == 1
+
+
+def test_different_params_are_not_coalesced(fake_server):
+    client = fake_server.client(coalesce_requests=True)
+    started = threading.Barrier(2, timeout=5)
+
+    def sites_route(request):
+        started.wait()
+        return []
+
+    fake_server.add("GET", SITES, sites_route)
+    sites = Sites(client)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(sites.get_all, [ORG_ID, uuid.uuid4()]))
+
+    assert fake_server.count("GET") == 2
+    assert client.coalesced_request_count == 0
+
+
+def test_coalescing_is_off_by_default(fake_server):
+    fake_server.add("GET", SITES, [])
+    client = fake_server.client()
+    Sites(client).get_all(ORG_ID)
+    Sites(client).get_all(ORG_ID)
+    assert fake_server.count("GET") == 2
+    assert client.coalesced_request_count == 0
@@ -0,0 +1,225 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from runzero.api import Sites
+from runzero.client import ResponseCache
+from runzero.types import SiteOptions
+
+ORG_ID = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+SITE_ID = uuid.UUID("f6cfb91a-52ea-4a86-bf9a-5a891a26f52b")
+SITES = "api/v1.0/org/sites"
+
+
+@pytest.fixture
+def site_routes(fake_server):
+    site = {"id": str(SITE_ID), "name": "Primary"}
+    fake_server.add("GET", SITES, [site])
+    fake_server.add("GET", f"{SITES}/{SITE_ID}", site)
+    fake_server.add("PATCH", f"{SITES}/{SITE_ID}", site)
+    return fake_server
+
+
+def test_cache_serves_repeat_gets(site_routes):
+    cache = ResponseCache(default_ttl_seconds=60)
+    sites = Sites(site_routes.client(response_cache=cache))
+
+    first = sites.get_all(ORG_ID)
+    second = sites.get_all(ORG_ID)
+
+    assert first == second
+    assert site_routes.count("GET", SITES) == 1
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+
+
+def test_cache_key_includes_params(site_routes):
+    cache = ResponseCache()
+    sites = Sites(site_routes.client(response_cache=cache))
+
+    sites.get_all(ORG_ID)
+    sites.get_all(uuid.uuid4())
+
+    assert site_routes.count("GET", SITES) == 2
+
+
+def test_cache_shared_by_clients_keeps_credentials_apart(site_routes):
+    cache = ResponseCache()
+    first = Sites(site_routes.client(response_cache=cache, org_key="OTfirst", account_key=None))
+    second = Sites(site_routes.client(response_cache=cache, org_key="OTsecond", account_key=None))
+
+    first.get_all(ORG_ID)
+    second.get_all(ORG_ID)
+    first.get_all(ORG_ID)
+
+    assert site_routes.count("GET", SITES) == 2
+    assert cache.stats().size == 2
+
+
+def test_cache_entries_expire(site_routes, monkeypatch):
+    now = [100.0]
+    cache = ResponseCache(default_ttl_seconds=0, ttls={SITES: 10})
+    monkeypatch.setattr(cache, "_clock", lambda: now[0])
+    sites = Sites(site_routes.client(response_cache=cache))
+
+    sites.get_all(ORG_ID)
+    now[0] += 5
+    sites.get_all(ORG_ID)
+    assert site_routes.count("GET", SITES) == 1
+
+    now[0] += 10
+    sites.get_all(ORG_ID)
+    assert site_routes.count("GET", SITES) == 2
+
+
+def test_cache_zero_ttl_disables_caching(site_routes):
+    cache = ResponseCache(default_ttl_seconds=60, ttls={SITES: 0})
+    sites = Sites(site_routes.client(response_cache=cache))
+
+    sites.get_all(ORG_ID)
+    sites.get_all(ORG_ID)
+
+    assert site_routes.count("GET", SITES) == 2
+    assert cache.stats().size == 0
+
+
+def test_cache_evicts_least_recently_used(site_routes):
+    cache = ResponseCache(max_entries=2)
+    client = site_routes.client(response_cache=cache)
+    sites = Sites(client)
+
+    sites.get_all(ORG_ID)
+    sites.get(ORG_ID, site_id=SITE_ID)
+    sites.get_all(ORG_ID)  # refresh recency of the list
+    sites.get_all(uuid.uuid4())  # evicts the single site entry
+
+    assert cache.stats().evictions == 1
+    sites.get_all(ORG_ID)
+    assert site_routes.count("GET", SITES) == 2
+    sites.get(ORG_ID, site_id=SITE_ID)
+    assert site_routes.count("GET", f"{SITES}/{SITE_ID}") == 2
+
+
+def test_cache_write_invalidates_resource_and_collection(site_routes):
+    cache = ResponseCache()
+    sites = Sites(site_routes.client(response_cache=cache))
+    site_routes.add("GET", "api/v1.0/org/explorers", [])
+
+    sites.get_all(ORG_ID)
+    sites.get(ORG_ID, site_id=SITE_ID)
+    site_routes.client(response_cache=cache).execute("GET", "api/v1.0/org/explorers")
+
+    sites.update(ORG_ID, SITE_ID, SiteOptions(name="Renamed"))
+
+    assert cache.stats().invalidations == 2
+    assert cache.stats().size == 1
+    sites.get_all(ORG_ID)
+    assert site_routes.count("GET", SITES) == 2
+
+
+def test_cache_invalidation_matches_account_and_org_paths():
+    cache = ResponseCache()
+    key = cache.key("api/v1.0/org/custom-integrations", None, "ACCOUNT")
+    cache.put(key, SimpleNamespace(etag=None, last_modified=None))
+    cache.put(
+        cache.key("api/v1.0/org/custom-integrations-other", None, "ACCOUNT"),
+        SimpleNamespace(etag=None, last_modified=None),
+    )
+
+    assert cache.invalidate("api/v1.0/account/custom-integrations/1234") == 1
+    assert cache.get(key) is None
+
+
+def test_cache_rejects_bad_configuration():
+    with pytest.raises(ValueError):
+        ResponseCache(default_ttl_seconds=-1)
+    with pytest.raises(ValueError):
+        ResponseCache(ttls={SITES: -1})
+    with pytest.raises(ValueError):
+        ResponseCache(max_entries=0)
+
+
+def test_conditional_get_uses_validators(fake_server, monkeypatch):
+    now = [100.0]
+    body = [{"id": str(SITE_ID), "name": "Primary"}]
+
+    def sites_route(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, None, {"ETag": '"v1"'}
+        return 200, body, {"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"}
+
+    fake_server.add("GET", SITES, sites_route)
+    cache = ResponseCache(default_ttl_seconds=10)
+    monkeypatch.setattr(cache, "_clock", lambda: now[0])
+    sites = Sites(fake_server.client(response_cache=cache))
+
+    first = sites.get_all(ORG_ID)
+    now[0] += 20
+    second = sites.get_all(ORG_ID)
+
+    assert fake_server.count("GET", SITES) == 2
+    conditional = fake_server.requests[-1]
+    assert conditional.headers["If-None-Match"] == '"v1"'
+    assert conditional.headers["If-Modified-Since"] == "Wed, 21 Oct 2026 07:28:00 GMT"
+    assert second == first
+    assert second[0] is not first[0]
+    assert cache.stats().revalidations == 1
+
+    # the revalidated entry is fresh again
+    sites.get_all(ORG_ID)
+    assert fake_server.count("GET", SITES) == 2
+
+
+def test_conditional_get_every_request_with_zero_ttl(fake_server):
+    calls = []
+
+    def sites_route(request):
+        calls.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, None, {"ETag": '"v1"'}
+        return 200, [{"id": str(SITE_ID), "name": "Primary"}], {"ETag": '"v1"'}
+
+    fake_server.add("GET", SITES, sites_route)
+    cache = ResponseCache(default_ttl_seconds=0)
+    sites = Sites(fake_server.client(response_cache=cache))
+
+    for _ in range(3):
+        assert sites.get_all(ORG_ID)[0].name == "Primary"
+    assert calls == [None, '"v1"', '"v1"']
+
+
+def test_conditional_get_without_validators_refetches(site_routes):
+    cache = ResponseCache(default_ttl_seconds=0)
+    sites = Sites(site_routes.client(response_cache=cache))
+
+    sites.get_all(ORG_ID)
+    sites.get_all(ORG_ID)
+
+    assert site_routes.count("GET", SITES) == 2
+    assert "If-None-Match" not in site_routes.requests[-1].headers
+    assert cache.stats().size == 0
+
+
+def test_conditional_get_changed_resource_replaces_entry(fake_server, monkeypatch):
+    now = [0.0]
+    version = ["v1"]
+
+    def sites_route(request):
+        etag = f'"{version[0]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return 304, None, {"ETag": etag}
+        return 200, [{"id": str(SITE_ID), "name": version[0]}], {"ETag": etag}
+
+    fake_server.add("GET", SITES, sites_route)
+    cache = ResponseCache(default_ttl_seconds=1)
+    monkeypatch.setattr(cache, "_clock", lambda: now[0])
+    sites = Sites(fake_server.client(response_cache=cache))
+
+    assert sites.get_all(ORG_ID)[0].name == "v1"
+    version[0] = "v2"
+    now[0] += 2
+    assert sites.get_all(ORG_ID)[0].name == "v2"
+    assert cache.stats().revalidations == 0
@@ -0,0 +1,113 @@
+import threading
+import time
+import uuid
+
+import pytest
+
+from runzero.api import Tasks
+from runzero.client import (
+    AdaptiveConcurrencyLimiter,
+    Priority,
+    RateLimitError,
+    RequestScheduler,
+)
+from runzero.types import RateLimitInformation
+
+ORG_ID = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+TASK_ID = uuid.UUID("f6cfb91a-52ea-4a86-bf9a-5a891a26f52b")
+
+
+def _wait_queued(scheduler, count):
+    deadline = time.monotonic() + 5
+    while sum(scheduler.queued().values()) < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def _queue(scheduler, priority, label, order):
+    def run():
+        ticket = scheduler.acquire(priority)
+        order.append(label)
+        ticket.release()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_high_priority_overtakes_queued_bulk_work_fairly():
+    scheduler = RequestScheduler(max_concurrency=1, weights={Priority.HIGH: 2, Priority.LOW: 1})
+    held = scheduler.acquire()
+    order = []
+    threads = []
+    for i in range(4):
+        threads.append(_queue(scheduler, Priority.LOW, f"low{i}", order))
+        _wait_queued(scheduler, len(threads))
+    for i in range(4):
+        threads.append(_queue(scheduler, Priority.HIGH, f"high{i}", order))
+        _wait_queued(scheduler, len(threads))
+
+    held.release()
+    for thread in threads:
+        thread.join()
+
+    # HIGH is admitted twice as often as LOW, ties going to the higher priority
+    assert order == ["high0", "high1", "low0", "high2", "high3", "low1", "low2", "low3"]
+    assert scheduler.admitted() == {Priority.HIGH: 4, Priority.NORMAL: 1, Priority.LOW: 4}
+    assert scheduler.in_flight == 0
+
+
+def test_acquire_times_out_and_leaves_queue():
+    scheduler = RequestScheduler(max_concurrency=1)
+    held = scheduler.acquire()
+    assert scheduler.acquire(Priority.HIGH, timeout=0.01) is None
+    assert scheduler.queued() == {Priority.HIGH: 0, Priority.NORMAL: 0, Priority.LOW: 0}
+    held.release()
+    held.release()
+    assert scheduler.acquire(timeout=0.01) is not None
+
+
+def test_scheduler_uses_limiter_capacity():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+    scheduler = RequestScheduler(limiter=limiter)
+    tickets = [scheduler.acquire(), scheduler.acquire()]
+    assert limiter.in_flight == 2
+    assert scheduler.acquire(timeout=0.01) is None
+    for ticket in tickets:
+        ticket.release()
+    assert limiter.in_flight == 0
+
+
+def test_rate_limit_reserve_is_kept_for_high_priority():
+    scheduler = RequestScheduler(rate_limit_reserve=10)
+    low_budget = RateLimitInformation(usage_limit=1000, usage_remaining=10, usage_today=990, usage_total=990)
+    with pytest.raises(RateLimitError):
+        scheduler.acquire(Priority.LOW, rate_limit_information=low_budget)
+    with pytest.raises(RateLimitError):
+        scheduler.acquire(Priority.NORMAL, rate_limit_information=low_budget)
+    scheduler.acquire(Priority.HIGH, rate_limit_information=low_budget).release()
+
+
+def test_scheduler_validation():
+    with pytest.raises(ValueError):
+        RequestScheduler(max_concurrency=2, limiter=AdaptiveConcurrencyLimiter())
+    with pytest.raises(ValueError):
+        RequestScheduler(max_concurrency=0)
+    with pytest.raises(ValueError):
+        RequestScheduler(weights={Priority.LOW: 0})
+
+
+def test_client_priority(fake_server):
+    fake_server.add("GET", f"api/v1.0/org/tasks/{TASK_ID}", {"id": str(TASK_ID), "status": "processed"})
+    scheduler = RequestScheduler(max_concurrency=2)
+    client = fake_server.client(scheduler=scheduler)
+    tasks = Tasks(client)
+
+    tasks.get_status(ORG_ID, TASK_ID)
+    with client.priority(Priority.LOW):
+        tasks.get_status(ORG_ID, TASK_ID)
+        client.execute("GET", f"api/v1.0/org/tasks/{TASK_ID}", priority=Priority.HIGH)
+
+    assert scheduler.admitted() == {Priority.HIGH: 1, Priority.NORMAL: 1, Priority.LOW: 1}
+    assert client.scheduler is scheduler
+    with pytest.raises(ValueError):
+        fake_server.client(scheduler=scheduler, concurrency_limiter=AdaptiveConcurrencyLimiter())
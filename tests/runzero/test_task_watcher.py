@@ -0,0 +1,194 @@
+import asyncio
+import uuid
+
+import pytest
+
+from runzero.api import Tasks, TaskWaitTimeoutError
+from runzero.api import tasks as tasks_module
+from runzero.client import ResponseCache
+from runzero.client.errors import DeadlineExceededError
+from tests.conftest import FakeServer
+
+ORG_ID = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+TASKS = "api/v1.0/org/tasks"
+
+
+class TaskTimeline:
+    """Serves scripted task statuses, advancing one step per list request."""
+
+    def __init__(self, timelines, hidden=()):
+        self.timelines = timelines
+        self.hidden = set(hidden)
+        self.tick = 0
+
+    def status(self, task_id):
+        timeline = self.timelines[task_id]
+        return timeline[min(self.tick, len(timeline) - 1)]
+
+    def list_route(self, request):
+        search = FakeServer.query(request)["search"][0]
+        result = [
+            {"id": str(task_id), "status": self.status(task_id)}
+            for task_id in self.timelines
+            if f"id:{task_id}" in search and task_id not in self.hidden
+        ]
+        self.tick += 1
+        return result
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(tasks_module.time, "sleep", delays.append)
+    return delays
+
+
+def test_wait_for_yields_transitions_with_one_request_per_tick(fake_server, sleeps):
+    first, second = uuid.uuid4(), uuid.uuid4()
+    timeline = TaskTimeline(
+        {
+            first: ["new", "processing", "processed"],
+            second: ["new", "new", "new", "failed"],
+        }
+    )
+    fake_server.add("GET", TASKS, timeline.list_route)
+
+    changes = list(Tasks(fake_server.client()).wait_for(ORG_ID, [first, second], initial_interval=1))
+
+    assert [(c.task_id, c.previous_status, c.status) for c in changes] == [
+        (first, None, "new"),
+        (second, None, "new"),
+        (first, "new", "processing"),
+        (first, "processing", "processed"),
+        (second, "new", "failed"),
+    ]
+    assert [c.terminal for c in changes] == [False, False, False, True, True]
+    assert fake_server.count("GET", TASKS) == 4
+    assert len(sleeps) == 3
+
+
+def test_wait_for_backs_off_while_nothing_changes(fake_server, sleeps):
+    task_id = uuid.uuid4()
+    timeline = TaskTimeline({task_id: ["running"] * 5 + ["processed"]})
+    fake_server.add("GET", TASKS, timeline.list_route)
+
+    list(Tasks(fake_server.client()).wait_for(ORG_ID, [task_id], initial_interval=1, max_interval=2))
+
+    assert sleeps == [1, 1.5, 2, 2, 2]
+
+
+def test_wait_for_backs_off_while_status_is_missing(fake_server, sleeps):
+    task_id = uuid.uuid4()
+    timeline = TaskTimeline({task_id: [None] * 4 + ["processed"]})
+    fake_server.add("GET", TASKS, timeline.list_route)
+
+    changes = list(Tasks(fake_server.client()).wait_for(ORG_ID, [task_id], initial_interval=1, max_interval=4))
+
+    assert [(c.previous_status, c.status) for c in changes] == [(None, None), (None, "processed")]
+    assert sleeps == [1, 1.5, 2.25, 3.375]
+
+
+def test_wait_for_batches_task_queries(fake_server, sleeps):
+    ids = [uuid.uuid4() for _ in range(120)]
+    timeline = TaskTimeline({task_id: ["processed"] for task_id in ids})
+    fake_server.add("GET", TASKS, timeline.list_route)
+
+    changes = list(Tasks(fake_server.client()).wait_for(ORG_ID, ids))
+
+    assert len(changes) == 120
+    assert fake_server.count("GET", TASKS) == 3
+    assert sleeps == []
+
+
+def test_wait_for_falls_back_to_single_lookup(fake_server, sleeps):
+    hidden = uuid.uuid4()
+    timeline = TaskTimeline({hidden: ["processed"]}, hidden=[hidden])
+    fake_server.add("GET", TASKS, timeline.list_route)
+    fake_server.add("GET", f"{TASKS}/{hidden}", {"id": str(hidden), "status": "processed"})
+
+    changes = list(Tasks(fake_server.client()).wait_for(ORG_ID, [hidden]))
+
+    assert [c.status for c in changes] == ["processed"]
+    assert fake_server.count("GET", f"{TASKS}/{hidden}") == 1
+
+
+def test_wait_for_looks_up_unlisted_tasks_directly_on_later_polls(fake_server, sleeps):
+    task_ids = [uuid.uuid4() for _ in range(3)]
+    fake_server.add("GET", TASKS, [])
+    polls = {task_id: 0 for task_id in task_ids}
+
+    def get_route(task_id):
+        def route(request):
+            polls[task_id] += 1
+            return {"id": str(task_id), "status": "processed" if polls[task_id] >= 3 else "running"}
+
+        return route
+
+    for task_id in task_ids:
+        fake_server.add("GET", f"{TASKS}/{task_id}", get_route(task_id))
+
+    watched = list(Tasks(fake_server.client()).wait_for(ORG_ID, task_ids))
+
+    assert [c.status for c in watched] == ["running"] * 3 + ["processed"] * 3
+    # search lists none of the tasks, so it is only tried on the first poll
+    assert fake_server.count("GET", TASKS) == 1
+    assert [fake_server.count("GET", f"{TASKS}/{task_id}") for task_id in task_ids] == [3, 3, 3]
+
+
+def test_wait_for_times_out(fake_server, sleeps, monkeypatch):
+    task_id = uuid.uuid4()
+    now = [0.0]
+    monkeypatch.setattr(tasks_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(tasks_module.time, "sleep", lambda delay: now.__setitem__(0, now[0] + delay))
+    fake_server.add("GET", TASKS, TaskTimeline({task_id: ["running"]}).list_route)
+
+    with pytest.raises(TaskWaitTimeoutError) as exc_info:
+        list(Tasks(fake_server.client()).wait_for(ORG_ID, [task_id], timeout=5))
+
+    assert exc_info.value.pending == {task_id: "running"}
+    assert isinstance(exc_info.value, TimeoutError)
+
+
+def test_wait_for_bypasses_response_cache(fake_server, sleeps):
+    task_id = uuid.uuid4()
+    fake_server.add("GET", TASKS, TaskTimeline({task_id: ["running", "processed"]}).list_route)
+    client = fake_server.client(response_cache=ResponseCache(default_ttl_seconds=600))
+
+    changes = list(Tasks(client).wait_for(ORG_ID, [task_id]))
+
+    assert [c.status for c in changes] == ["running", "processed"]
+
+
+def test_async_wait_for(fake_server, monkeypatch):
+    task_id = uuid.uuid4()
+    fake_server.add("GET", TASKS, TaskTimeline({task_id: ["new", "processed"]}).list_route)
+
+    async def no_sleep(delay):
+        return None
+
+    monkeypatch.setattr(tasks_module.asyncio, "sleep", no_sleep)
+
+    async def collect():
+        return [c.status async for c in Tasks(fake_server.client()).async_wait_for(ORG_ID, [task_id])]
+
+    assert asyncio.run(collect()) == ["new", "processed"]
+
+
+def test_async_wait_for_keeps_the_callers_deadline(fake_server, monkeypatch):
+    task_id = uuid.uuid4()
+    fake_server.add("GET", TASKS, TaskTimeline({task_id: ["new", "new", "processed"]}).list_route)
+    sleep = asyncio.sleep
+
+    async def slow_sleep(delay):
+        await sleep(0.1)
+
+    monkeypatch.setattr(tasks_module.asyncio, "sleep", slow_sleep)
+    client = fake_server.client()
+
+    async def collect():
+        with client.timeouts(deadline_seconds=0.05):
+            return [c.status async for c in Tasks(client).async_wait_for(ORG_ID, [task_id])]
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(collect())
+    assert fake_server.count("GET", TASKS) == 1
@@ -0,0 +1,89 @@
+import time
+import uuid
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from runzero.api import Tasks
+from runzero.client import Client
+from runzero.client.errors import ConnTimeoutError, DeadlineExceededError
+
+ORG_ID = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+TASK_ID = uuid.UUID("f6cfb91a-52ea-4a86-bf9a-5a891a26f52b")
+TASK = f"api/v1.0/org/tasks/{TASK_ID}"
+
+
+@pytest.fixture
+def sent_timeouts(fake_server, monkeypatch):
+    timeouts = []
+
+    def send(adapter, request, **kwargs):
+        timeouts.append(kwargs.get("timeout"))
+        return fake_server.send(request, **kwargs)
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    fake_server.add("GET", TASK, {"id": str(TASK_ID), "status": "processed"})
+    return timeouts
+
+
+def test_client_timeout_defaults():
+    c = Client(account_key="CTtest")
+    assert c.timeout == 180
+    assert c.connect_timeout == 10
+    assert Client(account_key="CTtest", timeout_seconds=5).connect_timeout == 5
+    assert Client(account_key="CTtest", connect_timeout_seconds=2.5).connect_timeout == 2.5
+    with pytest.raises(ValueError):
+        Client(account_key="CTtest", connect_timeout_seconds=0)
+
+
+def test_connect_and_read_timeouts_are_separate(fake_server, sent_timeouts):
+    client = fake_server.client(timeout_seconds=600, connect_timeout_seconds=3)
+    Tasks(client).get_status(ORG_ID, TASK_ID)
+    assert sent_timeouts == [(3, 600)]
+
+
+def test_timeouts_context_and_per_call_override(fake_server, sent_timeouts):
+    client = fake_server.client()
+    with client.timeouts(connect_seconds=1):
+        with client.timeouts(read_seconds=20):
+            Tasks(client).get_status(ORG_ID, TASK_ID)
+        client.execute("GET", TASK, timeout=(2, 30))
+        client.execute("GET", TASK, timeout=7)
+    Tasks(client).get_status(ORG_ID, TASK_ID)
+    assert sent_timeouts == [(1, 20), (2, 30), (7, 7), (10, 180)]
+
+
+def test_deadline_shortens_timeouts(fake_server, sent_timeouts):
+    client = fake_server.client()
+    with client.timeouts(deadline_seconds=60):
+        with client.timeouts(deadline_seconds=600):
+            Tasks(client).get_status(ORG_ID, TASK_ID)
+    ((connect, read),) = sent_timeouts
+    assert connect == 10
+    assert 59 < read <= 60
+
+
+def test_deadline_exceeded_before_send(fake_server, sent_timeouts):
+    client = fake_server.client()
+    with client.timeouts(deadline_seconds=0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceededError):
+            Tasks(client).get_status(ORG_ID, TASK_ID)
+    assert sent_timeouts == []
+
+
+def test_read_timeout_after_deadline_is_deadline_error(fake_server, monkeypatch):
+    def slow(adapter, request, **kwargs):
+        time.sleep(0.05)
+        raise requests.exceptions.ReadTimeout("read timed out")
+
+    monkeypatch.setattr(HTTPAdapter, "send", slow)
+    client = fake_server.client()
+    with pytest.raises(ConnTimeoutError) as exc_info:
+        Tasks(client).get_status(ORG_ID, TASK_ID)
+    assert not isinstance(exc_info.value, DeadlineExceededError)
+
+    with client.timeouts(deadline_seconds=0.01):
+        with pytest.raises(DeadlineExceededError):
+            Tasks(client).get_status(ORG_ID, TASK_ID)
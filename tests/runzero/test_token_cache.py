@@ -0,0 +1,148 @@
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from runzero.api import OrgsAdmin
+from runzero.client import AuthError, Client, TokenCache
+from runzero.client._http.auth import OAuthToken
+
+
+@pytest.fixture
+def token_route(fake_server):
+    logins = []
+
+    def route(request):
+        logins.append(request)
+        return {"access_token": f"token-{len(logins)}", "token_type": "bearer", "expires_in": 3600}
+
+    fake_server.add("POST", Client._Paths.TOKEN.value, route)
+    fake_server.add("GET", "api/v1.0/account/orgs", [])
+    return logins
+
+
+def test_oauth_token_lifetime_is_measured_from_issue():
+    token = OAuthToken.parse_obj({"access_token": "a", "token_type": "bearer", "expires_in": 3600})
+    assert 3599 < token.seconds_remaining() <= 3600
+    assert not token.is_expired()
+
+    old = OAuthToken(
+        access_token="a", token_type="bearer", expires_in=3600, created_at=datetime.now() - timedelta(seconds=3550)
+    )
+    assert old.seconds_remaining() <= 50
+    assert old.is_expired()
+
+
+def test_token_cache_round_trip(tmp_path):
+    cache = TokenCache(tmp_path / "runzero" / "tokens.json")
+    token = OAuthToken(access_token="a", token_type="bearer", expires_in=3600)
+    cache.store("https://runzero.test/", "client-id", "secret", token)
+
+    loaded = cache.load("https://runzero.test", "client-id", "secret")
+    assert loaded is not None
+    assert loaded.access_token == "a"
+    assert abs(loaded.seconds_remaining() - token.seconds_remaining()) < 5
+    assert cache.load("https://runzero.test", "other-id", "secret") is None
+    assert cache.load("https://runzero.test", "client-id", "rotated") is None
+    assert cache.load("https://other.test", "client-id", "secret") is None
+
+    cache.discard("https://runzero.test", "client-id", "secret")
+    assert cache.load("https://runzero.test", "client-id", "secret") is None
+
+
+def test_token_cache_ignores_expired_tokens(tmp_path):
+    cache = TokenCache(tmp_path / "tokens.json")
+    token = OAuthToken(
+        access_token="a", token_type="bearer", expires_in=3600, created_at=datetime.now() - timedelta(seconds=3590)
+    )
+    cache.store("https://runzero.test", "client-id", "secret", token)
+    assert cache.load("https://runzero.test", "client-id", "secret") is None
+
+
+@pytest.mark.skipif(os.name != "posix", reason="file modes are POSIX only")
+def test_token_cache_file_is_private(tmp_path):
+    path = tmp_path / "tokens.json"
+    cache = TokenCache(path)
+    cache.store(
+        "https://runzero.test",
+        "client-id",
+        "secret",
+        OAuthToken(access_token="a", token_type="bearer", expires_in=3600),
+    )
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert "secret" not in path.read_text()
+
+    os.chmod(path, 0o644)
+    assert cache.load("https://runzero.test", "client-id", "secret") is None
+
+
+def test_client_reuses_cached_token(fake_server, token_route, tmp_path):
+    cache = TokenCache(tmp_path / "tokens.json")
+
+    first = Client(server_url=fake_server.URL, token_cache=cache)
+    first.oauth_login("client-id", "secret")
+    assert len(token_route) == 1
+    assert "secret" not in (tmp_path / "tokens.json").read_text()
+
+    second = Client(server_url=fake_server.URL, token_cache=cache)
+    second.oauth_login("client-id", "secret")
+    OrgsAdmin(client=second).get_all()
+    assert len(token_route) == 1
+    assert fake_server.requests[-1].headers["Authorization"] == "Bearer token-1"
+
+
+def test_client_replaces_a_revoked_cached_token(fake_server, token_route, tmp_path):
+    cache = TokenCache(tmp_path / "tokens.json")
+    cache.store(
+        fake_server.URL, "client-id", "secret", OAuthToken(access_token="revoked", token_type="bearer", expires_in=3600)
+    )
+
+    def orgs(request):
+        if request.headers["Authorization"] == "Bearer revoked":
+            return 401, {"error": "token revoked"}, {}
+        return []
+
+    fake_server.add("GET", "api/v1.0/account/orgs", orgs)
+    c = Client(server_url=fake_server.URL, token_cache=cache)
+    c.oauth_login("client-id", "secret")
+    OrgsAdmin(client=c).get_all()
+
+    assert len(token_route) == 1
+    assert [r.headers["Authorization"] for r in fake_server.requests if r.method == "GET"] == [
+        "Bearer revoked",
+        "Bearer token-1",
+    ]
+    assert cache.load(fake_server.URL, "client-id", "secret").access_token == "token-1"
+
+    # a token which was not loaded from the cache is not replaced
+    fake_server.add("GET", "api/v1.0/account/orgs", lambda request: (401, {"error": "token revoked"}, {}))
+    with pytest.raises(AuthError):
+        OrgsAdmin(client=c).get_all()
+    assert len(token_route) == 1
+
+
+def test_client_does_not_reuse_a_token_cached_for_another_secret(fake_server, token_route, tmp_path):
+    cache = TokenCache(tmp_path / "tokens.json")
+    Client(server_url=fake_server.URL, token_cache=cache).oauth_login("client-id", "secret")
+
+    Client(server_url=fake_server.URL, token_cache=cache).oauth_login("client-id", "rotated")
+
+    assert len(token_route) == 2
+
+
+def test_client_refreshes_token_in_background(fake_server, token_route, monkeypatch):
+    # the first token is inside the refresh window, so renewal is due as soon as it is issued
+    monkeypatch.setattr(Client, "__token_refresh_ahead__", 1200)
+    monkeypatch.setattr(OAuthToken, "seconds_remaining", lambda self: 1000 if self.access_token == "token-1" else 3600)
+    c = Client(server_url=fake_server.URL, background_token_refresh=True)
+    c.oauth_login("client-id", "secret")
+    try:
+        deadline = time.monotonic() + 5
+        while len(token_route) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        c.close()
+    assert len(token_route) == 2
+    OrgsAdmin(client=c).get_all()
+    assert fake_server.requests[-1].headers["Authorization"] == "Bearer token-2"
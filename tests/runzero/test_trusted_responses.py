@@ -0,0 +1,121 @@
+import copy
+import json
+import pickle
+import uuid
+
+import pytest
+
+from runzero._pydantic import dump_json, parse
+from runzero._trusted import construct, is_trusted
+from runzero.api import Sites, Tasks
+from runzero.client import ResponseCache
+from runzero.types import ImportAsset, Site, Task, ValidationError
+
+ORG_ID = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+TASKS = "api/v1.0/org/tasks"
+SITES = "api/v1.0/org/sites"
+
+TASK = {
+    "id": "f6cfb91a-52ea-4a86-bf9a-5a891a26f52b",
+    "name": "import",
+    "created_at": 1576300370,
+    "organization_id": str(ORG_ID),
+    "site_id": "dc97bd5a-9cf6-4f04-8c55-4e6d1f5d0e3b",
+    "status": "processed",
+    "params": {"custom-integration-id": "f6cfb91a-52ea-4a86-bf9a-5a891a26f52b"},
+    "unknown_to_the_sdk": True,
+}
+
+
+def test_trusted_model_converts_fields_on_first_read():
+    task = construct(Task, TASK)
+
+    assert isinstance(task, Task)
+    assert is_trusted(task)
+    assert not is_trusted(parse(Task, TASK))
+    assert type(task).__name__ == "Task"
+    assert task.status == "processed"
+    assert task.params == TASK["params"]
+    assert "site_id" not in task.__dict__
+
+    assert task.site_id == uuid.UUID(TASK["site_id"])
+    assert task.__dict__["site_id"] is task.site_id
+    assert task.template_id is None
+
+
+def test_trusted_model_matches_validated_model():
+    strict = parse(Task, TASK)
+
+    assert construct(Task, TASK) == strict
+    assert strict == construct(Task, TASK)
+    assert dump_json(construct(Task, TASK)) == dump_json(strict)
+    assert repr(construct(Task, TASK)) == repr(strict)
+    assert dict(construct(Task, TASK)) == dict(strict)
+
+    payload = {
+        "id": "a",
+        "hostnames": ["h"],
+        "tags": ["prod"],
+        "networkInterfaces": [{"macAddress": "00:1b:44:11:3a:b7", "ipv4Addresses": ["10.0.0.1"]}],
+        "customAttributes": {"rack": "4"},
+    }
+    asset = construct(ImportAsset, payload)
+    assert dump_json(asset, by_alias=True) == dump_json(parse(ImportAsset, payload), by_alias=True)
+
+
+def test_copies_and_pickles_are_validated_models():
+    for duplicate in (
+        copy.copy(construct(Task, TASK)),
+        copy.deepcopy(construct(Task, TASK)),
+        pickle.loads(pickle.dumps(construct(Task, TASK))),
+    ):
+        assert type(duplicate) is Task
+        assert duplicate == parse(Task, TASK)
+
+
+def test_invalid_fields_raise_when_read():
+    task = construct(Task, {**TASK, "site_id": "not-a-uuid"})
+    assert task.name == "import"
+    with pytest.raises(ValidationError):
+        _ = task.site_id
+
+    with pytest.raises(ValidationError):
+        construct(Task, ["not", "an", "object"])
+
+
+def test_client_builds_trusted_models(fake_server):
+    fake_server.add("GET", TASKS, [TASK, {**TASK, "status": "failed"}])
+    fake_server.add("GET", f"{TASKS}/{TASK['id']}", TASK)
+
+    tasks = Tasks(fake_server.client(trusted_responses=True))
+    listed = tasks.get_all(ORG_ID)
+    assert all(is_trusted(task) for task in listed)
+    assert [task.status for task in listed] == ["processed", "failed"]
+    assert is_trusted(tasks.get(ORG_ID, task_id=uuid.UUID(TASK["id"])))
+
+    strict = Tasks(fake_server.client()).get_all(ORG_ID)
+    assert not any(is_trusted(task) for task in strict)
+    assert listed == strict
+
+
+def test_shared_responses_build_fresh_trusted_models(fake_server):
+    site = {"id": str(uuid.uuid4()), "name": "Primary", "created_at": 1576300370}
+    fake_server.add("GET", SITES, [site])
+    sites = Sites(fake_server.client(trusted_responses=True, response_cache=ResponseCache(default_ttl_seconds=60)))
+
+    first = sites.get_all(ORG_ID)
+    first[0].name = "renamed"
+    second = sites.get_all(ORG_ID)
+
+    assert fake_server.count("GET", SITES) == 1
+    assert second[0].name == "Primary"
+    assert second[0] is not first[0]
+    assert json.loads(dump_json(second[0]))["id"] == site["id"]
+    assert isinstance(second[0], Site)
+
+
+def test_config_carries_trusted_responses(fake_server):
+    config = fake_server.client(trusted_responses=True).config()
+    assert config.trusted_responses
+    assert config.build().config().trusted_responses
+    assert not fake_server.client().config().trusted_responses
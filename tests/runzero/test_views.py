@@ -0,0 +1,122 @@
+import pickle
+import uuid
+
+import pytest
+
+from runzero.api import Explorers, HostedZones, Sites, Tasks
+from runzero.types import (
+    Explorer,
+    ExplorerView,
+    HostedZone,
+    HostedZoneView,
+    Site,
+    SiteView,
+    Task,
+    TaskView,
+    ValidationError,
+)
+
+ORG_ID = uuid.UUID("e77602e0-3fb8-4734-aef9-fbc6fdcb0fa8")
+SITE_ID = "dc97bd5a-9cf6-4f04-8c55-4e6d1f5d0e3b"
+
+TASKS = [
+    {
+        "id": f"f6cfb91a-52ea-4a86-bf9a-{i:012x}",
+        "name": "import",
+        "created_at": 1576300370 + i,
+        "organization_id": str(ORG_ID),
+        "site_id": SITE_ID,
+        "status": "processed" if i else "failed",
+        "params": {"custom-integration-id": "f6cfb91a-52ea-4a86-bf9a-5a891a26f52b"},
+        "unknown_to_the_sdk": True,
+    }
+    for i in range(3)
+]
+
+
+@pytest.fixture
+def task_route(fake_server):
+    fake_server.add("GET", "api/v1.0/org/tasks", TASKS)
+    return fake_server
+
+
+def test_views_read_fields_like_models(task_route):
+    views = Tasks(task_route.client()).get_all_views(ORG_ID, status="processed")
+    models = Tasks(task_route.client()).get_all(ORG_ID)
+
+    assert all(isinstance(view, TaskView) for view in views)
+    for view, model in zip(views, models):
+        assert view.id == model.id
+        assert isinstance(view.id, uuid.UUID)
+        assert view.status == model.status
+        assert view.created_at == model.created_at
+        assert view.params == model.params
+        assert view.template_id is None
+        assert view.to_model() == model
+        assert type(view.to_model()) is Task
+    assert "status" in dir(views[0])
+    assert repr(views[0]).startswith("TaskView(id=UUID(")
+    assert task_route.requests[0].url.endswith("status=processed")
+
+
+def test_views_are_read_only_and_share_repeated_strings(task_route):
+    first, second, _ = Tasks(task_route.client()).get_all_views(ORG_ID)
+
+    with pytest.raises(AttributeError):
+        first.status = "failed"
+    with pytest.raises(AttributeError):
+        del first.name
+    with pytest.raises(AttributeError):
+        first.other = 1
+    assert not hasattr(first, "__dict__")
+
+    site_id = TaskView._names.index("site_id")
+    assert first._values is not second._values
+    assert first._values[site_id] is second._values[site_id]
+
+
+def test_views_compare_pickle_and_round_trip(task_route):
+    view = Tasks(task_route.client()).get_all_views(ORG_ID)[0]
+
+    assert pickle.loads(pickle.dumps(view)) == view
+    assert view != Tasks(task_route.client()).get_all_views(ORG_ID)[1]
+    assert TaskView(TASKS[0]) == view
+    assert "unknown_to_the_sdk" not in view.to_dict()
+    assert view.to_dict()["site_id"] == SITE_ID
+
+
+def test_invalid_values_raise_when_read():
+    view = TaskView({**TASKS[0], "site_id": "not-a-uuid"})
+    assert view.name == "import"
+    with pytest.raises(ValidationError):
+        _ = view.site_id
+    with pytest.raises(ValidationError):
+        view.to_model()
+
+
+@pytest.mark.parametrize(
+    "api, path, body, view_type, model",
+    [
+        (Sites, "api/v1.0/org/sites", {"id": SITE_ID, "name": "Primary"}, SiteView, Site),
+        (Explorers, "api/v1.0/org/explorers", None, ExplorerView, Explorer),
+        (HostedZones, "api/v1.0/org/hosted-zones", {"id": SITE_ID, "name": "zone1"}, HostedZoneView, HostedZone),
+    ],
+)
+def test_other_listings_have_views(fake_server, api, path, body, view_type, model):
+    if body is None:
+        body = {
+            "id": SITE_ID,
+            "client_id": str(ORG_ID),
+            "organization_id": str(ORG_ID),
+            "name": "explorer",
+            "created_at": 1576300370,
+            "updated_at": 1576300370,
+        }
+    fake_server.add("GET", path, [body])
+
+    views = api(fake_server.client()).get_all_views(ORG_ID)
+
+    assert [type(view) for view in views] == [view_type]
+    assert views[0].id == uuid.UUID(SITE_ID)
+    assert views[0].to_model() == api(fake_server.client()).get_all(ORG_ID)[0]
+    assert isinstance(views[0].to_model(), model)